@@ -0,0 +1,51 @@
+"""Measures structuring and unstructuring of search result pages.
+
+Usage:
+    python benchmarks/conversion.py [path/to/recorded/page.json] [--repeat N]
+
+If no recorded page is given, a page of 10 000 synthetic assignments is generated. A recorded page is a response body
+of `GET /api/v1/assignments?limit=10000`.
+"""
+
+import argparse
+from decimal import Decimal
+
+import simplejson
+
+from json_decoding import generate_page, measure
+from toloka.client import structure, unstructure
+from toloka.client.search_results import AssignmentSearchResult, TaskSearchResult
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('page', nargs='?', help='Path to a recorded response with assignments')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of runs, the best one is reported')
+    args = parser.parse_args()
+
+    if args.page:
+        with open(args.page, 'rb') as page_file:
+            body = page_file.read()
+    else:
+        body = generate_page()
+    data = simplejson.loads(body, parse_float=Decimal)
+    tasks_data = {'items': [task for item in data['items'] for task in item['tasks']], 'has_more': False}
+    count, tasks_count = len(data['items']), len(tasks_data['items'])
+    print(f'Page: {count} assignments, {tasks_count} tasks')
+
+    assignments = structure(data, AssignmentSearchResult)
+    tasks = structure(tasks_data, TaskSearchResult)
+    measure('structure assignments', lambda: structure(data, AssignmentSearchResult), args.repeat, count)
+    measure('unstructure assignments', lambda: unstructure(assignments), args.repeat, count)
+    measure(
+        'structure assignments (lazy)',
+        lambda: [item.status for item in AssignmentSearchResult.structure(data, lazy=True).items],
+        args.repeat,
+        count,
+    )
+    measure('structure tasks', lambda: structure(tasks_data, TaskSearchResult), args.repeat, tasks_count)
+    measure('unstructure tasks', lambda: unstructure(tasks), args.repeat, tasks_count)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Measures import time of toloka packages with `python -X importtime`.
+
+Usage:
+    python benchmarks/import_time.py [module ...] [--repeat N] [--top N] [--output result.json]
+        [--baseline result.json] [--max-regression 0.1]
+
+Every import is measured in a fresh interpreter, the best run is reported. Save the results of a release with
+`--output` and compare the next one with `--baseline`: the script exits with a non-zero code if any module became
+slower than allowed by `--max-regression`.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+from toloka.__version__ import __version__
+
+DEFAULT_MODULES = ['toloka.client', 'toloka.async_client', 'toloka.streaming', 'toloka.metrics']
+
+
+def measure_import(module: str) -> List[Tuple[str, int, int]]:
+    """Imports the module in a new interpreter and returns `(name, self_us, cumulative_us)` for every loaded module."""
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    timings = []
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        timings.append((name.strip(), int(self_us), int(cumulative_us)))
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES, help='Modules to import')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of runs, the best one is reported')
+    parser.add_argument('--top', type=int, default=10, help='Number of the slowest dependencies to show')
+    parser.add_argument('--output', help='Path to save the results to')
+    parser.add_argument('--baseline', help='Path to the results to compare with')
+    parser.add_argument('--max-regression', type=float, default=0.1, help='Allowed relative slowdown')
+    args = parser.parse_args()
+
+    results: Dict[str, int] = {}
+    for module in args.modules:
+        runs = [measure_import(module) for _ in range(args.repeat)]
+        best = min(runs, key=lambda timings: timings[-1][2])
+        results[module] = best[-1][2]
+        print(f'{module:<32} {results[module] / 1000:9.1f} ms')
+        for name, _, cumulative_us in sorted(best[:-1], key=lambda timing: -timing[2])[:args.top]:
+            print(f'    {name:<56} {cumulative_us / 1000:9.1f} ms')
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump({'version': __version__, 'import_time_us': results}, output_file, indent=4)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        print(f'Compared with {baseline["version"]}:')
+        failed = False
+        for module, import_time in results.items():
+            baseline_time = baseline['import_time_us'].get(module)
+            if baseline_time is None:
+                continue
+            change = import_time / baseline_time - 1
+            failed = failed or change > args.max_regression
+            print(f'{module:<32} {change:+9.1%}')
+        if failed:
+            sys.exit(f'Import time regressed by more than {args.max_regression:.0%}')
+
+
+if __name__ == '__main__':
+    main()
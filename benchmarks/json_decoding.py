@@ -0,0 +1,111 @@
+"""Compares the default and the fast JSON decoders on a page of assignments.
+
+Usage:
+    python benchmarks/json_decoding.py [path/to/recorded/page.json] [--repeat N]
+
+If no recorded page is given, a page of 10 000 synthetic assignments is generated. A recorded page is a response body
+of `GET /api/v1/assignments?limit=10000`.
+"""
+
+import argparse
+import gc
+import random
+import time
+from decimal import Decimal
+
+import simplejson
+
+from toloka.client import structure
+from toloka.client.search_results import AssignmentSearchResult
+from toloka.util._json import fast_json_loads
+
+
+def generate_page(count: int = 10000) -> bytes:
+    rnd = random.Random(0)
+    items = []
+    for i in range(count):
+        items.append({
+            'id': f'00001a2b3c--{i:024x}',
+            'task_suite_id': f'00001a2b3c--{i // 5:024x}',
+            'pool_id': '1234567',
+            'user_id': f'{rnd.getrandbits(128):032x}',
+            'status': rnd.choice(['SUBMITTED', 'ACCEPTED', 'REJECTED']),
+            'reward': Decimal(rnd.randint(1, 500)) / 100,
+            'mixed': True,
+            'automerged': False,
+            'created': '2021-06-01T10:00:00.123',
+            'submitted': '2021-06-01T10:05:12.456',
+            'tasks': [
+                {
+                    'id': f'00001a2b3c--{i * 5 + j:024x}',
+                    'pool_id': '1234567',
+                    'input_values': {'image': f'https://example.com/{i}/{j}.png', 'score': rnd.random()},
+                    'overlap': 3,
+                }
+                for j in range(5)
+            ],
+            'solutions': [
+                {'output_values': {'label': rnd.choice(['cat', 'dog']), 'confidence': rnd.random()}}
+                for _ in range(5)
+            ],
+        })
+    return simplejson.dumps({'items': items, 'has_more': True}).encode()
+
+
+def measure(name: str, func, repeat: int, count: int) -> None:
+    # Like timeit, measure without garbage collection pauses
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    best = min(timings)
+    print(f'{name:<32} {best * 1000:9.1f} ms {count / best:12.0f} assignments/s')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('page', nargs='?', help='Path to a recorded response with assignments')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of runs, the best one is reported')
+    args = parser.parse_args()
+
+    if args.page:
+        with open(args.page, 'rb') as page_file:
+            body = page_file.read()
+    else:
+        body = generate_page()
+    count = len(simplejson.loads(body)['items'])
+    print(f'Page: {len(body) / 2 ** 20:.1f} MiB, {count} assignments')
+
+    def default_loads():
+        return simplejson.loads(body, parse_float=Decimal)
+
+    measure('decode (default)', default_loads, args.repeat, count)
+    measure(
+        'decode + structure (default)',
+        lambda: structure(default_loads(), AssignmentSearchResult),
+        args.repeat,
+        count,
+    )
+
+    if fast_json_loads is None:
+        print('Neither orjson nor simdjson is installed, skipping the fast decoder')
+        return
+
+    name = fast_json_loads.__module__ or 'fast'
+    measure(f'decode ({name})', lambda: fast_json_loads(body), args.repeat, count)
+    measure(
+        f'decode + structure ({name})',
+        lambda: structure(fast_json_loads(body), AssignmentSearchResult),
+        args.repeat,
+        count,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""Measures memory taken by structured objects of the main entities.
+
+Usage:
+    python benchmarks/memory.py [--count N]
+
+Objects are structured from typical API responses, the memory is measured with `tracemalloc` and includes nested
+objects, e.g. tasks and solutions of an assignment. Values shared between objects, like interned strings, are not
+counted.
+"""
+
+import argparse
+import gc
+import tracemalloc
+from decimal import Decimal
+
+import simplejson
+
+from json_decoding import generate_page
+from toloka.client import structure
+from toloka.client.assignment import Assignment
+from toloka.client.operation_log import OperationLogItem
+from toloka.client.task import Task
+from toloka.client.task_suite import TaskSuite
+from toloka.client.user_bonus import UserBonus
+from toloka.client.user_skill import UserSkill
+
+
+def generate_data(count: int) -> dict:
+    assignments = simplejson.loads(generate_page(count), parse_float=Decimal)['items']
+    tasks = [task for assignment in assignments for task in assignment['tasks']][:count]
+    return {
+        Assignment: assignments,
+        Task: tasks,
+        TaskSuite: [
+            {'id': f'{i:024x}', 'pool_id': '1234567', 'tasks': tasks[i * 5 % count:i * 5 % count + 5], 'overlap': 3}
+            for i in range(count)
+        ],
+        UserBonus: [
+            {
+                'id': f'{i:024x}', 'user_id': f'{i:032x}', 'amount': Decimal('1.50'), 'assignment_id': f'{i:024x}',
+                'private_comment': 'For the good work', 'created': '2021-06-01T10:00:00.123',
+            }
+            for i in range(count)
+        ],
+        UserSkill: [
+            {
+                'id': f'{i:024x}', 'skill_id': '12345', 'user_id': f'{i:032x}', 'value': 80,
+                'exact_value': Decimal('80.5'), 'created': '2021-06-01T10:00:00.123',
+                'modified': '2021-06-01T10:00:00.123',
+            }
+            for i in range(count)
+        ],
+        OperationLogItem: [
+            {
+                'type': 'TASK_CREATE', 'success': True, 'input': {'pool_id': '1234567'},
+                'output': {'task_id': f'{i:024x}'}, 'datetime': '2021-06-01T10:00:00.123',
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def measure(type_: type, items: list) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        objects = [structure(item, type_) for item in items]
+        size = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    del objects
+    # The list holding the objects is not counted
+    return (size - 8 * len(items)) / len(items)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=10000, help='Number of objects of each type')
+    args = parser.parse_args()
+
+    for type_, items in generate_data(args.count).items():
+        structure(items[0], type_)  # Compile structure functions beforehand
+        print(f'{type_.__name__:<24} {measure(type_, items):9.0f} bytes per object')
+
+
+if __name__ == '__main__':
+    main()
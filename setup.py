@@ -36,6 +36,7 @@ setup(
         'cattrs >= 1.1.1; python_version >= "3.7.0"',
         'cached-property; python_version < "3.8.0"',
         'backports-datetime-fromisoformat; python_version < "3.7.0"',
+        'aiohttp',
         'requests',
         'urllib3',
         'pandas',
@@ -44,7 +45,11 @@ setup(
         'ipyplot',
         'jupyter-dash',
     ],
-    extras_require={'dev': ['requests-mock']},
+    extras_require={
+        'dev': ['requests-mock'],
+        'fast-json': ['orjson'],
+        'arrow': ['pyarrow'],
+    },
     include_package_data=True,
     project_urls={
         'Documentation': 'https://yandex.com/dev/toloka/toloka-kit/doc/',
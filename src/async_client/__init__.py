@@ -0,0 +1,9 @@
+__all__ = [
+    'client',
+
+    'AsyncTolokaClient',
+]
+
+from . import client
+
+from .client import AsyncTolokaClient
@@ -0,0 +1,6 @@
+__all__ = [
+    'client',
+    'AsyncTolokaClient',
+]
+from toloka.async_client import client
+from toloka.async_client.client import AsyncTolokaClient
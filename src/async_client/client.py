@@ -0,0 +1,3812 @@
+__all__ = [
+    'AsyncTolokaClient',
+]
+
+import asyncio
+import datetime
+import functools
+import logging
+import operator
+import os
+import tempfile
+import time
+
+import aiohttp
+import requests
+from decimal import Decimal
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from typing import Any, BinaryIO, Callable, Dict, Generator, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib3.exceptions import MaxRetryError
+from urllib3.response import HTTPResponse
+from urllib3.util.retry import Retry
+
+from ..__version__ import __version__
+from ..client import (
+    TolokaClient,
+    _AsyncModeCreation,
+    _CreatedIdsWindow,
+    _OperationPolls,
+    _check_parallelism,
+    _enumerate_chunks,
+    _get_attachment_path,
+    _get_next_page_request,
+    _is_attachment_saved,
+    _split_request_by_created_range,
+    _summarize_attachments_download,
+    aggregation,
+    assignment,
+    batch_create_results,
+    operations,
+    pool,
+    search_requests,
+    search_results,
+    task,
+    task_suite,
+    training,
+    structure,
+    unstructure,
+)
+from ..client.aggregation import AggregatedSolution
+from ..client.analytics_request import AnalyticsRequest
+from ..client.app import App, AppItem, AppProject, AppBatch, AppBatchCreateRequest, AppItemsCreateRequest
+from ..client.assignment import Assignment, AssignmentPatch, GetAssignmentsTsvParameters
+from ..client.attachment import Attachment
+from ..client.batch_create_results import _is_fatal_chunk_failure, _merge_batch_create_results
+from ..client.clone_results import CloneResults
+from ..client.exceptions import raise_on_api_error
+from ..client.message_thread import (
+    Folder, MessageThread, MessageThreadReply, MessageThreadFolders, MessageThreadCompose
+)
+from ..client.operation_log import OperationLogItem
+from ..client.pool import Pool, PoolPatchRequest
+from ..client.primitives.base import autocast_to_enum
+from ..client.primitives.cache import ObjectCache
+from ..client.primitives.rate_limiter import RateLimiter
+from ..client.primitives.retry import TolokaRetry
+from ..client.project import Project
+from ..client.requester import Requester
+from ..client.skill import Skill
+from ..client.task import Task
+from ..client.task_suite import TaskSuite
+from ..client.training import Training
+from ..client.user_bonus import UserBonus, UserBonusCreateRequestParameters
+from ..client.user_restriction import UserRestriction
+from ..client.user_skill import SetUserSkillRequest, UserSkill
+from ..client.webhook_subscription import WebhookSubscription
+from ..util._codegen import expand
+from ..util._iterators import aiterate_concurrently
+from ..util._json import aiter_json_array, fast_json_loads
+
+logger = logging.getLogger(__name__)
+
+
+async def _aiter(iterable):
+    for item in iterable:
+        yield item
+
+
+async def _write_content(response: requests.Response, out: BinaryIO) -> int:
+    # Streams the content of the open aiohttp response, writes are run in the default executor, so other requests are
+    # not blocked by the disk
+    loop = asyncio.get_event_loop()
+    size = 0
+    async for content in response.raw.content.iter_chunked(64 * 1024):
+        await loop.run_in_executor(None, out.write, content)
+        size += len(content)
+    return size
+
+
+async def _save_attachment(path: str, response: requests.Response) -> Optional[int]:
+    # Same as the sync version, but the content is streamed from the open aiohttp response and files are written in
+    # the default executor, so other requests are not blocked by the disk
+    loop = asyncio.get_event_loop()
+    if await loop.run_in_executor(None, _is_attachment_saved, path, response.headers):
+        return None
+    part_path = f'{path}.part'
+    out_file = await loop.run_in_executor(None, open, part_path, 'wb')
+    try:
+        size = await _write_content(response, out_file)
+    finally:
+        await loop.run_in_executor(None, out_file.close)
+    await loop.run_in_executor(None, os.replace, part_path, path)
+    return size
+
+
+class AsyncTolokaClient:
+    """Asynchronous version of `TolokaClient`.
+
+    Provides the same methods as `TolokaClient` but all of them are coroutines, and `get_*` methods return
+    asynchronous iterators. All requests are issued from the current event loop through a single pool of connections,
+    so a lot of requests can be run concurrently without threads. The same retry policy (including Toloka quotas
+    handling) as in `TolokaClient` is applied.
+
+    Args:
+        token: Your OAuth token for Toloka.
+        environment: Toloka environment: `SANDBOX` or `PRODUCTION`. See `TolokaClient`.
+        retries: The number of retries for all requests. See `TolokaClient`.
+        timeout: Connect and read timeouts in seconds. See `TolokaClient`.
+        url: Specific URL instead of Toloka environment. See `TolokaClient`.
+        retry_quotas: List of quotas that must be retried. See `TolokaClient`.
+        retryer_factory: Factory that creates `Retry` object. See `TolokaClient`.
+        max_connections: Maximum number of simultaneously open connections, i.e. the number of requests that are
+            executed concurrently. Other requests wait for a free connection. Default value: `100`.
+        prefetch_pages: The number of result pages that `get_*` methods request in advance in a background task.
+            See `TolokaClient`.
+        rate_limiter: Client-side limits on the rate of requests. Can be shared with `TolokaClient`. See `TolokaClient`.
+        fast_json: Decode responses with `orjson` or `simdjson` if one of them is installed. See `TolokaClient`.
+        cache: Cache of projects, pools, trainings, skills and the requester. Can be shared with `TolokaClient`. See
+            `TolokaClient`.
+
+    Example:
+        How to fetch assignments from many pools concurrently.
+
+        >>> async with AsyncTolokaClient(your_oauth_token, 'PRODUCTION') as toloka_client:
+        >>>     results = await asyncio.gather(*[
+        >>>         toloka_client.find_assignments(pool_id=pool_id, status='SUBMITTED')
+        >>>         for pool_id in pool_ids
+        >>>     ])
+        ...
+
+        Iterate over all tasks in the pool.
+
+        >>> async for task in toloka_client.get_tasks(pool_id='1'):
+        >>>     print(task.id)
+        ...
+    """
+
+    Environment = TolokaClient.Environment
+
+    def __init__(
+        self,
+        token: str,
+        environment: Union[TolokaClient.Environment, str, None] = None,
+        retries: Union[int, Retry] = 3,
+        timeout: Union[float, Tuple[float, float]] = 10.0,
+        url: Optional[str] = None,
+        retry_quotas: Union[List[str], str, None] = TolokaRetry.Unit.MIN,
+        retryer_factory: Optional[Callable[[], Retry]] = None,
+        max_connections: int = 100,
+        prefetch_pages: int = 0,
+        rate_limiter: Optional[RateLimiter] = None,
+        fast_json: bool = False,
+        cache: Optional[ObjectCache] = None,
+    ):
+        sync_client = TolokaClient(
+            token, environment, retries, timeout, url, retry_quotas, retryer_factory, prefetch_pages, rate_limiter,
+            fast_json, cache,
+        )
+        self.token = sync_client.token
+        self.url = sync_client.url
+        self.default_timeout = sync_client.default_timeout
+        self.retryer_factory = sync_client.retryer_factory
+        self.prefetch_pages = sync_client.prefetch_pages
+        self.rate_limiter = sync_client.rate_limiter
+        self.fast_json = sync_client.fast_json
+        self.cache = sync_client.cache
+        self.max_connections = max_connections
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._http_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def from_sync_client(cls, toloka_client: TolokaClient, max_connections: int = 100) -> 'AsyncTolokaClient':
+        """Creates asynchronous client with the same settings as the given `TolokaClient`.
+
+        Args:
+            toloka_client: Synchronous client to take settings from.
+            max_connections: Maximum number of simultaneously open connections.
+
+        Returns:
+            AsyncTolokaClient: New client instance.
+        """
+        return cls(
+            toloka_client.token,
+            url=toloka_client.url,
+            timeout=toloka_client.default_timeout,
+            retryer_factory=toloka_client.retryer_factory,
+            max_connections=max_connections,
+            prefetch_pages=toloka_client.prefetch_pages,
+            rate_limiter=toloka_client.rate_limiter,
+            fast_json=toloka_client.fast_json,
+            cache=toloka_client.cache,
+        )
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['_http_session'] = None
+        state['_http_session_loop'] = None
+        return state
+
+    async def __aenter__(self) -> 'AsyncTolokaClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes all open connections."""
+        if self._http_session is not None:
+            await self._http_session.close()
+        self._http_session = None
+        self._http_session_loop = None
+
+    def _make_timeout(self, timeout: Union[float, Tuple[float, float], None]) -> aiohttp.ClientTimeout:
+        if timeout is None:
+            return aiohttp.ClientTimeout(total=None)
+        connect_timeout, read_timeout = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        return aiohttp.ClientTimeout(total=None, sock_connect=connect_timeout, sock_read=read_timeout)
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_event_loop()
+        if self._http_session is None or self._http_session.closed or self._http_session_loop is not loop:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                headers={
+                    'Authorization': f'OAuth {self.token}',
+                    'User-Agent': f'python-toloka-client-{__version__}',
+                },
+            )
+            self._http_session_loop = loop
+        return self._http_session
+
+    async def _send(self, method: str, url: str, stream_body: bool = False, **kwargs) -> requests.Response:
+        http_response = await self._get_http_session().request(method, url, **kwargs)
+        response = requests.Response()
+        response.status_code = http_response.status
+        response.headers = CaseInsensitiveDict(http_response.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = str(http_response.url)
+        if stream_body and 200 <= http_response.status < 300:
+            # Closed together with the response by the caller
+            response.raw = http_response
+            return response
+
+        async with http_response:
+            response._content = await http_response.read()
+        response._content_consumed = True
+        return response
+
+    async def _raw_request(self, method, path, stream_body: bool = False, **kwargs) -> requests.Response:
+        """Sends a request with retries.
+
+        The body of the response is read completely, unless `stream_body` is set: then the body of a successful
+        response is left in `response.raw` as an open `aiohttp.ClientResponse`, and the response must be closed by
+        the caller.
+        """
+
+        # Fixing capitalisation in boolean parameters
+        if kwargs.get('params'):
+            params = kwargs['params']
+            for key, value in params.items():
+                if isinstance(value, bool):
+                    params[key] = 'true' if value else 'false'
+        if 'stream' in kwargs:
+            raise TypeError('AsyncTolokaClient does not support the stream argument, use stream_body instead')
+        kwargs['timeout'] = self._make_timeout(kwargs.get('timeout', self.default_timeout))
+
+        if self.rate_limiter is not None:
+            delay = self.rate_limiter.reserve(method, path)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        url = f'{self.url}/api{path}'
+        method = method.upper()
+        retry = self.retryer_factory()
+        while True:
+            try:
+                response = await self._send(method, url, stream_body, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+                try:
+                    retry = retry.increment(method, url, error=exc)
+                except MaxRetryError:
+                    raise exc
+                logger.warning('Retrying (%r) after connection broken by %r: %s', retry, exc, path)
+                await asyncio.sleep(retry.get_backoff_time())
+                continue
+
+            has_retry_after = bool(response.headers.get('Retry-After'))
+            if not retry.is_retry(method, response.status_code, has_retry_after):
+                break
+
+            urllib3_response = HTTPResponse(
+                body=response.content,
+                headers=dict(response.headers),
+                status=response.status_code,
+                preload_content=False,
+            )
+            try:
+                retry = retry.increment(method, url, response=urllib3_response)
+            except MaxRetryError:
+                # Let the caller see the API error from the last response
+                break
+            retry_after = retry.get_retry_after(urllib3_response) if retry.respect_retry_after_header else None
+            await asyncio.sleep(retry_after if retry_after is not None else retry.get_backoff_time())
+
+        if method.lower() != 'get':
+            # The object may have changed even if the request failed
+            self._invalidate_cache(path)
+        raise_on_api_error(response)
+        return response
+
+    def _invalidate_cache(self, path):
+        if self.cache is not None:
+            self.cache.invalidate(ObjectCache.get_key(path))
+
+    async def _cached_request(self, path):
+        if self.cache is None:
+            return await self._request('get', path)
+        response = self.cache.get(path)
+        if response is None:
+            response = await self._request('get', path)
+            self.cache.put(path, response)
+        return response
+
+    async def _request(self, method, path, **kwargs):
+        response = await self._raw_request(method, path, **kwargs)
+        if self.fast_json and fast_json_loads is not None:
+            return fast_json_loads(response.content)
+        return response.json(parse_float=Decimal)
+
+    async def _search_request(self, method, path, request, sort, limit):
+        params = unstructure(request) or {}
+        if sort is not None:
+            params['sort'] = unstructure(sort)
+        if limit:
+            params['limit'] = limit
+        return await self._request(method, path, params=params)
+
+    async def _find_all_pages(self, find_function, request, sort_field: str, items_field: str):
+        while request is not None:
+            result = await find_function(request, sort=[sort_field])
+            yield result
+            request = _get_next_page_request(request, result, sort_field, items_field)
+
+    async def _find_all(self, find_function, request, sort_field: str = 'id', items_field: str = 'items'):
+        pages_factory = functools.partial(self._find_all_pages, find_function, request, sort_field, items_field)
+        if self.prefetch_pages:
+            # Next pages are requested in the background as soon as the previous ones are received
+            pages = aiterate_concurrently([pages_factory], buffer_size=self.prefetch_pages)
+        else:
+            pages = pages_factory()
+        async for result in pages:
+            for item in getattr(result, items_field):
+                yield item
+
+    async def _split_request_by_created(self, find_function, request, parallelism: int):
+        _check_parallelism(parallelism)
+        first_items = (await find_function(request, sort=['created'], limit=1)).items
+        if not first_items:
+            return []
+        last_items = (await find_function(request, sort=['-created'], limit=1)).items
+        return _split_request_by_created_range(request, first_items[0].created, last_items[0].created, parallelism)
+
+    async def _find_all_in_partitions(self, find_function, request, parallelism: int, ordered: bool,
+                                      buffer_size: int = 1000):
+        partitions = await self._split_request_by_created(find_function, request, parallelism)
+        items = aiterate_concurrently(
+            [functools.partial(self._find_all, find_function, partition) for partition in partitions],
+            key=operator.attrgetter('id') if ordered else None,
+            buffer_size=buffer_size,
+        )
+        async for item in items:
+            yield item
+
+    async def _create_in_chunks(self, create_chunk, objects, parameters, result_type, chunk_size: int,
+                                parallelism: int):
+        skip_invalid_items = bool(getattr(parameters, 'skip_invalid_items', False))
+        chunk_futures = {}
+        loop = asyncio.get_event_loop()
+        pending = set()
+        for offset, chunk in _enumerate_chunks(objects, parameters, chunk_size, parallelism):
+            if len(pending) == parallelism:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if _is_fatal_chunk_failure(done, skip_invalid_items):
+                    break
+            future = loop.create_task(create_chunk(chunk))
+            chunk_futures[future] = offset
+            pending.add(future)
+        if pending:
+            await asyncio.wait(pending)
+        return _merge_batch_create_results(result_type, chunk_futures, skip_invalid_items)
+
+    async def _download_attachment_to_dir(self, attachment, out_dir):
+        if isinstance(attachment, str):
+            attachment = await self.get_attachment(attachment)
+        path = _get_attachment_path(out_dir, attachment)
+        with await self._raw_request('get', f'/v1/attachments/{attachment.id}/download', stream_body=True) as response:
+            return attachment.id, path, await _save_attachment(path, response)
+
+    async def _download_attachments(self, attachments, out_dir, parallelism: int):
+        _check_parallelism(parallelism)
+        if not hasattr(attachments, '__aiter__'):
+            attachments = _aiter(attachments)
+        os.makedirs(out_dir, exist_ok=True)
+        started = time.monotonic()
+        results = []
+        loop = asyncio.get_event_loop()
+        pending = set()
+        async for attachment in attachments:
+            if len(pending) == parallelism:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                results.extend(future.result() for future in done)
+            pending.add(loop.create_task(self._download_attachment_to_dir(attachment, out_dir)))
+        if pending:
+            done, _ = await asyncio.wait(pending)
+            results.extend(future.result() for future in done)
+        return _summarize_attachments_download(results, time.monotonic() - started)
+
+    async def _create_user_bonuses_chunk(self, user_bonuses, parameters):
+        response = await self._request(
+            'post', '/v1/user-bonuses', json=unstructure(user_bonuses),
+            params=({} if parameters is None else unstructure(parameters)),
+        )
+        return structure(response, batch_create_results.UserBonusBatchCreateResult)
+
+    async def _wait_operations(self, ops, timeout):
+        polls = _OperationPolls(ops, timeout)
+        for op in polls.completed:
+            yield op
+        while polls:
+            poll, time_to_wait = polls.pop()
+            if time_to_wait > 0:
+                await asyncio.sleep(time_to_wait)
+            updated_op = await self.get_operation(poll[2].id)
+            if updated_op.is_completed():
+                yield updated_op
+            else:
+                polls.push(poll, updated_op)
+
+    async def _iter_operation_log(self, operation_id):
+        response = await self._raw_request('get', f'/v1/operations/{operation_id}/log', stream_body=True)
+        with response:
+            async for log_item in aiter_json_array(response.raw.content.iter_chunked(64 * 1024)):
+                yield structure(log_item, OperationLogItem)
+
+    async def _find_created(self, find_function, pool_id, ids, batch_size=1000):
+        window = _CreatedIdsWindow(ids, batch_size)
+        while window:
+            for obj in window.take(await find_function(pool_id=pool_id, sort='id', **window.get_params())):
+                yield obj
+
+    async def _sync_via_async(self, objects, parameters, url, result_type, operation_type, output_id_field, find_function):
+        if not parameters.async_mode:
+            response = await self._request('post', url, json=unstructure(objects), params=unstructure(parameters))
+            return structure(response, result_type)
+
+        # Emulates synchronous operation, through asynchronous calls and reading operation logs.
+        creation = _AsyncModeCreation(objects, output_id_field)
+        response = await self._request('post', url, json=unstructure(objects), params=unstructure(parameters))
+        insert_operation = structure(response, operation_type)
+        insert_operation = await self.wait_operation(insert_operation, datetime.timedelta(minutes=60))
+        async for log_item in self.iter_operation_log(insert_operation.id):
+            creation.add_log_item(log_item)
+        creation.check_created()
+
+        created_objects = []
+        for pool_id, created_ids in creation.created_ids_by_pool.items():
+            async for obj in self._find_created(find_function, pool_id, created_ids.keys()):
+                created_objects.append(obj)
+        return creation.get_result(result_type, created_objects)
+
+    @expand('request')
+    async def aggregate_solutions_by_pool(self, request: aggregation.PoolAggregatedSolutionRequest) -> operations.AggregatedSolutionOperation:
+        """Starts aggregation of solutions in the pool
+
+        Responses to all completed tasks will be aggregated.
+        The method only starts the aggregation and returns the operation for further tracking.
+
+        **Note**: In all aggregation purposes we are strongly recommending using our crowd-kit library, that have more aggregation
+        methods and can perform on your computers: https://github.com/Toloka/crowd-kit
+
+        Args:
+            request: Parameters describing in which pool to aggregate solutions and by what rules.
+
+        Returns:
+            operations.AggregatedSolutionOperation: An operation upon completion of which you can get the results of the aggregation.
+
+        Example:
+            How to start aggregating solutions by pool.
+
+            >>> aggregation_operation = toloka_client.aggregate_solutions_by_pool(
+            >>>         type=toloka.aggregation.AggregatedSolutionType.WEIGHTED_DYNAMIC_OVERLAP,
+            >>>         pool_id=some_existing_pool_id,   # Aggregate in this pool
+            >>>         answer_weight_skill_id=some_skill_id,   # Aggregate by this skill
+            >>>         fields=[toloka.aggregation.PoolAggregatedSolutionRequest.Field(name='result')]  # Aggregate this field
+            >>>     )
+            >>> aggregation_operation = toloka_client.wait_operation(aggregation_operation)
+            >>> # Now you can call "find_aggregated_solutions"
+            ...
+        """
+        data = unstructure(request)
+        response = await self._request('post', '/v1/aggregated-solutions/aggregate-by-pool', json=data)
+        return structure(response, operations.AggregatedSolutionOperation)
+
+    @expand('request')
+    async def aggregate_solutions_by_task(self, request: aggregation.WeightedDynamicOverlapTaskAggregatedSolutionRequest) -> AggregatedSolution:
+        """Starts aggregation of solutions to a single task
+
+        The method only starts the aggregation and returns the operation for further tracking.
+
+        Args:
+            request: Parameters describing on which task to aggregate solutions and by what rules.
+
+        Returns:
+            AggregatedSolution: Result of aggregation. Also contains input parameters and result confidence.
+
+        Example:
+            How to aggregate solutions to a task.
+
+            >>> aggregation_operation = toloka_client.aggregate_solutions_by_task(
+            >>>         type=toloka.aggregation.AggregatedSolutionType.WEIGHTED_DYNAMIC_OVERLAP,
+            >>>         pool_id=some_existing_pool_id,   # Task in this pool
+            >>>         task_id=some_existing_task_id,   # Aggregate on this task
+            >>>         answer_weight_skill_id=some_skill_id,   # Aggregate by this skill
+            >>>         fields=[toloka.aggregation.PoolAggregatedSolutionRequest.Field(name='result')]  # Aggregate this field
+            >>>     )
+            >>> print(aggregation_operation.output_values['result'])
+            ...
+        """
+        response = await self._request('post', '/v1/aggregated-solutions/aggregate-by-task', json=unstructure(request))
+        return structure(response, AggregatedSolution)
+
+    @expand('request')
+    async def find_aggregated_solutions(self, operation_id: str, request: search_requests.AggregatedSolutionSearchRequest,
+                                  sort: Union[List[str], search_requests.AggregatedSolutionSortItems, None] = None,
+                                  limit: Optional[int] = None,
+                                  lazy: bool = False) -> search_results.AggregatedSolutionSearchResult:
+        """Gets aggregated responses after the AggregatedSolutionOperation completes.
+        It is better to use the "get_aggregated_solutions" method, that allows to iterate through all results.
+
+        **Note**: In all aggregation purposes we are strongly recommending using our crowd-kit library, that have more aggregation
+        methods and can perform on your computers: https://github.com/Toloka/crowd-kit
+
+        Args:
+            operation_id: From what aggregation operation you want to get results.
+            request: How to filter search results.
+            sort: How to sort results. Defaults to None.
+            limit: Limit on the number of results returned. The maximum is 100,000.
+                Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found solutions are `LazyObject` views which structure fields on first access.
+                Defaults to False.
+
+        Returns:
+            search_results.AggregatedSolutionSearchResult: The first `limit` solutions in `items`. And a mark that there is more.
+
+        Example:
+            How to get all aggregated solutions from pool.
+
+            >>> # run toloka_client.aggregate_solutions_by_pool and wait operation for closing.
+            >>> current_result = toloka_client.find_aggregated_solutions(aggregation_operation.id)
+            >>> aggregation_results = current_result.items
+            >>> # If we have more results, let's get them
+            >>> while current_result.has_more:
+            >>>     current_result = toloka_client.find_aggregated_solutions(
+            >>>         aggregation_operation.id,
+            >>>         task_id_gt=current_result.items[len(current_result.items) - 1].task_id,
+            >>>     )
+            >>>     aggregation_results = aggregation_results + current_result.items
+            >>> print(len(aggregation_results))
+            ...
+        """
+        sort = None if sort is None else structure(sort, search_requests.AggregatedSolutionSortItems)
+        response = await self._search_request('get', f'/v1/aggregated-solutions/{operation_id}', request, sort, limit)
+        return search_results.AggregatedSolutionSearchResult.structure(response, lazy=lazy)
+
+    @expand('request')
+    def get_aggregated_solutions(self, operation_id: str, request: search_requests.AggregatedSolutionSearchRequest, lazy: bool = False) -> Generator[AggregatedSolution, None, None]:
+        """Finds all aggregated responses after the AggregatedSolutionOperation completes
+
+        **Note**: In all aggregation purposes we are strongly recommending using our crowd-kit library, that have more aggregation
+        methods and can perform on your computers: https://github.com/Toloka/crowd-kit
+
+        Args:
+            operation_id: From what aggregation operation you want to get results.
+            request: How to filter search results.
+            lazy: If `True`, solutions are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
+
+        Yields:
+            AggregatedSolution: The next object corresponding to the request parameters.
+
+        Example:
+            How to get all aggregated solutions from pool.
+
+            >>> # run toloka_client.aggregate_solutions_by_pool and wait operation for closing.
+            >>> aggregation_results = list(toloka_client.get_aggregated_solutions(aggregation_operation.id))
+            ...
+        """
+        find_function = functools.partial(self.find_aggregated_solutions, operation_id, lazy=lazy)
+        return self._find_all(find_function, request, sort_field='task_id')
+
+    async def accept_assignment(self, assignment_id: str, public_comment: str) -> Assignment:
+        """Marks one assignment as accepted
+
+        Used then your pool created with auto_accept_solutions=False parametr.
+
+        Args:
+            assignment_id: What assignment will be accepted.
+            public_comment: Message to the performer.
+
+        Returns:
+            Assignment: Object with new status.
+
+        Example:
+            How to accept one assignment.
+
+            >>> toloka_client.accept_assignment(assignment_id, 'Well done!')
+            ...
+        """
+        return await self.patch_assignment(assignment_id, public_comment=public_comment, status=Assignment.ACCEPTED)
+
+    @expand('request')
+    async def find_assignments(self, request: search_requests.AssignmentSearchRequest,
+                         sort: Union[List[str], search_requests.AssignmentSortItems, None] = None,
+                         limit: Optional[int] = None,
+                         lazy: bool = False) -> search_results.AssignmentSearchResult:
+        """Finds all assignments that match certain rules
+
+        As a result, it returns an object that contains the first part of the found assignments and whether there
+        are any more results.
+        It is better to use the "get_assignments" method, they allow to iterate trought all results
+        and not just the first output.
+
+        Args:
+            request: How to search assignments.
+            sort: How to sort result. Defaults to None.
+            limit: Limit on the number of assignments returned. The maximum is 100,000.
+                Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found assignments are `LazyObject` views which structure fields on first access.
+                Defaults to False.
+
+        Returns:
+            search_results.AssignmentSearchResult: The first `limit` assignments in `items`. And a mark that there is more.
+
+        Example:
+            Search for `SKIPPED` or `EXPIRED` assignments in the specified pool.
+
+            >>> toloka_client.find_assignments(pool_id='1', status = ['SKIPPED', 'EXPIRED'])
+            ...
+
+            If method finds more objects than custom or system `limit` allows to operate, it will also show an indicator `has_more=True`.
+        """
+        sort = None if sort is None else structure(sort, search_requests.AssignmentSortItems)
+        response = await self._search_request('get', '/v1/assignments', request, sort, limit)
+        return search_results.AssignmentSearchResult.structure(response, lazy=lazy)
+
+    async def get_assignment(self, assignment_id: str) -> Assignment:
+        """Reads one specific assignment
+
+        Args:
+            assignment_id: ID of assignment.
+
+        Returns:
+            Assignment: The solution read as a result.
+
+        Example:
+            >>> toloka_client.get_assignment(assignment_id='1')
+            ...
+        """
+        response = await self._request('get', f'/v1/assignments/{assignment_id}')
+        return structure(response, Assignment)
+
+    @expand('request')
+    def get_assignments(self, request: search_requests.AssignmentSearchRequest, parallelism: int = 1,
+                        ordered: bool = True, lazy: bool = False) -> Generator[Assignment, None, None]:
+        """Finds all assignments that match certain rules and returns them in an iterable object
+
+        Unlike find_assignments, returns generator. Does not sort assignments.
+        While iterating over the result, several requests to the Toloka server is possible.
+
+        Args:
+            request: How to search assignments.
+            parallelism: The number of concurrent requests. If it is greater than 1, the creation time range of
+                matching assignments is split into `parallelism` parts which are fetched concurrently.
+                Default value: `1`.
+            ordered: If `True`, assignments are yielded sorted by ID, the same way as without `parallelism`. Otherwise
+                they are yielded as soon as they are fetched, which is faster. Only used if `parallelism` is
+                greater than 1.
+                Default value: `True`.
+            lazy: If `True`, assignments are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
+
+        Yields:
+            Assignment: The next object corresponding to the request parameters.
+
+        Example:
+            Let’s make a list of `assignment_id` of all `SUBMITTED` assignments in the specified pool.
+
+            >>> from toloka.client import Assignment
+            >>> assignments = toloka_client.get_assignments(pool_id='1', status=Assignment.SUBMITTED)
+            >>> result_list = [assignment.id for assignment in assignments]
+            ...
+        """
+        find_function = functools.partial(self.find_assignments, lazy=lazy)
+        if parallelism > 1:
+            return self._find_all_in_partitions(find_function, request, parallelism, ordered)
+        return self._find_all(find_function, request)
+
+    @expand('patch')
+    async def patch_assignment(self, assignment_id: str, patch: AssignmentPatch) -> Assignment:
+        """Changes status and comment on assignment
+
+        It's better to use methods "reject_assignment" and "accept_assignment".
+
+        Args:
+            assignment_id: What assignment will be affected.
+            patch: Object with new status and comment.
+
+        Returns:
+            Assignment: Object with new status.
+
+        Example:
+            >>> toloka_client.patch_assignment(assignment_id='1', public_comment='Some issues present, but work is acceptable', status='ACCEPTED')
+            ...
+        """
+        response = await self._request('patch', f'/v1/assignments/{assignment_id}', json=unstructure(patch))
+        return structure(response, Assignment)
+
+    async def reject_assignment(self, assignment_id: str, public_comment: str) -> Assignment:
+        """Marks one assignment as rejected
+
+        Used then your pool created with auto_accept_solutions=False parametr.
+
+        Args:
+            assignment_id: What assignment will be rejected.
+            public_comment: Message to the performer.
+
+        Returns:
+            Assignment: Object with new status.
+
+        Example:
+            Reject an assignment that was completed too fast.
+
+            >>> toloka_client.reject_assignment(assignment_id='1', 'Assignment was completed too fast.')
+            ...
+        """
+        return await self.patch_assignment(assignment_id, public_comment=public_comment, status=Assignment.REJECTED)
+
+    @expand('request')
+    async def find_attachments(self, request: search_requests.AttachmentSearchRequest,
+                         sort: Union[List[str], search_requests.AttachmentSortItems, None] = None,
+                         limit: Optional[int] = None,
+                         lazy: bool = False) -> search_results.AttachmentSearchResult:
+        """Finds all attachments that match certain rules
+
+        As a result, it returns an object that contains the first part of the found attachments and whether there
+        are any more results.
+        It is better to use the "get_attachments" method, they allow to iterate trought all results
+        and not just the first output.
+
+        Args:
+            request: How to search attachments.
+            sort: How to sort result. Defaults to None.
+            limit: Limit on the number of results returned. The maximum is 100,000.
+                Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found attachments are `LazyObject` views which structure fields on first access.
+                Defaults to False.
+
+        Returns:
+            search_results.AttachmentSearchResult: The first `limit` assignments in `items`. And a mark that there is more.
+
+        Example:
+            Let's find attachments in the pool and sort them by id and date of creation.
+
+            >>> toloka_client.find_attachments(pool_id='1', sort=['-created', '-id'], limit=10)
+            ...
+
+            If method finds more objects than custom or system `limit` allows to operate, it will also show an indicator `has_more=True`.
+        """
+        sort = None if sort is None else structure(sort, search_requests.AttachmentSortItems)
+        response = await self._search_request('get', '/v1/attachments', request, sort, limit)
+        return search_results.AttachmentSearchResult.structure(response, lazy=lazy)
+
+    async def get_attachment(self, attachment_id: str) -> Attachment:
+        """Gets attachment metadata without downloading it
+
+        To download attachments as a file use "TolokaClient.download_attachment" method.
+
+        Args:
+            attachment_id: ID of attachment.
+
+        Returns:
+            Attachment: The attachment metadata read as a result.
+
+        Example:
+            Specify an `attachment_id` to get the information about any attachment object.
+
+            >>> toloka_client.get_attachment(attachment_id='1')
+            ...
+        """
+        response = await self._request('get', f'/v1/attachments/{attachment_id}')
+        return structure(response, Attachment)
+
+    @expand('request')
+    def get_attachments(self, request: search_requests.AttachmentSearchRequest, lazy: bool = False) -> Generator[Attachment, None, None]:
+        """Finds all attachments that match certain rules and returns their metadata in an iterable object
+
+        Unlike find_attachments, returns generator. Does not sort attachments.
+        While iterating over the result, several requests to the Toloka server is possible.
+
+        Args:
+            request: How to search attachments.
+            lazy: If `True`, attachments are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
+
+        Yields:
+            Attachment: The next object corresponding to the request parameters.
+
+        Example:
+            Make a list of all received attachments in the specified pool.
+
+            >>> results_list = [attachment for attachment in toloka_client.get_attachments(pool_id='1')]
+            ...
+        """
+        find_function = functools.partial(self.find_attachments, lazy=lazy)
+        return self._find_all(find_function, request)
+
+    async def download_attachment(self, attachment_id: str, out: BinaryIO) -> None:
+        """Downloads specific attachment
+
+        Args:
+            attachment_id: ID of attachment.
+            out: File object where to put downloaded file.
+
+        Example:
+            How to download an attachment.
+
+            >>> with open('my_new_file.txt', 'wb') as out_f:
+            >>>     toloka_client.download_attachment(attachment_id='1', out=out_f)
+            ...
+        """
+        with await self._raw_request('get', f'/v1/attachments/{attachment_id}/download', stream_body=True) as response:
+            await _write_content(response, out)
+
+    async def download_attachments(
+        self,
+        attachments: Union[search_requests.AttachmentSearchRequest, Iterable[str]],
+        out_dir: Union[str, os.PathLike],
+        parallelism: int = 8,
+    ) -> Dict[str, str]:
+        """Downloads many attachments to a directory concurrently
+
+        Files are named `<attachment ID>_<file name>`. Every file is written chunk by chunk as it's received. A file
+        that already exists and has the same size as the attachment is not downloaded again, so an interrupted download
+        can be resumed by calling the method once more. The throughput is logged at the end.
+
+        Args:
+            attachments: How to search attachments or a list of attachment IDs.
+            out_dir: The directory where to put files. It's created if it doesn't exist.
+            parallelism: The number of attachments downloaded concurrently.
+                Default value: `8`.
+
+        Returns:
+            Dict[str, str]: Paths to the files by attachment IDs.
+
+        Example:
+            How to download all attachments from a pool.
+
+            >>> request = toloka.search_requests.AttachmentSearchRequest(pool_id='1')
+            >>> paths = toloka_client.download_attachments(request, 'attachments', parallelism=16)
+            ...
+        """
+        if isinstance(attachments, search_requests.AttachmentSearchRequest):
+            attachments = self.get_attachments(attachments)
+        return await self._download_attachments(attachments, out_dir, parallelism)
+
+    @autocast_to_enum
+    async def add_message_thread_to_folders(
+        self,
+        message_thread_id: str, folders: Union[List[Folder], MessageThreadFolders]
+    ) -> MessageThread:
+        """Adds a message chain to one or more folders ("unread", "important" etc.)
+
+        Args:
+            message_thread_id: ID of message chain.
+            folders: List of folders, where to move chain.
+
+        Returns:
+            MessageThread: Full object by ID with updated folders.
+
+        Example:
+            >>> toloka_client.add_message_thread_to_folders(message_thread_id='1', folders=['IMPORTANT'])
+            ...
+        """
+        if not isinstance(folders, MessageThreadFolders):
+            folders = structure({'folders': folders}, MessageThreadFolders)
+        response = await self._request('post', f'/v1/message-threads/{message_thread_id}/add-to-folders', json=unstructure(folders))
+        return structure(response, MessageThread)
+
+    @expand('compose')
+    async def compose_message_thread(self, compose: MessageThreadCompose) -> MessageThread:
+        """Sends message to performer
+
+        The sent message is added to a new message thread.
+
+        Args:
+            compose: Message parameters.
+
+        Returns:
+            MessageThread: New created thread.
+
+        Example:
+            If you want to thank Toloka performers who have tried to complete your tasks, send them a nice message.
+
+            >>> message_text = 'Amazing job! We\'ve just trained our first model with the data YOU prepared for us. Thank you!'
+            >>> toloka_client.compose_message_thread(
+            >>>     recipients_select_type='ALL',
+            >>>     topic={'EN':'Thank you, performer!'},
+            >>>     text={'EN': message_text},
+            >>>     answerable=False
+            >>> )
+            ...
+        """
+        response = await self._request('post', '/v1/message-threads/compose', json=unstructure(compose))
+        return structure(response, MessageThread)
+
+    @expand('request')
+    async def find_message_threads(self, request: search_requests.MessageThreadSearchRequest,
+                             sort: Union[List[str], search_requests.MessageThreadSortItems, None] = None,
+                             limit: Optional[int] = None,
+                             lazy: bool = False) -> search_results.MessageThreadSearchResult:
+        """Finds all message threads that match certain rules
+
+        As a result, it returns an object that contains the first part of the found threads and whether there
+        are any more results.
+        It is better to use the "get_message_threads" method, they allow to iterate trought all results
+        and not just the first output.
+
+        Args:
+            request:  How to search threads.
+            sort: How to sort result. Defaults to None.
+            limit: Limit on the number of results returned. The maximum is 300.
+                Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found message threads are `LazyObject` views which structure fields on first access.
+                Defaults to False.
+
+        Returns:
+            search_results.MessageThreadSearchResult: The first `limit` message threads in `items`.
+                And a mark that there is more.
+
+        Example:
+            Find all message threads in the Inbox folder.
+
+            >>> toloka_client.find_message_threads(folder='INBOX')
+            ...
+        """
+        sort = None if sort is None else structure(sort, search_requests.MessageThreadSortItems)
+        response = await self._search_request('get', '/v1/message-threads', request, sort, limit)
+        return search_results.MessageThreadSearchResult.structure(response, lazy=lazy)
+
+    async def reply_message_thread(self, message_thread_id: str, reply: MessageThreadReply) -> MessageThread:
+        """Replies to a message in thread
+
+        Args:
+            message_thread_id: In which thread to reply.
+            reply: Reply message.
+
+        Returns:
+            MessageThread: New created message.
+
+        Example:
+            >>> message_threads = toloka_client.get_message_threads(folder='UNREAD')
+            >>> message_reply = {'EN': 'Thank you for your message! I will get back to you soon.'}
+            >>> for thread in message_threads:
+            >>>     toloka_client.reply_message_thread(message_thread_id=thread.id, reply=toloka.message_thread.MessageThreadReply(text=message_reply))
+            ...
+        """
+        response = await self._request('post', f'/v1/message-threads/{message_thread_id}/reply', json=unstructure(reply))
+        return structure(response, MessageThread)
+
+    @expand('request')
+    def get_message_threads(self, request: search_requests.MessageThreadSearchRequest, lazy: bool = False) -> Generator[MessageThread, None, None]:
+        """Finds all message threads that match certain rules and returns them in an iterable object
+
+        Unlike find_message_threads, returns generator. Does not sort threads.
+        While iterating over the result, several requests to the Toloka server is possible.
+
+        Args:
+            request: How to search attachments.
+            lazy: If `True`, message threads are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
+
+        Yields:
+            MessageThread: The next object corresponding to the request parameters.
+
+        Example:
+            How to get all unread incoming messages.
+
+            >>> message_threads = toloka_client.get_message_threads(folder=['INBOX', 'UNREAD'])
+            ...
+        """
+        find_function = functools.partial(self.find_message_threads, lazy=lazy)
+        return self._find_all(find_function, request)
+
+    @autocast_to_enum
+    async def remove_message_thread_from_folders(self, message_thread_id: str, folders: Union[List[Folder], MessageThreadFolders]) -> MessageThread:
+        """Deletes a message chain from one or more folders ("unread", "important" etc.)
+
+        Args:
+            message_thread_id: ID of message chain.
+            folders:  List of folders, where from to remove chain.
+
+        Returns:
+            MessageThread: Full object by ID with updated folders.
+
+        Example:
+            >>> toloka_client.remove_message_thread_from_folders(message_thread_id='1', folders=['IMPORTANT'])
+            ...
+        """
+        if not isinstance(folders, MessageThreadFolders):
+            folders = structure({'folders': folders}, MessageThreadFolders)
+        response = await self._request('post', f'/v1/message-threads/{message_thread_id}/remove-from-folders', json=unstructure(folders))
+        return structure(response, MessageThread)
+
+    async def archive_project(self, project_id: str) -> Project:
+        """Sends project to archive
+
+        Use it when you have no need this project anymore. To perform the operation, all pools in the project must be archived.
+        The archived project is not deleted. You can access it when you will need it.
+
+        Args:
+            project_id: ID of project that will be archived.
+
+        Returns:
+            Project: Object with updated status.
+
+        Example:
+            >>> toloka_client.archive_project(project_id='1')
+            ...
+        """
+        operation = await self.archive_project_async(project_id)
+        operation = await self.wait_operation(operation)
+        self._invalidate_cache(f'/v1/projects/{operation.parameters.project_id}')
+        return await self.get_project(operation.parameters.project_id)
+
+    async def archive_project_async(self, project_id: str) -> operations.ProjectArchiveOperation:
+        """Sends project to archive, asynchronous version
+
+        Use when you have no need this project anymore. To perform the operation, all pools in the project must be archived.
+        The archived project is not deleted. You can access it when you will need it.
+
+        Args:
+            project_id: ID of project that will be archived.
+
+        Returns:
+            ProjectArchiveOperation: An operation upon completion of which you can get the project with updated status.
+
+        Example:
+            >>> archive_op = toloka_client.archive_project_async(project_id='1')
+            >>> toloka_client.wait_operation(archive_op)
+            ...
+        """
+        response = await self._request('post', f'/v1/projects/{project_id}/archive')
+        return structure(response, operations.ProjectArchiveOperation)
+
+    async def create_project(self, project: Project) -> Project:
+        """Creates a new project
+
+        Args:
+            project: New Project with setted parameters.
+
+        Returns:
+            Project: Created project. With read-only fields.
+
+        Example:
+            How to create a new project.
+
+            >>> new_project = toloka.project.Project(
+            >>>     assignments_issuing_type=toloka.project.Project.AssignmentsIssuingType.AUTOMATED,
+            >>>     public_name='My best project',
+            >>>     public_description='Describe the picture',
+            >>>     public_instructions='Describe in a few words what is happening in the image.',
+            >>>     task_spec=toloka.project.task_spec.TaskSpec(
+            >>>         input_spec={'image': toloka.project.field_spec.UrlSpec()},
+            >>>         output_spec={'result': toloka.project.field_spec.StringSpec()},
+            >>>         view_spec=project_interface,
+            >>>     ),
+            >>> )
+            >>> new_project = toloka_client.create_project(new_project)
+            >>> print(new_project.id)
+            ...
+        """
+        response = await self._request('post', '/v1/projects', json=unstructure(project))
+        result = structure(response, Project)
+        logger.info(f'A new project with ID "{result.id}" has been created. Link to open in web interface: {self.url}/requester/project/{result.id}')
+        return result
+
+    @expand('request')
+    async def find_projects(self, request: search_requests.ProjectSearchRequest,
+                      sort: Union[List[str], search_requests.ProjectSortItems, None] = None,
+                      limit: Optional[int] = None) -> search_results.ProjectSearchResult:
+        """Finds all projects that match certain rules
+
+        As a result, it returns an object that contains the first part of the found projects and whether there
+        are any more results.
+        It is better to use the "get_projects" method, they allow to iterate trought all results
+        and not just the first output.
+
+        Args:
+            request: How to search projects.
+            sort: How to sort result. Defaults to None.
+            limit: Limit on the number of results returned. The maximum is 300.
+                Defaults to None, in which case it returns first 20 results.
+
+        Returns:
+            search_results.ProjectSearchResult: The first `limit` projects in `items`.
+                And a mark that there is more.
+
+        Example:
+            Find projects that were created before a specific date.
+
+            >>> toloka_client.find_projects(created_lt='2021-06-01T00:00:00')
+            ...
+
+            If method finds more objects than custom or system `limit` allows to operate, it will also show an indicator `has_more=True`.
+        """
+        sort = None if sort is None else structure(sort, search_requests.ProjectSortItems)
+        response = await self._search_request('get', '/v1/projects', request, sort, limit)
+        return structure(response, search_results.ProjectSearchResult)
+
+    async def get_project(self, project_id: str) -> Project:
+        """Reads one specific project
+
+        Args:
+            project_id: ID of the project.
+
+        Returns:
+            Project: The project.
+
+        Example:
+            >>> toloka_client.get_project(project_id='1')
+            ...
+        """
+        response = await self._cached_request(f'/v1/projects/{project_id}')
+        return structure(response, Project)
+
+    @expand('request')
+    def get_projects(self, request: search_requests.ProjectSearchRequest) -> Generator[Project, None, None]:
+        """Finds all projects that match certain rules and returns them in an iterable object
+
+        Unlike find_projects, returns generator. Does not sort projects.
+        While iterating over the result, several requests to the Toloka server is possible.
+
+        Args:
+            request: How to search projects.
+
+        Yields:
+            Project: The next object corresponding to the request parameters.
+
+        Example:
+            Get all active projects.
+
+            >>> active_projects = toloka_client.get_projects(status='ACTIVE')
+            ...
+
+            Get all your projects.
+
+            >>> my_projects = toloka_client.get_projects()
+            ...
+        """
+        return self._find_all(self.find_projects, request)
+
+    async def update_project(self, project_id: str, project: Project) -> Project:
+        """Makes changes to the project
+
+        Args:
+            project_id: Project ID that will be changed.
+            project: A project object with all the fields: those that will be updated and those that will not.
+
+        Returns:
+            Project: Project object with all fields.
+
+        Example:
+            >>> updated_project = toloka_client.update_project(project_id=old_project.id, project=new_project_object)
+            ...
+        """
+        response = await self._request('put', f'/v1/projects/{project_id}', json=unstructure(project))
+        return structure(response, Project)
+
+    async def clone_project(self, project_id: str, reuse_controllers: bool = True) -> CloneResults:
+        """Synchronously clones the project, all pools and trainings
+
+        Emulates cloning behaviour via Toloka interface:
+        - the same skills will be used
+        - the same quality control collectors will be used (could be changed by reuse_controllers=False)
+        - the expiration date will not be changed in the new project
+        - etc.
+
+        Doesn't have transaction - can clone project, and then raise on cloning pool.
+        Doesn't copy tasks/golden tasks/training tasks.
+
+        Args:
+            project_id: ID of the project to be cloned.
+            reuse_controllers: Use same quality controllers in cloned and created projects. Defaults to True.
+                This means that all quality control rules will be applied to both projects.
+                For example, if you have rule "fast_submitted_count", fast responses counts across both projects.
+
+        Returns:
+            Tuple[Project, List[Pool], List[Training]]: All created objects project, pools and trainings.
+
+        Example:
+
+            >>> project, pools, trainings = toloka_client.clone_project('123')
+            >>> # add tasks in pools and trainings
+            ...
+        """
+
+        def reset_quality_control(quality_control, old_to_new_train_ids):
+            if quality_control is None:
+                return
+            if not reuse_controllers:
+                for quality_control_config in quality_control.configs:
+                    quality_control_config.collector_config.uuid = None
+            if (
+                hasattr(quality_control, 'training_requirement') and
+                hasattr(quality_control.training_requirement, 'training_pool_id') and
+                quality_control.training_requirement.training_pool_id is not None
+            ):
+                new_id = old_to_new_train_ids[quality_control.training_requirement.training_pool_id]
+                quality_control.training_requirement.training_pool_id = new_id
+
+        # clone project
+        project_for_clone = await self.get_project(project_id)
+        project_quality_control = project_for_clone.quality_control
+        project_for_clone.quality_control = None
+        new_project = await self.create_project(project_for_clone)
+
+        # create trainings
+        new_trainings = []
+        old_to_new_train_ids = {}
+        async for training in self.get_trainings(project_id=project_id):  # noqa
+            old_id = training.id
+            training.project_id = new_project.id
+            new_training = await self.create_training(training)
+            new_trainings.append(new_training)
+            old_to_new_train_ids[old_id] = new_training.id
+
+        # save quality control on project
+        reset_quality_control(project_quality_control, old_to_new_train_ids)
+        if project_quality_control is not None:
+            new_project.quality_control = project_quality_control
+            new_project = await self.update_project(new_project.id, new_project)
+
+        # create new pools
+        new_pools = []
+        async for pool in self.get_pools(project_id=project_id):
+            pool.project_id = new_project.id
+            reset_quality_control(pool.quality_control, old_to_new_train_ids)
+            new_pools.append(await self.create_pool(pool))
+
+        return CloneResults(project=new_project, pools=new_pools, trainings=new_trainings)
+
+    async def archive_pool(self, pool_id: str) -> Pool:
+        """Sends pool to archive
+
+        The pool must be in the status "closed".
+        The archived pool is not deleted. You can access it when you will need it.
+
+        Args:
+            pool_id: ID of pool that will be archived.
+
+        Returns:
+            Pool: Object with updated status.
+
+        Example:
+            >>> closed_pool = next(toloka_client.get_pools(status='CLOSED'))
+            >>> toloka_client.archive_pool(pool_id=closed_pool.id)
+            ...
+        """
+        operation = await self.archive_pool_async(pool_id)
+        if operation:
+            operation = await self.wait_operation(operation)
+            operation.raise_on_fail()
+        self._invalidate_cache(f'/v1/pools/{pool_id}')
+        return await self.get_pool(pool_id)
+
+    async def archive_pool_async(self, pool_id: str) -> Optional[operations.PoolArchiveOperation]:
+        """Sends pool to archive, asynchronous version
+
+        The pool must be in the status "closed".
+        The archived pool is not deleted. You can access it when you will need it.
+
+        Args:
+            pool_id: ID of pool that will be archived.
+
+        Returns:
+            PoolArchiveOperation: An operation upon completion of which you can get the pool with updated status. If
+                pool is already archived then None is returned
+
+        Example:
+            >>> closed_pool = next(toloka_client.get_pools(status='CLOSED'))
+            >>> archive_op = toloka_client.archive_pool_async(pool_id=closed_pool.id)
+            >>> toloka_client.wait_operation(archive_op)
+            ...
+        """
+        response = await self._raw_request('post', f'/v1/pools/{pool_id}/archive')
+        # is pool already archived?
+        if response.status_code == 204:
+            return
+        return structure(response.json(), operations.PoolArchiveOperation)
+
+    async def close_pool(self, pool_id: str) -> Pool:
+        """Stops distributing tasks from the pool
+
+        If all tasks done, the pool will be closed automatically.
+
+        Args:
+            pool_id: ID of the pool that will be closed.
+
+        Returns:
+            Pool: Pool object with new status.
+
+        Example:
+            >>> open_pool = next(toloka_client.get_pools(status='OPEN'))
+            >>> toloka_client.close_pool(pool_id=open_pool.id)
+            ...
+        """
+        operation = await self.close_pool_async(pool_id)
+        if operation:
+            operation = await self.wait_operation(operation)
+            operation.raise_on_fail()
+
+        self._invalidate_cache(f'/v1/pools/{pool_id}')
+        return await self.get_pool(pool_id)
+
+    async def close_pool_async(self, pool_id: str) -> Optional[operations.PoolCloseOperation]:
+        """Stops distributing tasks from the pool, asynchronous version
+
+        If all tasks done, the pool will be closed automatically.
+
+        Args:
+            pool_id: ID of the pool that will be closed.
+
+        Returns:
+            Optional[PoolCloseOperation]: An operation upon completion of which you can get the pool with updated
+                status. If pool is already closed then None is returned.
+
+        Example:
+            >>> open_pool = next(toloka_client.get_pools(status='OPEN'))
+            >>> close_op = toloka_client.close_pool_async(pool_id=open_pool.id)
+            >>> toloka_client.wait_operation(close_op)
+            ...
+        """
+        response = await self._raw_request('post', f'/v1/pools/{pool_id}/close')
+        # is pool already closed?
+        if response.status_code == 204:
+            return None
+        return structure(response.json(), operations.PoolCloseOperation)
+
+    async def close_pool_for_update(self, pool_id: str) -> Pool:
+        """Closes pool for update
+
+        Args:
+            pool_id: ID of the pool that will be closed for update.
+
+        Returns:
+            Pool: Pool object with new status.
+
+        Example:
+            >>> toloka_client.close_pool_for_update(pool_id='1')
+            ...
+        """
+        operation = await self.close_pool_for_update_async(pool_id)
+        if operation:
+            operation = await self.wait_operation(operation)
+            operation.raise_on_fail()
+        self._invalidate_cache(f'/v1/pools/{pool_id}')
+        return await self.get_pool(pool_id)
+
+    async def close_pool_for_update_async(self, pool_id: str) -> Optional[operations.PoolCloseOperation]:
+        """Closes pool for update, asynchronous version
+
+        Args:
+            pool_id: ID of the pool that will be closed for update.
+
+        Returns:
+            Optional[PoolCloseOperation]: An operation upon completion of which you can get the pool with updated
+                status. If pool is already closed for update then None is returned.
+
+        Example:
+            >>> close_op = toloka_client.close_pool_for_update_async(pool_id='1')
+            >>> toloka_client.wait_operation(close_op)
+            ...
+        """
+        response = await self._raw_request('post', f'/v1/pools/{pool_id}/close-for-update')
+        # is pool already closed for update?
+        if response.status_code == 204:
+            return None
+        return structure(response.json(), operations.PoolCloseOperation)
+
+    async def clone_pool(self, pool_id: str) -> Pool:
+        """Duplicates existing pool
+
+        An empty pool with the same parameters will be created.
+        A new pool will be attached to the same project.
+
+        Args:
+            pool_id: ID of the existing pool.
+
+        Returns:
+            Pool: New pool.
+
+        Example:
+            >>> toloka_client.clone_pool(pool_id='1')
+            ...
+        """
+        operation = await self.clone_pool_async(pool_id)
+        operation = await self.wait_operation(operation)
+        result = await self.get_pool(operation.details.pool_id)
+        logger.info(f'A new pool with ID "{result.id}" has been cloned. Link to open in web interface: {self.url}/requester/project/{result.project_id}/pool/{result.id}')
+        return result
+
+    async def clone_pool_async(self, pool_id: str) -> operations.PoolCloneOperation:
+        """Duplicates existing pool, asynchronous version
+
+        An empty pool with the same parameters will be created.
+        A new pool will be attached to the same project.
+
+        Args:
+            pool_id: ID of the existing pool.
+
+        Returns:
+            PoolCloneOperation: An operation upon completion of which you can get the new pool.
+
+        Example:
+            >>> new_pool = toloka_client.clone_pool_async(pool_id='1')
+            >>> toloka_client.wait_operation(new_pool)
+            ...
+        """
+        response = await self._request('post', f'/v1/pools/{pool_id}/clone')
+        return structure(response, operations.PoolCloneOperation)
+
+    async def create_pool(self, pool: Pool) -> Pool:
+        """Creates a new pool
+
+        You can send a maximum of 20 requests of this kind per minute and 100 requests per day.
+
+        Args:
+            pool: New Pool with setted parameters.
+
+        Returns:
+            Pool: Created pool. With read-only fields.
+
+        Example:
+            How to create a new pool in a project.
+
+            >>> new_pool = toloka.pool.Pool(
+            >>>     project_id=existing_project_id,
+            >>>     private_name='Pool 1',
+            >>>     may_contain_adult_content=False,
+            >>>     will_expire=datetime.datetime.utcnow() + datetime.timedelta(days=365),
+            >>>     reward_per_assignment=0.01,
+            >>>     assignment_max_duration_seconds=60*20,
+            >>>     defaults=toloka.pool.Pool.Defaults(default_overlap_for_new_task_suites=3),
+            >>>     filter=toloka.filter.Languages.in_('EN'),
+            >>> )
+            >>> new_pool.set_mixer_config(real_tasks_count=10, golden_tasks_count=0, training_tasks_count=0)
+            >>> new_pool.quality_control.add_action(...)
+            >>> new_pool = toloka_client.create_pool(new_pool)
+            >>> print(new_pool.id)
+            ...
+        """
+        if pool.type == Pool.Type.TRAINING:
+            raise ValueError('Training pools are not supported')
+
+        response = await self._request('post', '/v1/pools', json=unstructure(pool))
+        result = structure(response, Pool)
+        logger.info(f'A new pool with ID "{result.id}" has been created. Link to open in web interface: {self.url}/requester/project/{result.project_id}/pool/{result.id}')
+        return result
+
+    @expand('request')
+    async def find_pools(self, request: search_requests.PoolSearchRequest,
+                   sort: Union[List[str], search_requests.PoolSortItems, None] = None,
+                   limit: Optional[int] = None) -> search_results.PoolSearchResult:
+        """Finds all pools that match certain rules
+
+        As a result, it returns an object that contains the first part of the found pools and whether there
+        are any more results.
+        It is better to use the "get_pools" method, they allow to iterate trought all results
+        and not just the first output.
+
+        Args:
+            request: How to search pools.
+            sort: How to sort result. Defaults to None.
+            limit: Limit on the number of results returned. The maximum is 300.
+                Defaults to None, in which case it returns first 20 results.
+
+        Returns:
+            search_results.PoolSearchResult: The first `limit` pools in `items`.
+                And a mark that there is more.
+
+        Examples:
+            Find all pools in all projects.
+
+            >>> toloka_client.find_pools()
+            ...
+
+            Find all open pools in all projects.
+
+            >>> toloka_client.find_pools(status='OPEN')
+            ...
+
+            Find open pools in a specific project.
+
+            >>> toloka_client.find_pools(status='OPEN', project_id='1')
+            ...
+
+            If method finds more objects than custom or system `limit` allows to operate, it will also show an indicator `has_more=True`.
+        """
+        sort = None if sort is None else structure(sort, search_requests.PoolSortItems)
+        response = await self._search_request('get', '/v1/pools', request, sort, limit)
+        return structure(response, search_results.PoolSearchResult)
+
+    async def get_pool(self, pool_id: str) -> Pool:
+        """Reads one specific pool
+
+        Args:
+            pool_id: ID of the pool.
+
+        Returns:
+            Pool: The pool.
+
+        Example:
+            >>> toloka_client.get_pool(pool_id='1')
+            ...
+        """
+        response = await self._cached_request(f'/v1/pools/{pool_id}')
+        return structure(response, Pool)
+
+    @expand('request')
+    def get_pools(self, request: search_requests.PoolSearchRequest) -> Generator[Pool, None, None]:
+        """Finds all pools that match certain rules and returns them in an iterable object
+
+        Unlike find_pools, returns generator. Does not sort pools.
+        While iterating over the result, several requests to the Toloka server is possible.
+
+        Args:
+            request: How to search pools.
+
+        Yields:
+            Pool: The next object corresponding to the request parameters.
+
+        Example:
+            How to get all open pools from project.
+
+            >>> open_pools = toloka_client.get_pools(project_id='1', status='OPEN')
+            ...
+
+            How to get all pools from project.
+
+            >>> all_pools = toloka_client.get_pools(project_id='1')
+            ...
+        """
+        return self._find_all(self.find_pools, request)
+
+    async def open_pool(self, pool_id: str) -> Pool:
+        """Starts distributing tasks from the pool
+
+        Performers will see your tasks only after that call.
+
+        Args:
+            pool_id: ID of the pool that will be started.
+
+        Returns:
+            Pool: Pool object with new status.
+
+        Example:
+            Open the pool for performers.
+
+            >>> toloka_client.open_pool(pool_id='1')
+            ...
+        """
+        operation = await self.open_pool_async(pool_id)
+        if operation:
+            operation = await self.wait_operation(operation)
+            operation.raise_on_fail()
+
+        self._invalidate_cache(f'/v1/pools/{pool_id}')
+        return await self.get_pool(pool_id)
+
+    async def open_pool_async(self, pool_id: str) -> Optional[operations.PoolOpenOperation]:
+        """Starts distributing tasks from the pool, asynchronous version
+
+        Performers will see your tasks only after that call.
+
+        Args:
+            pool_id: ID of the pool that will be started.
+
+        Returns:
+            PoolOpenOperation: An operation upon completion of which you can get the pool with new status. If pool is
+                already opened then None is returned.
+
+        Example:
+            Open the pool for performers.
+
+            >>> open_pool = toloka_client.open_pool(pool_id='1')
+            >>> toloka_client.wait_operation(open_pool)
+            ...
+        """
+        response = await self._raw_request('post', f'/v1/pools/{pool_id}/open')
+        # is pool already opened?
+        if response.status_code == 204:
+            return None
+        return structure(response.json(), operations.PoolOpenOperation)
+
+    @expand('request')
+    async def patch_pool(self, pool_id: str, request: PoolPatchRequest) -> Pool:
+        """Changes the priority of the pool issue
+
+        Args:
+            pool_id: ID of the pool that will be patched.
+            request: New priority of the pool.
+
+        Returns:
+            Pool: Object with updated priority.
+
+        Example:
+            Set the highest priority to a specified pool.
+
+            >>> toloka_client.patch_pool(pool_id='1', priority=100)
+            ...
+        """
+        response = await self._request('patch', f'/v1/pools/{pool_id}', json=unstructure(request))
+        return structure(response, Pool)
+
+    async def update_pool(self, pool_id: str, pool: Pool) -> Pool:
+        """Makes changes to the pool
+
+        Args:
+            pool_id: ID of the pool that will be changed.
+            pool: A pool object with all the fields: those that will be updated and those that will not.
+
+        Returns:
+            Pool: Pool object with all fields.
+
+        Example:
+            >>> updated_pool = toloka_client.update_pool(pool_id=old_pool_id, pool=new_pool_object)
+            ...
+        """
+        if pool.type == Pool.Type.TRAINING:
+            raise ValueError('Training pools are not supported')
+        response = await self._request('put', f'/v1/pools/{pool_id}', json=unstructure(pool))
+        return structure(response, Pool)
+
+    async def archive_training(self, training_id: str) -> Training:
+        """Sends training to archive
+
+        The training must be in the status "closed".
+        The archived training is not deleted. You can access it when you will need it.
+
+        Args:
+            training_id: ID of training that will be archived.
+
+        Returns:
+            Training: Object with updated status.
+
+        Example:
+            >>> closed_training = next(toloka_client.get_trainings(status='CLOSED'))
+            >>> toloka_client.archive_training(training_id=closed_training.id)
+            ...
+        """
+        operation = await self.archive_training_async(training_id)
+        if operation:
+            operation = await self.wait_operation(operation)
+            operation.raise_on_fail()
+        self._invalidate_cache(f'/v1/trainings/{training_id}')
+        return await self.get_training(training_id)
+
+    async def archive_training_async(self, training_id: str) -> Optional[operations.TrainingArchiveOperation]:
+        """Sends training to archive, asynchronous version
+
+        The training must be in the status "closed".
+        The archived training is not deleted. You can access it when you will need it.
+
+        Args:
+            training_id: ID of training that will be archived.
+
+        Returns:
+            TrainingArchiveOperation: An operation upon completion of which you can get the training with updated
+                status. If pool is already archived then None is returned.
+
+        Example:
+            >>> closed_training = next(toloka_client.find_trainings(status='CLOSED'))
+            >>> archive_op = toloka_client.archive_training_async(training_id=closed_training.id)
+            >>> toloka_client.wait_operation(archive_op)
+            ...
+        """
+        response = await self._raw_request('post', f'/v1/trainings/{training_id}/archive')
+        # is training already archived?
+        if response.status_code == 204:
+            return
+        return structure(response.json(), operations.TrainingArchiveOperation)
+
+    async def close_training(self, training_id: str) -> Training:
+        """Stops distributing tasks from the training
+
+        Args:
+            training_id: ID of the training that will be closed.
+
+        Returns:
+            Training: Training object with new status.
+
+        Example:
+            >>> open_training = next(toloka_client.get_trainings(status='OPEN'))
+            >>> toloka_client.close_training(training_id=open_training.id)
+            ...
+        """
+        operation = await self.close_training_async(training_id)
+        if operation:
+            operation = await self.wait_operation(operation)
+            operation.raise_on_fail()
+        self._invalidate_cache(f'/v1/trainings/{training_id}')
+        return await self.get_training(training_id)
+
+    async def close_training_async(self, training_id: str) -> Optional[operations.TrainingCloseOperation]:
+        """Stops distributing tasks from the training, asynchronous version
+
+        Args:
+            training_id: ID of the training that will be closed.
+
+        Returns:
+            TrainingCloseOperation: An operation upon completion of which you can get the training with updated status.
+                If training is already closed then None is returned.
+
+        Example:
+            >>> open_training = next(toloka_client.get_trainings(status='OPEN'))
+            >>> close_training = toloka_client.close_training_async(training_id=open_training.id)
+            >>> toloka_client.wait_operation(close_training)
+            ...
+        """
+        response = await self._raw_request('post', f'/v1/trainings/{training_id}/close')
+        # is training already closed?
+        if response.status_code == 204:
+            return None
+        return structure(response.json(), operations.TrainingCloseOperation)
+
+    async def clone_training(self, training_id: str) -> Training:
+        """Duplicates existing training
+
+        An empty training with the same parameters will be created.
+        A new training will be attached to the same project.
+
+        Args:
+            training_id: ID of the existing training.
+
+        Returns:
+            Training: New training.
+
+        Example:
+            >>> toloka_client.clone_training(training_id='1')
+            ...
+        """
+        operation = await self.clone_training_async(training_id)
+        operation = await self.wait_operation(operation)
+        result = await self.get_training(operation.details.training_id)
+        logger.info(f'A new training with ID "{result.id}" has been cloned. Link to open in web interface: {self.url}/requester/project/{result.project_id}/training/{result.id}')
+        return result
+
+    async def clone_training_async(self, training_id: str) -> operations.TrainingCloneOperation:
+        """Duplicates existing training, asynchronous version
+
+        An empty training with the same parameters will be created.
+        A new training will be attached to the same project.
+
+        Args:
+            training_id: ID of the existing training.
+
+        Returns:
+            TrainingCloneOperation: An operation upon completion of which you can get the new training.
+
+        Example:
+            >>> clone_training = toloka_client.clone_training_async(training_id='1')
+            >>> toloka_client.wait_operation(clone_training)
+            ...
+        """
+        response = await self._request('post', f'/v1/trainings/{training_id}/clone')
+        return structure(response, operations.TrainingCloneOperation)
+
+    async def create_training(self, training: Training) -> Training:
+        """Creates a new training
+
+        Args:
+            training: New Training with setted parameters.
+
+        Returns:
+            Training: Created training. With read-only fields.
+
+        Example:
+            How to create a new training in a project.
+
+            >>> new_training = toloka.training.Training(
+            >>>     project_id=existing_project_id,
+            >>>     private_name='Some training in my project',
+            >>>     may_contain_adult_content=True,
+            >>>     assignment_max_duration_seconds=10000,
+            >>>     mix_tasks_in_creation_order=True,
+            >>>     shuffle_tasks_in_task_suite=True,
+            >>>     training_tasks_in_task_suite_count=3,
+            >>>     task_suites_required_to_pass=1,
+            >>>     retry_training_after_days=7,
+            >>>     inherited_instructions=True,
+            >>>     public_instructions='',
+            >>> )
+            >>> new_training = toloka_client.create_training(new_training)
+            >>> print(new_training.id)
+            ...
+        """
+        response = await self._request('post', '/v1/trainings', json=unstructure(training))
+        result = structure(response, Training)
+        logger.info(f'A new training with ID "{result.id}" has been created. Link to open in web interface: {self.url}/requester/project/{result.project_id}/training/{result.id}')
+        return result
+
+    @expand('request')
+    async def find_trainings(self, request: search_requests.TrainingSearchRequest,
+                       sort: Union[List[str], search_requests.TrainingSortItems, None] = None,
+                       limit: Optional[int] = None) -> search_results.TrainingSearchResult:
+        """Finds all trainings that match certain rules
+
+        As a result, it returns an object that contains the first part of the found trainings and whether there
+        are any more results.
+        It is better to use the "get_trainings" method, they allow to iterate trought all results
+        and not just the first output.
+
+        Args:
+            request: How to search trainings.
+            sort: How to sort result. Defaults to None.
+            limit: Limit on the number of results returned.
+
+        Returns:
+            search_results.TrainingSearchResult: The first `limit` trainings in `items`.
+                And a mark that there is more.
+
+        Examples:
+            Find all trainings in all projects.
+
+            >>> toloka_client.find_trainings()
+            ...
+
+            Find all open trainings in all projects.
+
+            >>> toloka_client.find_trainings(status='OPEN')
+            ...
+
+            Find all open trainings in a specific project.
+
+            >>> toloka_client.find_trainings(status='OPEN', project_id='1')
+            ...
+
+            If method finds more objects than custom or system `limit` allows to operate, it will also show an indicator `has_more=True`.
+        """
+        sort = None if sort is None else structure(sort, search_requests.TrainingSortItems)
+        response = await self._search_request('get', '/v1/trainings', request, sort, limit)
+        return structure(response, search_results.TrainingSearchResult)
+
+    async def get_training(self, training_id: str) -> Training:
+        """Reads one specific training
+
+        Args:
+            training_id: ID of the training.
+
+        Returns:
+            Training: The training.
+
+        Example:
+            >>> toloka_client.get_training(training_id='1')
+            ...
+        """
+        response = await self._cached_request(f'/v1/trainings/{training_id}')
+        return structure(response, Training)
+
+    @expand('request')
+    def get_trainings(self, request: search_requests.TrainingSearchRequest) -> Generator[Training, None, None]:
+        """Finds all trainings that match certain rules and returns them in an iterable object
+
+        Unlike find_trainings, returns generator. Does not sort trainings.
+        While iterating over the result, several requests to the Toloka server is possible.
+
+        Args:
+            request: How to search trainings.
+
+        Yields:
+            Training: The next object corresponding to the request parameters.
+
+        Example:
+            How to get all trainings in project.
+
+            >>> trainings = toloka_client.get_trainings(project_id=project_id)
+            ...
+        """
+        return self._find_all(self.find_trainings, request)
+
+    async def open_training(self, training_id: str) -> Training:
+        """Starts distributing tasks from the training
+
+        Args:
+            training_id: ID of the training that will be started.
+
+        Returns:
+            Training: Training object with new status.
+
+        Example:
+            Open the training for performers.
+
+            >>> toloka_client.open_training(training_id='1')
+            ...
+        """
+        operation = await self.open_training_async(training_id)
+        if operation:
+            operation = await self.wait_operation(operation)
+            operation.raise_on_fail()
+        self._invalidate_cache(f'/v1/trainings/{training_id}')
+        return await self.get_training(training_id)
+
+    async def open_training_async(self, training_id: str) -> Optional[operations.TrainingOpenOperation]:
+        """Starts distributing tasks from the training, asynchronous version
+
+        Args:
+            training_id: ID of the training that will be started.
+
+        Returns:
+            TrainingOpenOperation: An operation upon completion of which you can get the training with new status. If
+                training is already opened then None is returned.
+
+        Example:
+            Open the training for performers.
+
+            >>> open_training = toloka_client.open_training_async(training_id='1')
+            >>> toloka_client.wait_operation(open_training)
+            ...
+        """
+        response = await self._raw_request('post', f'/v1/trainings/{training_id}/open')
+        # is training already opened?
+        if response.status_code == 204:
+            return None
+        return structure(response.json(), operations.TrainingOpenOperation)
+
+    async def update_training(self, training_id: str, training: Training) -> Training:
+        """Makes changes to the training
+
+        Args:
+            training_id: ID of the training that will be changed.
+            training: A training object with all the fields: those that will be updated and those that will not.
+
+        Returns:
+            Training: Training object with all fields.
+
+        Example:
+            If you want to update any configurations of the existing training.
+
+            >>> updated_training = toloka_client.update_training(training_id=old_training_id, training=new_training_object)
+            ...
+        """
+        response = await self._request('put', f'/v1/trainings/{training_id}', json=unstructure(training))
+        return structure(response, Training)
+
+    @expand('skill')
+    async def create_skill(self, skill: Skill) -> Skill:
+        """Creates a new Skill
+
+        You can send a maximum of 10 requests of this kind per minute and 100 requests per day.
+
+        Args:
+            skill: New Skill with setted parameters.
+
+        Returns:
+            Skill: Created skill. With read-only fields.
+
+        Example:
+            How to create a new skill.
+
+            >>> new_skill = toloka_client.create_skill(
+            >>>     name='Area selection of road signs',
+            >>>     public_requester_description={
+            >>>         'EN': 'Performer is annotating road signs',
+            >>>         'FR': 'L'exécuteur marque les signaux routier',
+            >>>     },
+            >>> )
+            >>> print(new_skill.id)
+            ...
+        """
+        response = await self._request('post', '/v1/skills', json=unstructure(skill))
+        result = structure(response, Skill)
+        logger.info(f'A new skill with ID "{result.id}" has been created. Link to open in web interface: {self.url}/requester/quality/skill/{result.id}')
+        return result
+
+    @expand('request')
+    async def find_skills(self, request: search_requests.SkillSearchRequest,
+                    sort: Union[List[str], search_requests.SkillSortItems, None] = None,
+                    limit: Optional[int] = None) -> search_results.SkillSearchResult:
+        """Finds all skills that match certain rules
+
+        As a result, it returns an object that contains the first part of the found skills and whether there
+        are any more results.
+        It is better to use the "get_skills" method, they allow to iterate trought all results
+        and not just the first output.
+
+        Args:
+            request: How to search skills.
+            sort: How to sort result. Defaults to None.
+            limit: Limit on the number of results returned.
+
+        Returns:
+            SkillSearchResult: The first `limit` skills in `items`.
+                And a mark that there is more.
+
+        Example:
+            Find ten most recently created skills.
+
+            >>> toloka_client.find_skills(sort=['-created', '-id'], limit=10)
+            ...
+
+            If method finds more objects than custom or system `limit` allows to operate, it will also show an indicator `has_more=True`.
+        """
+        sort = None if sort is None else structure(sort, search_requests.SkillSortItems)
+        response = await self._search_request('get', '/v1/skills', request, sort, limit)
+        return structure(response, search_results.SkillSearchResult)
+
+    async def get_skill(self, skill_id: str) -> Skill:
+        """Reads one specific skill
+
+        Args:
+            skill_id: ID of the skill.
+
+        Returns:
+            Skill: The skill.
+
+        Example:
+            >>> toloka_client.get_skill(skill_id='1')
+            ...
+        """
+        response = await self._cached_request(f'/v1/skills/{skill_id}')
+        return structure(response, Skill)
+
+    @expand('request')
+    def get_skills(self, request: search_requests.SkillSearchRequest) -> Generator[Skill, None, None]:
+        """Finds all skills that match certain rules and returns them in an iterable object
+
+        Unlike find_skills, returns generator. Does not sort skills.
+        While iterating over the result, several requests to the Toloka server is possible.
+
+        Args:
+            request: How to search skills.
+
+        Yields:
+            Skill: The next object corresponding to the request parameters.
+
+        Example:
+            How to check that a skill exists.
+
+            >>> segmentation_skill = next(toloka_client.get_skills(name='Area selection of road signs'), None)
+            >>> if segmentation_skill:
+            >>>     print(f'Segmentation skill already exists, with id {segmentation_skill.id}')
+            >>> else:
+            >>>     print('Create new segmentation skill here')
+            ...
+        """
+        return self._find_all(self.find_skills, request)
+
+    async def update_skill(self, skill_id: str, skill: Skill) -> Skill:
+        """Makes changes to the skill
+
+        Args:
+            skill_id: ID of the training that will be changed.
+            skill: A skill object with all the fields: those that will be updated and those that will not.
+
+        Returns:
+            Skill: Modified skill object with all fields.
+
+        Example:
+            >>> toloka_client.create_skill(skill_id=old_skill_id, skill=new_skill_object)
+            ...
+        """
+        response = await self._request('put', f'/v1/skills/{skill_id}', json=unstructure(skill))
+        return structure(response, Skill)
+
+    async def get_analytics(self, stats: List[AnalyticsRequest]) -> operations.Operation:
+        """Sends analytics queries, for example, to estimate the percentage of completed tasks in the pool
+
+        Only pool analytics queries are available.
+        The values of different analytical metrics will be returned in the "details" field of the operation when it is
+        completed. See the example.
+        You can request up to 10 metrics at a time.
+
+        Args:
+            stats: Analytics queries list.
+
+        Returns:
+            operations.Operation: An operation that you can wait for to get the required statistics.
+
+        Example:
+            How to get task completion percentage for one pool.
+
+            >>> from toloka.client.analytics_request import CompletionPercentagePoolAnalytics
+            >>> operation = toloka_client.get_analytics([CompletionPercentagePoolAnalytics(subject_id=pool_id)])
+            >>> operation = toloka_client.wait_operation(operation)
+            >>> print(op.details['value'][0]['result']['value'])
+            ...
+        """
+        response = await self._request('post', '/staging/analytics-2', json=unstructure(stats))
+        return structure(response, operations.Operation)
+
+    @expand('parameters')
+    async def create_task(self, task: Task, parameters: Optional[task.CreateTaskParameters] = None) -> Task:
+        """Creates a new task
+
+        It's better to use "create_tasks", if you need to insert several tasks.
+        You can send a maximum of 100,000 requests of this kind per minute and a maximum of 2,000,000 requests per day.
+
+        Args:
+            task: Task that need to be created.
+            parameters: Parameters for Task creation controlling. Defaults to None.
+                Allows you to use default overlap and start pool after task creation.
+
+        Returns:
+            Task: Created task.
+
+        Example:
+            >>> task = toloka.task.Task(
+            >>>             input_values={'image': 'https://tlk.s3.yandex.net/dataset/cats_vs_dogs/dogs/048e5760fc5a46faa434922b2447a527.jpg'},
+            >>>             pool_id='1')
+            >>> toloka_client.create_task(task=task, allow_defaults=True)
+            ...
+        """
+        response = await self._request('post', '/v1/tasks', json=unstructure(task), params=unstructure(parameters))
+        return structure(response, Task)
+
+    @expand('parameters')
+    async def create_tasks(
+        self,
+        tasks: Iterable[Task],
+        parameters: Optional[task.CreateTasksParameters] = None,
+        *,
+        chunk_size: Optional[int] = None,
+        parallelism: int = 1,
+    ) -> batch_create_results.TaskBatchCreateResult:
+        """Creates many tasks in pools
+
+        By default uses asynchronous operation inside. It's better not to set "async_mode=False", if you not understand
+        clearly why you need it.
+        Tasks can be from different pools. You can insert both regular tasks and golden-tasks.
+        You can send a maximum of 100,000 requests of this kind per minute and a maximum of 2,000,000 requests per day.
+        Recomended maximum of 10,000 task per request if async_mode is True.
+
+        Args:
+            tasks: Tasks that will be created. Any iterable, including generators, is accepted.
+            parameters: Parameters for Tasks creation controlling. Defaults to None, in which case the asynchronous
+                operations is used.
+            chunk_size: The maximum number of tasks sent in one request. Larger sequences are split into chunks
+                which are created by separate operations.
+                Default value: `None`, which means 10,000 tasks in asynchronous mode and 5,000 otherwise.
+            parallelism: The maximum number of chunks that are created concurrently.
+                Default value: `1`.
+
+        Returns:
+            batch_create_results.TaskBatchCreateResult: Result of tasks creating. Contains created tasks in `items` and
+                problems in "validation_errors".
+
+        Raises:
+            ValidationApiError: If no tasks were created, or skip_invalid_items==False and there is a problem when
+                checking any task. In the latter case the remaining chunks are not sent, but the chunks that are
+                already created are not rolled back.
+
+        Example:
+            How to create regular tasks from tsv.
+
+            >>> dataset = pandas.read_csv('dataset.tsv', sep='\t')
+            >>> tasks = [
+            >>>     toloka.task.Task(input_values={'image': url}, pool_id=existing_pool_id)
+            >>>     for url in dataset['image'].values[:50]
+            >>> ]
+            >>> created_result = toloka_client.create_tasks(tasks, allow_defaults=True)
+            >>> print(len(created_result.items))
+            ...
+
+            How to create golden-tasks.
+
+            >>> dataset = pd.read_csv('dateset.tsv', sep=';')
+            >>> golden_tasks = []
+            >>> for _, row in dataset.iterrows():
+            >>>     golden_tasks.append(
+            >>>             toloka.task.Task(
+            >>>                 input_values={'image': row['image']},
+            >>>                 known_solutions = [toloka.task.BaseTask.KnownSolution(output_values={'animal': row['label']})],
+            >>>                 pool_id = existing_pool_id,
+            >>>             )
+            >>>         )
+            >>> created_result = toloka_client.create_tasks(golden_tasks, allow_defaults=True)
+            >>> print(len(created_result.items))
+            ...
+        """
+        if not parameters:
+            parameters = task.CreateTasksParameters()
+        create_chunk = functools.partial(
+            self._sync_via_async,
+            parameters=parameters,
+            url='/v1/tasks',
+            result_type=batch_create_results.TaskBatchCreateResult,
+            operation_type=operations.TasksCreateOperation,
+            output_id_field='task_id',
+            find_function=self.find_tasks
+        )
+        return await self._create_in_chunks(
+            create_chunk, tasks, parameters, batch_create_results.TaskBatchCreateResult,
+            chunk_size=chunk_size or (10000 if parameters.async_mode else 5000),
+            parallelism=parallelism,
+        )
+
+    @expand('parameters')
+    async def create_tasks_async(self, tasks: List[Task], parameters: Optional[task.CreateTasksParameters] = None) -> operations.TasksCreateOperation:
+        """Creates many tasks in pools, asynchronous version
+
+        You can send a maximum of 100,000 requests of this kind per minute and a maximum of 2,000,000 requests per day.
+        Recomended maximum of 10,000 task per request if async_mode is True.
+
+        Args:
+            tasks: List of tasks, that will be created.
+            parameters: Parameters for Tasks creation controlling. Defaults to None.
+
+        Returns:
+            TasksCreateOperation: An operation upon completion of which you can get the created tasks.
+
+        Example:
+            >>> training_tasks = [
+            >>>     toloka.task.Task(
+            >>>                 input_values={'image': 'link1'},
+            >>>                 pool_id='1'),
+            >>>     toloka.task.Task(
+            >>>             input_values={'image': 'link2'},
+            >>>             pool_id='1')
+            >>> ]
+            >>> tasks_op = toloka_client.create_tasks_async(training_tasks)
+            >>> toloka_client.wait_operation(tasks_op)
+            ...
+        """
+        params = {**(unstructure(parameters) or {}), 'async_mode': True}
+        response = await self._request('post', '/v1/tasks', json=unstructure(tasks), params=params)
+        return structure(response, operations.TasksCreateOperation)
+
+    @expand('request')
+    async def find_tasks(self, request: search_requests.TaskSearchRequest,
+                   sort: Union[List[str], search_requests.TaskSortItems, None] = None,
+                   limit: Optional[int] = None,
+                   lazy: bool = False) -> search_results.TaskSearchResult:
+        """Finds all tasks that match certain rules
+
+        As a result, it returns an object that contains the first part of the found tasks and whether there
+        are any more results.
+        It is better to use the "get_tasks" method, they allow to iterate trought all results
+        and not just the first output.
+
+        Args:
+            request: How to search tasks.
+            sort: How to sort result. Defaults to None.
+            limit: Limit on the number of results returned. The maximum is 100 000.
+                Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found tasks are `LazyObject` views which structure fields on first access.
+                Defaults to False.
+
+        Returns:
+            TaskSearchResult: The first `limit` tasks in `items`. And a mark that there is more.
+
+        Example:
+            Find three most recently created tasks in a specified pool.
+
+            >>> toloka_client.find_tasks(pool_id='1', sort=['-created', '-id'], limit=3)
+            ...
+
+            If method finds more objects than custom or system `limit` allows to operate, it will also show an indicator `has_more=True`.
+        """
+        sort = None if sort is None else structure(sort, search_requests.TaskSortItems)
+        response = await self._search_request('get', '/v1/tasks', request, sort, limit)
+        return search_results.TaskSearchResult.structure(response, lazy=lazy)
+
+    async def get_task(self, task_id: str) -> Task:
+        """Reads one specific task
+
+        Args:
+            task_id: ID of the task.
+
+        Returns:
+            Task: The task.
+
+        Example:
+            >>> toloka_client.get_task(task_id='1')
+            ...
+        """
+        response = await self._request('get', f'/v1/tasks/{task_id}')
+        return structure(response, Task)
+
+    @expand('request')
+    def get_tasks(self, request: search_requests.TaskSearchRequest, parallelism: int = 1,
+                  ordered: bool = True, lazy: bool = False) -> Generator[Task, None, None]:
+        """Finds all tasks that match certain rules and returns them in an iterable object
+
+        Unlike find_tasks, returns generator. Does not sort tasks.
+        While iterating over the result, several requests to the Toloka server is possible.
+
+        Args:
+            request: How to search tasks.
+            parallelism: The number of concurrent requests. If it is greater than 1, the creation time range of
+                matching tasks is split into `parallelism` parts which are fetched concurrently.
+                Default value: `1`.
+            ordered: If `True`, tasks are yielded sorted by ID, the same way as without `parallelism`. Otherwise
+                they are yielded as soon as they are fetched, which is faster. Only used if `parallelism` is
+                greater than 1.
+                Default value: `True`.
+            lazy: If `True`, tasks are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
+
+        Yields:
+            Task: The next object corresponding to the request parameters.
+
+        Example:
+            Get tasks from a specific pool.
+
+            >>> results_list = [task for task in toloka_client.get_tasks(pool_id='1')]
+            ...
+        """
+        find_function = functools.partial(self.find_tasks, lazy=lazy)
+        if parallelism > 1:
+            return self._find_all_in_partitions(find_function, request, parallelism, ordered)
+        return self._find_all(find_function, request)
+
+    @expand('patch')
+    async def patch_task(self, task_id: str, patch: task.TaskPatch) -> Task:
+        """Changes the task overlap
+
+        Args:
+            task_id: ID of the task that will be changed.
+            patch: New overlap value.
+
+        Returns:
+            Task: Task with updated fields.
+        """
+        response = await self._request('patch', f'/v1/tasks/{task_id}', json=unstructure(patch))
+        return structure(response, Task)
+
+    @expand('patch')
+    async def patch_task_overlap_or_min(self, task_id: str, patch: task.TaskOverlapPatch) -> Task:
+        """Stops issuing the task
+
+        Args:
+            task_id: ID of the task.
+            patch: New overlap value.
+
+        Returns:
+            Task: Task with updated fields.
+
+        Example:
+            Set an infinite overlap for a specific task in training.
+
+            >>> toloka_client.patch_task_overlap_or_min(task_id='1', infinite_overlap=True)
+            ...
+
+            **Note**: you can't set infinite overlap in a regular pool.
+        """
+        response = await self._request('patch', f'/v1/tasks/{task_id}/set-overlap-or-min', json=unstructure(patch))
+        return structure(response, Task)
+
+    @expand('parameters')
+    async def create_task_suite(self, task_suite: TaskSuite, parameters: Optional[task_suite.TaskSuiteCreateRequestParameters] = None) -> TaskSuite:
+        """Creates a new task suite
+
+        Generally, you don't need to create a task set yourself, because you can create tasks and Toloka will create
+        task suites for you. Use this method only then you need to group specific tasks in one suite or to set a
+        different parameters on different tasks suites.
+        It's better to use "create_task_suites", if you need to insert several task suites.
+        You can send a maximum of 100,000 requests of this kind per minute and 2,000,000 requests per day.
+
+        Args:
+            task_suite: Task suite that need to be created.
+            parameters: Parameters for TaskSuite creation controlling. Defaults to None.
+
+        Returns:
+            TaskSuite: Created task suite.
+
+        Example:
+            >>> new_task_suite = toloka.task_suite.TaskSuite(
+            >>>                 pool_id='1',
+            >>>                 tasks=[toloka.task.Task(input_values={'label': 'Cats vs Dogs'})],
+            >>>                 overlap=2)
+            >>> toloka_client.create_task_suite(new_task_suite)
+            ...
+        """
+        params = {**(unstructure(parameters) or {}), 'async_mode': False}
+        response = await self._request('post', '/v1/task-suites', json=unstructure(task_suite), params=unstructure(params))
+        return structure(response, TaskSuite)
+
+    @expand('parameters')
+    async def create_task_suites(
+        self,
+        task_suites: Iterable[TaskSuite],
+        parameters: Optional[task_suite.TaskSuiteCreateRequestParameters] = None,
+        *,
+        chunk_size: Optional[int] = None,
+        parallelism: int = 1,
+    ) -> batch_create_results.TaskSuiteBatchCreateResult:
+        """Creates many task suites in pools
+
+        Generally, you don't need to create a task set yourself, because you can create tasks and Toloka will create
+        task suites for you. Use this method only then you need to group specific tasks in one suite or to set a
+        different parameters on different tasks suites.
+        By default uses asynchronous operation inside. It's better not to set "async_mode=False", if you not understand
+        clearly why you need it.
+        Task suites can be from different pools. You can insert both regular tasks and golden-tasks.
+        You can send a maximum of 100,000 requests of this kind per minute and 2,000,000 requests per day.
+        Recomended maximum of 10,000 task suites per request if async_mode is True.
+
+        Args:
+            task_suites: Task suites that will be created. Any iterable, including generators, is accepted.
+            parameters: Parameters for TaskSuite creation controlling. Defaults to None, in which case the asynchronous
+                operations is used.
+            chunk_size: The maximum number of task suites sent in one request. Larger sequences are split into chunks
+                which are created by separate operations.
+                Default value: `None`, which means 10,000 task suites in asynchronous mode and 5,000 otherwise.
+            parallelism: The maximum number of chunks that are created concurrently.
+                Default value: `1`.
+
+        Returns:
+            TaskSuiteBatchCreateResult: Result of task suites creating. Contains created task suites in `items` and
+                problems in "validation_errors".
+
+        Raises:
+            ValidationApiError: If no tasks were created, or skip_invalid_items==False and there is a problem when
+                checking any task. In the latter case the remaining chunks are not sent, but the chunks that are
+                already created are not rolled back.
+
+        Example:
+            >>> task_suites = [
+            >>>     toloka.task_suite.TaskSuite(
+            >>>         pool_id=pool.id,
+            >>>         overlap=1,
+            >>>         tasks=[
+            >>>             toloka.task.Task(input_values={
+            >>>                 'input1': some_input_value,
+            >>>                 'input2': some_input_value
+            >>>             })
+            >>>         ]
+            >>>     )
+            >>> ]
+            >>> task_suites = toloka_client.create_task_suites(task_suites)
+            ...
+        """
+        if not parameters:
+            parameters = task_suite.TaskSuiteCreateRequestParameters()
+        create_chunk = functools.partial(
+            self._sync_via_async,
+            parameters=parameters,
+            url='/v1/task-suites',
+            result_type=batch_create_results.TaskBatchCreateResult,
+            operation_type=operations.TaskSuiteCreateBatchOperation,
+            output_id_field='task_suite_id',
+            find_function=self.find_task_suites
+        )
+        return await self._create_in_chunks(
+            create_chunk, task_suites, parameters, batch_create_results.TaskBatchCreateResult,
+            chunk_size=chunk_size or (10000 if parameters.async_mode else 5000),
+            parallelism=parallelism,
+        )
+
+    @expand('parameters')
+    async def create_task_suites_async(self, task_suites: List[TaskSuite], parameters: Optional[task_suite.TaskSuiteCreateRequestParameters] = None) -> operations.TaskSuiteCreateBatchOperation:
+        """Creates many task suites in pools, asynchronous version
+
+        You can send a maximum of 100,000 requests of this kind per minute and 2,000,000 requests per day.
+        Recomended maximum of 10,000 task suites per request.
+
+        Args:
+            task_suites: List of task suites, that will be created.
+            parameters: Parameters for TaskSuite creation controlling.
+
+        Returns:
+            TaskSuiteCreateBatchOperation: An operation upon completion of which you can get the created teask suites.
+
+        Example:
+            >>> task_suites = [
+            >>>     toloka.task_suite.TaskSuite(
+            >>>         pool_id=pool.id,
+            >>>         overlap=1,
+            >>>         tasks=[
+            >>>             toloka.task.Task(input_values={
+            >>>                 'input1': some_input_value,
+            >>>                 'input2': some_input_value
+            >>>             })
+            >>>         ]
+            >>>     )
+            >>> ]
+            >>> task_suites_op = toloka_client.create_task_suites_async(task_suites)
+            >>> toloka_client.wait_operation(task_suites_op)
+            ...
+        """
+        params = {**(unstructure(parameters) or {}), 'async_mode': True}
+        response = await self._request('post', '/v1/task-suites', json=unstructure(task_suites), params=params)
+        return structure(response, operations.TaskSuiteCreateBatchOperation)
+
+    @expand('request')
+    async def find_task_suites(self, request: search_requests.TaskSuiteSearchRequest,
+                         sort: Union[List[str], search_requests.TaskSuiteSortItems, None] = None,
+                         limit: Optional[int] = None,
+                         lazy: bool = False) -> search_results.TaskSuiteSearchResult:
+        """Finds all task suites that match certain rules
+
+        As a result, it returns an object that contains the first part of the found task suites and whether there
+        are any more results.
+        It is better to use the "get_task_suites" method, they allow to iterate trought all results
+        and not just the first output.
+
+        Args:
+            request: How to search task suites.
+            sort: How to sort result. Defaults to None.
+            limit: Limit on the number of results returned. The maximum is 100 000.
+                Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found task suites are `LazyObject` views which structure fields on first access.
+                Defaults to False.
+
+        Returns:
+            TaskSuiteSearchResult: The first `limit` task suites in `items`. And a mark that there is more.
+
+        Example:
+            Find three most recently created task suites in a specified pool.
+
+            >>> toloka_client.find_task_suites(pool_id='1', sort=['-created', '-id'], limit=3)
+            ...
+
+            If method finds more objects than custom or system `limit` allows to operate, it will also show an indicator `has_more=True`.
+        """
+        sort = None if sort is None else structure(sort, search_requests.TaskSuiteSortItems)
+        response = await self._search_request('get', '/v1/task-suites', request, sort, limit)
+        return search_results.TaskSuiteSearchResult.structure(response, lazy=lazy)
+
+    async def get_task_suite(self, task_suite_id: str) -> TaskSuite:
+        """Reads one specific task suite
+
+        Args:
+            task_suite_id: ID of the task suite.
+
+        Returns:
+            TaskSuite: The task suite.
+
+        Example:
+            >>> toloka_client.get_task_suite(task_suite_id='1')
+            ...
+        """
+        response = await self._request('get', f'/v1/task-suites/{task_suite_id}')
+        return structure(response, TaskSuite)
+
+    @expand('request')
+    def get_task_suites(self, request: search_requests.TaskSuiteSearchRequest, parallelism: int = 1,
+                        ordered: bool = True, lazy: bool = False) -> Generator[TaskSuite, None, None]:
+        """Finds all task suites that match certain rules and returns them in an iterable object
+
+        Unlike find_task_suites, returns generator. Does not sort task suites.
+        While iterating over the result, several requests to the Toloka server is possible.
+
+        Args:
+            request: How to search task suites.
+            parallelism: The number of concurrent requests. If it is greater than 1, the creation time range of
+                matching task suites is split into `parallelism` parts which are fetched concurrently.
+                Default value: `1`.
+            ordered: If `True`, task suites are yielded sorted by ID, the same way as without `parallelism`. Otherwise
+                they are yielded as soon as they are fetched, which is faster. Only used if `parallelism` is
+                greater than 1.
+                Default value: `True`.
+            lazy: If `True`, task suites are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
+
+        Yields:
+            TaskSuite: The next object corresponding to the request parameters.
+
+        Example:
+            Get task suites from a specific pool.
+
+            >>> results_list = [task_suite for task_suite in toloka_client.get_task_suites(pool_id='1')]
+            ...
+        """
+        find_function = functools.partial(self.find_task_suites, lazy=lazy)
+        if parallelism > 1:
+            return self._find_all_in_partitions(find_function, request, parallelism, ordered)
+        return self._find_all(find_function, request)
+
+    @expand('patch')
+    async def patch_task_suite(self, task_suite_id: str, patch: task_suite.TaskSuitePatch) -> TaskSuite:
+        """Changes the task suite overlap or priority
+
+        Args:
+            task_suite_id: ID of the task suite that will be changed.
+            patch: New values.
+
+        Returns:
+            TaskSuite: Task suite with updated fields.
+
+        Example:
+            Change the task suite's priority.
+
+            >>> toloka_client.patch_task_suite(task_suite_id='1', issuing_order_override=100)
+            ...
+        """
+        body = unstructure(patch)
+        params = {'open_pool': body.pop('open_pool')} if 'open_pool' in body else None
+        response = await self._request('patch', f'/v1/task-suites/{task_suite_id}', json=body, params=params)
+        return structure(response, TaskSuite)
+
+    @expand('patch')
+    async def patch_task_suite_overlap_or_min(self, task_suite_id: str, patch: task_suite.TaskSuiteOverlapPatch) -> TaskSuite:
+        """Stops issuing the task suites
+
+        Args:
+            task_suite_id: ID of the task suite.
+            patch: New overlap value.
+
+        Returns:
+            TaskSuite: Task suite with updated fields.
+
+        Example:
+            >>> toloka_client.patch_task_suite_overlap_or_min(task_suite_id='1', overlap=100)
+            ...
+        """
+        body = unstructure(patch)
+        params = {'open_pool': body.pop('open_pool')} if 'open_pool' in body else None
+        response = await self._request('patch', f'/v1/task-suites/{task_suite_id}/set-overlap-or-min', json=body, params=params)
+        return structure(response, TaskSuite)
+
+    async def get_operation(self, operation_id: str) -> operations.Operation:
+        """Reads information about operation
+
+        All asynchronous actions in Toloka works via operations. If you have some "Operation" usually you need to use
+        "wait_operation" method.
+
+        Args:
+            operation_id: ID of the operation.
+
+        Returns:
+            Operation: The operation.
+
+        Example:
+            >>> op = toloka_client.get_operation(operation_id='1')
+            ...
+        """
+        response = await self._request('get', f'/v1/operations/{operation_id}')
+        return structure(response, operations.Operation)
+
+    async def wait_operation(self, op: operations.Operation, timeout: datetime.timedelta = datetime.timedelta(minutes=10)) -> operations.Operation:
+        """Waits for the operation to complete, and return it
+
+        Args:
+            op: ID of the operation.
+            timeout: How long to wait. Defaults to 10 minutes.
+
+        Raises:
+            TimeoutError: Raises it if the timeout has expired and the operation is still not completed.
+
+        Returns:
+            Operation: Completed operation.
+
+        Example:
+            Waiting for the pool to close can be running in the background.
+
+            >>> pool = toloka_client.get_pool(pool_id)
+            >>> while not pool.is_closed():
+            >>>     op = toloka_client.get_analytics([toloka.analytics_request.CompletionPercentagePoolAnalytics(subject_id=pool.id)])
+            >>>     op = toloka_client.wait_operation(op)
+            >>>     percentage = op.details['value'][0]['result']['value']
+            >>>     print(
+            >>>         f'   {datetime.datetime.now().strftime("%H:%M:%S")}\t'
+            >>>         f'Pool {pool.id} - {percentage}%'
+            >>>         )
+            >>>     time.sleep(60 * minutes_to_wait)
+            >>>     pool = toloka_client.get_pool(pool.id)
+            >>> print('Pool was closed.')
+            ...
+        """
+        if op.is_completed():
+            return op
+
+        async for op in self.wait_operations([op], timeout):
+            return op
+
+    def wait_operations(
+        self,
+        ops: List[operations.Operation],
+        timeout: datetime.timedelta = datetime.timedelta(minutes=10),
+    ) -> Generator[operations.Operation, None, None]:
+        """Waits for several operations to complete, and returns them as soon as each one is completed
+
+        All operations are polled one by one from a single loop, so no threads are needed. The polling interval of
+        each operation adapts to its progress: it is shortened when the operation is about to finish and grows
+        exponentially when there is no progress. This takes far fewer requests than calling `wait_operation` for
+        every operation.
+
+        Args:
+            ops: Operations to wait for.
+            timeout: How long to wait for all operations. Defaults to 10 minutes.
+
+        Raises:
+            TimeoutError: Raises it if the timeout has expired and some operations are still not completed.
+
+        Returns:
+            Generator[Operation, None, None]: Completed operations in order of completion.
+
+        Example:
+            >>> ops = [toloka_client.open_pool_async(pool_id) for pool_id in pool_ids]
+            >>> for op in toloka_client.wait_operations(ops):
+            >>>     op.raise_on_fail()
+            >>>     print(f'Pool {op.parameters.pool_id} is opened')
+            ...
+        """
+        return self._wait_operations(ops, timeout)
+
+    async def get_operation_log(self, operation_id: str) -> List[OperationLogItem]:
+        """Reads information about validation errors and which task (or task suites) were created
+
+        You don't need to call this method if you use "create_tasks" for creating tasks ("create_task_suites" for task suites).
+        By asynchronous creating multiple tasks (or task sets) you can get the operation log.
+        Logs are only available for the last month.
+
+        Args:
+            operation_id: ID of the operation.
+
+        Returns:
+            List[OperationLogItem]: Logs for the operation.
+
+        Example:
+            >>> op = toloka_client.get_operation_log(operation_id='1')
+            ...
+        """
+        response = await self._request('get', f'/v1/operations/{operation_id}/log')
+        return structure(response, List[OperationLogItem])
+
+    def iter_operation_log(self, operation_id: str) -> Generator[OperationLogItem, None, None]:
+        """Reads the operation log item by item
+
+        Works like `get_operation_log`, but the log is parsed while it is being downloaded and its items are yielded one
+        by one. Use it to read logs of huge batch operations without loading the whole log into memory.
+
+        Args:
+            operation_id: ID of the operation.
+
+        Returns:
+            Generator[OperationLogItem, None, None]: Iterator over the operation log items.
+
+        Example:
+            >>> for log_item in toloka_client.iter_operation_log(operation_id='1'):
+            >>>     if not log_item.success:
+            >>>         print(log_item.output)
+            ...
+        """
+        return self._iter_operation_log(operation_id)
+
+    @expand('parameters')
+    async def create_user_bonus(self, user_bonus: UserBonus, parameters: Optional[UserBonusCreateRequestParameters] = None) -> UserBonus:
+        """Issues payments directly to the performer
+
+        You can send a maximum of 10,000 requests of this kind per day.
+
+        Args:
+            user_bonus: To whom, how much to pay and for what.
+            parameters: Parameters for UserBonus creation controlling.
+
+        Returns:
+            UserBonus: Created bonus.
+
+        Example:
+            Create bonus for specific assignment.
+
+            >>> import decimal
+            >>> new_bonus = toloka_client.create_user_bonus(
+            >>>     UserBonus(
+            >>>         user_id='1',
+            >>>         amount=decimal.Decimal('0.50'),
+            >>>         public_title='Perfect job!',
+            >>>         public_message='You are the best performer!',
+            >>>         assignment_id='012345'
+            >>>     )
+            >>> )
+            ...
+        """
+        response = await self._request(
+            'post', '/v1/user-bonuses', json=unstructure(user_bonus),
+            params=({} if parameters is None else unstructure(parameters)),
+        )
+        return structure(response, UserBonus)
+
+    @expand('parameters')
+    async def create_user_bonuses(
+        self,
+        user_bonuses: Iterable[UserBonus],
+        parameters: Optional[UserBonusCreateRequestParameters] = None,
+        *,
+        chunk_size: int = 10000,
+        parallelism: int = 1,
+    ) -> batch_create_results.UserBonusBatchCreateResult:
+        """Creates many user bonuses
+
+        Right now it's safer to use asynchronous version: "create_user_bonuses_async"
+        You can send a maximum of 10,000 requests of this kind per day.
+
+        Args:
+            user_bonuses: To whom, how much to pay and for what. Any iterable, including generators, is accepted.
+            parameters: Parameters for UserBonus creation controlling.
+            chunk_size: The maximum number of user bonuses sent in one request. Larger sequences are split into chunks
+                which are created by separate requests.
+                Default value: `10000`.
+            parallelism: The maximum number of chunks that are created concurrently.
+                Default value: `1`.
+
+        Returns:
+            UserBonusBatchCreateResult: Result of user bonuses creating. Contains created user bonuses in `items` and
+                problems in "validation_errors".
+
+        Raises:
+            ValidationApiError: If no bonuses were created, or skip_invalid_items==False and there is a problem when
+                checking any bonus. In the latter case the remaining chunks are not sent, but the bonuses that are
+                already issued are not rolled back.
+
+        Example:
+            >>> import decimal
+            >>> new_bonuses=[
+            >>>     UserBonus(
+            >>>         user_id='1',
+            >>>         amount=decimal.Decimal('0.50'),
+            >>>         public_title='Perfect job!',
+            >>>         public_message='You are the best performer!',
+            >>>         assignment_id='1'),
+            >>>     UserBonus(
+            >>>         user_id='2',
+            >>>         amount=decimal.Decimal('1.0'),
+            >>>         public_title='Excellent work!',
+            >>>         public_message='You completed all the tasks!',
+            >>>         assignment_id='2')
+            >>> ]
+            >>> toloka_client.create_user_bonuses(new_bonuses)
+            ...
+        """
+        return await self._create_in_chunks(
+            functools.partial(self._create_user_bonuses_chunk, parameters=parameters),
+            user_bonuses, parameters, batch_create_results.UserBonusBatchCreateResult,
+            chunk_size=chunk_size,
+            parallelism=parallelism,
+        )
+
+    @expand('parameters')
+    async def create_user_bonuses_async(self, user_bonuses: List[UserBonus], parameters: Optional[UserBonusCreateRequestParameters] = None) -> operations.UserBonusCreateBatchOperation:
+        """Issues payments directly to the performers, asynchronously creates many user bonuses
+
+        You can send a maximum of 10,000 requests of this kind per day.
+
+        Args:
+            user_bonuses: To whom, how much to pay and for what.
+            parameters: Parameters for UserBonus creation controlling.
+
+        Returns:
+            UserBonusCreateBatchOperation: An operation upon completion of which the bonuses can be considered created.
+
+        Example:
+            >>> import decimal
+            >>> new_bonuses=[
+            >>>     UserBonus(
+            >>>         user_id='1',
+            >>>         amount=decimal.Decimal('0.50'),
+            >>>         public_title='Perfect job!',
+            >>>         public_message='You are the best performer!',
+            >>>         assignment_id='1'),
+            >>>     UserBonus(
+            >>>         user_id='2',
+            >>>         amount=decimal.Decimal('1.0'),
+            >>>         public_title='Excellent work!',
+            >>>         public_message='You completed all the tasks!',
+            >>>         assignment_id='2')
+            >>> ]
+            >>> create_bonuses = toloka_client.create_user_bonuses_async(new_bonuses)
+            >>> toloka_client.wait_operation(create_bonuses)
+            ...
+        """
+        params = {'async_mode': True, **(unstructure(parameters) or {})}
+        response = await self._request('post', '/v1/user-bonuses', json=unstructure(user_bonuses), params=params)
+        return structure(response, operations.UserBonusCreateBatchOperation)
+
+    @expand('request')
+    async def find_user_bonuses(self, request: search_requests.UserBonusSearchRequest,
+                          sort: Union[List[str], search_requests.UserBonusSortItems, None] = None,
+                          limit: Optional[int] = None,
+                          lazy: bool = False) -> search_results.UserBonusSearchResult:
+        """Finds all user bonuses that match certain rules
+
+        As a result, it returns an object that contains the first part of the found user bonuses and whether there
+        are any more results.
+        It is better to use the "get_user_bonuses" method, they allow to iterate trought all results
+        and not just the first output.
+
+        Args:
+            request: How to search user bonuses.
+            sort: How to sort result. Defaults to None.
+            limit: Limit on the number of results returned.
+            lazy: If `True`, found bonuses are `LazyObject` views which structure fields on first access.
+                Defaults to False.
+
+        Returns:
+            UserBonusSearchResult: The first `limit` user bonuses in `items`.
+                And a mark that there is more.
+
+        Example:
+            >>> toloka_client.find_user_bonuses(user_id='1', sort=['-created', '-id'], limit=3)
+            ...
+
+            If method finds more objects than custom or system `limit` allows to operate, it will also show an indicator `has_more=True`.
+        """
+        sort = None if sort is None else structure(sort, search_requests.UserBonusSortItems)
+        response = await self._search_request('get', '/v1/user-bonuses', request, sort, limit)
+        return search_results.UserBonusSearchResult.structure(response, lazy=lazy)
+
+    async def get_user_bonus(self, user_bonus_id: str) -> UserBonus:
+        """Reads one specific user bonus
+
+        Args:
+            user_bonus_id: ID of the user bonus.
+
+        Returns:
+            UserBonus: The user bonus.
+
+        Example:
+            >>> toloka_client.get_user_bonus(user_bonus_id='1')
+            ...
+        """
+        response = await self._request('get', f'/v1/user-bonuses/{user_bonus_id}')
+        return structure(response, UserBonus)
+
+    @expand('request')
+    def get_user_bonuses(self, request: search_requests.UserBonusSearchRequest, parallelism: int = 1,
+                         ordered: bool = True, lazy: bool = False) -> Generator[UserBonus, None, None]:
+        """Finds all user bonuses that match certain rules and returns them in an iterable object
+
+        Unlike find_user_bonuses, returns generator. Does not sort user bonuses.
+        While iterating over the result, several requests to the Toloka server is possible.
+
+        Args:
+            request: How to search user bonus.
+            parallelism: The number of concurrent requests. If it is greater than 1, the creation time range of
+                matching user bonuses is split into `parallelism` parts which are fetched concurrently.
+                Default value: `1`.
+            ordered: If `True`, user bonuses are yielded sorted by ID, the same way as without `parallelism`. Otherwise
+                they are yielded as soon as they are fetched, which is faster. Only used if `parallelism` is
+                greater than 1.
+                Default value: `True`.
+            lazy: If `True`, bonuses are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
+
+        Yields:
+            UserBonus: The next object corresponding to the request parameters.
+
+        Example:
+            >>> bonuses = [bonus for bonus in toloka_client.get_user_bonuses(created_lt='2021-06-01T00:00:00')]
+            ...
+        """
+        find_function = functools.partial(self.find_user_bonuses, lazy=lazy)
+        if parallelism > 1:
+            return self._find_all_in_partitions(find_function, request, parallelism, ordered)
+        return self._find_all(find_function, request)
+
+    @expand('request')
+    async def find_user_restrictions(self, request: search_requests.UserRestrictionSearchRequest,
+                               sort: Union[List[str], search_requests.UserRestrictionSortItems, None] = None,
+                               limit: Optional[int] = None,
+                               lazy: bool = False) -> search_results.UserRestrictionSearchResult:
+        """Finds all user restrictions that match certain rules
+
+        As a result, it returns an object that contains the first part of the found user restrictions and whether there
+        are any more results.
+        It is better to use the "get_user_restriction" method, they allow to iterate trought all results
+        and not just the first output.
+
+        Args:
+            request: How to search user restrictions.
+            sort: How to sort result. Defaults to None.
+            limit: Limit on the number of results returned.
+            lazy: If `True`, found restrictions are `LazyObject` views which structure fields on first access.
+                Defaults to False.
+
+        Returns:
+            UserRestrictionSearchResult: The first `limit` user restrictions in `items`.
+                And a mark that there is more.
+
+        Example:
+            >>> toloka_client.find_user_restrictions(sort=['-created', '-id'], limit=10)
+            ...
+
+            If method finds more objects than custom or system `limit` allows to operate, it will also show an indicator `has_more=True`.
+        """
+        sort = None if sort is None else structure(sort, search_requests.UserRestrictionSortItems)
+        response = await self._search_request('get', '/v1/user-restrictions', request, sort, limit)
+        return search_results.UserRestrictionSearchResult.structure(response, lazy=lazy)
+
+    async def get_user_restriction(self, user_restriction_id: str) -> UserRestriction:
+        """Reads one specific user restriction
+
+        Args:
+            user_restriction_id: ID of the user restriction.
+
+        Returns:
+            UserRestriction: The user restriction.
+
+        Example:
+            >>> toloka_client.get_user_restriction(user_restriction_id='1')
+            ...
+        """
+        response = await self._request('get', f'/v1/user-restrictions/{user_restriction_id}')
+        return structure(response, UserRestriction)
+
+    @expand('request')
+    def get_user_restrictions(self, request: search_requests.UserRestrictionSearchRequest, lazy: bool = False) -> Generator[UserRestriction, None, None]:
+        """Finds all user restrictions that match certain rules and returns them in an iterable object
+
+        Unlike find_user_restrictions, returns generator. Does not sort user restrictions.
+        While iterating over the result, several requests to the Toloka server is possible.
+
+        Args:
+            request: How to search user restrictions.
+            lazy: If `True`, restrictions are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
+
+        Yields:
+            UserRestriction: The next object corresponding to the request parameters.
+
+        Example:
+            >>> results_list = [restriction for restriction in toloka_client.get_user_restrictions(scope='ALL_PROJECTS')]
+            ...
+        """
+        find_function = functools.partial(self.find_user_restrictions, lazy=lazy)
+        return self._find_all(find_function, request)
+
+    async def set_user_restriction(self, user_restriction: UserRestriction) -> UserRestriction:
+        """Closes the performer's access to one or more projects
+
+        Args:
+            user_restriction: To whom and what to prohibit.
+
+        Returns:
+            UserRestriction: Created restriction object.
+
+        Example:
+            If performer often makes mistakes, we will restrict access to all our projects.
+
+            >>> new_restriction = toloka_client.set_user_restriction(
+            >>>     toloka.user_restriction.ProjectUserRestriction(
+            >>>         user_id='1',
+            >>>         private_comment='Performer often makes mistakes',
+            >>>         project_id='5'
+            >>>     )
+            >>> )
+            ...
+        """
+        response = await self._request('put', '/v1/user-restrictions', json=unstructure(user_restriction))
+        return structure(response, UserRestriction)
+
+    async def delete_user_restriction(self, user_restriction_id: str) -> None:
+        """Unlocks existing restriction
+
+        Args:
+            user_restriction_id: Restriction that should be removed.
+
+        Example:
+            >>> toloka_client.delete_user_restriction(user_restriction_id='1')
+            ...
+        """
+        await self._raw_request('delete', f'/v1/user-restrictions/{user_restriction_id}')
+
+    async def get_requester(self) -> Requester:
+        """Reads information about the customer and the account balance
+
+        Returns:
+            Requester: Object that contains all information about customer.
+
+        Examples:
+            Make sure that you've entered a valid OAuth token.
+
+            >>> toloka_client.get_requester()
+            ...
+
+            You can also estimate approximate pipeline costs and check if there is enough money on your account.
+
+            >>> requester = toloka_client.get_requester()
+            >>> if requester.balance >= approx_pipeline_price:
+            >>>     print('You have enough money on your account!')
+            >>> else:
+            >>>     print('You haven\'t got enough money on your account!')
+            ...
+        """
+        response = await self._cached_request('/v1/requester')
+        return structure(response, Requester)
+
+    @expand('request')
+    async def find_user_skills(self, request: search_requests.UserSkillSearchRequest,
+                         sort: Union[List[str], search_requests.UserSkillSortItems, None] = None,
+                         limit: Optional[int] = None,
+                         lazy: bool = False) -> search_results.UserSkillSearchResult:
+        """Finds all user skills that match certain rules
+
+        UserSkill describe the skill value for a specific performer.
+        As a result, it returns an object that contains the first part of the found user skills and whether there
+        are any more results.
+        It is better to use the "get_user_skills" method, they allow to iterate trought all results
+        and not just the first output.
+
+        Args:
+            request: How to search user skills.
+            sort: How to sort result. Defaults to None.
+            limit: Limit on the number of results returned.
+            lazy: If `True`, found skills are `LazyObject` views which structure fields on first access.
+                Defaults to False.
+
+        Returns:
+            UserSkillSearchResult: The first `limit` user skills in `items`.
+                And a mark that there is more.
+
+        Example:
+            >>> toloka_client.find_user_skills(limit=10)
+            ...
+
+            If method finds more objects than custom or system `limit` allows to operate, it will also show an indicator `has_more=True`.
+        """
+        sort = None if sort is None else structure(sort, search_requests.UserSkillSortItems)
+        response = await self._search_request('get', '/v1/user-skills', request, sort, limit)
+        return search_results.UserSkillSearchResult.structure(response, lazy=lazy)
+
+    async def get_user_skill(self, user_skill_id: str) -> UserSkill:
+        """Gets the value of the user's skill
+
+        UserSkill describe the skill value for a specific performer.
+
+        Args:
+            user_skill_id: ID of the user skill.
+
+        Returns:
+            UserSkill: The skill value.
+
+        Example:
+            >>> toloka_client.get_user_skill(user_skill_id='1')
+            ...
+        """
+        response = await self._request('get', f'/v1/user-skills/{user_skill_id}')
+        return structure(response, UserSkill)
+
+    @expand('request')
+    def get_user_skills(self, request: search_requests.UserSkillSearchRequest, lazy: bool = False) -> Generator[UserSkill, None, None]:
+        """Finds all user skills that match certain rules and returns them in an iterable object
+
+        UserSkill describe the skill value for a specific performer.
+        Unlike find_user_skills, returns generator. Does not sort user skills.
+        While iterating over the result, several requests to the Toloka server is possible.
+
+        Args:
+            request: How to search user skills.
+            lazy: If `True`, skills are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
+
+        Yields:
+            UserSkill: The next object corresponding to the request parameters.
+
+        Example:
+            >>> results_list = [skill for skill in toloka_client.get_user_skills()]
+            ...
+        """
+        find_function = functools.partial(self.find_user_skills, lazy=lazy)
+        return self._find_all(find_function, request)
+
+    @expand('request')
+    async def set_user_skill(self, request: SetUserSkillRequest) -> UserSkill:
+        """Sets the skill value to the performer
+
+        Args:
+            request: To whom and what value of the skill to set.
+
+        Returns:
+            UserSkill: Сreated fact of skill installation.
+
+        Example:
+            >>> from decimal import *
+            >>> toloka_client.set_user_skill(skill_id='1', user_id='1', value=Decimal(100))
+            ...
+        """
+        response = await self._request('put', '/v1/user-skills', json=unstructure(request))
+        return structure(response, UserSkill)
+
+    async def delete_user_skill(self, user_skill_id: str) -> None:
+        """Drop specific UserSkill
+
+        UserSkill describe the skill value for a specific performer.
+
+        Args:
+            user_skill_id: ID of the fact that the performer has a skill to delete.
+
+        Example:
+            >>> toloka_client.delete_user_skill(user_skill_id='1')
+            ...
+        """
+        await self._raw_request('delete', f'/v1/user-skills/{user_skill_id}')
+
+    async def upsert_webhook_subscriptions(self, subscriptions: List[WebhookSubscription]) -> batch_create_results.WebhookSubscriptionBatchCreateResult:
+        """Creates (upsert) many webhook-subscriptions.
+
+        Args:
+            subscriptions: List of webhook-subscriptions, that will be created.
+
+        Returns:
+            batch_create_results.WebhookSubscriptionBatchCreateResult: Result of subscriptions creation.
+                Contains created subscriptions in `items` and problems in "validation_errors".
+
+        Raises:
+            ValidationApiError: If no subscriptions were created.
+
+        Example:
+            How to create several subscriptions.
+
+            >>> created_result = toloka_client.upsert_webhook_subscriptions([
+            >>>     {
+            >>>         'webhook_url': 'https://awesome-requester.com/toloka-webhook',
+            >>>         'event_type': toloka.webhook_subscription.WebhookSubscription.EventType.ASSIGNMENT_CREATED,
+            >>>         'pool_id': '121212'
+            >>>     },
+            >>>     {
+            >>>         'webhook_url': 'https://awesome-requester.com/toloka-webhook',
+            >>>         'event_type': toloka.webhook_subscription.WebhookSubscription.EventType.POOL_CLOSED,
+            >>>         'pool_id': '121212',
+            >>>     }
+            >>> ])
+            >>> print(len(created_result.items))
+            ...
+        """
+        response = await self._request('put', '/v1/webhook-subscriptions', json=unstructure(subscriptions))
+        return structure(response, batch_create_results.WebhookSubscriptionBatchCreateResult)
+
+    async def get_webhook_subscription(self, webhook_subscription_id: str) -> WebhookSubscription:
+        """Get one specific webhook-subscription
+
+        Args:
+            webhook_subscription_id: ID of the subscription.
+
+        Returns:
+            WebhookSubscription: The subscription.
+        """
+        response = await self._request('get', f'/v1/webhook-subscriptions/{webhook_subscription_id}')
+        return structure(response, WebhookSubscription)
+
+    @expand('request')
+    async def find_webhook_subscriptions(self, request: search_requests.WebhookSubscriptionSearchRequest,
+                                   sort: Union[List[str], search_requests.WebhookSubscriptionSortItems, None] = None,
+                                   limit: Optional[int] = None) -> search_results.WebhookSubscriptionSearchResult:
+        """Finds all webhook-subscriptions that match certain rules
+
+        As a result, it returns an object that contains the first part of the found webhook-subscriptions
+        and whether there are any more results.
+        It is better to use the "get_webhook_subscriptions" method, they allow to iterate through all results
+        and not just the first output.
+
+        Args:
+            request: How to search webhook-subscriptions.
+            sort: How to sort result. Defaults to None.
+            limit: Limit on the number of results returned. The maximum is 100 000.
+                Defaults to None, in which case it returns first 50 results.
+
+        Returns:
+            WebhookSubscriptionSearchResult: The first `limit` webhook-subscriptions in `items`.
+                And a mark that there is more.
+        """
+        sort = None if sort is None else structure(sort, search_requests.WebhookSubscriptionSortItems)
+        response = await self._search_request('get', '/v1/webhook-subscriptions', request, sort, limit)
+        return structure(response, search_results.WebhookSubscriptionSearchResult)
+
+    @expand('request')
+    def get_webhook_subscriptions(self, request: search_requests.WebhookSubscriptionSearchRequest) -> Generator[WebhookSubscription, None, None]:
+        """Finds all webhook-subscriptions that match certain rules and returns them in an iterable object
+
+        Unlike find_webhook-subscriptions, returns generator. Does not sort webhook-subscriptions.
+        While iterating over the result, several requests to the Toloka server is possible.
+
+        Args:
+            request: How to search webhook-subscriptions.
+
+        Yields:
+            WebhookSubscription: The next object corresponding to the request parameters.
+        """
+        return self._find_all(self.find_webhook_subscriptions, request, sort_field='created')
+
+    async def delete_webhook_subscription(self, webhook_subscription_id: str) -> None:
+        """Drop specific webhook-subscription
+
+        Args:
+            webhook_subscription_id: ID of the webhook-subscription to delete.
+        """
+        await self._raw_request('delete', f'/v1/webhook-subscriptions/{webhook_subscription_id}')
+
+    @expand('parameters')
+    async def get_assignments_df(
+        self,
+        pool_id: str,
+        parameters: GetAssignmentsTsvParameters,
+        *,
+        chunksize: Optional[int] = None,
+        usecols: Optional[List[str]] = None,
+        dtype: Optional[Dict[str, Any]] = None,
+    ) -> Union['pd.DataFrame', Iterator['pd.DataFrame']]:
+        """Downloads assignments as pandas.DataFrame
+
+        Experimental method.
+        Implements the same behavior as if you download results in web-interface and then read it by pandas.
+
+        The response is read in chunks while the DataFrame is being built, so the whole export is never held in memory
+        as text.
+
+        Args:
+            pool_id: From which pool the results are loaded.
+            parameters: Filters for the results and the set of fields that will be in the dataframe.
+            chunksize: If set, an iterator over DataFrames of up to `chunksize` rows is returned instead of a single
+                DataFrame. The response is downloaded as the iterator is consumed.
+            usecols: Names of the columns to read. Other columns are skipped while parsing.
+            dtype: Data types of the columns, e.g. `{'OUTPUT:result': 'category'}`.
+
+        Returns:
+            pd.DataFrame: DataFrame with all results. Contains groups of fields with prefixes:
+                * "INPUT" - Fields that were at the input in the task.
+                * "OUTPUT" - Fields that were received as a result of execution.
+                * "GOLDEN" - Fields with correct answers. Filled in only for golden tasks and training tasks.
+                * "HINT" - Hints for completing tasks. Filled in for training tasks.
+                * "ACCEPT" - Fields describing the deferred acceptance of tasks.
+                * "ASSIGNMENT" - fields describing additional information about the Assignment.
+
+        Example:
+            Get all assignments from the specified pool by `pool_id` to [pandas.DataFrame](https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.html).
+            And apply the native pandas `rename` method to change columns' names.
+
+            >>> answers_df = toloka_client.get_assignments_df(pool_id='1')
+            >>> answers_df = answers_df.rename(columns={
+            >>>     'INPUT:image': 'task',
+            >>>     'OUTPUT:result': 'label',
+            >>>     'ASSIGNMENT:worker_id': 'performer'
+            >>> })
+            ...
+
+            Process a large pool by chunks of 10000 rows reading only the needed columns.
+
+            >>> for chunk_df in toloka_client.get_assignments_df(
+            >>>     pool_id='1', chunksize=10000, usecols=['INPUT:image', 'OUTPUT:result'],
+            >>> ):
+            >>>     process(chunk_df)
+            ...
+        """
+        # pandas takes a large share of the import time and is needed only here
+        import pandas as pd
+
+        logger.warning('Experimental method')
+        response = await self._raw_request('get', f'/new/requester/pools/{pool_id}/assignments.tsv',
+                                           params=unstructure(parameters), stream_body=True)
+        # pandas parses synchronously, so the response is spooled to a temporary file instead of being kept in memory
+        stream = tempfile.TemporaryFile()
+        try:
+            with response:
+                await _write_content(response, stream)
+            stream.seek(0)
+            reader = pd.read_csv(stream, delimiter='\t', chunksize=chunksize, usecols=usecols, dtype=dtype,
+                                 encoding=response.encoding or 'utf-8')
+        except BaseException:
+            stream.close()
+            raise
+        if chunksize is None:
+            stream.close()
+            return reader
+
+        close_reader = reader.close
+
+        def close():
+            close_reader()
+            stream.close()
+
+        reader.close = close
+        return reader
+
+    @expand('parameters')
+    async def download_assignments_tsv(
+        self,
+        pool_id: str,
+        out: Union[str, os.PathLike, BinaryIO],
+        parameters: GetAssignmentsTsvParameters,
+    ) -> None:
+        """Downloads assignments in the TSV format as is
+
+        Experimental method.
+        The same export as in `get_assignments_df`, but it is written to a file chunk by chunk without parsing.
+
+        Args:
+            pool_id: From which pool the results are loaded.
+            out: Path to the file or a binary file object where to write the results.
+            parameters: Filters for the results and the set of fields that will be in the file.
+
+        Example:
+            >>> toloka_client.download_assignments_tsv(pool_id='1', out='results.tsv')
+            ...
+        """
+        logger.warning('Experimental method')
+        response = await self._raw_request('get', f'/new/requester/pools/{pool_id}/assignments.tsv',
+                                           params=unstructure(parameters), stream_body=True)
+        with response:
+            if isinstance(out, (str, os.PathLike)):
+                with open(out, 'wb') as out_file:
+                    await _write_content(response, out_file)
+            else:
+                await _write_content(response, out)
+
+    @expand('request')
+    async def find_app_projects(self, request: search_requests.AppProjectSearchRequest,
+                          sort: Union[List[str], search_requests.AppProjectSortItems, None] = None,
+                          limit: Optional[int] = None) -> search_results.AppProjectSearchResult:
+        """Finds all App projects that match certain rules.
+
+        As a result, it returns an object that contains the first part of the found App projects and whether there
+        are any more results.
+        It is better to use the "get_app_projects" method, they allow to iterate trought all results
+        and not just the first output.
+
+        Args:
+            request: How to search app projects.
+            sort: The order and direction of sorting the results.
+            limit: number of objects per page.
+
+        Returns:
+            AppProjectSearchResult: The first `limit` App projects in `content`. And a mark that there is more.
+        """
+
+        if self.url != self.Environment.PRODUCTION.value:
+            raise RuntimeError('this method supports only production environment')
+
+        sort = None if sort is None else structure(sort, search_requests.AppProjectSortItems)
+        response = await self._search_request('get', '/app/v0/app-projects', request, sort, limit)
+        return structure(response, search_results.AppProjectSearchResult)
+
+    @expand('request')
+    def get_app_projects(self, request: search_requests.AppProjectSearchRequest) -> Generator[AppProject, None, None]:
+        """Finds all App projects that match certain rules and returns them in an iterable object.
+
+        Unlike find_app_projects, returns generator. Does not sort App projects.
+        While iterating over the result, several requests to the Toloka server is possible.
+
+        Args:
+            request: How to search app projects.
+
+        Yields:
+            AppProject: The next object corresponding to the request parameters.
+        """
+
+        if self.url != self.Environment.PRODUCTION.value:
+            raise RuntimeError('this method supports only production environment')
+
+        return self._find_all(self.find_app_projects, request, items_field='content')
+
+    async def create_app_project(self, app_project: AppProject) -> AppProject:
+        """Creating a new App project.
+
+        Args:
+            app_project: New AppProject with setted parameters.
+
+        Returns:
+            UserBonusBatchCreateResult: Created AppProject.
+        """
+
+        if self.url != self.Environment.PRODUCTION.value:
+            raise RuntimeError('this method supports only production environment')
+
+        response = await self._request('post', '/app/v0/app-projects', json=unstructure(app_project))
+        return structure(response, AppProject)
+
+    async def get_app_project(self, app_project_id: str) -> AppProject:
+        """Project information.
+
+        Args:
+            app_project_id: Project ID.
+
+        Returns:
+            AppProject: the AppProject.
+        """
+
+        if self.url != self.Environment.PRODUCTION.value:
+            raise RuntimeError('this method supports only production environment')
+
+        response = await self._request('get', f'/app/v0/app-projects/{app_project_id}')
+        return structure(response, AppProject)
+
+    async def archive_app_project(self, app_project_id: str) -> AppProject:
+        """Archiving the project.
+
+        The project changes its status to ARCHIVE.
+
+        Args:
+            app_project_id: Project ID.
+
+        Returns:
+            AppProject: Object with updated status.
+        """
+
+        if self.url != self.Environment.PRODUCTION.value:
+            raise RuntimeError('this method supports only production environment')
+
+        await self._raw_request('post', f'/app/v0/app-projects/{app_project_id}/archive')
+        return await self.get_app_project(app_project_id)
+
+    async def unarchive_app_project(self, app_project_id: str) -> AppProject:
+        """Unarchiving the project.
+
+        The project changes its status to the last one it had before archiving.
+
+        Args:
+            app_project_id: Project ID.
+
+        Returns:
+            AppProject: Object with updated status.
+        """
+
+        if self.url != self.Environment.PRODUCTION.value:
+            raise RuntimeError('this method supports only production environment')
+
+        await self._raw_request('post', f'/app/v0/app-projects/{app_project_id}/unarchive')
+        return await self.get_app_project(app_project_id)
+
+    @expand('request')
+    async def find_apps(self, request: search_requests.AppSearchRequest,
+                          sort: Union[List[str], search_requests.AppSortItems, None] = None,
+                          limit: Optional[int] = None) -> search_results.AppSearchResult:
+        """Finds all Apps that match certain rules.
+
+        As a result, it returns an object that contains the first part of the found Apps and whether there
+        are any more results.
+        It is better to use the "get_apps" method, they allow to iterate trought all results
+        and not just the first output.
+
+        Args:
+            request: How to search Apps.
+            sort: The order and direction of sorting the results.
+            limit: number of objects per page.
+
+        Returns:
+            AppSearchResult: The first `limit` Apps in `content`. And a mark that there is more.
+        """
+
+        if self.url != self.Environment.PRODUCTION.value:
+            raise RuntimeError('this method supports only production environment')
+
+        sort = None if sort is None else structure(sort, search_requests.AppSortItems)
+        response = await self._search_request('get', '/app/v0/apps', request, sort, limit)
+        return structure(response, search_results.AppSearchResult)
+
+    @expand('request')
+    def get_apps(self, request: search_requests.AppSearchRequest) -> Generator[App, None, None]:
+        """Finds all Apps that match certain rules and returns them in an iterable object.
+
+        Unlike find_apps, returns generator. Does not sort Apps.
+        While iterating over the result, several requests to the Toloka server is possible.
+
+        Args:
+            request: How to search Apps.
+
+        Yields:
+            App: The next object corresponding to the request parameters.
+        """
+
+        if self.url != self.Environment.PRODUCTION.value:
+            raise RuntimeError('this method supports only production environment')
+
+        return self._find_all(self.find_apps, request, items_field='content')
+
+    async def get_app(self, app_id: str) -> App:
+        """Information about the App.
+
+        Args:
+            app_id: App ID.
+
+        Returns:
+            App: the App.
+        """
+
+        if self.url != self.Environment.PRODUCTION.value:
+            raise RuntimeError('this method supports only production environment')
+
+        response = await self._request('get', f'/app/v0/apps/{app_id}')
+        return structure(response, App)
+
+    @expand('request')
+    async def find_app_items(self, app_project_id: str,
+                          request: search_requests.AppItemSearchRequest,
+                          sort: Union[List[str], search_requests.AppItemSortItems, None] = None,
+                          limit: Optional[int] = None) -> search_results.AppItemSearchResult:
+        """Finds all work items in the App project that match certain rules.
+
+        As a result, it returns an object that contains the first part of the found work items in the App project
+        and whether there are any more results.
+        It is better to use the "get_app_items" method, they allow to iterate trought all results
+        and not just the first output.
+
+        Args:
+            app_project_id: Project ID.
+            request: How to search App items.
+            sort: The order and direction of sorting the results.
+            limit: number of objects per page.
+
+        Returns:
+            AppItemSearchResult: The first `limit` App items in `content`. And a mark that there is more.
+        """
+
+        if self.url != self.Environment.PRODUCTION.value:
+            raise RuntimeError('this method supports only production environment')
+
+        sort = None if sort is None else structure(sort, search_requests.AppItemSortItems)
+        response = await self._search_request('get', f'/app/v0/app-projects/{app_project_id}/items', request, sort, limit)
+        return structure(response, search_results.AppItemSearchResult)
+
+    @expand('request')
+    def get_app_items(self,
+                      app_project_id: str,
+                      request: search_requests.AppItemSearchRequest) -> Generator[AppItem, None, None]:
+        """Finds all work items in the App project that match certain rules and returns them in an iterable object.
+
+        Unlike find_app_items, returns generator. Does not sort work items in the App project.
+        While iterating over the result, several requests to the Toloka server is possible.
+
+        Args:
+            request: How to search App items.
+
+        Yields:
+            AppItem: The next object corresponding to the request parameters.
+        """
+
+        if self.url != self.Environment.PRODUCTION.value:
+            raise RuntimeError('this method supports only production environment')
+
+        find_function = functools.partial(self.find_app_items, app_project_id)
+        return self._find_all(find_function, request, items_field='content')
+
+    async def create_app_item(self, app_project_id: str, app_item: AppItem) -> AppItem:
+        """Adding a new work item.
+
+        Args:
+            app_project_id: Project ID.
+            app_item: New AppItem with setted parameters.
+
+        Returns:
+            UserBonusBatchCreateResult: Created AppItem.
+        """
+
+        if self.url != self.Environment.PRODUCTION.value:
+            raise RuntimeError('this method supports only production environment')
+
+        response = await self._request('post', f'/app/v0/app-projects/{app_project_id}/items', json=unstructure(app_item))
+        return structure(response, AppItem)
+
+    @expand('request')
+    async def create_app_items(self, app_project_id: str, request: AppItemsCreateRequest):
+        """Creating a batch of new items.
+
+        Args:
+            app_project_id: Project ID.
+            request: request for App items creation controlling.
+        """
+
+        if self.url != self.Environment.PRODUCTION.value:
+            raise RuntimeError('this method supports only production environment')
+
+        await self._raw_request('post', f'/app/v0/app-projects/{app_project_id}/items/bulk', json=unstructure(request))
+        return
+
+    async def get_app_item(self, app_project_id: str, app_item_id: str) -> AppItem:
+        """Information about one work item.
+
+        Args:
+            app_project_id: Project ID.
+            app_item_id: Item ID
+
+        Returns:
+            AppItem: the AppItem.
+        """
+
+        if self.url != self.Environment.PRODUCTION.value:
+            raise RuntimeError('this method supports only production environment')
+
+        response = await self._request('get', f'/app/v0/app-projects/{app_project_id}/items/{app_item_id}')
+        return structure(response, AppItem)
+
+    @expand('request')
+    async def find_app_batches(self, app_project_id: str,
+                         request: search_requests.AppBatchSearchRequest,
+                         sort: Union[List[str], search_requests.AppBatchSortItems, None] = None,
+                         limit: Optional[int] = None) -> search_results.AppBatchSearchResult:
+        """Finds all batches in the App project that match certain rules.
+
+        As a result, it returns an object that contains the first part of the found batches in the App project
+        and whether there are any more results.
+        It is better to use the "get_app_batches" method, they allow to iterate trought all results
+        and not just the first output.
+
+        Args:
+            app_project_id: Project ID.
+            request: How to search batches.
+            sort: The order and direction of sorting the results.
+            limit: number of objects per page.
+
+        Returns:
+            AppBatchSearchResult: The first `limit` batches in `content`. And a mark that there is more.
+        """
+
+        if self.url != self.Environment.PRODUCTION.value:
+            raise RuntimeError('this method supports only production environment')
+
+        sort = None if sort is None else structure(sort, search_requests.AppBatchSortItems)
+        response = await self._search_request('get', f'/app/v0/app-projects/{app_project_id}/batches', request, sort, limit)
+        return structure(response, search_results.AppBatchSearchResult)
+
+    @expand('request')
+    def get_app_batches(self,
+                        app_project_id: str,
+                        request: search_requests.AppBatchSearchRequest) -> Generator[AppBatch, None, None]:
+        """Finds all batches in the App project that match certain rules and returns them in an iterable object.
+
+        Unlike find_app_batches, returns generator. Does not sort batches in the App project.
+        While iterating over the result, several requests to the Toloka server is possible.
+
+        Args:
+            request: How to search batches.
+
+        Yields:
+            AppBatch: The next object corresponding to the request parameters.
+        """
+
+        if self.url != self.Environment.PRODUCTION.value:
+            raise RuntimeError('this method supports only production environment')
+
+        find_function = functools.partial(self.find_app_batches, app_project_id)
+        return self._find_all(find_function, request, items_field='content')
+
+    @expand('request')
+    async def create_app_batch(self, app_project_id: str, request: AppBatchCreateRequest) -> AppBatch:
+        """Creating a new batch.
+
+        Args:
+            app_project_id: Project ID.
+            request: request for AppBatch creation controlling.
+
+        Returns:
+            UserBonusBatchCreateResult: Created AppItem.
+        """
+
+        if self.url != self.Environment.PRODUCTION.value:
+            raise RuntimeError('this method supports only production environment')
+
+        response = await self._request('post', f'/app/v0/app-projects/{app_project_id}/batches', json=unstructure(request))
+        return structure(response, AppBatch)
+
+    async def get_app_batch(self, app_project_id: str, app_batch_id: str) -> AppBatch:
+        """Batch information.
+
+        Args:
+            app_project_id: Project ID.
+            app_batch_id: Batch ID
+
+        Returns:
+            AppBatch: the AppBatch.
+        """
+
+        if self.url != self.Environment.PRODUCTION.value:
+            raise RuntimeError('this method supports only production environment')
+
+        response = await self._request('get', f'/app/v0/app-projects/{app_project_id}/batches/{app_batch_id}')
+        return structure(response, AppBatch)
+
+    async def start_app_batch(self, app_project_id: str, app_batch_id: str):
+        """Start processing the batch.
+
+        Starts asynchronously.
+
+        Args:
+            app_project_id: Project ID.
+            app_batch_id: Batch ID.
+        """
+
+        if self.url != self.Environment.PRODUCTION.value:
+            raise RuntimeError('this method supports only production environment')
+
+        await self._raw_request('post', f'/app/v0/app-projects/{app_project_id}/batches/{app_batch_id}/start')
+        return
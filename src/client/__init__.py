@@ -55,20 +55,27 @@ __all__ = [
 ]
 
 import attr
+import bisect
 import datetime
 import functools
-import io
+import heapq
+import itertools
 import logging
-import pandas as pd
+import operator
+import os
 import requests
 import time
 import threading
 import uuid
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from decimal import Decimal
 from enum import Enum, unique
 from requests.adapters import HTTPAdapter
-from typing import BinaryIO, Callable, Generator, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING, Any, BinaryIO, Callable, Dict, Generator, Iterable, Iterator, List, Mapping, Optional, Tuple,
+    Union,
+)
 from urllib3.util.retry import Retry
 
 from . import actions
@@ -110,6 +117,7 @@ from .analytics_request import AnalyticsRequest
 from .app import App, AppItem, AppProject, AppBatch, AppBatchCreateRequest, AppItemsCreateRequest
 from .assignment import Assignment, AssignmentPatch, GetAssignmentsTsvParameters
 from .attachment import Attachment
+from .batch_create_results import _is_fatal_chunk_failure, _merge_batch_create_results
 from .clone_results import CloneResults
 from .exceptions import raise_on_api_error, ValidationApiError
 from .message_thread import (
@@ -117,6 +125,8 @@ from .message_thread import (
 )
 from .operation_log import OperationLogItem
 from .pool import Pool, PoolPatchRequest
+from .primitives.cache import ObjectCache
+from .primitives.rate_limiter import RateLimiter
 from .primitives.retry import TolokaRetry
 from .primitives.base import autocast_to_enum
 from .project import Project
@@ -130,10 +140,253 @@ from .user_restriction import UserRestriction
 from .user_skill import SetUserSkillRequest, UserSkill
 from ..util import identity
 from ..util._codegen import expand
+from ..util._io import iterable_to_stream
+from ..util._iterators import ProducerThreadPool, chunked, iterate_concurrently
+from ..util._json import fast_json_loads, iter_json_array
 from .webhook_subscription import WebhookSubscription
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+_OPERATION_POLL_INITIAL_DELAY = datetime.timedelta(milliseconds=500)
+_OPERATION_POLL_MIN_DELAY = datetime.timedelta(seconds=1)
+_OPERATION_POLL_MAX_DELAY = datetime.timedelta(seconds=10)
+
+
+def _get_operation_poll_delay(
+    previous: operations.Operation,
+    current: operations.Operation,
+    delay: datetime.timedelta,
+) -> datetime.timedelta:
+    """Chooses how long to wait before the next poll of a running operation.
+
+    If the operation progress has grown since the previous poll, the time left is estimated from the progress rate.
+    Otherwise the delay grows exponentially.
+    """
+
+    if previous.progress is not None and current.progress is not None and current.progress > previous.progress:
+        next_delay = delay * (100 - current.progress) / (current.progress - previous.progress)
+    else:
+        next_delay = delay * 2
+    return min(max(next_delay, _OPERATION_POLL_MIN_DELAY), _OPERATION_POLL_MAX_DELAY)
+
+
+def _is_attachment_saved(path: str, headers: Mapping[str, str]) -> bool:
+    # Content-Length is the size of the encoded content if the response is compressed
+    expected_size = None if headers.get('Content-Encoding') else headers.get('Content-Length')
+    return os.path.exists(path) and (expected_size is None or int(expected_size) == os.path.getsize(path))
+
+
+def _save_attachment(path: str, response: requests.Response) -> Optional[int]:
+    """Writes a downloaded attachment to the file unless it's already there.
+
+    Returns:
+        The number of written bytes or `None` if the file already exists and has the expected size.
+    """
+
+    if _is_attachment_saved(path, response.headers):
+        return None
+    # The file is renamed only when it's complete, so an interrupted download is not taken for a finished one
+    part_path = f'{path}.part'
+    size = 0
+    with open(part_path, 'wb') as out_file:
+        for content in response.iter_content(chunk_size=64 * 1024):
+            out_file.write(content)
+            size += len(content)
+    os.replace(part_path, path)
+    return size
+
+
+def _get_attachment_path(out_dir: Union[str, os.PathLike], attachment: Attachment) -> str:
+    # Attachments may have the same names, so IDs are prepended
+    name = os.path.basename(attachment.name or '')
+    return os.path.join(out_dir, f'{attachment.id}_{name}' if name else attachment.id)
+
+
+def _summarize_attachments_download(results: List[Tuple[str, str, Optional[int]]], seconds: float) -> Dict[str, str]:
+    sizes = [size for _, _, size in results if size is not None]
+    megabytes = sum(sizes) / 2 ** 20
+    logger.info(
+        f'Downloaded {len(sizes)} attachments ({megabytes:.1f} MiB) in {seconds:.1f} s, '
+        f'{megabytes / max(seconds, 1e-6):.1f} MiB/s, {len(sizes) / max(seconds, 1e-6):.1f} files/s. '
+        f'Skipped {len(results) - len(sizes)} already downloaded attachments'
+    )
+    return {attachment_id: path for attachment_id, path, _ in results}
+
+
+def _get_next_page_request(request, result, sort_field: str, items_field: str):
+    """Returns the request of the page after the given search result or `None` if it's the last page."""
+
+    if not result.has_more:
+        return None
+    items = getattr(result, items_field)
+    return attr.evolve(request, **{f'{sort_field}_gt': getattr(items[-1], sort_field)})
+
+
+def _check_parallelism(parallelism: int) -> None:
+    if parallelism < 1:
+        raise ValueError(f'parallelism must be a positive number, got {parallelism}')
+
+
+def _split_request_by_created_range(request, first_created: datetime.datetime, last_created: datetime.datetime,
+                                    parallelism: int) -> list:
+    """Splits a search request into requests of objects created in consecutive time ranges.
+
+    Partition bounds are rounded to milliseconds, the precision of Toloka timestamps. The first and the last partitions
+    stay open, so objects created during iteration are not lost.
+    """
+
+    if parallelism == 1 or first_created >= last_created:
+        return [request]
+    step = (last_created - first_created) / parallelism
+    bounds = sorted({
+        bound.replace(microsecond=bound.microsecond // 1000 * 1000)
+        for bound in (first_created + step * i for i in range(1, parallelism))
+    })
+    partitions = [attr.evolve(request, created_lt=bounds[0])]
+    for created_gte, created_lt in zip(bounds, bounds[1:]):
+        partitions.append(attr.evolve(request, created_gte=created_gte, created_lt=created_lt))
+    partitions.append(attr.evolve(request, created_gte=bounds[-1]))
+    return partitions
+
+
+def _enumerate_chunks(objects, parameters, chunk_size: int, parallelism: int) -> Iterator[Tuple[int, list]]:
+    """Splits objects into chunks for concurrent creation and yields them with offsets of their first objects."""
+
+    if chunk_size < 1 or parallelism < 1:
+        raise ValueError(f'chunk_size and parallelism must be positive numbers, got {chunk_size} and {parallelism}')
+    chunks = enumerate(chunked(objects, chunk_size))
+    first_chunks = list(itertools.islice(chunks, 2))
+    if len(first_chunks) > 1 and getattr(parameters, 'operation_id', None) is not None:
+        raise ValueError('operation_id can only be used if all objects fit into one chunk')
+    for chunk_index, chunk in itertools.chain(first_chunks, chunks):
+        yield chunk_index * chunk_size, chunk
+
+
+class _OperationPolls:
+    """Running operations ordered by the time of the next poll.
+
+    Operations completed from the start are available in `completed`. Every poll is taken with `pop`, and if the polled
+    operation is still running, it's put back with `push`.
+    """
+
+    def __init__(self, ops: Iterable[operations.Operation], timeout: datetime.timedelta):
+        utcnow = datetime.datetime.utcnow()
+        self.wait_until_time = utcnow + timeout
+        self.completed = []
+        self._polls = []
+        for index, op in enumerate(ops):
+            if op.is_completed():
+                self.completed.append(op)
+            elif not op.started or utcnow - op.started < _OPERATION_POLL_INITIAL_DELAY:
+                self._polls.append((utcnow + _OPERATION_POLL_INITIAL_DELAY, index, op, _OPERATION_POLL_INITIAL_DELAY))
+            else:
+                self._polls.append((utcnow, index, op, _OPERATION_POLL_INITIAL_DELAY))
+        heapq.heapify(self._polls)
+
+    def __bool__(self) -> bool:
+        return bool(self._polls)
+
+    def pop(self) -> Tuple[tuple, float]:
+        """Returns the next poll and the number of seconds to wait before it."""
+        poll = heapq.heappop(self._polls)
+        return poll, (poll[0] - datetime.datetime.utcnow()).total_seconds()
+
+    def push(self, poll: tuple, updated_op: operations.Operation) -> None:
+        """Schedules the next poll of the running operation."""
+        _, index, op, delay = poll
+        utcnow = datetime.datetime.utcnow()
+        if utcnow > self.wait_until_time:
+            raise TimeoutError
+        delay = _get_operation_poll_delay(op, updated_op, delay)
+        heapq.heappush(self._polls, (min(utcnow + delay, self.wait_until_time), index, updated_op, delay))
+
+
+class _CreatedIdsWindow:
+    """Ids of created objects that are not fetched yet.
+
+    Every request starts from the smallest id that is not fetched yet and asks only for the remaining number of
+    objects, so objects created concurrently by someone else are skipped instead of being scanned.
+    """
+
+    def __init__(self, ids: Iterable[str], batch_size: int):
+        self.batch_size = batch_size
+        self._ids = sorted(ids)
+        self._remaining = set(self._ids)
+        # Index of the smallest id that is not fetched yet
+        self._start = 0
+
+    def __bool__(self) -> bool:
+        return self._start < len(self._ids)
+
+    def get_params(self) -> Dict[str, Any]:
+        ids = self._ids
+        return {'id_gte': ids[self._start], 'id_lte': ids[-1], 'limit': min(len(ids) - self._start, self.batch_size)}
+
+    def take(self, response) -> list:
+        """Returns the wanted objects of the response and moves the window past them."""
+        found = [obj for obj in response.items if obj.id in self._remaining]
+        if not response.has_more or not response.items:
+            end = len(self._ids)
+        else:
+            end = bisect.bisect_right(self._ids, response.items[-1].id, self._start)
+        for obj_id in self._ids[self._start:end]:
+            self._remaining.discard(obj_id)
+        self._start = end
+        return found
+
+
+class _AsyncModeCreation:
+    """Emulates the result of synchronous creation of tasks or task suites from the log of an asynchronous operation.
+
+    Objects are marked with unique client ids, so their log items can be matched with their indexes.
+    """
+
+    _LOG_ITEM_TYPES = ('TASK_CREATE', 'TASK_VALIDATE', 'TASK_SUITE_VALIDATE', 'TASK_SUITE_CREATE')
+
+    def __init__(self, objects: list, output_id_field: str):
+        self.output_id_field = output_id_field
+        self.created_ids_by_pool = {}
+        self.validation_errors = {}
+        self._index_by_client_uuid = {}
+        for index, obj in enumerate(objects):
+            obj._unexpected['__client_uuid'] = uuid.uuid4().hex
+            self._index_by_client_uuid[obj._unexpected['__client_uuid']] = str(index)
+
+    def add_log_item(self, log_item: OperationLogItem) -> None:
+        if log_item.type not in self._LOG_ITEM_TYPES:
+            return
+        index = self._index_by_client_uuid.get(log_item.input.get('__client_uuid'))
+        if index is None:
+            return
+        if log_item.success:
+            created_ids = self.created_ids_by_pool.setdefault(log_item.input['pool_id'], {})
+            created_ids[log_item.output[self.output_id_field]] = index
+        else:
+            self.validation_errors[index] = {
+                name: structure(error, batch_create_results.FieldValidationError)
+                for name, error in log_item.output.items()
+            }
+
+    def check_created(self) -> None:
+        # Emulates the response as in a synchronous method:
+        # it will throw an exception even if the skip_invalid_items parameter is passed
+        # but no objects are created
+        if not self.created_ids_by_pool:
+            raise ValidationApiError(
+                code='VALIDATION_ERROR',
+                message='Validation failed',
+                payload=self.validation_errors
+            )
+
+    def get_result(self, result_type, created_objects: Iterable[Any]):
+        items = {}
+        for obj in created_objects:
+            items[self.created_ids_by_pool[obj.pool_id][obj.id]] = obj
+        return result_type(items=items, validation_errors=self.validation_errors or {})
+
 
 class TolokaClient:
     """Class that implements interaction with [Toloka API](https://yandex.com/dev/toloka/doc/concepts/about.html).
@@ -181,6 +434,22 @@ class TolokaClient:
         retryer_factory: Factory that creates `Retry` object.
             Fully specified retry policy that will apply to all requests.
             Default value: `None`.
+        prefetch_pages: The number of result pages that `get_*` methods request in advance in a background thread,
+            while previous pages are being processed. Overlaps network latency with processing at the cost of keeping
+            up to `prefetch_pages` extra pages in memory.
+            Default value: `0`, pages are requested one by one.
+        rate_limiter: Client-side limits on the rate of requests to different API endpoints. Requests wait for their
+            turn instead of exceeding Toloka quotas and getting the `429 Too Many Requests` error. A single
+            `RateLimiter` can be shared by several clients.
+            Default value: `None`, requests are not limited.
+        fast_json: Decode responses with `orjson` or `simdjson` if one of them is installed, which is several times
+            faster than the default decoder. Fields annotated as `Decimal` (e.g. `Assignment.reward`) are still
+            structured to `Decimal`, but other numbers in untyped fields such as `input_values` are decoded as `float`.
+            Default value: `False`.
+        cache: Cache of projects, pools, trainings, skills and the requester. `get_project`, `get_pool`,
+            `get_training`, `get_skill` and `get_requester` take objects from it instead of requesting them again.
+            Objects changed through the client are removed from the cache. See `ObjectCache`.
+            Default value: `None`, objects are not cached.
 
     Example:
         How to create `TolokaClient` instance and make your first request to Toloka.
@@ -206,6 +475,10 @@ class TolokaClient:
         url: Optional[str] = None,
         retry_quotas: Union[List[str], str, None] = TolokaRetry.Unit.MIN,
         retryer_factory: Optional[Callable[[], Retry]] = None,
+        prefetch_pages: int = 0,
+        rate_limiter: Optional[RateLimiter] = None,
+        fast_json: bool = False,
+        cache: Optional[ObjectCache] = None,
     ):
         if url is None and environment is None:
             raise ValueError('You must pass at least one parameter: url or environment.')
@@ -219,6 +492,8 @@ class TolokaClient:
             self.url = environment.value
         if isinstance(retries, Retry) and retry_quotas is not None:
             raise ValueError('You must set retry_quotas parameter to None when you specify retries parameters not as int.')
+        if prefetch_pages < 0:
+            raise ValueError(f'prefetch_pages must be a non-negative number, got {prefetch_pages}')
         self.token = token
         # float, or a (connect timeout, read timeout) tuple
         # How long to wait for the server to send data before giving up,
@@ -232,6 +507,23 @@ class TolokaClient:
             self.retryer_factory = retryer_factory
         else:
             self.retryer_factory = functools.partial(self._default_retryer_factory, retries, retry_quotas)
+        self.prefetch_pages = prefetch_pages
+        self.rate_limiter = rate_limiter
+        if fast_json and fast_json_loads is None:
+            logger.warning('Neither orjson nor simdjson is installed. The default JSON decoder is used.')
+        self.fast_json = fast_json
+        self.cache = cache
+        # Background threads of get_* methods are reused together with their sessions
+        self._producer_pool = ProducerThreadPool()
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state['_producer_pool']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._producer_pool = ProducerThreadPool()
 
     @staticmethod
     def _default_retryer_factory(
@@ -274,12 +566,33 @@ class TolokaClient:
                     params[key] = 'true' if value else 'false'
         if self.default_timeout is not None and 'timeout' not in kwargs:
             kwargs['timeout'] = self.default_timeout
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(method, path)
         response = self._session.request(method, f'{self.url}/api{path}', **kwargs)
+        if method.lower() != 'get':
+            # The object may have changed even if the request failed
+            self._invalidate_cache(path)
         raise_on_api_error(response)
         return response
 
+    def _invalidate_cache(self, path):
+        if self.cache is not None:
+            self.cache.invalidate(ObjectCache.get_key(path))
+
+    def _cached_request(self, path):
+        if self.cache is None:
+            return self._request('get', path)
+        response = self.cache.get(path)
+        if response is None:
+            response = self._request('get', path)
+            self.cache.put(path, response)
+        return response
+
     def _request(self, method, path, **kwargs):
-        return self._raw_request(method, path, **kwargs).json(parse_float=Decimal)
+        response = self._raw_request(method, path, **kwargs)
+        if self.fast_json and fast_json_loads is not None:
+            return fast_json_loads(response.content)
+        return response.json(parse_float=Decimal)
 
     def _search_request(self, method, path, request, sort, limit):
         params = unstructure(request) or {}
@@ -289,74 +602,121 @@ class TolokaClient:
             params['limit'] = limit
         return self._request(method, path, params=params)
 
-    def _find_all(self, find_function, request, sort_field: str = 'id', items_field: str = 'items'):
-        result = find_function(request, sort=[sort_field])
-        items = getattr(result, items_field)
-        while result.has_more:
-            request = attr.evolve(request, **{f'{sort_field}_gt': getattr(items[-1], sort_field)})
-            yield from items
+    def _find_all_pages(self, find_function, request, sort_field: str, items_field: str):
+        while request is not None:
             result = find_function(request, sort=[sort_field])
-            items = getattr(result, items_field)
+            yield result
+            request = _get_next_page_request(request, result, sort_field, items_field)
 
+    def _find_all(self, find_function, request, sort_field: str = 'id', items_field: str = 'items'):
+        pages_factory = functools.partial(self._find_all_pages, find_function, request, sort_field, items_field)
+        if self.prefetch_pages:
+            # Next pages are requested in the background as soon as the previous ones are received
+            pages = iterate_concurrently([pages_factory], buffer_size=self.prefetch_pages, pool=self._producer_pool)
+        else:
+            pages = pages_factory()
+        for result in pages:
+            yield from getattr(result, items_field)
+
+    def _split_request_by_created(self, find_function, request, parallelism: int):
+        _check_parallelism(parallelism)
+        first_items = find_function(request, sort=['created'], limit=1).items
+        if not first_items:
+            return []
+        last_items = find_function(request, sort=['-created'], limit=1).items
+        return _split_request_by_created_range(request, first_items[0].created, last_items[0].created, parallelism)
+
+    def _find_all_in_partitions(self, find_function, request, parallelism: int, ordered: bool,
+                                buffer_size: int = 1000):
+        partitions = self._split_request_by_created(find_function, request, parallelism)
+        items = iterate_concurrently(
+            [functools.partial(self._find_all, find_function, partition) for partition in partitions],
+            key=operator.attrgetter('id') if ordered else None,
+            buffer_size=buffer_size,
+            pool=self._producer_pool,
+        )
         yield from items
 
-    def _sync_via_async(self, objects, parameters, url, result_type, operation_type, output_id_field, get_method):
+    def _create_in_chunks(self, create_chunk, objects, parameters, result_type, chunk_size: int, parallelism: int):
+        skip_invalid_items = bool(getattr(parameters, 'skip_invalid_items', False))
+        chunk_futures = {}
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            pending = set()
+            for offset, chunk in _enumerate_chunks(objects, parameters, chunk_size, parallelism):
+                if len(pending) == parallelism:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    if _is_fatal_chunk_failure(done, skip_invalid_items):
+                        break
+                future = executor.submit(create_chunk, chunk)
+                chunk_futures[future] = offset
+                pending.add(future)
+            wait(pending)
+        return _merge_batch_create_results(result_type, chunk_futures, skip_invalid_items)
+
+    def _download_attachment_to_dir(self, attachment, out_dir):
+        if isinstance(attachment, str):
+            attachment = self.get_attachment(attachment)
+        path = _get_attachment_path(out_dir, attachment)
+        with self._raw_request('get', f'/v1/attachments/{attachment.id}/download', stream=True) as response:
+            return attachment.id, path, _save_attachment(path, response)
+
+    def _download_attachments(self, attachments, out_dir, parallelism: int):
+        _check_parallelism(parallelism)
+        os.makedirs(out_dir, exist_ok=True)
+        started = time.monotonic()
+        results = []
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            pending = set()
+            for attachment in attachments:
+                if len(pending) == parallelism:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    results.extend(future.result() for future in done)
+                pending.add(executor.submit(self._download_attachment_to_dir, attachment, out_dir))
+            results.extend(future.result() for future in wait(pending).done)
+        return _summarize_attachments_download(results, time.monotonic() - started)
+
+    def _wait_operations(self, ops, timeout):
+        polls = _OperationPolls(ops, timeout)
+        yield from polls.completed
+        while polls:
+            poll, time_to_wait = polls.pop()
+            if time_to_wait > 0:
+                time.sleep(time_to_wait)
+            updated_op = self.get_operation(poll[2].id)
+            if updated_op.is_completed():
+                yield updated_op
+            else:
+                polls.push(poll, updated_op)
+
+    def _iter_operation_log(self, operation_id):
+        response = self._raw_request('get', f'/v1/operations/{operation_id}/log', stream=True)
+        with response:
+            for log_item in iter_json_array(response.iter_content(chunk_size=64 * 1024)):
+                yield structure(log_item, OperationLogItem)
+
+    def _find_created(self, find_function, pool_id, ids, batch_size=1000):
+        window = _CreatedIdsWindow(ids, batch_size)
+        while window:
+            yield from window.take(find_function(pool_id=pool_id, sort='id', **window.get_params()))
+
+    def _sync_via_async(self, objects, parameters, url, result_type, operation_type, output_id_field, find_function):
         if not parameters.async_mode:
             response = self._request('post', url, json=unstructure(objects), params=unstructure(parameters))
             return structure(response, result_type)
 
         # Emulates synchronous operation, through asynchronous calls and reading operation logs.
-        client_uuid_to_index = {}
-        for i, obj in enumerate(objects):
-            obj._unexpected['__client_uuid'] = uuid.uuid4().hex
-            client_uuid_to_index[obj._unexpected['__client_uuid']] = str(i)
-
+        creation = _AsyncModeCreation(objects, output_id_field)
         response = self._request('post', url, json=unstructure(objects), params=unstructure(parameters))
         insert_operation = structure(response, operation_type)
         insert_operation = self.wait_operation(insert_operation, datetime.timedelta(minutes=60))
+        for log_item in self.iter_operation_log(insert_operation.id):
+            creation.add_log_item(log_item)
+        creation.check_created()
 
-        pools = {}
-        validation_errors = {}
-
-        for log_item in self.get_operation_log(insert_operation.id):
-            if log_item.type not in ['TASK_CREATE', 'TASK_VALIDATE', 'TASK_SUITE_VALIDATE', 'TASK_SUITE_CREATE']:
-                continue
-            if '__client_uuid' in log_item.input and log_item.input['__client_uuid'] in client_uuid_to_index:
-                index = client_uuid_to_index[log_item.input['__client_uuid']]
-            else:
-                continue
-            if log_item.success:
-                numerated_ids = pools.setdefault(log_item.input['pool_id'], {})
-                numerated_ids[log_item.output[output_id_field]] = index
-            else:
-                validation_errors[index] = {
-                    name: structure(error, batch_create_results.FieldValidationError)
-                    for name, error in log_item.output.items()
-                }
-
-        # Emulates the response as in a synchronous method:
-        # it will throw an exception even if the skip_invalid_items parameter is passed
-        # but no objects are created
-        if not pools:
-            raise ValidationApiError(
-                code='VALIDATION_ERROR',
-                message='Validation failed',
-                payload=validation_errors
-            )
-
-        # get object from all pools
-        items = {}
-        for pool_id, numerated_ids in pools.items():
-            obj_it = get_method(
-                pool_id=pool_id,
-                id_gte=min(numerated_ids.keys()),
-                id_lte=max(numerated_ids.keys()),
-            )
-            for obj in obj_it:
-                if obj.id in numerated_ids:
-                    items[numerated_ids[obj.id]] = obj
-
-        return result_type(items=items, validation_errors=validation_errors or {})
+        created_objects = []
+        for pool_id, created_ids in creation.created_ids_by_pool.items():
+            created_objects.extend(self._find_created(find_function, pool_id, created_ids.keys()))
+        return creation.get_result(result_type, created_objects)
 
     # Aggregation section
 
@@ -424,7 +784,8 @@ class TolokaClient:
     @expand('request')
     def find_aggregated_solutions(self, operation_id: str, request: search_requests.AggregatedSolutionSearchRequest,
                                   sort: Union[List[str], search_requests.AggregatedSolutionSortItems, None] = None,
-                                  limit: Optional[int] = None) -> search_results.AggregatedSolutionSearchResult:
+                                  limit: Optional[int] = None,
+                                  lazy: bool = False) -> search_results.AggregatedSolutionSearchResult:
         """Gets aggregated responses after the AggregatedSolutionOperation completes.
         It is better to use the "get_aggregated_solutions" method, that allows to iterate through all results.
 
@@ -437,6 +798,8 @@ class TolokaClient:
             sort: How to sort results. Defaults to None.
             limit: Limit on the number of results returned. The maximum is 100,000.
                 Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found solutions are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             search_results.AggregatedSolutionSearchResult: The first `limit` solutions in `items`. And a mark that there is more.
@@ -459,10 +822,10 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.AggregatedSolutionSortItems)
         response = self._search_request('get', f'/v1/aggregated-solutions/{operation_id}', request, sort, limit)
-        return structure(response, search_results.AggregatedSolutionSearchResult)
+        return search_results.AggregatedSolutionSearchResult.structure(response, lazy=lazy)
 
     @expand('request')
-    def get_aggregated_solutions(self, operation_id: str, request: search_requests.AggregatedSolutionSearchRequest) -> Generator[AggregatedSolution, None, None]:
+    def get_aggregated_solutions(self, operation_id: str, request: search_requests.AggregatedSolutionSearchRequest, lazy: bool = False) -> Generator[AggregatedSolution, None, None]:
         """Finds all aggregated responses after the AggregatedSolutionOperation completes
 
         **Note**: In all aggregation purposes we are strongly recommending using our crowd-kit library, that have more aggregation
@@ -471,6 +834,8 @@ class TolokaClient:
         Args:
             operation_id: From what aggregation operation you want to get results.
             request: How to filter search results.
+            lazy: If `True`, solutions are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             AggregatedSolution: The next object corresponding to the request parameters.
@@ -482,7 +847,7 @@ class TolokaClient:
             >>> aggregation_results = list(toloka_client.get_aggregated_solutions(aggregation_operation.id))
             ...
         """
-        find_function = functools.partial(self.find_aggregated_solutions, operation_id)
+        find_function = functools.partial(self.find_aggregated_solutions, operation_id, lazy=lazy)
         return self._find_all(find_function, request, sort_field='task_id')
 
     # Assignments section
@@ -510,7 +875,8 @@ class TolokaClient:
     @expand('request')
     def find_assignments(self, request: search_requests.AssignmentSearchRequest,
                          sort: Union[List[str], search_requests.AssignmentSortItems, None] = None,
-                         limit: Optional[int] = None) -> search_results.AssignmentSearchResult:
+                         limit: Optional[int] = None,
+                         lazy: bool = False) -> search_results.AssignmentSearchResult:
         """Finds all assignments that match certain rules
 
         As a result, it returns an object that contains the first part of the found assignments and whether there
@@ -523,6 +889,8 @@ class TolokaClient:
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of assignments returned. The maximum is 100,000.
                 Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found assignments are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             search_results.AssignmentSearchResult: The first `limit` assignments in `items`. And a mark that there is more.
@@ -537,7 +905,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.AssignmentSortItems)
         response = self._search_request('get', '/v1/assignments', request, sort, limit)
-        return structure(response, search_results.AssignmentSearchResult)
+        return search_results.AssignmentSearchResult.structure(response, lazy=lazy)
 
     def get_assignment(self, assignment_id: str) -> Assignment:
         """Reads one specific assignment
@@ -556,7 +924,8 @@ class TolokaClient:
         return structure(response, Assignment)
 
     @expand('request')
-    def get_assignments(self, request: search_requests.AssignmentSearchRequest) -> Generator[Assignment, None, None]:
+    def get_assignments(self, request: search_requests.AssignmentSearchRequest, parallelism: int = 1,
+                        ordered: bool = True, lazy: bool = False) -> Generator[Assignment, None, None]:
         """Finds all assignments that match certain rules and returns them in an iterable object
 
         Unlike find_assignments, returns generator. Does not sort assignments.
@@ -564,6 +933,15 @@ class TolokaClient:
 
         Args:
             request: How to search assignments.
+            parallelism: The number of concurrent requests. If it is greater than 1, the creation time range of
+                matching assignments is split into `parallelism` parts which are fetched concurrently.
+                Default value: `1`.
+            ordered: If `True`, assignments are yielded sorted by ID, the same way as without `parallelism`. Otherwise
+                they are yielded as soon as they are fetched, which is faster. Only used if `parallelism` is
+                greater than 1.
+                Default value: `True`.
+            lazy: If `True`, assignments are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             Assignment: The next object corresponding to the request parameters.
@@ -576,7 +954,10 @@ class TolokaClient:
             >>> result_list = [assignment.id for assignment in assignments]
             ...
         """
-        return self._find_all(self.find_assignments, request)
+        find_function = functools.partial(self.find_assignments, lazy=lazy)
+        if parallelism > 1:
+            return self._find_all_in_partitions(find_function, request, parallelism, ordered)
+        return self._find_all(find_function, request)
 
     @expand('patch')
     def patch_assignment(self, assignment_id: str, patch: AssignmentPatch) -> Assignment:
@@ -623,7 +1004,8 @@ class TolokaClient:
     @expand('request')
     def find_attachments(self, request: search_requests.AttachmentSearchRequest,
                          sort: Union[List[str], search_requests.AttachmentSortItems, None] = None,
-                         limit: Optional[int] = None) -> search_results.AttachmentSearchResult:
+                         limit: Optional[int] = None,
+                         lazy: bool = False) -> search_results.AttachmentSearchResult:
         """Finds all attachments that match certain rules
 
         As a result, it returns an object that contains the first part of the found attachments and whether there
@@ -636,6 +1018,8 @@ class TolokaClient:
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of results returned. The maximum is 100,000.
                 Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found attachments are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             search_results.AttachmentSearchResult: The first `limit` assignments in `items`. And a mark that there is more.
@@ -650,7 +1034,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.AttachmentSortItems)
         response = self._search_request('get', '/v1/attachments', request, sort, limit)
-        return structure(response, search_results.AttachmentSearchResult)
+        return search_results.AttachmentSearchResult.structure(response, lazy=lazy)
 
     def get_attachment(self, attachment_id: str) -> Attachment:
         """Gets attachment metadata without downloading it
@@ -673,7 +1057,7 @@ class TolokaClient:
         return structure(response, Attachment)
 
     @expand('request')
-    def get_attachments(self, request: search_requests.AttachmentSearchRequest) -> Generator[Attachment, None, None]:
+    def get_attachments(self, request: search_requests.AttachmentSearchRequest, lazy: bool = False) -> Generator[Attachment, None, None]:
         """Finds all attachments that match certain rules and returns their metadata in an iterable object
 
         Unlike find_attachments, returns generator. Does not sort attachments.
@@ -681,6 +1065,8 @@ class TolokaClient:
 
         Args:
             request: How to search attachments.
+            lazy: If `True`, attachments are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             Attachment: The next object corresponding to the request parameters.
@@ -691,7 +1077,8 @@ class TolokaClient:
             >>> results_list = [attachment for attachment in toloka_client.get_attachments(pool_id='1')]
             ...
         """
-        return self._find_all(self.find_attachments, request)
+        find_function = functools.partial(self.find_attachments, lazy=lazy)
+        return self._find_all(find_function, request)
 
     def download_attachment(self, attachment_id: str, out: BinaryIO) -> None:
         """Downloads specific attachment
@@ -708,9 +1095,41 @@ class TolokaClient:
             ...
         """
         response = self._raw_request('get', f'/v1/attachments/{attachment_id}/download', stream=True)
-        for content in response.iter_content():
+        for content in response.iter_content(chunk_size=64 * 1024):
             out.write(content)
 
+    def download_attachments(
+        self,
+        attachments: Union[search_requests.AttachmentSearchRequest, Iterable[str]],
+        out_dir: Union[str, os.PathLike],
+        parallelism: int = 8,
+    ) -> Dict[str, str]:
+        """Downloads many attachments to a directory concurrently
+
+        Files are named `<attachment ID>_<file name>`. Every file is written chunk by chunk as it's received. A file
+        that already exists and has the same size as the attachment is not downloaded again, so an interrupted download
+        can be resumed by calling the method once more. The throughput is logged at the end.
+
+        Args:
+            attachments: How to search attachments or a list of attachment IDs.
+            out_dir: The directory where to put files. It's created if it doesn't exist.
+            parallelism: The number of attachments downloaded concurrently.
+                Default value: `8`.
+
+        Returns:
+            Dict[str, str]: Paths to the files by attachment IDs.
+
+        Example:
+            How to download all attachments from a pool.
+
+            >>> request = toloka.search_requests.AttachmentSearchRequest(pool_id='1')
+            >>> paths = toloka_client.download_attachments(request, 'attachments', parallelism=16)
+            ...
+        """
+        if isinstance(attachments, search_requests.AttachmentSearchRequest):
+            attachments = self.get_attachments(attachments)
+        return self._download_attachments(attachments, out_dir, parallelism)
+
     # Message section
 
     @autocast_to_enum
@@ -766,7 +1185,8 @@ class TolokaClient:
     @expand('request')
     def find_message_threads(self, request: search_requests.MessageThreadSearchRequest,
                              sort: Union[List[str], search_requests.MessageThreadSortItems, None] = None,
-                             limit: Optional[int] = None) -> search_results.MessageThreadSearchResult:
+                             limit: Optional[int] = None,
+                             lazy: bool = False) -> search_results.MessageThreadSearchResult:
         """Finds all message threads that match certain rules
 
         As a result, it returns an object that contains the first part of the found threads and whether there
@@ -779,6 +1199,8 @@ class TolokaClient:
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of results returned. The maximum is 300.
                 Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found message threads are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             search_results.MessageThreadSearchResult: The first `limit` message threads in `items`.
@@ -792,7 +1214,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.MessageThreadSortItems)
         response = self._search_request('get', '/v1/message-threads', request, sort, limit)
-        return structure(response, search_results.MessageThreadSearchResult)
+        return search_results.MessageThreadSearchResult.structure(response, lazy=lazy)
 
     def reply_message_thread(self, message_thread_id: str, reply: MessageThreadReply) -> MessageThread:
         """Replies to a message in thread
@@ -815,7 +1237,7 @@ class TolokaClient:
         return structure(response, MessageThread)
 
     @expand('request')
-    def get_message_threads(self, request: search_requests.MessageThreadSearchRequest) -> Generator[MessageThread, None, None]:
+    def get_message_threads(self, request: search_requests.MessageThreadSearchRequest, lazy: bool = False) -> Generator[MessageThread, None, None]:
         """Finds all message threads that match certain rules and returns them in an iterable object
 
         Unlike find_message_threads, returns generator. Does not sort threads.
@@ -823,6 +1245,8 @@ class TolokaClient:
 
         Args:
             request: How to search attachments.
+            lazy: If `True`, message threads are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             MessageThread: The next object corresponding to the request parameters.
@@ -833,7 +1257,8 @@ class TolokaClient:
             >>> message_threads = toloka_client.get_message_threads(folder=['INBOX', 'UNREAD'])
             ...
         """
-        return self._find_all(self.find_message_threads, request)
+        find_function = functools.partial(self.find_message_threads, lazy=lazy)
+        return self._find_all(find_function, request)
 
     @autocast_to_enum
     def remove_message_thread_from_folders(self, message_thread_id: str, folders: Union[List[Folder], MessageThreadFolders]) -> MessageThread:
@@ -875,6 +1300,7 @@ class TolokaClient:
         """
         operation = self.archive_project_async(project_id)
         operation = self.wait_operation(operation)
+        self._invalidate_cache(f'/v1/projects/{operation.parameters.project_id}')
         return self.get_project(operation.parameters.project_id)
 
     def archive_project_async(self, project_id: str) -> operations.ProjectArchiveOperation:
@@ -975,7 +1401,7 @@ class TolokaClient:
             >>> toloka_client.get_project(project_id='1')
             ...
         """
-        response = self._request('get', f'/v1/projects/{project_id}')
+        response = self._cached_request(f'/v1/projects/{project_id}')
         return structure(response, Project)
 
     @expand('request')
@@ -1117,6 +1543,7 @@ class TolokaClient:
         if operation:
             operation = self.wait_operation(operation)
             operation.raise_on_fail()
+        self._invalidate_cache(f'/v1/pools/{pool_id}')
         return self.get_pool(pool_id)
 
     def archive_pool_async(self, pool_id: str) -> Optional[operations.PoolArchiveOperation]:
@@ -1165,6 +1592,7 @@ class TolokaClient:
             operation = self.wait_operation(operation)
             operation.raise_on_fail()
 
+        self._invalidate_cache(f'/v1/pools/{pool_id}')
         return self.get_pool(pool_id)
 
     def close_pool_async(self, pool_id: str) -> Optional[operations.PoolCloseOperation]:
@@ -1208,6 +1636,7 @@ class TolokaClient:
         if operation:
             operation = self.wait_operation(operation)
             operation.raise_on_fail()
+        self._invalidate_cache(f'/v1/pools/{pool_id}')
         return self.get_pool(pool_id)
 
     def close_pool_for_update_async(self, pool_id: str) -> Optional[operations.PoolCloseOperation]:
@@ -1367,7 +1796,7 @@ class TolokaClient:
             >>> toloka_client.get_pool(pool_id='1')
             ...
         """
-        response = self._request('get', f'/v1/pools/{pool_id}')
+        response = self._cached_request(f'/v1/pools/{pool_id}')
         return structure(response, Pool)
 
     @expand('request')
@@ -1418,6 +1847,7 @@ class TolokaClient:
             operation = self.wait_operation(operation)
             operation.raise_on_fail()
 
+        self._invalidate_cache(f'/v1/pools/{pool_id}')
         return self.get_pool(pool_id)
 
     def open_pool_async(self, pool_id: str) -> Optional[operations.PoolOpenOperation]:
@@ -1507,6 +1937,7 @@ class TolokaClient:
         if operation:
             operation = self.wait_operation(operation)
             operation.raise_on_fail()
+        self._invalidate_cache(f'/v1/trainings/{training_id}')
         return self.get_training(training_id)
 
     def archive_training_async(self, training_id: str) -> Optional[operations.TrainingArchiveOperation]:
@@ -1552,6 +1983,7 @@ class TolokaClient:
         if operation:
             operation = self.wait_operation(operation)
             operation.raise_on_fail()
+        self._invalidate_cache(f'/v1/trainings/{training_id}')
         return self.get_training(training_id)
 
     def close_training_async(self, training_id: str) -> Optional[operations.TrainingCloseOperation]:
@@ -1707,7 +2139,7 @@ class TolokaClient:
             >>> toloka_client.get_training(training_id='1')
             ...
         """
-        response = self._request('get', f'/v1/trainings/{training_id}')
+        response = self._cached_request(f'/v1/trainings/{training_id}')
         return structure(response, Training)
 
     @expand('request')
@@ -1750,6 +2182,7 @@ class TolokaClient:
         if operation:
             operation = self.wait_operation(operation)
             operation.raise_on_fail()
+        self._invalidate_cache(f'/v1/trainings/{training_id}')
         return self.get_training(training_id)
 
     def open_training_async(self, training_id: str) -> Optional[operations.TrainingOpenOperation]:
@@ -1871,7 +2304,7 @@ class TolokaClient:
             >>> toloka_client.get_skill(skill_id='1')
             ...
         """
-        response = self._request('get', f'/v1/skills/{skill_id}')
+        response = self._cached_request(f'/v1/skills/{skill_id}')
         return structure(response, Skill)
 
     @expand('request')
@@ -1972,7 +2405,14 @@ class TolokaClient:
         return structure(response, Task)
 
     @expand('parameters')
-    def create_tasks(self, tasks: List[Task], parameters: Optional[task.CreateTasksParameters] = None) -> batch_create_results.TaskBatchCreateResult:
+    def create_tasks(
+        self,
+        tasks: Iterable[Task],
+        parameters: Optional[task.CreateTasksParameters] = None,
+        *,
+        chunk_size: Optional[int] = None,
+        parallelism: int = 1,
+    ) -> batch_create_results.TaskBatchCreateResult:
         """Creates many tasks in pools
 
         By default uses asynchronous operation inside. It's better not to set "async_mode=False", if you not understand
@@ -1982,9 +2422,14 @@ class TolokaClient:
         Recomended maximum of 10,000 task per request if async_mode is True.
 
         Args:
-            tasks: List of tasks, that will be created.
+            tasks: Tasks that will be created. Any iterable, including generators, is accepted.
             parameters: Parameters for Tasks creation controlling. Defaults to None, in which case the asynchronous
                 operations is used.
+            chunk_size: The maximum number of tasks sent in one request. Larger sequences are split into chunks
+                which are created by separate operations.
+                Default value: `None`, which means 10,000 tasks in asynchronous mode and 5,000 otherwise.
+            parallelism: The maximum number of chunks that are created concurrently.
+                Default value: `1`.
 
         Returns:
             batch_create_results.TaskBatchCreateResult: Result of tasks creating. Contains created tasks in `items` and
@@ -1992,7 +2437,8 @@ class TolokaClient:
 
         Raises:
             ValidationApiError: If no tasks were created, or skip_invalid_items==False and there is a problem when
-                checking any task.
+                checking any task. In the latter case the remaining chunks are not sent, but the chunks that are
+                already created are not rolled back.
 
         Example:
             How to create regular tasks from tsv.
@@ -2024,14 +2470,19 @@ class TolokaClient:
         """
         if not parameters:
             parameters = task.CreateTasksParameters()
-        return self._sync_via_async(
-            objects=tasks,
+        create_chunk = functools.partial(
+            self._sync_via_async,
             parameters=parameters,
             url='/v1/tasks',
             result_type=batch_create_results.TaskBatchCreateResult,
             operation_type=operations.TasksCreateOperation,
             output_id_field='task_id',
-            get_method=self.get_tasks
+            find_function=self.find_tasks
+        )
+        return self._create_in_chunks(
+            create_chunk, tasks, parameters, batch_create_results.TaskBatchCreateResult,
+            chunk_size=chunk_size or (10000 if parameters.async_mode else 5000),
+            parallelism=parallelism,
         )
 
     @expand('parameters')
@@ -2068,7 +2519,8 @@ class TolokaClient:
     @expand('request')
     def find_tasks(self, request: search_requests.TaskSearchRequest,
                    sort: Union[List[str], search_requests.TaskSortItems, None] = None,
-                   limit: Optional[int] = None) -> search_results.TaskSearchResult:
+                   limit: Optional[int] = None,
+                   lazy: bool = False) -> search_results.TaskSearchResult:
         """Finds all tasks that match certain rules
 
         As a result, it returns an object that contains the first part of the found tasks and whether there
@@ -2081,6 +2533,8 @@ class TolokaClient:
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of results returned. The maximum is 100 000.
                 Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found tasks are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             TaskSearchResult: The first `limit` tasks in `items`. And a mark that there is more.
@@ -2095,7 +2549,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.TaskSortItems)
         response = self._search_request('get', '/v1/tasks', request, sort, limit)
-        return structure(response, search_results.TaskSearchResult)
+        return search_results.TaskSearchResult.structure(response, lazy=lazy)
 
     def get_task(self, task_id: str) -> Task:
         """Reads one specific task
@@ -2114,7 +2568,8 @@ class TolokaClient:
         return structure(response, Task)
 
     @expand('request')
-    def get_tasks(self, request: search_requests.TaskSearchRequest) -> Generator[Task, None, None]:
+    def get_tasks(self, request: search_requests.TaskSearchRequest, parallelism: int = 1,
+                  ordered: bool = True, lazy: bool = False) -> Generator[Task, None, None]:
         """Finds all tasks that match certain rules and returns them in an iterable object
 
         Unlike find_tasks, returns generator. Does not sort tasks.
@@ -2122,6 +2577,15 @@ class TolokaClient:
 
         Args:
             request: How to search tasks.
+            parallelism: The number of concurrent requests. If it is greater than 1, the creation time range of
+                matching tasks is split into `parallelism` parts which are fetched concurrently.
+                Default value: `1`.
+            ordered: If `True`, tasks are yielded sorted by ID, the same way as without `parallelism`. Otherwise
+                they are yielded as soon as they are fetched, which is faster. Only used if `parallelism` is
+                greater than 1.
+                Default value: `True`.
+            lazy: If `True`, tasks are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             Task: The next object corresponding to the request parameters.
@@ -2132,7 +2596,10 @@ class TolokaClient:
             >>> results_list = [task for task in toloka_client.get_tasks(pool_id='1')]
             ...
         """
-        return self._find_all(self.find_tasks, request)
+        find_function = functools.partial(self.find_tasks, lazy=lazy)
+        if parallelism > 1:
+            return self._find_all_in_partitions(find_function, request, parallelism, ordered)
+        return self._find_all(find_function, request)
 
     @expand('patch')
     def patch_task(self, task_id: str, patch: task.TaskPatch) -> Task:
@@ -2202,7 +2669,14 @@ class TolokaClient:
         return structure(response, TaskSuite)
 
     @expand('parameters')
-    def create_task_suites(self, task_suites: List[TaskSuite], parameters: Optional[task_suite.TaskSuiteCreateRequestParameters] = None) -> batch_create_results.TaskSuiteBatchCreateResult:
+    def create_task_suites(
+        self,
+        task_suites: Iterable[TaskSuite],
+        parameters: Optional[task_suite.TaskSuiteCreateRequestParameters] = None,
+        *,
+        chunk_size: Optional[int] = None,
+        parallelism: int = 1,
+    ) -> batch_create_results.TaskSuiteBatchCreateResult:
         """Creates many task suites in pools
 
         Generally, you don't need to create a task set yourself, because you can create tasks and Toloka will create
@@ -2215,9 +2689,14 @@ class TolokaClient:
         Recomended maximum of 10,000 task suites per request if async_mode is True.
 
         Args:
-            task_suites: List of task suites, that will be created.
+            task_suites: Task suites that will be created. Any iterable, including generators, is accepted.
             parameters: Parameters for TaskSuite creation controlling. Defaults to None, in which case the asynchronous
                 operations is used.
+            chunk_size: The maximum number of task suites sent in one request. Larger sequences are split into chunks
+                which are created by separate operations.
+                Default value: `None`, which means 10,000 task suites in asynchronous mode and 5,000 otherwise.
+            parallelism: The maximum number of chunks that are created concurrently.
+                Default value: `1`.
 
         Returns:
             TaskSuiteBatchCreateResult: Result of task suites creating. Contains created task suites in `items` and
@@ -2225,7 +2704,8 @@ class TolokaClient:
 
         Raises:
             ValidationApiError: If no tasks were created, or skip_invalid_items==False and there is a problem when
-                checking any task.
+                checking any task. In the latter case the remaining chunks are not sent, but the chunks that are
+                already created are not rolled back.
 
         Example:
             >>> task_suites = [
@@ -2245,14 +2725,19 @@ class TolokaClient:
         """
         if not parameters:
             parameters = task_suite.TaskSuiteCreateRequestParameters()
-        return self._sync_via_async(
-            objects=task_suites,
+        create_chunk = functools.partial(
+            self._sync_via_async,
             parameters=parameters,
             url='/v1/task-suites',
             result_type=batch_create_results.TaskBatchCreateResult,
             operation_type=operations.TaskSuiteCreateBatchOperation,
             output_id_field='task_suite_id',
-            get_method=self.get_task_suites
+            find_function=self.find_task_suites
+        )
+        return self._create_in_chunks(
+            create_chunk, task_suites, parameters, batch_create_results.TaskBatchCreateResult,
+            chunk_size=chunk_size or (10000 if parameters.async_mode else 5000),
+            parallelism=parallelism,
         )
 
     @expand('parameters')
@@ -2293,7 +2778,8 @@ class TolokaClient:
     @expand('request')
     def find_task_suites(self, request: search_requests.TaskSuiteSearchRequest,
                          sort: Union[List[str], search_requests.TaskSuiteSortItems, None] = None,
-                         limit: Optional[int] = None) -> search_results.TaskSuiteSearchResult:
+                         limit: Optional[int] = None,
+                         lazy: bool = False) -> search_results.TaskSuiteSearchResult:
         """Finds all task suites that match certain rules
 
         As a result, it returns an object that contains the first part of the found task suites and whether there
@@ -2306,6 +2792,8 @@ class TolokaClient:
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of results returned. The maximum is 100 000.
                 Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found task suites are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             TaskSuiteSearchResult: The first `limit` task suites in `items`. And a mark that there is more.
@@ -2320,7 +2808,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.TaskSuiteSortItems)
         response = self._search_request('get', '/v1/task-suites', request, sort, limit)
-        return structure(response, search_results.TaskSuiteSearchResult)
+        return search_results.TaskSuiteSearchResult.structure(response, lazy=lazy)
 
     def get_task_suite(self, task_suite_id: str) -> TaskSuite:
         """Reads one specific task suite
@@ -2339,7 +2827,8 @@ class TolokaClient:
         return structure(response, TaskSuite)
 
     @expand('request')
-    def get_task_suites(self, request: search_requests.TaskSuiteSearchRequest) -> Generator[TaskSuite, None, None]:
+    def get_task_suites(self, request: search_requests.TaskSuiteSearchRequest, parallelism: int = 1,
+                        ordered: bool = True, lazy: bool = False) -> Generator[TaskSuite, None, None]:
         """Finds all task suites that match certain rules and returns them in an iterable object
 
         Unlike find_task_suites, returns generator. Does not sort task suites.
@@ -2347,6 +2836,15 @@ class TolokaClient:
 
         Args:
             request: How to search task suites.
+            parallelism: The number of concurrent requests. If it is greater than 1, the creation time range of
+                matching task suites is split into `parallelism` parts which are fetched concurrently.
+                Default value: `1`.
+            ordered: If `True`, task suites are yielded sorted by ID, the same way as without `parallelism`. Otherwise
+                they are yielded as soon as they are fetched, which is faster. Only used if `parallelism` is
+                greater than 1.
+                Default value: `True`.
+            lazy: If `True`, task suites are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             TaskSuite: The next object corresponding to the request parameters.
@@ -2357,7 +2855,10 @@ class TolokaClient:
             >>> results_list = [task_suite for task_suite in toloka_client.get_task_suites(pool_id='1')]
             ...
         """
-        return self._find_all(self.find_task_suites, request)
+        find_function = functools.partial(self.find_task_suites, lazy=lazy)
+        if parallelism > 1:
+            return self._find_all_in_partitions(find_function, request, parallelism, ordered)
+        return self._find_all(find_function, request)
 
     @expand('patch')
     def patch_task_suite(self, task_suite_id: str, patch: task_suite.TaskSuitePatch) -> TaskSuite:
@@ -2452,25 +2953,42 @@ class TolokaClient:
             >>> print('Pool was closed.')
             ...
         """
-        default_time_to_wait = datetime.timedelta(seconds=1)
-        default_initial_delay = datetime.timedelta(milliseconds=500)
-
         if op.is_completed():
             return op
 
-        utcnow = datetime.datetime.utcnow()
-        wait_until_time = utcnow + timeout
+        for op in self.wait_operations([op], timeout):
+            return op
 
-        if not op.started or utcnow - op.started < default_initial_delay:
-            time.sleep(default_initial_delay.total_seconds())
+    def wait_operations(
+        self,
+        ops: List[operations.Operation],
+        timeout: datetime.timedelta = datetime.timedelta(minutes=10),
+    ) -> Generator[operations.Operation, None, None]:
+        """Waits for several operations to complete, and returns them as soon as each one is completed
 
-        while True:
-            op = self.get_operation(op.id)
-            if op.is_completed():
-                return op
-            time.sleep(default_time_to_wait.total_seconds())
-            if datetime.datetime.utcnow() > wait_until_time:
-                raise TimeoutError
+        All operations are polled one by one from a single loop, so no threads are needed. The polling interval of
+        each operation adapts to its progress: it is shortened when the operation is about to finish and grows
+        exponentially when there is no progress. This takes far fewer requests than calling `wait_operation` for
+        every operation.
+
+        Args:
+            ops: Operations to wait for.
+            timeout: How long to wait for all operations. Defaults to 10 minutes.
+
+        Raises:
+            TimeoutError: Raises it if the timeout has expired and some operations are still not completed.
+
+        Returns:
+            Generator[Operation, None, None]: Completed operations in order of completion.
+
+        Example:
+            >>> ops = [toloka_client.open_pool_async(pool_id) for pool_id in pool_ids]
+            >>> for op in toloka_client.wait_operations(ops):
+            >>>     op.raise_on_fail()
+            >>>     print(f'Pool {op.parameters.pool_id} is opened')
+            ...
+        """
+        return self._wait_operations(ops, timeout)
 
     def get_operation_log(self, operation_id: str) -> List[OperationLogItem]:
         """Reads information about validation errors and which task (or task suites) were created
@@ -2492,6 +3010,26 @@ class TolokaClient:
         response = self._request('get', f'/v1/operations/{operation_id}/log')
         return structure(response, List[OperationLogItem])
 
+    def iter_operation_log(self, operation_id: str) -> Generator[OperationLogItem, None, None]:
+        """Reads the operation log item by item
+
+        Works like `get_operation_log`, but the log is parsed while it is being downloaded and its items are yielded one
+        by one. Use it to read logs of huge batch operations without loading the whole log into memory.
+
+        Args:
+            operation_id: ID of the operation.
+
+        Returns:
+            Generator[OperationLogItem, None, None]: Iterator over the operation log items.
+
+        Example:
+            >>> for log_item in toloka_client.iter_operation_log(operation_id='1'):
+            >>>     if not log_item.success:
+            >>>         print(log_item.output)
+            ...
+        """
+        return self._iter_operation_log(operation_id)
+
     # User bonus
 
     @expand('parameters')
@@ -2529,20 +3067,37 @@ class TolokaClient:
         return structure(response, UserBonus)
 
     @expand('parameters')
-    def create_user_bonuses(self, user_bonuses: List[UserBonus], parameters: Optional[UserBonusCreateRequestParameters] = None) -> batch_create_results.UserBonusBatchCreateResult:
+    def create_user_bonuses(
+        self,
+        user_bonuses: Iterable[UserBonus],
+        parameters: Optional[UserBonusCreateRequestParameters] = None,
+        *,
+        chunk_size: int = 10000,
+        parallelism: int = 1,
+    ) -> batch_create_results.UserBonusBatchCreateResult:
         """Creates many user bonuses
 
         Right now it's safer to use asynchronous version: "create_user_bonuses_async"
         You can send a maximum of 10,000 requests of this kind per day.
 
         Args:
-            user_bonuses: To whom, how much to pay and for what.
+            user_bonuses: To whom, how much to pay and for what. Any iterable, including generators, is accepted.
             parameters: Parameters for UserBonus creation controlling.
+            chunk_size: The maximum number of user bonuses sent in one request. Larger sequences are split into chunks
+                which are created by separate requests.
+                Default value: `10000`.
+            parallelism: The maximum number of chunks that are created concurrently.
+                Default value: `1`.
 
         Returns:
             UserBonusBatchCreateResult: Result of user bonuses creating. Contains created user bonuses in `items` and
                 problems in "validation_errors".
 
+        Raises:
+            ValidationApiError: If no bonuses were created, or skip_invalid_items==False and there is a problem when
+                checking any bonus. In the latter case the remaining chunks are not sent, but the bonuses that are
+                already issued are not rolled back.
+
         Example:
             >>> import decimal
             >>> new_bonuses=[
@@ -2562,6 +3117,14 @@ class TolokaClient:
             >>> toloka_client.create_user_bonuses(new_bonuses)
             ...
         """
+        return self._create_in_chunks(
+            functools.partial(self._create_user_bonuses_chunk, parameters=parameters),
+            user_bonuses, parameters, batch_create_results.UserBonusBatchCreateResult,
+            chunk_size=chunk_size,
+            parallelism=parallelism,
+        )
+
+    def _create_user_bonuses_chunk(self, user_bonuses, parameters):
         response = self._request(
             'post', '/v1/user-bonuses', json=unstructure(user_bonuses),
             params=({} if parameters is None else unstructure(parameters)),
@@ -2608,7 +3171,8 @@ class TolokaClient:
     @expand('request')
     def find_user_bonuses(self, request: search_requests.UserBonusSearchRequest,
                           sort: Union[List[str], search_requests.UserBonusSortItems, None] = None,
-                          limit: Optional[int] = None) -> search_results.UserBonusSearchResult:
+                          limit: Optional[int] = None,
+                          lazy: bool = False) -> search_results.UserBonusSearchResult:
         """Finds all user bonuses that match certain rules
 
         As a result, it returns an object that contains the first part of the found user bonuses and whether there
@@ -2620,6 +3184,8 @@ class TolokaClient:
             request: How to search user bonuses.
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of results returned.
+            lazy: If `True`, found bonuses are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             UserBonusSearchResult: The first `limit` user bonuses in `items`.
@@ -2633,7 +3199,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.UserBonusSortItems)
         response = self._search_request('get', '/v1/user-bonuses', request, sort, limit)
-        return structure(response, search_results.UserBonusSearchResult)
+        return search_results.UserBonusSearchResult.structure(response, lazy=lazy)
 
     def get_user_bonus(self, user_bonus_id: str) -> UserBonus:
         """Reads one specific user bonus
@@ -2652,7 +3218,8 @@ class TolokaClient:
         return structure(response, UserBonus)
 
     @expand('request')
-    def get_user_bonuses(self, request: search_requests.UserBonusSearchRequest) -> Generator[UserBonus, None, None]:
+    def get_user_bonuses(self, request: search_requests.UserBonusSearchRequest, parallelism: int = 1,
+                         ordered: bool = True, lazy: bool = False) -> Generator[UserBonus, None, None]:
         """Finds all user bonuses that match certain rules and returns them in an iterable object
 
         Unlike find_user_bonuses, returns generator. Does not sort user bonuses.
@@ -2660,6 +3227,15 @@ class TolokaClient:
 
         Args:
             request: How to search user bonus.
+            parallelism: The number of concurrent requests. If it is greater than 1, the creation time range of
+                matching user bonuses is split into `parallelism` parts which are fetched concurrently.
+                Default value: `1`.
+            ordered: If `True`, user bonuses are yielded sorted by ID, the same way as without `parallelism`. Otherwise
+                they are yielded as soon as they are fetched, which is faster. Only used if `parallelism` is
+                greater than 1.
+                Default value: `True`.
+            lazy: If `True`, bonuses are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             UserBonus: The next object corresponding to the request parameters.
@@ -2668,14 +3244,18 @@ class TolokaClient:
             >>> bonuses = [bonus for bonus in toloka_client.get_user_bonuses(created_lt='2021-06-01T00:00:00')]
             ...
         """
-        return self._find_all(self.find_user_bonuses, request)
+        find_function = functools.partial(self.find_user_bonuses, lazy=lazy)
+        if parallelism > 1:
+            return self._find_all_in_partitions(find_function, request, parallelism, ordered)
+        return self._find_all(find_function, request)
 
     # User restrictions
 
     @expand('request')
     def find_user_restrictions(self, request: search_requests.UserRestrictionSearchRequest,
                                sort: Union[List[str], search_requests.UserRestrictionSortItems, None] = None,
-                               limit: Optional[int] = None) -> search_results.UserRestrictionSearchResult:
+                               limit: Optional[int] = None,
+                               lazy: bool = False) -> search_results.UserRestrictionSearchResult:
         """Finds all user restrictions that match certain rules
 
         As a result, it returns an object that contains the first part of the found user restrictions and whether there
@@ -2687,6 +3267,8 @@ class TolokaClient:
             request: How to search user restrictions.
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of results returned.
+            lazy: If `True`, found restrictions are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             UserRestrictionSearchResult: The first `limit` user restrictions in `items`.
@@ -2700,7 +3282,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.UserRestrictionSortItems)
         response = self._search_request('get', '/v1/user-restrictions', request, sort, limit)
-        return structure(response, search_results.UserRestrictionSearchResult)
+        return search_results.UserRestrictionSearchResult.structure(response, lazy=lazy)
 
     def get_user_restriction(self, user_restriction_id: str) -> UserRestriction:
         """Reads one specific user restriction
@@ -2719,7 +3301,7 @@ class TolokaClient:
         return structure(response, UserRestriction)
 
     @expand('request')
-    def get_user_restrictions(self, request: search_requests.UserRestrictionSearchRequest) -> Generator[UserRestriction, None, None]:
+    def get_user_restrictions(self, request: search_requests.UserRestrictionSearchRequest, lazy: bool = False) -> Generator[UserRestriction, None, None]:
         """Finds all user restrictions that match certain rules and returns them in an iterable object
 
         Unlike find_user_restrictions, returns generator. Does not sort user restrictions.
@@ -2727,6 +3309,8 @@ class TolokaClient:
 
         Args:
             request: How to search user restrictions.
+            lazy: If `True`, restrictions are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             UserRestriction: The next object corresponding to the request parameters.
@@ -2735,7 +3319,8 @@ class TolokaClient:
             >>> results_list = [restriction for restriction in toloka_client.get_user_restrictions(scope='ALL_PROJECTS')]
             ...
         """
-        return self._find_all(self.find_user_restrictions, request)
+        find_function = functools.partial(self.find_user_restrictions, lazy=lazy)
+        return self._find_all(find_function, request)
 
     def set_user_restriction(self, user_restriction: UserRestriction) -> UserRestriction:
         """Closes the performer's access to one or more projects
@@ -2796,7 +3381,7 @@ class TolokaClient:
             >>>     print('You haven\'t got enough money on your account!')
             ...
         """
-        response = self._request('get', '/v1/requester')
+        response = self._cached_request('/v1/requester')
         return structure(response, Requester)
 
     # User skills
@@ -2804,7 +3389,8 @@ class TolokaClient:
     @expand('request')
     def find_user_skills(self, request: search_requests.UserSkillSearchRequest,
                          sort: Union[List[str], search_requests.UserSkillSortItems, None] = None,
-                         limit: Optional[int] = None) -> search_results.UserSkillSearchResult:
+                         limit: Optional[int] = None,
+                         lazy: bool = False) -> search_results.UserSkillSearchResult:
         """Finds all user skills that match certain rules
 
         UserSkill describe the skill value for a specific performer.
@@ -2817,6 +3403,8 @@ class TolokaClient:
             request: How to search user skills.
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of results returned.
+            lazy: If `True`, found skills are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             UserSkillSearchResult: The first `limit` user skills in `items`.
@@ -2830,7 +3418,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.UserSkillSortItems)
         response = self._search_request('get', '/v1/user-skills', request, sort, limit)
-        return structure(response, search_results.UserSkillSearchResult)
+        return search_results.UserSkillSearchResult.structure(response, lazy=lazy)
 
     def get_user_skill(self, user_skill_id: str) -> UserSkill:
         """Gets the value of the user's skill
@@ -2851,7 +3439,7 @@ class TolokaClient:
         return structure(response, UserSkill)
 
     @expand('request')
-    def get_user_skills(self, request: search_requests.UserSkillSearchRequest) -> Generator[UserSkill, None, None]:
+    def get_user_skills(self, request: search_requests.UserSkillSearchRequest, lazy: bool = False) -> Generator[UserSkill, None, None]:
         """Finds all user skills that match certain rules and returns them in an iterable object
 
         UserSkill describe the skill value for a specific performer.
@@ -2860,6 +3448,8 @@ class TolokaClient:
 
         Args:
             request: How to search user skills.
+            lazy: If `True`, skills are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             UserSkill: The next object corresponding to the request parameters.
@@ -2868,7 +3458,8 @@ class TolokaClient:
             >>> results_list = [skill for skill in toloka_client.get_user_skills()]
             ...
         """
-        return self._find_all(self.find_user_skills, request)
+        find_function = functools.partial(self.find_user_skills, lazy=lazy)
+        return self._find_all(find_function, request)
 
     @expand('request')
     def set_user_skill(self, request: SetUserSkillRequest) -> UserSkill:
@@ -2999,15 +3590,30 @@ class TolokaClient:
     # Experimental section
 
     @expand('parameters')
-    def get_assignments_df(self, pool_id: str, parameters: GetAssignmentsTsvParameters) -> pd.DataFrame:
+    def get_assignments_df(
+        self,
+        pool_id: str,
+        parameters: GetAssignmentsTsvParameters,
+        *,
+        chunksize: Optional[int] = None,
+        usecols: Optional[List[str]] = None,
+        dtype: Optional[Dict[str, Any]] = None,
+    ) -> Union['pd.DataFrame', Iterator['pd.DataFrame']]:
         """Downloads assignments as pandas.DataFrame
 
         Experimental method.
         Implements the same behavior as if you download results in web-interface and then read it by pandas.
 
+        The response is read in chunks while the DataFrame is being built, so the whole export is never held in memory
+        as text.
+
         Args:
             pool_id: From which pool the results are loaded.
             parameters: Filters for the results and the set of fields that will be in the dataframe.
+            chunksize: If set, an iterator over DataFrames of up to `chunksize` rows is returned instead of a single
+                DataFrame. The response is downloaded as the iterator is consumed.
+            usecols: Names of the columns to read. Other columns are skipped while parsing.
+            dtype: Data types of the columns, e.g. `{'OUTPUT:result': 'category'}`.
 
         Returns:
             pd.DataFrame: DataFrame with all results. Contains groups of fields with prefixes:
@@ -3029,11 +3635,74 @@ class TolokaClient:
             >>>     'ASSIGNMENT:worker_id': 'performer'
             >>> })
             ...
+
+            Process a large pool by chunks of 10000 rows reading only the needed columns.
+
+            >>> for chunk_df in toloka_client.get_assignments_df(
+            >>>     pool_id='1', chunksize=10000, usecols=['INPUT:image', 'OUTPUT:result'],
+            >>> ):
+            >>>     process(chunk_df)
+            ...
+        """
+        # pandas takes a large share of the import time and is needed only here
+        import pandas as pd
+
+        logger.warning('Experimental method')
+        response = self._raw_request('get', f'/new/requester/pools/{pool_id}/assignments.tsv',
+                                     params=unstructure(parameters), stream=True)
+        # The connection is released as soon as the response is read to the end or the reader is closed
+        stream = iterable_to_stream(response.iter_content(chunk_size=64 * 1024), on_close=response.close)
+        try:
+            reader = pd.read_csv(stream, delimiter='\t', chunksize=chunksize, usecols=usecols, dtype=dtype,
+                                 encoding=response.encoding or 'utf-8')
+        except BaseException:
+            stream.close()
+            raise
+        if chunksize is None:
+            stream.close()
+            return reader
+
+        close_reader = reader.close
+
+        def close():
+            close_reader()
+            stream.close()
+
+        reader.close = close
+        return reader
+
+    @expand('parameters')
+    def download_assignments_tsv(
+        self,
+        pool_id: str,
+        out: Union[str, os.PathLike, BinaryIO],
+        parameters: GetAssignmentsTsvParameters,
+    ) -> None:
+        """Downloads assignments in the TSV format as is
+
+        Experimental method.
+        The same export as in `get_assignments_df`, but it is written to a file chunk by chunk without parsing.
+
+        Args:
+            pool_id: From which pool the results are loaded.
+            out: Path to the file or a binary file object where to write the results.
+            parameters: Filters for the results and the set of fields that will be in the file.
+
+        Example:
+            >>> toloka_client.download_assignments_tsv(pool_id='1', out='results.tsv')
+            ...
         """
         logger.warning('Experimental method')
         response = self._raw_request('get', f'/new/requester/pools/{pool_id}/assignments.tsv',
-                                     params=unstructure(parameters))
-        return pd.read_csv(io.StringIO(response.text), delimiter='\t')
+                                     params=unstructure(parameters), stream=True)
+        with response:
+            if isinstance(out, (str, os.PathLike)):
+                with open(out, 'wb') as out_file:
+                    for content in response.iter_content(chunk_size=64 * 1024):
+                        out_file.write(content)
+            else:
+                for content in response.iter_content(chunk_size=64 * 1024):
+                    out.write(content)
 
     # toloka apps
 
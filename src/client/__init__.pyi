@@ -55,6 +55,7 @@ __all__ = [
 import datetime
 import decimal
 import enum
+import os
 import pandas.core.frame
 import requests.packages.urllib3.util.retry
 import toloka.client.aggregation
@@ -69,6 +70,8 @@ import toloka.client.message_thread
 import toloka.client.operation_log
 import toloka.client.operations
 import toloka.client.pool
+import toloka.client.primitives.cache
+import toloka.client.primitives.rate_limiter
 import toloka.client.project
 import toloka.client.requester
 import toloka.client.search_requests
@@ -188,6 +191,22 @@ class TolokaClient:
         retryer_factory: Factory that creates `Retry` object.
             Fully specified retry policy that will apply to all requests.
             Default value: `None`.
+        prefetch_pages: The number of result pages that `get_*` methods request in advance in a background thread,
+            while previous pages are being processed. Overlaps network latency with processing at the cost of keeping
+            up to `prefetch_pages` extra pages in memory.
+            Default value: `0`, pages are requested one by one.
+        rate_limiter: Client-side limits on the rate of requests to different API endpoints. Requests wait for their
+            turn instead of exceeding Toloka quotas and getting the `429 Too Many Requests` error. A single
+            `RateLimiter` can be shared by several clients.
+            Default value: `None`, requests are not limited.
+        fast_json: Decode responses with `orjson` or `simdjson` if one of them is installed, which is several times
+            faster than the default decoder. Fields annotated as `Decimal` (e.g. `Assignment.reward`) are still
+            structured to `Decimal`, but other numbers in untyped fields such as `input_values` are decoded as `float`.
+            Default value: `False`.
+        cache: Cache of projects, pools, trainings, skills and the requester. `get_project`, `get_pool`,
+            `get_training`, `get_skill` and `get_requester` take objects from it instead of requesting them again.
+            Objects changed through the client are removed from the cache. See `ObjectCache`.
+            Default value: `None`, objects are not cached.
 
     Example:
         How to create `TolokaClient` instance and make your first request to Toloka.
@@ -214,9 +233,17 @@ class TolokaClient:
         timeout: typing.Union[float, typing.Tuple[float, float]] = ...,
         url: typing.Optional[str] = None,
         retry_quotas: typing.Union[typing.List[str], str, None] = 'MIN',
-        retryer_factory: typing.Optional[typing.Callable[[], requests.packages.urllib3.util.retry.Retry]] = None
+        retryer_factory: typing.Optional[typing.Callable[[], requests.packages.urllib3.util.retry.Retry]] = None,
+        prefetch_pages: int = 0,
+        rate_limiter: typing.Optional[toloka.client.primitives.rate_limiter.RateLimiter] = None,
+        fast_json: bool = False,
+        cache: typing.Optional[toloka.client.primitives.cache.ObjectCache] = None
     ): ...
 
+    def __getstate__(self): ...
+
+    def __setstate__(self, state): ...
+
     @typing.overload
     def aggregate_solutions_by_pool(self, request: toloka.client.aggregation.PoolAggregatedSolutionRequest) -> toloka.client.operations.AggregatedSolutionOperation:
         """Starts aggregation of solutions in the pool
@@ -353,7 +380,8 @@ class TolokaClient:
         operation_id: str,
         request: toloka.client.search_requests.AggregatedSolutionSearchRequest,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.AggregatedSolutionSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.AggregatedSolutionSearchResult:
         """Gets aggregated responses after the AggregatedSolutionOperation completes.
         It is better to use the "get_aggregated_solutions" method, that allows to iterate through all results.
@@ -367,6 +395,8 @@ class TolokaClient:
             sort: How to sort results. Defaults to None.
             limit: Limit on the number of results returned. The maximum is 100,000.
                 Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found solutions are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             search_results.AggregatedSolutionSearchResult: The first `limit` solutions in `items`. And a mark that there is more.
@@ -398,7 +428,8 @@ class TolokaClient:
         task_id_gt: typing.Optional[str] = None,
         task_id_gte: typing.Optional[str] = None,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.AggregatedSolutionSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.AggregatedSolutionSearchResult:
         """Gets aggregated responses after the AggregatedSolutionOperation completes.
         It is better to use the "get_aggregated_solutions" method, that allows to iterate through all results.
@@ -412,6 +443,8 @@ class TolokaClient:
             sort: How to sort results. Defaults to None.
             limit: Limit on the number of results returned. The maximum is 100,000.
                 Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found solutions are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             search_results.AggregatedSolutionSearchResult: The first `limit` solutions in `items`. And a mark that there is more.
@@ -438,7 +471,8 @@ class TolokaClient:
     def get_aggregated_solutions(
         self,
         operation_id: str,
-        request: toloka.client.search_requests.AggregatedSolutionSearchRequest
+        request: toloka.client.search_requests.AggregatedSolutionSearchRequest,
+        lazy: bool = False
     ) -> typing.Generator[toloka.client.aggregation.AggregatedSolution, None, None]:
         """Finds all aggregated responses after the AggregatedSolutionOperation completes
 
@@ -448,6 +482,8 @@ class TolokaClient:
         Args:
             operation_id: From what aggregation operation you want to get results.
             request: How to filter search results.
+            lazy: If `True`, solutions are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             AggregatedSolution: The next object corresponding to the request parameters.
@@ -468,7 +504,8 @@ class TolokaClient:
         task_id_lt: typing.Optional[str] = None,
         task_id_lte: typing.Optional[str] = None,
         task_id_gt: typing.Optional[str] = None,
-        task_id_gte: typing.Optional[str] = None
+        task_id_gte: typing.Optional[str] = None,
+        lazy: bool = False
     ) -> typing.Generator[toloka.client.aggregation.AggregatedSolution, None, None]:
         """Finds all aggregated responses after the AggregatedSolutionOperation completes
 
@@ -478,6 +515,8 @@ class TolokaClient:
         Args:
             operation_id: From what aggregation operation you want to get results.
             request: How to filter search results.
+            lazy: If `True`, solutions are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             AggregatedSolution: The next object corresponding to the request parameters.
@@ -520,7 +559,8 @@ class TolokaClient:
         self,
         request: toloka.client.search_requests.AssignmentSearchRequest,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.AssignmentSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.AssignmentSearchResult:
         """Finds all assignments that match certain rules
 
@@ -534,6 +574,8 @@ class TolokaClient:
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of assignments returned. The maximum is 100,000.
                 Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found assignments are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             search_results.AssignmentSearchResult: The first `limit` assignments in `items`. And a mark that there is more.
@@ -585,7 +627,8 @@ class TolokaClient:
         expired_gt: typing.Optional[datetime.datetime] = None,
         expired_gte: typing.Optional[datetime.datetime] = None,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.AssignmentSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.AssignmentSearchResult:
         """Finds all assignments that match certain rules
 
@@ -599,6 +642,8 @@ class TolokaClient:
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of assignments returned. The maximum is 100,000.
                 Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found assignments are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             search_results.AssignmentSearchResult: The first `limit` assignments in `items`. And a mark that there is more.
@@ -629,7 +674,13 @@ class TolokaClient:
         ...
 
     @typing.overload
-    def get_assignments(self, request: toloka.client.search_requests.AssignmentSearchRequest) -> typing.Generator[toloka.client.assignment.Assignment, None, None]:
+    def get_assignments(
+        self,
+        request: toloka.client.search_requests.AssignmentSearchRequest,
+        parallelism: int = 1,
+        ordered: bool = True,
+        lazy: bool = False
+    ) -> typing.Generator[toloka.client.assignment.Assignment, None, None]:
         """Finds all assignments that match certain rules and returns them in an iterable object
 
         Unlike find_assignments, returns generator. Does not sort assignments.
@@ -637,6 +688,15 @@ class TolokaClient:
 
         Args:
             request: How to search assignments.
+            parallelism: The number of concurrent requests. If it is greater than 1, the creation time range of
+                matching assignments is split into `parallelism` parts which are fetched concurrently.
+                Default value: `1`.
+            ordered: If `True`, assignments are yielded sorted by ID, the same way as without `parallelism`. Otherwise
+                they are yielded as soon as they are fetched, which is faster. Only used if `parallelism` is
+                greater than 1.
+                Default value: `True`.
+            lazy: If `True`, assignments are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             Assignment: The next object corresponding to the request parameters.
@@ -686,7 +746,10 @@ class TolokaClient:
         expired_lt: typing.Optional[datetime.datetime] = None,
         expired_lte: typing.Optional[datetime.datetime] = None,
         expired_gt: typing.Optional[datetime.datetime] = None,
-        expired_gte: typing.Optional[datetime.datetime] = None
+        expired_gte: typing.Optional[datetime.datetime] = None,
+        parallelism: int = 1,
+        ordered: bool = True,
+        lazy: bool = False
     ) -> typing.Generator[toloka.client.assignment.Assignment, None, None]:
         """Finds all assignments that match certain rules and returns them in an iterable object
 
@@ -695,6 +758,15 @@ class TolokaClient:
 
         Args:
             request: How to search assignments.
+            parallelism: The number of concurrent requests. If it is greater than 1, the creation time range of
+                matching assignments is split into `parallelism` parts which are fetched concurrently.
+                Default value: `1`.
+            ordered: If `True`, assignments are yielded sorted by ID, the same way as without `parallelism`. Otherwise
+                they are yielded as soon as they are fetched, which is faster. Only used if `parallelism` is
+                greater than 1.
+                Default value: `True`.
+            lazy: If `True`, assignments are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             Assignment: The next object corresponding to the request parameters.
@@ -786,7 +858,8 @@ class TolokaClient:
         self,
         request: toloka.client.search_requests.AttachmentSearchRequest,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.AttachmentSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.AttachmentSearchResult:
         """Finds all attachments that match certain rules
 
@@ -800,6 +873,8 @@ class TolokaClient:
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of results returned. The maximum is 100,000.
                 Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found attachments are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             search_results.AttachmentSearchResult: The first `limit` assignments in `items`. And a mark that there is more.
@@ -833,7 +908,8 @@ class TolokaClient:
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.AttachmentSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.AttachmentSearchResult:
         """Finds all attachments that match certain rules
 
@@ -847,6 +923,8 @@ class TolokaClient:
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of results returned. The maximum is 100,000.
                 Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found attachments are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             search_results.AttachmentSearchResult: The first `limit` assignments in `items`. And a mark that there is more.
@@ -881,7 +959,11 @@ class TolokaClient:
         ...
 
     @typing.overload
-    def get_attachments(self, request: toloka.client.search_requests.AttachmentSearchRequest) -> typing.Generator[toloka.client.attachment.Attachment, None, None]:
+    def get_attachments(
+        self,
+        request: toloka.client.search_requests.AttachmentSearchRequest,
+        lazy: bool = False
+    ) -> typing.Generator[toloka.client.attachment.Attachment, None, None]:
         """Finds all attachments that match certain rules and returns their metadata in an iterable object
 
         Unlike find_attachments, returns generator. Does not sort attachments.
@@ -889,6 +971,8 @@ class TolokaClient:
 
         Args:
             request: How to search attachments.
+            lazy: If `True`, attachments are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             Attachment: The next object corresponding to the request parameters.
@@ -918,7 +1002,8 @@ class TolokaClient:
         created_lt: typing.Optional[datetime.datetime] = None,
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
-        created_gte: typing.Optional[datetime.datetime] = None
+        created_gte: typing.Optional[datetime.datetime] = None,
+        lazy: bool = False
     ) -> typing.Generator[toloka.client.attachment.Attachment, None, None]:
         """Finds all attachments that match certain rules and returns their metadata in an iterable object
 
@@ -927,6 +1012,8 @@ class TolokaClient:
 
         Args:
             request: How to search attachments.
+            lazy: If `True`, attachments are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             Attachment: The next object corresponding to the request parameters.
@@ -959,6 +1046,36 @@ class TolokaClient:
         """
         ...
 
+    def download_attachments(
+        self,
+        attachments: typing.Union[toloka.client.search_requests.AttachmentSearchRequest, typing.Iterable[str]],
+        out_dir: typing.Union[str, os.PathLike],
+        parallelism: int = 8
+    ) -> typing.Dict[str, str]:
+        """Downloads many attachments to a directory concurrently
+
+        Files are named `<attachment ID>_<file name>`. Every file is written chunk by chunk as it's received. A file
+        that already exists and has the same size as the attachment is not downloaded again, so an interrupted download
+        can be resumed by calling the method once more. The throughput is logged at the end.
+
+        Args:
+            attachments: How to search attachments or a list of attachment IDs.
+            out_dir: The directory where to put files. It's created if it doesn't exist.
+            parallelism: The number of attachments downloaded concurrently.
+                Default value: `8`.
+
+        Returns:
+            Dict[str, str]: Paths to the files by attachment IDs.
+
+        Example:
+            How to download all attachments from a pool.
+
+            >>> request = toloka.search_requests.AttachmentSearchRequest(pool_id='1')
+            >>> paths = toloka_client.download_attachments(request, 'attachments', parallelism=16)
+            ...
+        """
+        ...
+
     def add_message_thread_to_folders(
         self,
         message_thread_id: str,
@@ -1045,7 +1162,8 @@ class TolokaClient:
         self,
         request: toloka.client.search_requests.MessageThreadSearchRequest,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.MessageThreadSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.MessageThreadSearchResult:
         """Finds all message threads that match certain rules
 
@@ -1059,6 +1177,8 @@ class TolokaClient:
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of results returned. The maximum is 300.
                 Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found message threads are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             search_results.MessageThreadSearchResult: The first `limit` message threads in `items`.
@@ -1086,7 +1206,8 @@ class TolokaClient:
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.MessageThreadSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.MessageThreadSearchResult:
         """Finds all message threads that match certain rules
 
@@ -1100,6 +1221,8 @@ class TolokaClient:
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of results returned. The maximum is 300.
                 Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found message threads are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             search_results.MessageThreadSearchResult: The first `limit` message threads in `items`.
@@ -1137,7 +1260,11 @@ class TolokaClient:
         ...
 
     @typing.overload
-    def get_message_threads(self, request: toloka.client.search_requests.MessageThreadSearchRequest) -> typing.Generator[toloka.client.message_thread.MessageThread, None, None]:
+    def get_message_threads(
+        self,
+        request: toloka.client.search_requests.MessageThreadSearchRequest,
+        lazy: bool = False
+    ) -> typing.Generator[toloka.client.message_thread.MessageThread, None, None]:
         """Finds all message threads that match certain rules and returns them in an iterable object
 
         Unlike find_message_threads, returns generator. Does not sort threads.
@@ -1145,6 +1272,8 @@ class TolokaClient:
 
         Args:
             request: How to search attachments.
+            lazy: If `True`, message threads are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             MessageThread: The next object corresponding to the request parameters.
@@ -1169,7 +1298,8 @@ class TolokaClient:
         created_lt: typing.Optional[datetime.datetime] = None,
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
-        created_gte: typing.Optional[datetime.datetime] = None
+        created_gte: typing.Optional[datetime.datetime] = None,
+        lazy: bool = False
     ) -> typing.Generator[toloka.client.message_thread.MessageThread, None, None]:
         """Finds all message threads that match certain rules and returns them in an iterable object
 
@@ -1178,6 +1308,8 @@ class TolokaClient:
 
         Args:
             request: How to search attachments.
+            lazy: If `True`, message threads are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             MessageThread: The next object corresponding to the request parameters.
@@ -2644,8 +2776,11 @@ class TolokaClient:
     @typing.overload
     def create_tasks(
         self,
-        tasks: typing.List[toloka.client.task.Task],
-        parameters: typing.Optional[toloka.client.task.CreateTasksParameters] = None
+        tasks: typing.Iterable[toloka.client.task.Task],
+        parameters: typing.Optional[toloka.client.task.CreateTasksParameters] = None,
+        *,
+        chunk_size: typing.Optional[int] = None,
+        parallelism: int = 1
     ) -> toloka.client.batch_create_results.TaskBatchCreateResult:
         """Creates many tasks in pools
 
@@ -2656,9 +2791,14 @@ class TolokaClient:
         Recomended maximum of 10,000 task per request if async_mode is True.
 
         Args:
-            tasks: List of tasks, that will be created.
+            tasks: Tasks that will be created. Any iterable, including generators, is accepted.
             parameters: Parameters for Tasks creation controlling. Defaults to None, in which case the asynchronous
                 operations is used.
+            chunk_size: The maximum number of tasks sent in one request. Larger sequences are split into chunks
+                which are created by separate operations.
+                Default value: `None`, which means 10,000 tasks in asynchronous mode and 5,000 otherwise.
+            parallelism: The maximum number of chunks that are created concurrently.
+                Default value: `1`.
 
         Returns:
             batch_create_results.TaskBatchCreateResult: Result of tasks creating. Contains created tasks in `items` and
@@ -2666,12 +2806,13 @@ class TolokaClient:
 
         Raises:
             ValidationApiError: If no tasks were created, or skip_invalid_items==False and there is a problem when
-                checking any task.
+                checking any task. In the latter case the remaining chunks are not sent, but the chunks that are
+                already created are not rolled back.
 
         Example:
             How to create regular tasks from tsv.
 
-            >>> dataset = pandas.read_csv('dataset.tsv', sep='  ')
+            >>> dataset = pandas.read_csv('dataset.tsv', sep='	')
             >>> tasks = [
             >>>     toloka.task.Task(input_values={'image': url}, pool_id=existing_pool_id)
             >>>     for url in dataset['image'].values[:50]
@@ -2701,13 +2842,15 @@ class TolokaClient:
     @typing.overload
     def create_tasks(
         self,
-        tasks: typing.List[toloka.client.task.Task],
+        tasks: typing.Iterable[toloka.client.task.Task],
         *,
         allow_defaults: typing.Optional[bool] = None,
         open_pool: typing.Optional[bool] = None,
         skip_invalid_items: typing.Optional[bool] = None,
         operation_id: typing.Optional[uuid.UUID] = None,
-        async_mode: typing.Optional[bool] = True
+        async_mode: typing.Optional[bool] = True,
+        chunk_size: typing.Optional[int] = None,
+        parallelism: int = 1
     ) -> toloka.client.batch_create_results.TaskBatchCreateResult:
         """Creates many tasks in pools
 
@@ -2718,9 +2861,14 @@ class TolokaClient:
         Recomended maximum of 10,000 task per request if async_mode is True.
 
         Args:
-            tasks: List of tasks, that will be created.
+            tasks: Tasks that will be created. Any iterable, including generators, is accepted.
             parameters: Parameters for Tasks creation controlling. Defaults to None, in which case the asynchronous
                 operations is used.
+            chunk_size: The maximum number of tasks sent in one request. Larger sequences are split into chunks
+                which are created by separate operations.
+                Default value: `None`, which means 10,000 tasks in asynchronous mode and 5,000 otherwise.
+            parallelism: The maximum number of chunks that are created concurrently.
+                Default value: `1`.
 
         Returns:
             batch_create_results.TaskBatchCreateResult: Result of tasks creating. Contains created tasks in `items` and
@@ -2728,12 +2876,13 @@ class TolokaClient:
 
         Raises:
             ValidationApiError: If no tasks were created, or skip_invalid_items==False and there is a problem when
-                checking any task.
+                checking any task. In the latter case the remaining chunks are not sent, but the chunks that are
+                already created are not rolled back.
 
         Example:
             How to create regular tasks from tsv.
 
-            >>> dataset = pandas.read_csv('dataset.tsv', sep='  ')
+            >>> dataset = pandas.read_csv('dataset.tsv', sep='	')
             >>> tasks = [
             >>>     toloka.task.Task(input_values={'image': url}, pool_id=existing_pool_id)
             >>>     for url in dataset['image'].values[:50]
@@ -2836,7 +2985,8 @@ class TolokaClient:
         self,
         request: toloka.client.search_requests.TaskSearchRequest,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.TaskSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.TaskSearchResult:
         """Finds all tasks that match certain rules
 
@@ -2850,6 +3000,8 @@ class TolokaClient:
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of results returned. The maximum is 100 000.
                 Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found tasks are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             TaskSearchResult: The first `limit` tasks in `items`. And a mark that there is more.
@@ -2882,7 +3034,8 @@ class TolokaClient:
         overlap_gt: typing.Optional[int] = None,
         overlap_gte: typing.Optional[int] = None,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.TaskSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.TaskSearchResult:
         """Finds all tasks that match certain rules
 
@@ -2896,6 +3049,8 @@ class TolokaClient:
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of results returned. The maximum is 100 000.
                 Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found tasks are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             TaskSearchResult: The first `limit` tasks in `items`. And a mark that there is more.
@@ -2926,7 +3081,13 @@ class TolokaClient:
         ...
 
     @typing.overload
-    def get_tasks(self, request: toloka.client.search_requests.TaskSearchRequest) -> typing.Generator[toloka.client.task.Task, None, None]:
+    def get_tasks(
+        self,
+        request: toloka.client.search_requests.TaskSearchRequest,
+        parallelism: int = 1,
+        ordered: bool = True,
+        lazy: bool = False
+    ) -> typing.Generator[toloka.client.task.Task, None, None]:
         """Finds all tasks that match certain rules and returns them in an iterable object
 
         Unlike find_tasks, returns generator. Does not sort tasks.
@@ -2934,6 +3095,15 @@ class TolokaClient:
 
         Args:
             request: How to search tasks.
+            parallelism: The number of concurrent requests. If it is greater than 1, the creation time range of
+                matching tasks is split into `parallelism` parts which are fetched concurrently.
+                Default value: `1`.
+            ordered: If `True`, tasks are yielded sorted by ID, the same way as without `parallelism`. Otherwise
+                they are yielded as soon as they are fetched, which is faster. Only used if `parallelism` is
+                greater than 1.
+                Default value: `True`.
+            lazy: If `True`, tasks are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             Task: The next object corresponding to the request parameters.
@@ -2962,7 +3132,10 @@ class TolokaClient:
         overlap_lt: typing.Optional[int] = None,
         overlap_lte: typing.Optional[int] = None,
         overlap_gt: typing.Optional[int] = None,
-        overlap_gte: typing.Optional[int] = None
+        overlap_gte: typing.Optional[int] = None,
+        parallelism: int = 1,
+        ordered: bool = True,
+        lazy: bool = False
     ) -> typing.Generator[toloka.client.task.Task, None, None]:
         """Finds all tasks that match certain rules and returns them in an iterable object
 
@@ -2971,6 +3144,15 @@ class TolokaClient:
 
         Args:
             request: How to search tasks.
+            parallelism: The number of concurrent requests. If it is greater than 1, the creation time range of
+                matching tasks is split into `parallelism` parts which are fetched concurrently.
+                Default value: `1`.
+            ordered: If `True`, tasks are yielded sorted by ID, the same way as without `parallelism`. Otherwise
+                they are yielded as soon as they are fetched, which is faster. Only used if `parallelism` is
+                greater than 1.
+                Default value: `True`.
+            lazy: If `True`, tasks are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             Task: The next object corresponding to the request parameters.
@@ -3142,8 +3324,11 @@ class TolokaClient:
     @typing.overload
     def create_task_suites(
         self,
-        task_suites: typing.List[toloka.client.task_suite.TaskSuite],
-        parameters: typing.Optional[toloka.client.task_suite.TaskSuiteCreateRequestParameters] = None
+        task_suites: typing.Iterable[toloka.client.task_suite.TaskSuite],
+        parameters: typing.Optional[toloka.client.task_suite.TaskSuiteCreateRequestParameters] = None,
+        *,
+        chunk_size: typing.Optional[int] = None,
+        parallelism: int = 1
     ) -> toloka.client.batch_create_results.TaskSuiteBatchCreateResult:
         """Creates many task suites in pools
 
@@ -3157,9 +3342,14 @@ class TolokaClient:
         Recomended maximum of 10,000 task suites per request if async_mode is True.
 
         Args:
-            task_suites: List of task suites, that will be created.
+            task_suites: Task suites that will be created. Any iterable, including generators, is accepted.
             parameters: Parameters for TaskSuite creation controlling. Defaults to None, in which case the asynchronous
                 operations is used.
+            chunk_size: The maximum number of task suites sent in one request. Larger sequences are split into chunks
+                which are created by separate operations.
+                Default value: `None`, which means 10,000 task suites in asynchronous mode and 5,000 otherwise.
+            parallelism: The maximum number of chunks that are created concurrently.
+                Default value: `1`.
 
         Returns:
             TaskSuiteBatchCreateResult: Result of task suites creating. Contains created task suites in `items` and
@@ -3167,7 +3357,8 @@ class TolokaClient:
 
         Raises:
             ValidationApiError: If no tasks were created, or skip_invalid_items==False and there is a problem when
-                checking any task.
+                checking any task. In the latter case the remaining chunks are not sent, but the chunks that are
+                already created are not rolled back.
 
         Example:
             >>> task_suites = [
@@ -3190,13 +3381,15 @@ class TolokaClient:
     @typing.overload
     def create_task_suites(
         self,
-        task_suites: typing.List[toloka.client.task_suite.TaskSuite],
+        task_suites: typing.Iterable[toloka.client.task_suite.TaskSuite],
         *,
         operation_id: typing.Optional[uuid.UUID] = None,
         skip_invalid_items: typing.Optional[bool] = None,
         allow_defaults: typing.Optional[bool] = None,
         open_pool: typing.Optional[bool] = None,
-        async_mode: typing.Optional[bool] = True
+        async_mode: typing.Optional[bool] = True,
+        chunk_size: typing.Optional[int] = None,
+        parallelism: int = 1
     ) -> toloka.client.batch_create_results.TaskSuiteBatchCreateResult:
         """Creates many task suites in pools
 
@@ -3210,9 +3403,14 @@ class TolokaClient:
         Recomended maximum of 10,000 task suites per request if async_mode is True.
 
         Args:
-            task_suites: List of task suites, that will be created.
+            task_suites: Task suites that will be created. Any iterable, including generators, is accepted.
             parameters: Parameters for TaskSuite creation controlling. Defaults to None, in which case the asynchronous
                 operations is used.
+            chunk_size: The maximum number of task suites sent in one request. Larger sequences are split into chunks
+                which are created by separate operations.
+                Default value: `None`, which means 10,000 task suites in asynchronous mode and 5,000 otherwise.
+            parallelism: The maximum number of chunks that are created concurrently.
+                Default value: `1`.
 
         Returns:
             TaskSuiteBatchCreateResult: Result of task suites creating. Contains created task suites in `items` and
@@ -3220,7 +3418,8 @@ class TolokaClient:
 
         Raises:
             ValidationApiError: If no tasks were created, or skip_invalid_items==False and there is a problem when
-                checking any task.
+                checking any task. In the latter case the remaining chunks are not sent, but the chunks that are
+                already created are not rolled back.
 
         Example:
             >>> task_suites = [
@@ -3324,7 +3523,8 @@ class TolokaClient:
         self,
         request: toloka.client.search_requests.TaskSuiteSearchRequest,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.TaskSuiteSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.TaskSuiteSearchResult:
         """Finds all task suites that match certain rules
 
@@ -3338,6 +3538,8 @@ class TolokaClient:
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of results returned. The maximum is 100 000.
                 Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found task suites are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             TaskSuiteSearchResult: The first `limit` task suites in `items`. And a mark that there is more.
@@ -3371,7 +3573,8 @@ class TolokaClient:
         overlap_gt: typing.Optional[int] = None,
         overlap_gte: typing.Optional[int] = None,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.TaskSuiteSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.TaskSuiteSearchResult:
         """Finds all task suites that match certain rules
 
@@ -3385,6 +3588,8 @@ class TolokaClient:
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of results returned. The maximum is 100 000.
                 Defaults to None, in which case it returns first 50 results.
+            lazy: If `True`, found task suites are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             TaskSuiteSearchResult: The first `limit` task suites in `items`. And a mark that there is more.
@@ -3415,7 +3620,13 @@ class TolokaClient:
         ...
 
     @typing.overload
-    def get_task_suites(self, request: toloka.client.search_requests.TaskSuiteSearchRequest) -> typing.Generator[toloka.client.task_suite.TaskSuite, None, None]:
+    def get_task_suites(
+        self,
+        request: toloka.client.search_requests.TaskSuiteSearchRequest,
+        parallelism: int = 1,
+        ordered: bool = True,
+        lazy: bool = False
+    ) -> typing.Generator[toloka.client.task_suite.TaskSuite, None, None]:
         """Finds all task suites that match certain rules and returns them in an iterable object
 
         Unlike find_task_suites, returns generator. Does not sort task suites.
@@ -3423,6 +3634,15 @@ class TolokaClient:
 
         Args:
             request: How to search task suites.
+            parallelism: The number of concurrent requests. If it is greater than 1, the creation time range of
+                matching task suites is split into `parallelism` parts which are fetched concurrently.
+                Default value: `1`.
+            ordered: If `True`, task suites are yielded sorted by ID, the same way as without `parallelism`. Otherwise
+                they are yielded as soon as they are fetched, which is faster. Only used if `parallelism` is
+                greater than 1.
+                Default value: `True`.
+            lazy: If `True`, task suites are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             TaskSuite: The next object corresponding to the request parameters.
@@ -3452,7 +3672,10 @@ class TolokaClient:
         overlap_lt: typing.Optional[int] = None,
         overlap_lte: typing.Optional[int] = None,
         overlap_gt: typing.Optional[int] = None,
-        overlap_gte: typing.Optional[int] = None
+        overlap_gte: typing.Optional[int] = None,
+        parallelism: int = 1,
+        ordered: bool = True,
+        lazy: bool = False
     ) -> typing.Generator[toloka.client.task_suite.TaskSuite, None, None]:
         """Finds all task suites that match certain rules and returns them in an iterable object
 
@@ -3461,6 +3684,15 @@ class TolokaClient:
 
         Args:
             request: How to search task suites.
+            parallelism: The number of concurrent requests. If it is greater than 1, the creation time range of
+                matching task suites is split into `parallelism` parts which are fetched concurrently.
+                Default value: `1`.
+            ordered: If `True`, task suites are yielded sorted by ID, the same way as without `parallelism`. Otherwise
+                they are yielded as soon as they are fetched, which is faster. Only used if `parallelism` is
+                greater than 1.
+                Default value: `True`.
+            lazy: If `True`, task suites are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             TaskSuite: The next object corresponding to the request parameters.
@@ -3620,6 +3852,37 @@ class TolokaClient:
         """
         ...
 
+    def wait_operations(
+        self,
+        ops: typing.List[toloka.client.operations.Operation],
+        timeout: datetime.timedelta = ...
+    ) -> typing.Generator[toloka.client.operations.Operation, None, None]:
+        """Waits for several operations to complete, and returns them as soon as each one is completed
+
+        All operations are polled one by one from a single loop, so no threads are needed. The polling interval of
+        each operation adapts to its progress: it is shortened when the operation is about to finish and grows
+        exponentially when there is no progress. This takes far fewer requests than calling `wait_operation` for
+        every operation.
+
+        Args:
+            ops: Operations to wait for.
+            timeout: How long to wait for all operations. Defaults to 10 minutes.
+
+        Raises:
+            TimeoutError: Raises it if the timeout has expired and some operations are still not completed.
+
+        Returns:
+            Generator[Operation, None, None]: Completed operations in order of completion.
+
+        Example:
+            >>> ops = [toloka_client.open_pool_async(pool_id) for pool_id in pool_ids]
+            >>> for op in toloka_client.wait_operations(ops):
+            >>>     op.raise_on_fail()
+            >>>     print(f'Pool {op.parameters.pool_id} is opened')
+            ...
+        """
+        ...
+
     def get_operation_log(self, operation_id: str) -> typing.List[toloka.client.operation_log.OperationLogItem]:
         """Reads information about validation errors and which task (or task suites) were created
 
@@ -3639,6 +3902,26 @@ class TolokaClient:
         """
         ...
 
+    def iter_operation_log(self, operation_id: str) -> typing.Generator[toloka.client.operation_log.OperationLogItem, None, None]:
+        """Reads the operation log item by item
+
+        Works like `get_operation_log`, but the log is parsed while it is being downloaded and its items are yielded one
+        by one. Use it to read logs of huge batch operations without loading the whole log into memory.
+
+        Args:
+            operation_id: ID of the operation.
+
+        Returns:
+            Generator[OperationLogItem, None, None]: Iterator over the operation log items.
+
+        Example:
+            >>> for log_item in toloka_client.iter_operation_log(operation_id='1'):
+            >>>     if not log_item.success:
+            >>>         print(log_item.output)
+            ...
+        """
+        ...
+
     @typing.overload
     def create_user_bonus(
         self,
@@ -3712,8 +3995,11 @@ class TolokaClient:
     @typing.overload
     def create_user_bonuses(
         self,
-        user_bonuses: typing.List[toloka.client.user_bonus.UserBonus],
-        parameters: typing.Optional[toloka.client.user_bonus.UserBonusCreateRequestParameters] = None
+        user_bonuses: typing.Iterable[toloka.client.user_bonus.UserBonus],
+        parameters: typing.Optional[toloka.client.user_bonus.UserBonusCreateRequestParameters] = None,
+        *,
+        chunk_size: int = 10000,
+        parallelism: int = 1
     ) -> toloka.client.batch_create_results.UserBonusBatchCreateResult:
         """Creates many user bonuses
 
@@ -3721,13 +4007,23 @@ class TolokaClient:
         You can send a maximum of 10,000 requests of this kind per day.
 
         Args:
-            user_bonuses: To whom, how much to pay and for what.
+            user_bonuses: To whom, how much to pay and for what. Any iterable, including generators, is accepted.
             parameters: Parameters for UserBonus creation controlling.
+            chunk_size: The maximum number of user bonuses sent in one request. Larger sequences are split into chunks
+                which are created by separate requests.
+                Default value: `10000`.
+            parallelism: The maximum number of chunks that are created concurrently.
+                Default value: `1`.
 
         Returns:
             UserBonusBatchCreateResult: Result of user bonuses creating. Contains created user bonuses in `items` and
                 problems in "validation_errors".
 
+        Raises:
+            ValidationApiError: If no bonuses were created, or skip_invalid_items==False and there is a problem when
+                checking any bonus. In the latter case the remaining chunks are not sent, but the bonuses that are
+                already issued are not rolled back.
+
         Example:
             >>> import decimal
             >>> new_bonuses=[
@@ -3752,10 +4048,12 @@ class TolokaClient:
     @typing.overload
     def create_user_bonuses(
         self,
-        user_bonuses: typing.List[toloka.client.user_bonus.UserBonus],
+        user_bonuses: typing.Iterable[toloka.client.user_bonus.UserBonus],
         *,
         operation_id: typing.Optional[str] = None,
-        skip_invalid_items: typing.Optional[bool] = None
+        skip_invalid_items: typing.Optional[bool] = None,
+        chunk_size: int = 10000,
+        parallelism: int = 1
     ) -> toloka.client.batch_create_results.UserBonusBatchCreateResult:
         """Creates many user bonuses
 
@@ -3763,13 +4061,23 @@ class TolokaClient:
         You can send a maximum of 10,000 requests of this kind per day.
 
         Args:
-            user_bonuses: To whom, how much to pay and for what.
+            user_bonuses: To whom, how much to pay and for what. Any iterable, including generators, is accepted.
             parameters: Parameters for UserBonus creation controlling.
+            chunk_size: The maximum number of user bonuses sent in one request. Larger sequences are split into chunks
+                which are created by separate requests.
+                Default value: `10000`.
+            parallelism: The maximum number of chunks that are created concurrently.
+                Default value: `1`.
 
         Returns:
             UserBonusBatchCreateResult: Result of user bonuses creating. Contains created user bonuses in `items` and
                 problems in "validation_errors".
 
+        Raises:
+            ValidationApiError: If no bonuses were created, or skip_invalid_items==False and there is a problem when
+                checking any bonus. In the latter case the remaining chunks are not sent, but the bonuses that are
+                already issued are not rolled back.
+
         Example:
             >>> import decimal
             >>> new_bonuses=[
@@ -3876,7 +4184,8 @@ class TolokaClient:
         self,
         request: toloka.client.search_requests.UserBonusSearchRequest,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.UserBonusSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.UserBonusSearchResult:
         """Finds all user bonuses that match certain rules
 
@@ -3889,6 +4198,8 @@ class TolokaClient:
             request: How to search user bonuses.
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of results returned.
+            lazy: If `True`, found bonuses are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             UserBonusSearchResult: The first `limit` user bonuses in `items`.
@@ -3916,7 +4227,8 @@ class TolokaClient:
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.UserBonusSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.UserBonusSearchResult:
         """Finds all user bonuses that match certain rules
 
@@ -3929,6 +4241,8 @@ class TolokaClient:
             request: How to search user bonuses.
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of results returned.
+            lazy: If `True`, found bonuses are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             UserBonusSearchResult: The first `limit` user bonuses in `items`.
@@ -3958,7 +4272,13 @@ class TolokaClient:
         ...
 
     @typing.overload
-    def get_user_bonuses(self, request: toloka.client.search_requests.UserBonusSearchRequest) -> typing.Generator[toloka.client.user_bonus.UserBonus, None, None]:
+    def get_user_bonuses(
+        self,
+        request: toloka.client.search_requests.UserBonusSearchRequest,
+        parallelism: int = 1,
+        ordered: bool = True,
+        lazy: bool = False
+    ) -> typing.Generator[toloka.client.user_bonus.UserBonus, None, None]:
         """Finds all user bonuses that match certain rules and returns them in an iterable object
 
         Unlike find_user_bonuses, returns generator. Does not sort user bonuses.
@@ -3966,6 +4286,15 @@ class TolokaClient:
 
         Args:
             request: How to search user bonus.
+            parallelism: The number of concurrent requests. If it is greater than 1, the creation time range of
+                matching user bonuses is split into `parallelism` parts which are fetched concurrently.
+                Default value: `1`.
+            ordered: If `True`, user bonuses are yielded sorted by ID, the same way as without `parallelism`. Otherwise
+                they are yielded as soon as they are fetched, which is faster. Only used if `parallelism` is
+                greater than 1.
+                Default value: `True`.
+            lazy: If `True`, bonuses are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             UserBonus: The next object corresponding to the request parameters.
@@ -3988,7 +4317,10 @@ class TolokaClient:
         created_lt: typing.Optional[datetime.datetime] = None,
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
-        created_gte: typing.Optional[datetime.datetime] = None
+        created_gte: typing.Optional[datetime.datetime] = None,
+        parallelism: int = 1,
+        ordered: bool = True,
+        lazy: bool = False
     ) -> typing.Generator[toloka.client.user_bonus.UserBonus, None, None]:
         """Finds all user bonuses that match certain rules and returns them in an iterable object
 
@@ -3997,6 +4329,15 @@ class TolokaClient:
 
         Args:
             request: How to search user bonus.
+            parallelism: The number of concurrent requests. If it is greater than 1, the creation time range of
+                matching user bonuses is split into `parallelism` parts which are fetched concurrently.
+                Default value: `1`.
+            ordered: If `True`, user bonuses are yielded sorted by ID, the same way as without `parallelism`. Otherwise
+                they are yielded as soon as they are fetched, which is faster. Only used if `parallelism` is
+                greater than 1.
+                Default value: `True`.
+            lazy: If `True`, bonuses are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             UserBonus: The next object corresponding to the request parameters.
@@ -4012,7 +4353,8 @@ class TolokaClient:
         self,
         request: toloka.client.search_requests.UserRestrictionSearchRequest,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.UserRestrictionSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.UserRestrictionSearchResult:
         """Finds all user restrictions that match certain rules
 
@@ -4025,6 +4367,8 @@ class TolokaClient:
             request: How to search user restrictions.
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of results returned.
+            lazy: If `True`, found restrictions are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             UserRestrictionSearchResult: The first `limit` user restrictions in `items`.
@@ -4054,7 +4398,8 @@ class TolokaClient:
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.UserRestrictionSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.UserRestrictionSearchResult:
         """Finds all user restrictions that match certain rules
 
@@ -4067,6 +4412,8 @@ class TolokaClient:
             request: How to search user restrictions.
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of results returned.
+            lazy: If `True`, found restrictions are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             UserRestrictionSearchResult: The first `limit` user restrictions in `items`.
@@ -4096,7 +4443,11 @@ class TolokaClient:
         ...
 
     @typing.overload
-    def get_user_restrictions(self, request: toloka.client.search_requests.UserRestrictionSearchRequest) -> typing.Generator[toloka.client.user_restriction.UserRestriction, None, None]:
+    def get_user_restrictions(
+        self,
+        request: toloka.client.search_requests.UserRestrictionSearchRequest,
+        lazy: bool = False
+    ) -> typing.Generator[toloka.client.user_restriction.UserRestriction, None, None]:
         """Finds all user restrictions that match certain rules and returns them in an iterable object
 
         Unlike find_user_restrictions, returns generator. Does not sort user restrictions.
@@ -4104,6 +4455,8 @@ class TolokaClient:
 
         Args:
             request: How to search user restrictions.
+            lazy: If `True`, restrictions are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             UserRestriction: The next object corresponding to the request parameters.
@@ -4128,7 +4481,8 @@ class TolokaClient:
         created_lt: typing.Optional[datetime.datetime] = None,
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
-        created_gte: typing.Optional[datetime.datetime] = None
+        created_gte: typing.Optional[datetime.datetime] = None,
+        lazy: bool = False
     ) -> typing.Generator[toloka.client.user_restriction.UserRestriction, None, None]:
         """Finds all user restrictions that match certain rules and returns them in an iterable object
 
@@ -4137,6 +4491,8 @@ class TolokaClient:
 
         Args:
             request: How to search user restrictions.
+            lazy: If `True`, restrictions are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             UserRestriction: The next object corresponding to the request parameters.
@@ -4210,7 +4566,8 @@ class TolokaClient:
         self,
         request: toloka.client.search_requests.UserSkillSearchRequest,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.UserSkillSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.UserSkillSearchResult:
         """Finds all user skills that match certain rules
 
@@ -4224,6 +4581,8 @@ class TolokaClient:
             request: How to search user skills.
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of results returned.
+            lazy: If `True`, found skills are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             UserSkillSearchResult: The first `limit` user skills in `items`.
@@ -4255,7 +4614,8 @@ class TolokaClient:
         modified_gt: typing.Optional[datetime.datetime] = None,
         modified_gte: typing.Optional[datetime.datetime] = None,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.UserSkillSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.UserSkillSearchResult:
         """Finds all user skills that match certain rules
 
@@ -4269,6 +4629,8 @@ class TolokaClient:
             request: How to search user skills.
             sort: How to sort result. Defaults to None.
             limit: Limit on the number of results returned.
+            lazy: If `True`, found skills are `LazyObject` views which structure fields on first access.
+                Defaults to False.
 
         Returns:
             UserSkillSearchResult: The first `limit` user skills in `items`.
@@ -4300,7 +4662,11 @@ class TolokaClient:
         ...
 
     @typing.overload
-    def get_user_skills(self, request: toloka.client.search_requests.UserSkillSearchRequest) -> typing.Generator[toloka.client.user_skill.UserSkill, None, None]:
+    def get_user_skills(
+        self,
+        request: toloka.client.search_requests.UserSkillSearchRequest,
+        lazy: bool = False
+    ) -> typing.Generator[toloka.client.user_skill.UserSkill, None, None]:
         """Finds all user skills that match certain rules and returns them in an iterable object
 
         UserSkill describe the skill value for a specific performer.
@@ -4309,6 +4675,8 @@ class TolokaClient:
 
         Args:
             request: How to search user skills.
+            lazy: If `True`, skills are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             UserSkill: The next object corresponding to the request parameters.
@@ -4335,7 +4703,8 @@ class TolokaClient:
         modified_lt: typing.Optional[datetime.datetime] = None,
         modified_lte: typing.Optional[datetime.datetime] = None,
         modified_gt: typing.Optional[datetime.datetime] = None,
-        modified_gte: typing.Optional[datetime.datetime] = None
+        modified_gte: typing.Optional[datetime.datetime] = None,
+        lazy: bool = False
     ) -> typing.Generator[toloka.client.user_skill.UserSkill, None, None]:
         """Finds all user skills that match certain rules and returns them in an iterable object
 
@@ -4345,6 +4714,8 @@ class TolokaClient:
 
         Args:
             request: How to search user skills.
+            lazy: If `True`, skills are `LazyObject` views which structure fields on first access.
+                Default value: `False`.
 
         Yields:
             UserSkill: The next object corresponding to the request parameters.
@@ -4568,16 +4939,27 @@ class TolokaClient:
     def get_assignments_df(
         self,
         pool_id: str,
-        parameters: toloka.client.assignment.GetAssignmentsTsvParameters
-    ) -> pandas.core.frame.DataFrame:
+        parameters: toloka.client.assignment.GetAssignmentsTsvParameters,
+        *,
+        chunksize: typing.Optional[int] = None,
+        usecols: typing.Optional[typing.List[str]] = None,
+        dtype: typing.Optional[typing.Dict[str, typing.Any]] = None
+    ) -> typing.Union[pandas.core.frame.DataFrame, typing.Iterator[pandas.core.frame.DataFrame]]:
         """Downloads assignments as pandas.DataFrame
 
         Experimental method.
         Implements the same behavior as if you download results in web-interface and then read it by pandas.
 
+        The response is read in chunks while the DataFrame is being built, so the whole export is never held in memory
+        as text.
+
         Args:
             pool_id: From which pool the results are loaded.
             parameters: Filters for the results and the set of fields that will be in the dataframe.
+            chunksize: If set, an iterator over DataFrames of up to `chunksize` rows is returned instead of a single
+                DataFrame. The response is downloaded as the iterator is consumed.
+            usecols: Names of the columns to read. Other columns are skipped while parsing.
+            dtype: Data types of the columns, e.g. `{'OUTPUT:result': 'category'}`.
 
         Returns:
             pd.DataFrame: DataFrame with all results. Contains groups of fields with prefixes:
@@ -4599,6 +4981,14 @@ class TolokaClient:
             >>>     'ASSIGNMENT:worker_id': 'performer'
             >>> })
             ...
+
+            Process a large pool by chunks of 10000 rows reading only the needed columns.
+
+            >>> for chunk_df in toloka_client.get_assignments_df(
+            >>>     pool_id='1', chunksize=10000, usecols=['INPUT:image', 'OUTPUT:result'],
+            >>> ):
+            >>>     process(chunk_df)
+            ...
         """
         ...
 
@@ -4611,16 +5001,26 @@ class TolokaClient:
         start_time_from: typing.Optional[datetime.datetime] = None,
         start_time_to: typing.Optional[datetime.datetime] = None,
         exclude_banned: typing.Optional[bool] = None,
-        field: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Field]] = ...
-    ) -> pandas.core.frame.DataFrame:
+        field: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Field]] = ...,
+        chunksize: typing.Optional[int] = None,
+        usecols: typing.Optional[typing.List[str]] = None,
+        dtype: typing.Optional[typing.Dict[str, typing.Any]] = None
+    ) -> typing.Union[pandas.core.frame.DataFrame, typing.Iterator[pandas.core.frame.DataFrame]]:
         """Downloads assignments as pandas.DataFrame
 
         Experimental method.
         Implements the same behavior as if you download results in web-interface and then read it by pandas.
 
+        The response is read in chunks while the DataFrame is being built, so the whole export is never held in memory
+        as text.
+
         Args:
             pool_id: From which pool the results are loaded.
             parameters: Filters for the results and the set of fields that will be in the dataframe.
+            chunksize: If set, an iterator over DataFrames of up to `chunksize` rows is returned instead of a single
+                DataFrame. The response is downloaded as the iterator is consumed.
+            usecols: Names of the columns to read. Other columns are skipped while parsing.
+            dtype: Data types of the columns, e.g. `{'OUTPUT:result': 'category'}`.
 
         Returns:
             pd.DataFrame: DataFrame with all results. Contains groups of fields with prefixes:
@@ -4642,6 +5042,65 @@ class TolokaClient:
             >>>     'ASSIGNMENT:worker_id': 'performer'
             >>> })
             ...
+
+            Process a large pool by chunks of 10000 rows reading only the needed columns.
+
+            >>> for chunk_df in toloka_client.get_assignments_df(
+            >>>     pool_id='1', chunksize=10000, usecols=['INPUT:image', 'OUTPUT:result'],
+            >>> ):
+            >>>     process(chunk_df)
+            ...
+        """
+        ...
+
+    @typing.overload
+    def download_assignments_tsv(
+        self,
+        pool_id: str,
+        out: typing.Union[str, os.PathLike, typing.BinaryIO],
+        parameters: toloka.client.assignment.GetAssignmentsTsvParameters
+    ) -> None:
+        """Downloads assignments in the TSV format as is
+
+        Experimental method.
+        The same export as in `get_assignments_df`, but it is written to a file chunk by chunk without parsing.
+
+        Args:
+            pool_id: From which pool the results are loaded.
+            out: Path to the file or a binary file object where to write the results.
+            parameters: Filters for the results and the set of fields that will be in the file.
+
+        Example:
+            >>> toloka_client.download_assignments_tsv(pool_id='1', out='results.tsv')
+            ...
+        """
+        ...
+
+    @typing.overload
+    def download_assignments_tsv(
+        self,
+        pool_id: str,
+        out: typing.Union[str, os.PathLike, typing.BinaryIO],
+        *,
+        status: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Status]] = ...,
+        start_time_from: typing.Optional[datetime.datetime] = None,
+        start_time_to: typing.Optional[datetime.datetime] = None,
+        exclude_banned: typing.Optional[bool] = None,
+        field: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Field]] = ...
+    ) -> None:
+        """Downloads assignments in the TSV format as is
+
+        Experimental method.
+        The same export as in `get_assignments_df`, but it is written to a file chunk by chunk without parsing.
+
+        Args:
+            pool_id: From which pool the results are loaded.
+            out: Path to the file or a binary file object where to write the results.
+            parameters: Filters for the results and the set of fields that will be in the file.
+
+        Example:
+            >>> toloka_client.download_assignments_tsv(pool_id='1', out='results.tsv')
+            ...
         """
         ...
 
@@ -57,9 +57,11 @@ converter.register_structure_hook(
 converter.register_unstructure_hook(datetime.datetime, lambda data: data.isoformat())  # type: ignore
 
 
+# Floats come from fast JSON decoders. Their shortest representation is used to get the same Decimal as the one
+# parsed from JSON text, e.g. Decimal('0.01') instead of Decimal(0.01) == Decimal('0.01000000000000000020816...')
 converter.register_structure_hook(
     Decimal,
-    lambda data, type_: Decimal(data)  # type: ignore
+    lambda data, type_: Decimal(repr(data)) if isinstance(data, float) else Decimal(data)  # type: ignore
 )
 
 # We need to redefine structure/unstructure hook for ExtendableStrEnum because hasattr(type_, 'structure') works
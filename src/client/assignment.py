@@ -17,7 +17,7 @@ from ..util._codegen import attribute
 from ..util._extendable_enum import ExtendableStrEnum
 
 
-class Assignment(BaseTolokaObject):
+class Assignment(BaseTolokaObject, slots=True):
     """Contains information about an assigned task suite and the results
 
     Attributes:
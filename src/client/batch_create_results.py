@@ -7,6 +7,7 @@ __all__ = [
 ]
 from typing import Any, Dict, List, Optional, Type
 
+from .exceptions import ValidationApiError
 from .primitives.base import BaseTolokaObject, BaseTolokaObjectMetaclass
 from .task import Task
 from .task_suite import TaskSuite
@@ -81,3 +82,56 @@ WebhookSubscriptionBatchCreateResult = _create_batch_create_result_class_for(
         validation_errors: Object with validation errors.
     """
 )
+
+
+def _shift_indexes(indexed: Optional[Dict[str, Any]], offset: int) -> Dict[str, Any]:
+    if not isinstance(indexed, dict):
+        return {}
+    return {str(int(index) + offset) if str(index).isdigit() else index: value for index, value in indexed.items()}
+
+
+def _is_fatal_chunk_failure(futures, skip_invalid_items: bool) -> bool:
+    """Checks whether creating of the remaining chunks should be stopped after these chunks are done."""
+    for future in futures:
+        exception = future.exception()
+        if exception is not None and (not skip_invalid_items or not isinstance(exception, ValidationApiError)):
+            return True
+    return False
+
+
+def _merge_batch_create_results(result_type: Type, chunk_futures: Dict[Any, int], skip_invalid_items: bool):
+    """Merges results of creating consecutive chunks of objects into one result.
+
+    Args:
+        result_type: One of the batch create result classes.
+        chunk_futures: Finished futures (or asyncio tasks) that created chunks, mapped to the chunk offsets
+            in the original sequence.
+        skip_invalid_items: Whether invalid objects were allowed to be skipped.
+
+    Raises:
+        ValidationApiError: If no objects were created or `skip_invalid_items` is not set and some chunk failed.
+            Payload contains validation errors of all chunks with indexes in the original sequence.
+    """
+
+    items = {}
+    validation_errors = None
+    failure = None
+    for future, offset in sorted(chunk_futures.items(), key=lambda future_offset: future_offset[1]):
+        if isinstance(future.exception(), ValidationApiError):
+            failure = future.exception()
+            validation_errors = {**(validation_errors or {}), **_shift_indexes(failure.payload, offset)}
+            continue
+        result = future.result()
+        items.update(_shift_indexes(result.items, offset))
+        if result.validation_errors is not None:
+            validation_errors = {**(validation_errors or {}), **_shift_indexes(result.validation_errors, offset)}
+
+    if failure is not None and (not items or not skip_invalid_items):
+        raise ValidationApiError(
+            status_code=failure.status_code,
+            request_id=failure.request_id,
+            code=failure.code,
+            message=failure.message,
+            payload=validation_errors,
+        )
+    return result_type(items=items, validation_errors=validation_errors)
@@ -4,7 +4,7 @@ from typing import Any, Dict
 from .primitives.base import BaseTolokaObject
 
 
-class OperationLogItem(BaseTolokaObject):
+class OperationLogItem(BaseTolokaObject, slots=True):
     """Objects of which the operation log consists
 
     Contains information about the validation errors and what sets of objects were created.
@@ -9,20 +9,25 @@ __all__ = [
 
 import inspect
 import typing
-from copy import copy
 from enum import Enum
 from functools import update_wrapper, partial
-from typing import Any, ClassVar, Dict, List, Optional, Type, TypeVar, Union, Tuple
+from inspect import Parameter, Signature
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Type, TypeVar, Union, Tuple
 
 import attr
 import simplejson as json
 
 from .._converter import converter
 from ..exceptions import SpecClassIdentificationError
-from ...util._codegen import attribute, expand, fix_attrs_converters, REQUIRED_KEY, ORIGIN_KEY, AUTOCAST_KEY
+from ...util._codegen import (
+    _compile_function, attribute, expand, fix_attrs_converters, REQUIRED_KEY, ORIGIN_KEY, AUTOCAST_KEY,
+)
+from ...util._typing import is_optional_of
 
 E = TypeVar('E', bound=Enum)
 
+_CountingAttr = type(attr.attrib())
+
 
 class VariantRegistry:
 
@@ -30,6 +35,8 @@ class VariantRegistry:
         self.field: str = field
         self.enum: Type[E] = enum
         self.registered_classes: Dict[E, type] = {}
+        # Registered classes by both enum members and their raw values
+        self._classes_by_value: Dict[Any, type] = {}
 
     def register(self, type_: type, value: E) -> type:
 
@@ -41,6 +48,8 @@ class VariantRegistry:
 
         setattr(type_, self.field, value)
         self.registered_classes[value] = type_
+        self._classes_by_value[value] = type_
+        self._classes_by_value[value.value] = type_
 
         return type_
 
@@ -96,8 +105,13 @@ def replace_with_any_if_not_whitelisted(cur_type, types_whitelist: Tuple[Type]):
 class BaseTolokaObjectMetaclass(type):
 
     def __new__(mcs, name, bases, namespace, auto_attribs=True, kw_only=True, frozen=False, order=True, eq=True,
-                **kwargs):
+                slots=False, **kwargs):
+        these = None
+        if slots:
+            namespace, these = mcs._make_slotted_namespace(bases, namespace)
+
         cls = attr.attrs(
+            these=these,
             auto_attribs=auto_attribs,
             kw_only=kw_only,
             field_transformer=mcs.transformer,
@@ -120,6 +134,36 @@ class BaseTolokaObjectMetaclass(type):
 
         return cls
 
+    @staticmethod
+    def _make_slotted_namespace(bases: tuple, namespace: dict) -> Tuple[dict, Dict[str, Any]]:
+        """Adds `__slots__` for own attributes to the class namespace.
+
+        Slots can't coexist with class attributes of the same names, so default values are moved out of the namespace
+        and returned separately to be passed to attrs as `these`. Unlike `attr.s(slots=True)`, the class is created only
+        once, so variant registration and bare `super()` calls keep working.
+        """
+
+        namespace = dict(namespace)
+        annotations = namespace.get('__annotations__', {})
+        base_slots = {slot for base in bases for cls in base.__mro__ for slot in cls.__dict__.get('__slots__', ())}
+        these = {}
+        for name, type_ in annotations.items():
+            if type_ is ClassVar or getattr(type_, '__origin__', None) is ClassVar:
+                continue
+            default = namespace.pop(name, attr.NOTHING)
+            these[name] = default if isinstance(default, _CountingAttr) else attr.attrib(default=default)
+
+        slots = [name for name in these if name not in base_slots]
+        # Mixins without slots, e.g. InfiniteOverlapParametersMixin, may ask for slots to store their state
+        slots.extend(
+            slot for base in bases for cls in base.__mro__ for slot in cls.__dict__.get('_mixin_slots', ())
+            if slot not in base_slots and slot not in slots
+        )
+        if not any(hasattr(base, '__weakref__') for base in bases):
+            slots.append('__weakref__')
+        namespace['__slots__'] = tuple(slots)
+        return namespace, these
+
     @staticmethod
     def transformer(type_: type, fields: List[attr.Attribute]) -> List[attr.Attribute]:
         transformed_fields = []
@@ -146,7 +190,7 @@ class BaseTolokaObjectMetaclass(type):
         return transformed_fields
 
 
-class BaseTolokaObject(metaclass=BaseTolokaObjectMetaclass):
+class BaseTolokaObject(metaclass=BaseTolokaObjectMetaclass, slots=True):
     """
     A base class for classes representing Toloka objects.
 
@@ -156,10 +200,13 @@ class BaseTolokaObject(metaclass=BaseTolokaObjectMetaclass):
     * Automatically convert annotated attributes attributes via attrs making them optional
       if not explicitly configured otherwise
     * Skip missing optional fields during unstructuring with client's cattr converter
+    * Be slotted if defined with `slots=True`, e.g. `class Task(BaseTask, slots=True)`. Such objects take less memory
+      but can't have attributes other than declared ones
     """
 
     _variant_registry: ClassVar[Optional[VariantRegistry]] = None
-    _unexpected: Dict[str, Any] = attribute(factory=dict, init=False)
+    # Unexpected fields are allocated on first access, see __getattr__
+    _unexpected: Dict[str, Any] = attribute(init=False, required=True)
 
     def __new__(cls, *args, **kwargs):
         """Overriding new for our check to be executed before auto-generated __init__"""
@@ -194,12 +241,19 @@ class BaseTolokaObject(metaclass=BaseTolokaObjectMetaclass):
     # Unexpected fields access
 
     def __getattr__(self, item):
+        if item == '_unexpected':
+            _unexpected = {}
+            object.__setattr__(self, '_unexpected', _unexpected)
+            return _unexpected
+
+        # get _unexpected pickle-friendly and without allocating it
         try:
-            # get _unexpected pickle-friendly
-            _unexpected = super().__getattribute__('_unexpected')
+            _unexpected = object.__getattribute__(self, '_unexpected')
+        except AttributeError:
+            raise AttributeError(str(item)) from None
+        if item in _unexpected:
             return _unexpected[item]
-        except KeyError as exc:
-            raise AttributeError(str(item)) from exc
+        raise AttributeError(str(item))
 
     # Variant type related checks
 
@@ -236,57 +290,20 @@ class BaseTolokaObject(metaclass=BaseTolokaObjectMetaclass):
     # Conversions related functions
 
     def unstructure(self) -> Optional[dict]:
-        data = dict(self._unexpected)
         obj_class = type(self)
-
-        for field in attr.fields(obj_class):
-            if field.name == '_unexpected':
-                continue
-
-            value = converter.unstructure(getattr(self, field.name))
-            if field.metadata.get(REQUIRED_KEY) or value is not None:
-                key = field.metadata.get(ORIGIN_KEY, field.name)
-                data[key] = value
-
-        data.update(converter.unstructure(self.get_variant_specs()))
-        assert '_unexpected' not in data
-        return data or None
+        unstructure_function = obj_class.__dict__.get('_unstructure_function')
+        if unstructure_function is None:
+            unstructure_function = _compile_unstructure_function(obj_class)
+            obj_class._unstructure_function = unstructure_function
+        return unstructure_function(self)
 
     @classmethod
     def structure(cls, data: dict):
-
-        # If a class is an incomplete variant type we structure it into
-        # one of its subclasses
-        if cls.is_variant_incomplete():
-            # TODO: Optimize copying
-            data = dict(data)  # Do not modify input data
-            spec_field = cls._variant_registry.field
-            data_field = data.pop(spec_field)
-            try:
-                spec_value = cls._variant_registry.enum(data_field)
-                spec_class = cls._variant_registry.registered_classes[spec_value]
-            except Exception:
-                raise SpecClassIdentificationError(spec_field=spec_field,
-                                                   spec_enum=cls._variant_registry.enum.__name__)
-            return spec_class.structure(data)
-
-        data = copy(data)
-        kwargs = {}
-
-        for field in attr.fields(cls):
-            key = field.metadata.get(ORIGIN_KEY, field.name)
-            if key not in data:
-                continue
-
-            value = data.pop(key)
-            if field.type is not None:
-                value = converter.structure(value, field.type)
-
-            kwargs[field.name] = value
-
-        obj = cls(**kwargs)
-        obj._unexpected = data
-        return obj
+        structure_function = cls.__dict__.get('_structure_function')
+        if structure_function is None:
+            structure_function = _compile_structure_function(cls)
+            cls._structure_function = structure_function
+        return structure_function(data)
 
     def to_json(self, pretty: bool = False) -> str:
         basic_config = {
@@ -303,6 +320,111 @@ class BaseTolokaObject(metaclass=BaseTolokaObjectMetaclass):
         return cls.structure(json.loads(json_str, use_decimal=True))
 
 
+# Types that are unstructured as is
+_PRIMITIVE_TYPES = frozenset((str, int, float, bool))
+
+
+def _get_spec_class(cls: Type[BaseTolokaObject], data_field: Any) -> Type[BaseTolokaObject]:
+    # Finds the subclass of an incomplete variant type registered for the value of its variant field
+    registry = cls._variant_registry
+    try:
+        return registry._classes_by_value[data_field]
+    except (KeyError, TypeError):
+        try:
+            return registry.registered_classes[registry.enum(data_field)]
+        except Exception:
+            raise SpecClassIdentificationError(spec_field=registry.field, spec_enum=registry.enum.__name__)
+
+
+def _structure_incomplete_variant(cls: Type[BaseTolokaObject], data: dict) -> BaseTolokaObject:
+    # Structures an incomplete variant type into one of its subclasses
+    data = dict(data)  # Do not modify input data
+    data_field = data.pop(cls._variant_registry.field)
+    return _get_spec_class(cls, data_field).structure(data)
+
+
+def _compile_structure_function(cls: Type[BaseTolokaObject]) -> Callable[[dict], BaseTolokaObject]:
+    """Generates a function that structures `cls` objects from dicts.
+
+    Field keys and types are resolved once, and cattrs structure hooks are looked up once per field type instead of
+    being dispatched on every call.
+    """
+
+    if cls.is_variant_incomplete():
+        return partial(_structure_incomplete_variant, cls)
+
+    globs = {'cls': cls, 'NOTHING': attr.NOTHING}
+    lines = ['data = dict(data)', 'kwargs = {}']
+    for index, field in enumerate(attr.fields(cls)):
+        if field.name == '_unexpected':
+            continue
+        key = field.metadata.get(ORIGIN_KEY, field.name)
+        lines.append(f'value = data.pop({key!r}, NOTHING)')
+        lines.append('if value is not NOTHING:')
+        if field.type is None:
+            lines.append(f'    kwargs[{field.name!r}] = value')
+            continue
+
+        type_ = is_optional_of(field.type)
+        if type_ is not None and getattr(type_, '__origin__', None) is not Union:
+            # Optional values are handled inline, so the hook of the nested type is used directly
+            lines.append(f'    kwargs[{field.name!r}] = None if value is None else hook_{index}(value, type_{index})')
+        else:
+            type_ = field.type
+            lines.append(f'    kwargs[{field.name!r}] = hook_{index}(value, type_{index})')
+        globs[f'hook_{index}'] = converter._structure_func.dispatch(type_)
+        globs[f'type_{index}'] = type_
+    lines.extend(['obj = cls(**kwargs)', 'if data:', '    obj._unexpected = data', 'return obj'])
+
+    return _compile_function(
+        f'structure_{cls.__name__}',
+        Signature(parameters=[Parameter(name='data', kind=Parameter.POSITIONAL_OR_KEYWORD)]),
+        '\n'.join(lines),
+        globs,
+    )
+
+
+def _compile_unstructure_function(cls: Type[BaseTolokaObject]) -> Callable[[BaseTolokaObject], Optional[dict]]:
+    """Generates a function that unstructures `cls` objects to dicts.
+
+    Field keys are resolved once, primitive values are not passed through cattrs at all, and variant specs are
+    unstructured in advance.
+    """
+
+    globs = {
+        'PRIMITIVE_TYPES': _PRIMITIVE_TYPES,
+        'unstructure': converter.unstructure,
+        'variant_specs': converter.unstructure(cls.get_variant_specs()),
+        'get_attribute': object.__getattribute__,
+    }
+    # Unexpected fields are read without allocating them
+    lines = ['try:', "    data = dict(get_attribute(self, '_unexpected'))", 'except AttributeError:', '    data = {}']
+    for field in attr.fields(cls):
+        if field.name == '_unexpected':
+            continue
+        key = field.metadata.get(ORIGIN_KEY, field.name)
+        lines.append(f'value = self.{field.name}')
+        if field.metadata.get(REQUIRED_KEY):
+            lines.append('if value.__class__ not in PRIMITIVE_TYPES:')
+            lines.append('    value = unstructure(value)')
+            lines.append(f'data[{key!r}] = value')
+        else:
+            # Non-primitive values (e.g. empty objects) may be unstructured to None as well
+            lines.append('if value is not None:')
+            lines.append('    if value.__class__ not in PRIMITIVE_TYPES:')
+            lines.append('        value = unstructure(value)')
+            lines.append('    if value is not None:')
+            lines.append(f'        data[{key!r}] = value')
+    lines.extend(['data.update(variant_specs)', 'return data or None'])
+
+    return _compile_function(
+        f'unstructure_{cls.__name__}',
+        Signature(parameters=[Parameter(name='self', kind=Parameter.POSITIONAL_OR_KEYWORD)]),
+        '\n'.join(lines),
+        globs,
+    )
+
+
 def autocast_to_enum(func: typing.Callable) -> typing.Callable:
     """Function decorator that performs str -> Enum conversion when decorated function is called
 
@@ -332,6 +454,12 @@ def autocast_to_enum(func: typing.Callable) -> typing.Callable:
             new_args[argument_name] = converter.structure(argument_value, casting_type)
         return func(**new_args)
 
+    if inspect.iscoroutinefunction(func):
+        sync_wrapper = wrapper
+
+        async def wrapper(*args, **kwargs):
+            return await sync_wrapper(*args, **kwargs)
+
     update_wrapper(wrapper, func)
     wrapper.__signature__ = signature
     wrapper.__casting_types = casting_types
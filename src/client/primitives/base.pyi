@@ -42,6 +42,8 @@ class BaseTolokaObject:
     * Automatically convert annotated attributes attributes via attrs making them optional
       if not explicitly configured otherwise
     * Skip missing optional fields during unstructuring with client's cattr converter
+    * Be slotted if defined with `slots=True`, e.g. `class Task(BaseTask, slots=True)`. Such objects take less memory
+      but can't have attributes other than declared ones
     """
 
     @classmethod
@@ -0,0 +1,97 @@
+__all__ = ['ObjectCache']
+
+import datetime
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Union
+
+
+class ObjectCache:
+    """Thread-safe cache of Toloka objects that rarely change: projects, pools, trainings, skills and the requester.
+
+    `TolokaClient` with a cache returns objects from it instead of requesting them again, until they expire. An object
+    is removed from the cache as soon as the client sends a request that may change it, e.g. `update_pool`,
+    `patch_pool`, `open_pool` or `close_pool`. Changes made elsewhere, e.g. by other clients or by Toloka itself, are
+    seen after `ttl` at most.
+
+    Objects are cached as API responses, so every call returns a new object that can be modified freely.
+
+    A single cache can be shared by several clients of the same requester.
+
+    Args:
+        ttl: How long objects are kept. Either `timedelta` or the number of seconds.
+            Default value: 60 seconds.
+        max_size: The maximum number of cached objects. If it's exceeded, the least recently used object is removed.
+            Default value: `1000`.
+
+    Attributes:
+        hits: The number of objects taken from the cache.
+        misses: The number of objects that were not found in the cache or have expired.
+
+    Example:
+        Pool status is requested once a minute at most, no matter how often observers check it.
+
+        >>> cache = ObjectCache(ttl=datetime.timedelta(minutes=1))
+        >>> toloka_client = toloka.TolokaClient(token, 'PRODUCTION', cache=cache)
+        ...
+    """
+
+    def __init__(self, ttl: Union[datetime.timedelta, float] = 60.0, max_size: int = 1000):
+        if isinstance(ttl, datetime.timedelta):
+            ttl = ttl.total_seconds()
+        if ttl <= 0 or max_size < 1:
+            raise ValueError('ttl and max_size must be positive numbers')
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        # Keys in order of use, the least recently used goes first
+        self._items: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @staticmethod
+    def get_key(path: str) -> str:
+        """Returns the key of the object that the API path refers to, e.g. `/v1/pools/1` for `/v1/pools/1/open`."""
+        return '/' + '/'.join(path.strip('/').split('/')[:3])
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the cached object or `None` if there is no such object or it has expired."""
+        with self._lock:
+            item = self._items.get(key)
+            if item is None or item[0] < time.monotonic():
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def put(self, key: str, value: Any) -> None:
+        """Adds the object to the cache."""
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.ttl, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        """Removes the object from the cache."""
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all objects from the cache. Counters are not reset."""
+        with self._lock:
+            self._items.clear()
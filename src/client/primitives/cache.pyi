@@ -0,0 +1,74 @@
+__all__ = [
+    'ObjectCache',
+]
+import datetime
+import typing
+
+
+class ObjectCache:
+    """Thread-safe cache of Toloka objects that rarely change: projects, pools, trainings, skills and the requester.
+
+    `TolokaClient` with a cache returns objects from it instead of requesting them again, until they expire. An object
+    is removed from the cache as soon as the client sends a request that may change it, e.g. `update_pool`,
+    `patch_pool`, `open_pool` or `close_pool`. Changes made elsewhere, e.g. by other clients or by Toloka itself, are
+    seen after `ttl` at most.
+
+    Objects are cached as API responses, so every call returns a new object that can be modified freely.
+
+    A single cache can be shared by several clients of the same requester.
+
+    Args:
+        ttl: How long objects are kept. Either `timedelta` or the number of seconds.
+            Default value: 60 seconds.
+        max_size: The maximum number of cached objects. If it's exceeded, the least recently used object is removed.
+            Default value: `1000`.
+
+    Attributes:
+        hits: The number of objects taken from the cache.
+        misses: The number of objects that were not found in the cache or have expired.
+
+    Example:
+        Pool status is requested once a minute at most, no matter how often observers check it.
+
+        >>> cache = ObjectCache(ttl=datetime.timedelta(minutes=1))
+        >>> toloka_client = toloka.TolokaClient(token, 'PRODUCTION', cache=cache)
+        ...
+    """
+
+    def __init__(
+        self,
+        ttl: typing.Union[datetime.timedelta, float] = 60.0,
+        max_size: int = 1000
+    ): ...
+
+    def __getstate__(self): ...
+
+    def __setstate__(self, state): ...
+
+    def __len__(self) -> int: ...
+
+    @staticmethod
+    def get_key(path: str) -> str:
+        """Returns the key of the object that the API path refers to, e.g. `/v1/pools/1` for `/v1/pools/1/open`."""
+        ...
+
+    def get(self, key: str) -> typing.Optional[typing.Any]:
+        """Returns the cached object or `None` if there is no such object or it has expired."""
+        ...
+
+    def put(
+        self,
+        key: str,
+        value: typing.Any
+    ) -> None:
+        """Adds the object to the cache."""
+        ...
+
+    def invalidate(self, key: str) -> None:
+        """Removes the object from the cache."""
+        ...
+
+    def clear(self) -> None:
+        """Removes all objects from the cache. Counters are not reset."""
+        ...
+
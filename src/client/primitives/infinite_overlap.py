@@ -24,6 +24,10 @@ class InfiniteOverlapParametersMixin:
     All other states are considered invalid
     """
 
+    # Slotted subclasses store the state in slots created by BaseTolokaObjectMetaclass
+    __slots__ = ()
+    _mixin_slots = ('_infinite_overlap', '_overlap')
+
     _infinite_overlap: Optional[bool]
     _overlap: Optional[int]
 
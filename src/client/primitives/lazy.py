@@ -0,0 +1,116 @@
+__all__ = ['LazyObject']
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Type
+
+import attr
+
+from .base import BaseTolokaObject, _get_spec_class
+from .._converter import converter
+from ...util._codegen import ORIGIN_KEY
+
+
+@lru_cache(maxsize=None)
+def _get_fields(type_: Type[BaseTolokaObject]) -> Dict[str, Tuple[str, Any]]:
+    # Attribute names mapped to data keys and types
+    return {
+        field.name: (field.metadata.get(ORIGIN_KEY, field.name), field.type)
+        for field in attr.fields(type_)
+        if field.name != '_unexpected'
+    }
+
+
+class LazyObject:
+    """A read-only view of a Toloka object that structures its fields on first access.
+
+    Search results with many items are cheaper to get this way if only a few fields of every item are needed: nested
+    objects, e.g. `tasks` and `solutions` of an assignment, are not created until they are accessed. Accessed values are
+    cached.
+
+    Fields missing from the data are `None`, unexpected fields are returned as is.
+
+    Attributes:
+        type_: The type of the object.
+        data: The object as it was received from Toloka.
+
+    Example:
+        >>> assignments = toloka_client.get_assignments(pool_id='1', lazy=True)
+        >>> statuses = {assignment.id: assignment.status for assignment in assignments}
+        ...
+    """
+
+    __slots__ = ('_type', '_data', '_values')
+
+    def __init__(self, type_: Type[BaseTolokaObject], data: dict):
+        # Variants may be nested, e.g. a spec class may be a variant type on another field itself
+        while type_.is_variant_incomplete():
+            type_ = _get_spec_class(type_, data.get(type_._variant_registry.field))
+        self._type = type_
+        self._data = data
+        self._values = {}
+
+    @property
+    def type_(self) -> Type[BaseTolokaObject]:
+        return self._type
+
+    @property
+    def data(self) -> dict:
+        return self._data
+
+    def __getattr__(self, name: str):
+        if name in LazyObject.__slots__:
+            raise AttributeError(name)
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+
+        field = _get_fields(self._type).get(name)
+        if field is None:
+            variant_specs = self._type.get_variant_specs()
+            if name in variant_specs:
+                return variant_specs[name]
+            if name in self._data:
+                return self._data[name]
+            raise AttributeError(f'{self._type.__name__!r} object has no attribute {name!r}')
+
+        key, type_ = field
+        value = self._data.get(key)
+        if value is not None and type_ is not None:
+            value = converter.structure(value, type_)
+        self._values[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any):
+        if name not in LazyObject.__slots__:
+            raise AttributeError(f'{type(self).__name__} is read-only, use structure() to get a mutable object')
+        object.__setattr__(self, name, value)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyObject):
+            return self._type is other._type and self.unstructure() == other.unstructure()
+        return NotImplemented
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self._type.__name__}, {self._data!r})'
+
+    def __reduce__(self):
+        return LazyObject, (self._type, self._data)
+
+    def structure(self) -> BaseTolokaObject:
+        """Structures the whole object."""
+        data = dict(self.unstructure())
+        # Variant specs are already resolved into the type
+        for name in self._type.get_variant_specs():
+            data.pop(name, None)
+        return self._type.structure(data)
+
+    def unstructure(self) -> Optional[dict]:
+        data = self._data
+        if self._values:
+            fields = _get_fields(self._type)
+            data = dict(data)
+            # Accessed values are unstructured again, so the result is the same as for a structured object
+            for name, value in self._values.items():
+                if value is not None:
+                    data[fields[name][0]] = converter.unstructure(value)
+        return data
@@ -0,0 +1,52 @@
+__all__ = [
+    'LazyObject',
+]
+import toloka.client.primitives.base
+import typing
+
+
+class LazyObject:
+    """A read-only view of a Toloka object that structures its fields on first access.
+
+    Search results with many items are cheaper to get this way if only a few fields of every item are needed: nested
+    objects, e.g. `tasks` and `solutions` of an assignment, are not created until they are accessed. Accessed values are
+    cached.
+
+    Fields missing from the data are `None`, unexpected fields are returned as is.
+
+    Attributes:
+        type_: The type of the object.
+        data: The object as it was received from Toloka.
+
+    Example:
+        >>> assignments = toloka_client.get_assignments(pool_id='1', lazy=True)
+        >>> statuses = {assignment.id: assignment.status for assignment in assignments}
+        ...
+    """
+
+    def __init__(
+        self,
+        type_: typing.Type[toloka.client.primitives.base.BaseTolokaObject],
+        data: dict
+    ): ...
+
+    def __getattr__(self, name: str): ...
+
+    def __setattr__(
+        self,
+        name: str,
+        value: typing.Any
+    ): ...
+
+    def structure(self) -> toloka.client.primitives.base.BaseTolokaObject:
+        """Structures the whole object.
+        """
+        ...
+
+    def unstructure(self) -> typing.Optional[dict]: ...
+
+    @property
+    def type_(self) -> typing.Type[toloka.client.primitives.base.BaseTolokaObject]: ...
+
+    @property
+    def data(self) -> dict: ...
@@ -0,0 +1,114 @@
+__all__ = [
+    'TokenBucket',
+    'RateLimiter',
+]
+import datetime
+import typing
+
+
+class TokenBucket:
+    """Thread-safe token bucket that limits the rate of requests.
+
+    The bucket holds up to `capacity` tokens and gets `limit` new tokens every `interval`. Every request takes one
+    token. If the bucket is empty, the request has to wait for the next token, so bursts of requests are spread
+    evenly instead of exceeding the limit.
+
+    Args:
+        limit: The number of requests allowed per `interval`.
+        interval: The length of the interval. Either `timedelta` or the number of seconds. Defaults to 1 second.
+        capacity: The maximum number of requests that can be sent at once after a pause. Defaults to the number of
+            requests allowed per second, but not less than 1.
+
+    Example:
+        Not more than 600 requests per minute and 100 000 requests per day.
+
+        >>> per_minute = TokenBucket(600, datetime.timedelta(minutes=1))
+        >>> per_day = TokenBucket(100000, datetime.timedelta(days=1))
+        ...
+    """
+
+    def __init__(
+        self,
+        limit: float,
+        interval: typing.Union[datetime.timedelta, float] = 1.0,
+        capacity: typing.Optional[float] = None
+    ): ...
+
+    def __getstate__(self): ...
+
+    def __setstate__(self, state): ...
+
+    @property
+    def tokens(self) -> float:
+        """The current number of tokens. It is negative if some requests are waiting for tokens."""
+        ...
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Takes tokens from the bucket and returns the number of seconds to wait before using them.
+
+        Tokens are taken immediately even if the bucket is empty, so the caller must wait for the returned time.
+        """
+        ...
+
+
+class RateLimiter:
+    """Client-side limits on the rate of Toloka API requests.
+
+    Requests are grouped into endpoint families: by the HTTP method and the API resource, by the resource only, and
+    all requests together. Each family can be limited by one or more token buckets, for example, a per-minute and a
+    per-day limit. A request waits until every bucket of every matching family has a token for it.
+
+    A single rate limiter can be shared by several clients, threads and `AsyncMultithreadWrapper`.
+
+    Args:
+        limits: Token buckets by endpoint family. Family names are:
+            * `'<METHOD> <resource>'`, e.g. `'POST tasks'` – the method and the first part of the API path.
+            * `'<resource>'`, e.g. `'assignments'` – all requests to the resource.
+            * `'*'` – all requests.
+
+    Example:
+        Create tasks at a steady rate and limit search requests separately.
+
+        >>> rate_limiter = RateLimiter({
+        >>>     'POST tasks': TokenBucket(100, datetime.timedelta(minutes=1)),
+        >>>     'GET assignments': TokenBucket(10),
+        >>>     '*': [TokenBucket(50), TokenBucket(1000000, datetime.timedelta(days=1))],
+        >>> })
+        >>> toloka_client = toloka.TolokaClient(token, 'PRODUCTION', rate_limiter=rate_limiter)
+        ...
+    """
+
+    def __init__(self, limits: typing.Dict[str, typing.Union[TokenBucket, typing.List[TokenBucket]]]): ...
+
+    @staticmethod
+    def get_families(
+        method: str,
+        path: str
+    ) -> typing.List[str]:
+        """Returns the names of all endpoint families of the request, e.g. `['GET tasks', 'tasks', '*']`
+        for `GET /v1/tasks/1`.
+        """
+        ...
+
+    @property
+    def tokens(self) -> typing.Dict[str, typing.List[float]]:
+        """The current number of tokens in buckets of each family."""
+        ...
+
+    def reserve(
+        self,
+        method: str,
+        path: str
+    ) -> float:
+        """Takes tokens for the request and returns the number of seconds to wait before sending it."""
+        ...
+
+    def acquire(
+        self,
+        method: str,
+        path: str
+    ) -> None:
+        """Blocks until the request can be sent."""
+        ...
+
+    limits: typing.Dict[str, typing.List[TokenBucket]]
@@ -18,7 +18,7 @@ __all__ = [
     'AppItemSearchResult',
     'AppBatchSearchResult'
 ]
-from typing import Type, List, Optional
+from typing import ClassVar, Type, List, Optional
 from .aggregation import AggregatedSolution
 from .app import App, AppItem, AppProject, AppBatch
 from .assignment import Assignment
@@ -26,6 +26,7 @@ from .attachment import Attachment
 from .message_thread import MessageThread
 from .pool import Pool
 from .primitives.base import BaseTolokaObject, BaseTolokaObjectMetaclass
+from .primitives.lazy import LazyObject
 from .project import Project
 from .training import Training
 from .skill import Skill
@@ -37,11 +38,37 @@ from .user_skill import UserSkill
 from .webhook_subscription import WebhookSubscription
 
 
+class _BaseSearchResult(BaseTolokaObject):
+    _item_type: ClassVar[Type[BaseTolokaObject]]
+    _items_field: ClassVar[str]
+
+    @classmethod
+    def structure(cls, data: dict, lazy: bool = False):
+        """Structures a search result.
+
+        Args:
+            data: The search result as it was received from Toloka.
+            lazy: If `True`, found items are `LazyObject` instances that structure fields on first access.
+        """
+
+        if not lazy:
+            return super().structure(data)
+        data = dict(data)
+        items = data.pop(cls._items_field, None)
+        result = super().structure(data)
+        setattr(result, cls._items_field, None if items is None else [LazyObject(cls._item_type, item) for item in items])
+        return result
+
+
 def _create_search_result_class_for(type_: Type, docstring: Optional[str] = None, items_field: str = 'items'):
     cls = BaseTolokaObjectMetaclass(
         f'{type_.__name__}SearchResult',
-        (BaseTolokaObject,),
-        {'__annotations__': {items_field: List[type_], 'has_more': bool}},
+        (_BaseSearchResult,),
+        {
+            '__annotations__': {items_field: List[type_], 'has_more': bool},
+            '_item_type': type_,
+            '_items_field': items_field,
+        },
     )
     cls.__module__ = __name__
     cls.__doc__ = docstring
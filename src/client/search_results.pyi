@@ -37,7 +37,30 @@ import toloka.client.webhook_subscription
 import typing
 
 
-class AggregatedSolutionSearchResult(toloka.client.primitives.base.BaseTolokaObject):
+class _BaseSearchResult(toloka.client.primitives.base.BaseTolokaObject):
+    def __init__(self) -> None:
+        """Method generated by attrs for class _BaseSearchResult.
+        """
+        ...
+
+    @classmethod
+    def structure(
+        cls,
+        data: dict,
+        lazy: bool = False
+    ):
+        """Structures a search result.
+
+        Args:
+            data: The search result as it was received from Toloka.
+            lazy: If `True`, found items are `LazyObject` instances that structure fields on first access.
+        """
+        ...
+
+    _unexpected: typing.Optional[typing.Dict[str, typing.Any]]
+
+
+class AggregatedSolutionSearchResult(_BaseSearchResult):
     """The list of found AggregatedSolutions and whether there is something else on the original request
 
     Attributes:
@@ -62,7 +85,7 @@ class AggregatedSolutionSearchResult(toloka.client.primitives.base.BaseTolokaObj
     has_more: typing.Optional[bool]
 
 
-class AssignmentSearchResult(toloka.client.primitives.base.BaseTolokaObject):
+class AssignmentSearchResult(_BaseSearchResult):
     """The list of found assignments and whether there is something else on the original request
 
     It's better to use TolokaClient.get_assignments(), which already implements the correct handling of the search result.
@@ -89,7 +112,7 @@ class AssignmentSearchResult(toloka.client.primitives.base.BaseTolokaObject):
     has_more: typing.Optional[bool]
 
 
-class AttachmentSearchResult(toloka.client.primitives.base.BaseTolokaObject):
+class AttachmentSearchResult(_BaseSearchResult):
     """The list of found attachments and whether there is something else on the original request
 
     It's better to use TolokaClient.get_attachments(), which already implements the correct handling of the search result.
@@ -116,7 +139,7 @@ class AttachmentSearchResult(toloka.client.primitives.base.BaseTolokaObject):
     has_more: typing.Optional[bool]
 
 
-class MessageThreadSearchResult(toloka.client.primitives.base.BaseTolokaObject):
+class MessageThreadSearchResult(_BaseSearchResult):
     """The list of found message chains and whether there is something else on the original request
 
     It's better to use TolokaClient.get_message_threads(), which already implements the correct handling of the search result.
@@ -143,7 +166,7 @@ class MessageThreadSearchResult(toloka.client.primitives.base.BaseTolokaObject):
     has_more: typing.Optional[bool]
 
 
-class ProjectSearchResult(toloka.client.primitives.base.BaseTolokaObject):
+class ProjectSearchResult(_BaseSearchResult):
     """The list of found projects and whether there is something else on the original request
 
     It's better to use TolokaClient.get_projects(), which already implements the correct handling of the search result.
@@ -170,7 +193,7 @@ class ProjectSearchResult(toloka.client.primitives.base.BaseTolokaObject):
     has_more: typing.Optional[bool]
 
 
-class PoolSearchResult(toloka.client.primitives.base.BaseTolokaObject):
+class PoolSearchResult(_BaseSearchResult):
     """The list of found pools and whether there is something else on the original request
 
     It's better to use TolokaClient.get_pools(), which already implements the correct handling of the search result.
@@ -197,7 +220,7 @@ class PoolSearchResult(toloka.client.primitives.base.BaseTolokaObject):
     has_more: typing.Optional[bool]
 
 
-class SkillSearchResult(toloka.client.primitives.base.BaseTolokaObject):
+class SkillSearchResult(_BaseSearchResult):
     """The list of found skills and whether there is something else on the original request
 
     It's better to use TolokaClient.get_skill(), which already implements the correct handling of the search result.
@@ -224,7 +247,7 @@ class SkillSearchResult(toloka.client.primitives.base.BaseTolokaObject):
     has_more: typing.Optional[bool]
 
 
-class TaskSearchResult(toloka.client.primitives.base.BaseTolokaObject):
+class TaskSearchResult(_BaseSearchResult):
     """The list of found tasks and whether there is something else on the original request
 
     It's better to use TolokaClient.get_tasks(), which already implements the correct handling of the search result.
@@ -251,7 +274,7 @@ class TaskSearchResult(toloka.client.primitives.base.BaseTolokaObject):
     has_more: typing.Optional[bool]
 
 
-class TaskSuiteSearchResult(toloka.client.primitives.base.BaseTolokaObject):
+class TaskSuiteSearchResult(_BaseSearchResult):
     """The list of found sets of tasks and whether there is something else on the original request
 
     It's better to use TolokaClient.get_task_suites(), which already implements the correct handling of the search result.
@@ -278,7 +301,7 @@ class TaskSuiteSearchResult(toloka.client.primitives.base.BaseTolokaObject):
     has_more: typing.Optional[bool]
 
 
-class TrainingSearchResult(toloka.client.primitives.base.BaseTolokaObject):
+class TrainingSearchResult(_BaseSearchResult):
     """The list of found training pools and whether there is something else on the original request
 
     It's better to use TolokaClient.get_trainings(), which already implements the correct handling of the search result.
@@ -305,7 +328,7 @@ class TrainingSearchResult(toloka.client.primitives.base.BaseTolokaObject):
     has_more: typing.Optional[bool]
 
 
-class UserBonusSearchResult(toloka.client.primitives.base.BaseTolokaObject):
+class UserBonusSearchResult(_BaseSearchResult):
     """The list of found user bonuses and whether there is something else on the original request
 
     It's better to use TolokaClient.get_user_bonuses(), which already implements the correct handling of the search result.
@@ -332,7 +355,7 @@ class UserBonusSearchResult(toloka.client.primitives.base.BaseTolokaObject):
     has_more: typing.Optional[bool]
 
 
-class UserRestrictionSearchResult(toloka.client.primitives.base.BaseTolokaObject):
+class UserRestrictionSearchResult(_BaseSearchResult):
     """The list of found user restrictions and whether there is something else on the original request
 
     It's better to use TolokaClient.get_user_restrictions(), which already implements the correct handling of the search result.
@@ -359,7 +382,7 @@ class UserRestrictionSearchResult(toloka.client.primitives.base.BaseTolokaObject
     has_more: typing.Optional[bool]
 
 
-class UserSkillSearchResult(toloka.client.primitives.base.BaseTolokaObject):
+class UserSkillSearchResult(_BaseSearchResult):
     """The list of found user skills and whether there is something else on the original request
 
     It's better to use TolokaClient.get_user_skills(), which already implements the correct handling of the search result.
@@ -386,7 +409,7 @@ class UserSkillSearchResult(toloka.client.primitives.base.BaseTolokaObject):
     has_more: typing.Optional[bool]
 
 
-class WebhookSubscriptionSearchResult(toloka.client.primitives.base.BaseTolokaObject):
+class WebhookSubscriptionSearchResult(_BaseSearchResult):
     """The list of found subscriptions and whether there is something else on the original request
 
     It's better to use TolokaClient.get_webhook_subscriptions(),
@@ -414,7 +437,7 @@ class WebhookSubscriptionSearchResult(toloka.client.primitives.base.BaseTolokaOb
     has_more: typing.Optional[bool]
 
 
-class AppProjectSearchResult(toloka.client.primitives.base.BaseTolokaObject):
+class AppProjectSearchResult(_BaseSearchResult):
     """The list of found App projects and whether there is something else on the original request.
 
     It's better to use TolokaClient.get_app_projects(),
@@ -442,7 +465,7 @@ class AppProjectSearchResult(toloka.client.primitives.base.BaseTolokaObject):
     has_more: typing.Optional[bool]
 
 
-class AppSearchResult(toloka.client.primitives.base.BaseTolokaObject):
+class AppSearchResult(_BaseSearchResult):
     """The list of found Apps and whether there is something else on the original request.
 
     It's better to use TolokaClient.get_apps(),
@@ -470,7 +493,7 @@ class AppSearchResult(toloka.client.primitives.base.BaseTolokaObject):
     has_more: typing.Optional[bool]
 
 
-class AppItemSearchResult(toloka.client.primitives.base.BaseTolokaObject):
+class AppItemSearchResult(_BaseSearchResult):
     """The list of found work items in the App project and whether there is something else on the original request.
 
     It's better to use TolokaClient.get_app_items(),
@@ -498,7 +521,7 @@ class AppItemSearchResult(toloka.client.primitives.base.BaseTolokaObject):
     has_more: typing.Optional[bool]
 
 
-class AppBatchSearchResult(toloka.client.primitives.base.BaseTolokaObject):
+class AppBatchSearchResult(_BaseSearchResult):
     """The list of found batches in the App project and whether there is something else on the original request.
 
     It's better to use TolokaClient.get_app_batches(),
@@ -4,7 +4,7 @@ from typing import Dict, Any
 import attr
 
 
-@attr.attrs(auto_attribs=True)
+@attr.attrs(auto_attribs=True, slots=True)
 class Solution:
     """Performer response for one task
 
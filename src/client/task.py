@@ -18,7 +18,7 @@ from ..util._codegen import attribute
 from ..util._docstrings import inherit_docstrings
 
 
-class BaseTask(BaseTolokaObject):
+class BaseTask(BaseTolokaObject, slots=True):
     """Base class for Task
 
     Attributes:
@@ -34,7 +34,7 @@ class BaseTask(BaseTolokaObject):
         origin_task_id: ID of the task it was copied from.
     """
 
-    class KnownSolution(BaseTolokaObject):
+    class KnownSolution(BaseTolokaObject, slots=True):
         """Answers and hints for control and training tasks.
 
         If several output fields are taken into account when checking, you must specify all combinations of the correct answer.
@@ -64,7 +64,7 @@ class BaseTask(BaseTolokaObject):
 
 
 @inherit_docstrings
-class Task(InfiniteOverlapParametersMixin, BaseTask):
+class Task(InfiniteOverlapParametersMixin, BaseTask, slots=True):
     """The task that will be issued to the performers
 
     Not to be confused with TaskSuite - a set of tasks that is shown to the user at one time.
@@ -93,7 +93,7 @@ class Task(InfiniteOverlapParametersMixin, BaseTask):
         ...
     """
 
-    class BaselineSolution(BaseTolokaObject):
+    class BaselineSolution(BaseTolokaObject, slots=True):
         output_values: Dict[str, Any]
         confidence_weight: float
 
@@ -17,7 +17,7 @@ from .task import BaseTask
 from ..util._codegen import attribute, expand
 
 
-class TaskSuite(InfiniteOverlapParametersMixin, BaseTolokaObject):
+class TaskSuite(InfiniteOverlapParametersMixin, BaseTolokaObject, slots=True):
     """A set of tasks issued to the performer at a time
 
     TaskSuite can contain one or more tasks. The execution price is charged for one TaskSuite.
@@ -12,7 +12,7 @@ from .primitives.parameter import Parameters
 from ..util._codegen import attribute
 
 
-class UserBonus(BaseTolokaObject):
+class UserBonus(BaseTolokaObject, slots=True):
     """Issuing a bonus to a specific performer
 
     It's addition to payment for completed tasks.
@@ -27,7 +27,7 @@ class SetUserSkillRequest(BaseTolokaObject):
     value: Decimal = attribute(validator=optional(instance_of(Decimal)))
 
 
-class UserSkill(BaseTolokaObject):
+class UserSkill(BaseTolokaObject, slots=True):
     """Describes the value of a specific skill for a specific performer
 
     Attributes:
@@ -0,0 +1,20 @@
+__all__ = [
+    'arrow',
+    'get_assignments_schema',
+    'get_tasks_schema',
+    'iter_assignment_batches',
+    'iter_task_batches',
+    'write_assignments_parquet',
+    'write_tasks_parquet',
+]
+
+from . import arrow
+
+from .arrow import (
+    get_assignments_schema,
+    get_tasks_schema,
+    iter_assignment_batches,
+    iter_task_batches,
+    write_assignments_parquet,
+    write_tasks_parquet,
+)
@@ -0,0 +1,356 @@
+__all__ = [
+    'get_assignments_schema',
+    'get_tasks_schema',
+    'iter_assignment_batches',
+    'iter_task_batches',
+    'write_assignments_parquet',
+    'write_tasks_parquet',
+]
+
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import attr
+import pyarrow as pa
+import pyarrow.parquet as pq
+import simplejson as json
+
+from ..client import TolokaClient
+from ..client._converter import str_to_datetime
+from ..client.project import Project
+from ..client.project.field_spec import FieldSpec, FieldType
+from ..client.search_requests import AssignmentSearchRequest, TaskSearchRequest
+
+# Column name, Arrow type and a function that gets the value from a row
+_Column = Tuple[str, pa.DataType, Callable[[Any], Any]]
+_Row = Tuple[dict, dict, Optional[dict]]  # Assignment or None, task and solution or None
+
+_SCALAR_TYPES: Dict[FieldType, Tuple[pa.DataType, Callable[[Any], Any]]] = {
+    FieldType.BOOLEAN: (pa.bool_(), bool),
+    FieldType.STRING: (pa.string(), str),
+    FieldType.FLOAT: (pa.float64(), float),
+    FieldType.INTEGER: (pa.int64(), int),
+    FieldType.URL: (pa.string(), str),
+    FieldType.FILE: (pa.string(), str),
+    FieldType.COORDINATES: (pa.string(), str),
+    FieldType.JSON: (pa.string(), json.dumps),
+}
+
+_ARRAY_ITEM_TYPES: Dict[FieldType, FieldType] = {
+    FieldType.ARRAY_BOOLEAN: FieldType.BOOLEAN,
+    FieldType.ARRAY_STRING: FieldType.STRING,
+    FieldType.ARRAY_INTEGER: FieldType.INTEGER,
+    FieldType.ARRAY_FLOAT: FieldType.FLOAT,
+    FieldType.ARRAY_URL: FieldType.URL,
+    FieldType.ARRAY_FILE: FieldType.FILE,
+    FieldType.ARRAY_COORDINATES: FieldType.COORDINATES,
+    FieldType.ARRAY_JSON: FieldType.JSON,
+}
+
+
+def _optional(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    return lambda value: None if value is None else convert(value)
+
+
+def _get_field_type(spec: FieldSpec) -> Tuple[pa.DataType, Callable[[Any], Any]]:
+    item_type = _ARRAY_ITEM_TYPES.get(spec.type)
+    if item_type is not None:
+        arrow_type, convert = _SCALAR_TYPES[item_type]
+        convert = _optional(convert)
+        return pa.list_(arrow_type), lambda values: [convert(value) for value in values]
+    # Values of unknown field types are kept as JSON
+    return _SCALAR_TYPES.get(spec.type, (pa.string(), json.dumps))
+
+
+def _get_spec_columns(prefix: str, spec: Dict[str, FieldSpec], values_key: str, source: int) -> List[_Column]:
+    columns = []
+    for name, field_spec in spec.items():
+        arrow_type, convert = _get_field_type(field_spec)
+        convert = _optional(convert)
+
+        def get(row: _Row, name=name, convert=convert):
+            obj = row[source]
+            return None if obj is None else convert(obj.get(values_key, {}).get(name))
+
+        columns.append((f'{prefix}:{name}', arrow_type, get))
+    return columns
+
+
+def _get_column(source: int, key: str, convert: Callable[[Any], Any] = None) -> Callable[[_Row], Any]:
+    convert = _optional(convert) if convert else None
+
+    def get(row: _Row):
+        value = row[source].get(key)
+        return convert(value) if convert else value
+
+    return get
+
+
+_ASSIGNMENT, _TASK, _SOLUTION = range(3)
+
+# Column names follow the assignments export of `TolokaClient.get_assignments_df`
+_ASSIGNMENT_COLUMNS: List[_Column] = [
+    ('ASSIGNMENT:assignment_id', pa.string(), _get_column(_ASSIGNMENT, 'id')),
+    ('ASSIGNMENT:task_suite_id', pa.string(), _get_column(_ASSIGNMENT, 'task_suite_id')),
+    ('ASSIGNMENT:task_id', pa.string(), _get_column(_TASK, 'id')),
+    ('ASSIGNMENT:pool_id', pa.string(), _get_column(_ASSIGNMENT, 'pool_id')),
+    ('ASSIGNMENT:worker_id', pa.string(), _get_column(_ASSIGNMENT, 'user_id')),
+    ('ASSIGNMENT:status', pa.string(), _get_column(_ASSIGNMENT, 'status')),
+    ('ASSIGNMENT:reward', pa.float64(), _get_column(_ASSIGNMENT, 'reward', float)),
+    ('ASSIGNMENT:mixed', pa.bool_(), _get_column(_ASSIGNMENT, 'mixed')),
+    ('ASSIGNMENT:automerged', pa.bool_(), _get_column(_ASSIGNMENT, 'automerged')),
+    ('ASSIGNMENT:started', pa.timestamp('ms'), _get_column(_ASSIGNMENT, 'created', str_to_datetime)),
+    ('ASSIGNMENT:submitted', pa.timestamp('ms'), _get_column(_ASSIGNMENT, 'submitted', str_to_datetime)),
+    ('ASSIGNMENT:accepted', pa.timestamp('ms'), _get_column(_ASSIGNMENT, 'accepted', str_to_datetime)),
+    ('ASSIGNMENT:rejected', pa.timestamp('ms'), _get_column(_ASSIGNMENT, 'rejected', str_to_datetime)),
+    ('ASSIGNMENT:skipped', pa.timestamp('ms'), _get_column(_ASSIGNMENT, 'skipped', str_to_datetime)),
+    ('ASSIGNMENT:expired', pa.timestamp('ms'), _get_column(_ASSIGNMENT, 'expired', str_to_datetime)),
+]
+
+_TASK_COLUMNS: List[_Column] = [
+    ('TASK:task_id', pa.string(), _get_column(_TASK, 'id')),
+    ('TASK:pool_id', pa.string(), _get_column(_TASK, 'pool_id')),
+    ('TASK:overlap', pa.int64(), _get_column(_TASK, 'overlap')),
+    ('TASK:infinite_overlap', pa.bool_(), _get_column(_TASK, 'infinite_overlap')),
+    ('TASK:remaining_overlap', pa.int64(), _get_column(_TASK, 'remaining_overlap')),
+    ('TASK:created', pa.timestamp('ms'), _get_column(_TASK, 'created', str_to_datetime)),
+]
+
+
+def _get_assignments_columns(project: Project) -> List[_Column]:
+    return [
+        *_ASSIGNMENT_COLUMNS,
+        *_get_spec_columns('INPUT', project.task_spec.input_spec, 'input_values', _TASK),
+        *_get_spec_columns('OUTPUT', project.task_spec.output_spec, 'output_values', _SOLUTION),
+    ]
+
+
+def _get_tasks_columns(project: Project) -> List[_Column]:
+    return [*_TASK_COLUMNS, *_get_spec_columns('INPUT', project.task_spec.input_spec, 'input_values', _TASK)]
+
+
+def _get_schema(columns: List[_Column]) -> pa.Schema:
+    return pa.schema([pa.field(name, arrow_type) for name, arrow_type, _ in columns])
+
+
+def get_assignments_schema(project: Project) -> pa.Schema:
+    """Returns the Arrow schema of assignments of the project.
+
+    Every row is a task of an assignment with its solution. Besides the `ASSIGNMENT:*` columns, there is an
+    `INPUT:<name>` column for every field of the project's `input_spec` and an `OUTPUT:<name>` column for every field
+    of the `output_spec`. Column types are derived from field specifications.
+
+    Args:
+        project: The project of assignments.
+
+    Returns:
+        pyarrow.Schema: The schema of record batches returned by `iter_assignment_batches`.
+    """
+
+    return _get_schema(_get_assignments_columns(project))
+
+
+def get_tasks_schema(project: Project) -> pa.Schema:
+    """Returns the Arrow schema of tasks of the project.
+
+    Besides the `TASK:*` columns, there is an `INPUT:<name>` column for every field of the project's `input_spec`.
+
+    Args:
+        project: The project of tasks.
+
+    Returns:
+        pyarrow.Schema: The schema of record batches returned by `iter_task_batches`.
+    """
+
+    return _get_schema(_get_tasks_columns(project))
+
+
+def _get_project(toloka_client: TolokaClient, request: Union[AssignmentSearchRequest, TaskSearchRequest],
+                 project: Optional[Project]) -> Project:
+    if project is not None:
+        return project
+    if request.pool_id is None:
+        raise ValueError('Either project or pool_id of the request must be set')
+    pool = toloka_client.get_pool(request.pool_id)
+    return toloka_client.get_project(pool.project_id)
+
+
+def _iter_raw_items(toloka_client: TolokaClient, path: str, request, page_size: Optional[int]) -> Iterator[dict]:
+    # Items are not structured into objects, only the needed values are taken from dicts
+    while True:
+        page = toloka_client._search_request('get', path, request, ['id'], page_size)
+        yield from page['items']
+        if not page['has_more'] or not page['items']:
+            return
+        request = attr.evolve(request, id_gt=page['items'][-1]['id'])
+
+
+def _iter_batches(rows: Iterable[_Row], columns: List[_Column], batch_size: int) -> Iterator[pa.RecordBatch]:
+    schema = _get_schema(columns)
+    values = [[] for _ in columns]
+    size = 0
+    for row in rows:
+        for column_values, (_, _, get) in zip(values, columns):
+            column_values.append(get(row))
+        size += 1
+        if size == batch_size:
+            yield _make_batch(values, columns, schema)
+            values = [[] for _ in columns]
+            size = 0
+    if size:
+        yield _make_batch(values, columns, schema)
+
+
+def _make_batch(values: List[list], columns: List[_Column], schema: pa.Schema) -> pa.RecordBatch:
+    arrays = [pa.array(column_values, type=arrow_type) for column_values, (_, arrow_type, _) in zip(values, columns)]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _iter_assignment_rows(assignments: Iterable[dict]) -> Iterator[_Row]:
+    for assignment in assignments:
+        solutions = assignment.get('solutions') or []
+        for index, task in enumerate(assignment.get('tasks') or []):
+            yield assignment, task, solutions[index] if index < len(solutions) else None
+
+
+def iter_assignment_batches(
+    toloka_client: TolokaClient,
+    request: AssignmentSearchRequest,
+    project: Optional[Project] = None,
+    batch_size: int = 10000,
+    page_size: Optional[int] = None,
+) -> Iterator[pa.RecordBatch]:
+    """Finds all assignments that match the request and returns them as Arrow record batches.
+
+    Search results are converted into columns straight from API responses without creating `Assignment` objects.
+
+    Args:
+        toloka_client: Client to request assignments with.
+        request: How to search assignments.
+        project: The project of assignments. Its `task_spec` defines `INPUT` and `OUTPUT` columns. By default, the
+            project of `request.pool_id` is requested.
+        batch_size: The maximum number of rows in a batch.
+        page_size: The number of assignments requested at once. By default, the API limit is used.
+
+    Yields:
+        pyarrow.RecordBatch: Batches with the schema returned by `get_assignments_schema`.
+
+    Example:
+        How to load accepted assignments of a pool into a table.
+
+        >>> request = toloka.search_requests.AssignmentSearchRequest(pool_id='1', status='ACCEPTED')
+        >>> table = pyarrow.Table.from_batches(iter_assignment_batches(toloka_client, request))
+        ...
+    """
+
+    columns = _get_assignments_columns(_get_project(toloka_client, request, project))
+    assignments = _iter_raw_items(toloka_client, '/v1/assignments', request, page_size)
+    return _iter_batches(_iter_assignment_rows(assignments), columns, batch_size)
+
+
+def iter_task_batches(
+    toloka_client: TolokaClient,
+    request: TaskSearchRequest,
+    project: Optional[Project] = None,
+    batch_size: int = 10000,
+    page_size: Optional[int] = None,
+) -> Iterator[pa.RecordBatch]:
+    """Finds all tasks that match the request and returns them as Arrow record batches.
+
+    Search results are converted into columns straight from API responses without creating `Task` objects.
+
+    Args:
+        toloka_client: Client to request tasks with.
+        request: How to search tasks.
+        project: The project of tasks. Its `task_spec` defines `INPUT` columns. By default, the project of
+            `request.pool_id` is requested.
+        batch_size: The maximum number of rows in a batch.
+        page_size: The number of tasks requested at once. By default, the API limit is used.
+
+    Yields:
+        pyarrow.RecordBatch: Batches with the schema returned by `get_tasks_schema`.
+    """
+
+    columns = _get_tasks_columns(_get_project(toloka_client, request, project))
+    tasks = _iter_raw_items(toloka_client, '/v1/tasks', request, page_size)
+    return _iter_batches(((None, task, None) for task in tasks), columns, batch_size)
+
+
+def _write_parquet(path: Union[str, os.PathLike], schema: pa.Schema, batches: Iterator[pa.RecordBatch],
+                   **kwargs) -> int:
+    rows = 0
+    with pq.ParquetWriter(path, schema, **kwargs) as writer:
+        for batch in batches:
+            # Every batch is written as a separate row group, so only one batch is kept in memory
+            writer.write_table(pa.Table.from_batches([batch], schema=schema))
+            rows += batch.num_rows
+    return rows
+
+
+def write_assignments_parquet(
+    toloka_client: TolokaClient,
+    path: Union[str, os.PathLike],
+    request: AssignmentSearchRequest,
+    project: Optional[Project] = None,
+    batch_size: int = 10000,
+    page_size: Optional[int] = None,
+    **kwargs,
+) -> int:
+    """Writes all assignments that match the request to a Parquet file.
+
+    The file is written incrementally, one row group per batch of `iter_assignment_batches`.
+
+    Args:
+        toloka_client: Client to request assignments with.
+        path: Path to the file.
+        request: How to search assignments.
+        project: The project of assignments. By default, the project of `request.pool_id` is requested.
+        batch_size: The maximum number of rows in a row group.
+        page_size: The number of assignments requested at once. By default, the API limit is used.
+        **kwargs: Other arguments of `pyarrow.parquet.ParquetWriter`, e.g. `compression`.
+
+    Returns:
+        int: The number of written rows.
+
+    Example:
+        How to save accepted assignments of a pool to a compressed file.
+
+        >>> request = toloka.search_requests.AssignmentSearchRequest(pool_id='1', status='ACCEPTED')
+        >>> write_assignments_parquet(toloka_client, 'assignments.parquet', request, compression='zstd')
+        ...
+    """
+
+    project = _get_project(toloka_client, request, project)
+    batches = iter_assignment_batches(toloka_client, request, project, batch_size, page_size)
+    return _write_parquet(path, get_assignments_schema(project), batches, **kwargs)
+
+
+def write_tasks_parquet(
+    toloka_client: TolokaClient,
+    path: Union[str, os.PathLike],
+    request: TaskSearchRequest,
+    project: Optional[Project] = None,
+    batch_size: int = 10000,
+    page_size: Optional[int] = None,
+    **kwargs,
+) -> int:
+    """Writes all tasks that match the request to a Parquet file.
+
+    The file is written incrementally, one row group per batch of `iter_task_batches`.
+
+    Args:
+        toloka_client: Client to request tasks with.
+        path: Path to the file.
+        request: How to search tasks.
+        project: The project of tasks. By default, the project of `request.pool_id` is requested.
+        batch_size: The maximum number of rows in a row group.
+        page_size: The number of tasks requested at once. By default, the API limit is used.
+        **kwargs: Other arguments of `pyarrow.parquet.ParquetWriter`, e.g. `compression`.
+
+    Returns:
+        int: The number of written rows.
+    """
+
+    project = _get_project(toloka_client, request, project)
+    batches = iter_task_batches(toloka_client, request, project, batch_size, page_size)
+    return _write_parquet(path, get_tasks_schema(project), batches, **kwargs)
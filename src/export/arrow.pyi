@@ -0,0 +1,164 @@
+__all__ = [
+    'get_assignments_schema',
+    'get_tasks_schema',
+    'iter_assignment_batches',
+    'iter_task_batches',
+    'write_assignments_parquet',
+    'write_tasks_parquet',
+]
+import os
+import pyarrow
+import toloka.client
+import toloka.client.project
+import toloka.client.search_requests
+import typing
+
+
+def get_assignments_schema(project: toloka.client.project.Project) -> pyarrow.Schema:
+    """Returns the Arrow schema of assignments of the project.
+
+    Every row is a task of an assignment with its solution. Besides the `ASSIGNMENT:*` columns, there is an
+    `INPUT:<name>` column for every field of the project's `input_spec` and an `OUTPUT:<name>` column for every field
+    of the `output_spec`. Column types are derived from field specifications.
+
+    Args:
+        project: The project of assignments.
+
+    Returns:
+        pyarrow.Schema: The schema of record batches returned by `iter_assignment_batches`.
+    """
+    ...
+
+
+def get_tasks_schema(project: toloka.client.project.Project) -> pyarrow.Schema:
+    """Returns the Arrow schema of tasks of the project.
+
+    Besides the `TASK:*` columns, there is an `INPUT:<name>` column for every field of the project's `input_spec`.
+
+    Args:
+        project: The project of tasks.
+
+    Returns:
+        pyarrow.Schema: The schema of record batches returned by `iter_task_batches`.
+    """
+    ...
+
+
+def iter_assignment_batches(
+    toloka_client: toloka.client.TolokaClient,
+    request: toloka.client.search_requests.AssignmentSearchRequest,
+    project: typing.Optional[toloka.client.project.Project] = None,
+    batch_size: int = 10000,
+    page_size: typing.Optional[int] = None
+) -> typing.Iterator[pyarrow.RecordBatch]:
+    """Finds all assignments that match the request and returns them as Arrow record batches.
+
+    Search results are converted into columns straight from API responses without creating `Assignment` objects.
+
+    Args:
+        toloka_client: Client to request assignments with.
+        request: How to search assignments.
+        project: The project of assignments. Its `task_spec` defines `INPUT` and `OUTPUT` columns. By default, the
+            project of `request.pool_id` is requested.
+        batch_size: The maximum number of rows in a batch.
+        page_size: The number of assignments requested at once. By default, the API limit is used.
+
+    Yields:
+        pyarrow.RecordBatch: Batches with the schema returned by `get_assignments_schema`.
+
+    Example:
+        How to load accepted assignments of a pool into a table.
+
+        >>> request = toloka.search_requests.AssignmentSearchRequest(pool_id='1', status='ACCEPTED')
+        >>> table = pyarrow.Table.from_batches(iter_assignment_batches(toloka_client, request))
+        ...
+    """
+    ...
+
+
+def iter_task_batches(
+    toloka_client: toloka.client.TolokaClient,
+    request: toloka.client.search_requests.TaskSearchRequest,
+    project: typing.Optional[toloka.client.project.Project] = None,
+    batch_size: int = 10000,
+    page_size: typing.Optional[int] = None
+) -> typing.Iterator[pyarrow.RecordBatch]:
+    """Finds all tasks that match the request and returns them as Arrow record batches.
+
+    Search results are converted into columns straight from API responses without creating `Task` objects.
+
+    Args:
+        toloka_client: Client to request tasks with.
+        request: How to search tasks.
+        project: The project of tasks. Its `task_spec` defines `INPUT` columns. By default, the project of
+            `request.pool_id` is requested.
+        batch_size: The maximum number of rows in a batch.
+        page_size: The number of tasks requested at once. By default, the API limit is used.
+
+    Yields:
+        pyarrow.RecordBatch: Batches with the schema returned by `get_tasks_schema`.
+    """
+    ...
+
+
+def write_assignments_parquet(
+    toloka_client: toloka.client.TolokaClient,
+    path: typing.Union[str, os.PathLike],
+    request: toloka.client.search_requests.AssignmentSearchRequest,
+    project: typing.Optional[toloka.client.project.Project] = None,
+    batch_size: int = 10000,
+    page_size: typing.Optional[int] = None,
+    **kwargs
+) -> int:
+    """Writes all assignments that match the request to a Parquet file.
+
+    The file is written incrementally, one row group per batch of `iter_assignment_batches`.
+
+    Args:
+        toloka_client: Client to request assignments with.
+        path: Path to the file.
+        request: How to search assignments.
+        project: The project of assignments. By default, the project of `request.pool_id` is requested.
+        batch_size: The maximum number of rows in a row group.
+        page_size: The number of assignments requested at once. By default, the API limit is used.
+        **kwargs: Other arguments of `pyarrow.parquet.ParquetWriter`, e.g. `compression`.
+
+    Returns:
+        int: The number of written rows.
+
+    Example:
+        How to save accepted assignments of a pool to a compressed file.
+
+        >>> request = toloka.search_requests.AssignmentSearchRequest(pool_id='1', status='ACCEPTED')
+        >>> write_assignments_parquet(toloka_client, 'assignments.parquet', request, compression='zstd')
+        ...
+    """
+    ...
+
+
+def write_tasks_parquet(
+    toloka_client: toloka.client.TolokaClient,
+    path: typing.Union[str, os.PathLike],
+    request: toloka.client.search_requests.TaskSearchRequest,
+    project: typing.Optional[toloka.client.project.Project] = None,
+    batch_size: int = 10000,
+    page_size: typing.Optional[int] = None,
+    **kwargs
+) -> int:
+    """Writes all tasks that match the request to a Parquet file.
+
+    The file is written incrementally, one row group per batch of `iter_task_batches`.
+
+    Args:
+        toloka_client: Client to request tasks with.
+        path: Path to the file.
+        request: How to search tasks.
+        project: The project of tasks. By default, the project of `request.pool_id` is requested.
+        batch_size: The maximum number of rows in a row group.
+        page_size: The number of tasks requested at once. By default, the API limit is used.
+        **kwargs: Other arguments of `pyarrow.parquet.ParquetWriter`, e.g. `compression`.
+
+    Returns:
+        int: The number of written rows.
+    """
+    ...
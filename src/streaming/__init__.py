@@ -1,15 +1,28 @@
 __all__ = [
     'AssignmentsObserver',
+    'MultiPoolAssignmentsObserver',
     'PoolStatusObserver',
+    'WebhookAssignmentsObserver',
     'Pipeline',
+    'PollingSchedule',
+    'JSONLocalStorage',
+    'SQLiteStorage',
     'cursor',
     'pipeline',
     'observer',
+    'storage',
 ]
 
 from . import cursor
 from . import pipeline
 from . import observer
+from . import storage
 
-from .pipeline import Pipeline
-from .observer import AssignmentsObserver, PoolStatusObserver
+from .pipeline import Pipeline, PollingSchedule
+from .observer import (
+    AssignmentsObserver,
+    MultiPoolAssignmentsObserver,
+    PoolStatusObserver,
+    WebhookAssignmentsObserver,
+)
+from .storage import JSONLocalStorage, SQLiteStorage
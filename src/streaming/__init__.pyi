@@ -1,18 +1,34 @@
 __all__ = [
     'AssignmentsObserver',
+    'MultiPoolAssignmentsObserver',
     'PoolStatusObserver',
+    'WebhookAssignmentsObserver',
     'Pipeline',
+    'PollingSchedule',
+    'JSONLocalStorage',
+    'SQLiteStorage',
     'cursor',
     'pipeline',
     'observer',
+    'storage',
 ]
 from toloka.streaming import (
     cursor,
     observer,
-    pipeline
+    pipeline,
+    storage
 )
 from toloka.streaming.observer import (
     AssignmentsObserver,
-    PoolStatusObserver
+    MultiPoolAssignmentsObserver,
+    PoolStatusObserver,
+    WebhookAssignmentsObserver
+)
+from toloka.streaming.pipeline import (
+    Pipeline,
+    PollingSchedule
+)
+from toloka.streaming.storage import (
+    JSONLocalStorage,
+    SQLiteStorage
 )
-from toloka.streaming.pipeline import Pipeline
@@ -8,12 +8,18 @@ __all__ = [
     'UserSkillCursor',
 ]
 
+import asyncio
 import attr
 import functools
+import itertools
+import json
 import logging
 from datetime import datetime
-from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Optional, Tuple, TypeVar, Union
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, TypeVar, Union
+)
 
+from ..async_client import AsyncTolokaClient
 from ..client import (
     Assignment,
     Task,
@@ -24,15 +30,18 @@ from ..client import (
     search_requests,
     search_results,
     structure,
+    unstructure,
 )
 from ..util._codegen import fix_attrs_converters
+from ..util._iterators import aiterate_concurrently, iterate_concurrently
 from .event import AssignmentEvent, BaseEvent, TaskEvent, UserBonusEvent, UserSkillEvent
+from .storage import BaseStorage
 from ..util.async_utils import AsyncMultithreadWrapper, ensure_async
 
 
 RequestObjectType = TypeVar('RequestObjectType')
 ResponseObjectType = TypeVar('ResponseObjectType')
-TolokaClientSyncOrAsyncType = Union[TolokaClient, AsyncMultithreadWrapper[TolokaClient]]
+TolokaClientSyncOrAsyncType = Union[TolokaClient, AsyncMultithreadWrapper[TolokaClient], AsyncTolokaClient]
 
 DATETIME_MIN = datetime.fromtimestamp(0)
 
@@ -42,56 +51,104 @@ logger = logging.getLogger(__name__)
 
 @attr.s
 class _ByIdCursor:
-    """Iterate by id only."""
+    """Iterate by id only.
+
+    If `prefetch_pages` is positive, up to `prefetch_pages` next pages are requested in the background
+    while the current one is being processed.
+    """
     fetcher: Callable[[RequestObjectType], ResponseObjectType] = attr.ib()
     request: RequestObjectType = attr.ib()
+    prefetch_pages: int = attr.ib(default=0)
 
-    def __iter__(self) -> Iterator[Any]:
+    def _iter_pages(self) -> Iterator[ResponseObjectType]:
+        request = self.request
+        while True:
+            response = self.fetcher(request, sort='id')  # Diff between sync and async.
+            yield response
+            if not response.has_more:
+                return
+            if response.items:
+                request = attr.evolve(request, id_gt=response.items[-1].id)
+
+    async def _aiter_pages(self) -> AsyncIterator[ResponseObjectType]:
+        request = self.request
         while True:
-            response = self.fetcher(self.request, sort='id')  # Diff between sync and async.
+            response = await ensure_async(self.fetcher)(request, sort='id')  # Diff between sync and async.
+            yield response
+            if not response.has_more:
+                return
+            if response.items:
+                request = attr.evolve(request, id_gt=response.items[-1].id)
+
+    def __iter__(self) -> Iterator[Any]:
+        if self.prefetch_pages:
+            pages = iterate_concurrently([self._iter_pages], buffer_size=self.prefetch_pages)  # Diff between sync and async.
+        else:
+            pages = self._iter_pages()  # Diff between sync and async.
+        for response in pages:
             if response.items:
                 for item in response.items:
                     yield item
                 self.request = attr.evolve(self.request, id_gt=item.id)
-            if not response.has_more:
-                return
 
     async def __aiter__(self) -> AsyncIterator[Any]:
-        while True:
-            response = await ensure_async(self.fetcher)(self.request, sort='id')  # Diff between sync and async.
+        if self.prefetch_pages:
+            pages = aiterate_concurrently([self._aiter_pages], buffer_size=self.prefetch_pages)  # Diff between sync and async.
+        else:
+            pages = self._aiter_pages()  # Diff between sync and async.
+        async for response in pages:
             if response.items:
                 for item in response.items:
                     yield item
                 self.request = attr.evolve(self.request, id_gt=item.id)
-            if not response.has_more:
-                return
 
 
 @attr.s
 class BaseCursor:
+    """Base class for cursors over Toloka events.
+
+    The cursor keeps its position as the search request with the time bound of the last fetched event and the ids of
+    events seen at that time, so the position is exact after every event. If `storage` is set, the position is loaded on creation and saved every time
+    `try_fetch_all` commits, so a restarted process resumes from the last committed event. Unless `storage_key` is set,
+    the key is built from the cursor type, the event type and the request the cursor is created with.
+    """
+
     toloka_client: TolokaClientSyncOrAsyncType = attr.ib()
     _request: RequestObjectType = attr.ib()
-    _prev_response: Optional[ResponseObjectType] = attr.ib(default=None, init=False)
+    _seen_ids: Set[str] = attr.ib(factory=set, init=False)
+    _prefetch_pages: int = attr.ib(default=0, kw_only=True)
+    _storage: Optional[BaseStorage] = attr.ib(default=None, kw_only=True)
+    _storage_key: Optional[str] = attr.ib(default=None, kw_only=True)
 
     @attr.s
     class CursorFetchContext:
         """Context manager to return from `BaseCursor.try_fetch_all method`.
         Commit cursor state only if no error occured.
+        If `batch_size` is set, fetch at most `batch_size` events, the rest are fetched by the next calls.
         """
         _cursor: 'BaseCursor' = attr.ib()
+        _batch_size: Optional[int] = attr.ib(default=None)
         _start_state: Optional[Tuple] = attr.ib(default=None, init=False)
         _finish_state: Optional[Tuple] = attr.ib(default=None, init=False)
 
         def __enter__(self) -> List[BaseEvent]:
             self._start_state = self._cursor._get_state()
-            res = [item for item in self._cursor]
+            events = iter(self._cursor)
+            res = list(itertools.islice(events, self._batch_size))
+            events.close()
             self._finish_state = self._cursor._get_state()
             self._cursor._set_state(self._start_state)
             return res
 
         async def __aenter__(self) -> List[BaseEvent]:
             self._start_state = self._cursor._get_state()
-            res = [item async for item in self._cursor]
+            events = self._cursor.__aiter__()
+            res = []
+            async for item in events:
+                res.append(item)
+                if len(res) == self._batch_size:
+                    break
+            await events.aclose()
             self._finish_state = self._cursor._get_state()
             self._cursor._set_state(self._start_state)
             return res
@@ -99,21 +156,80 @@ class BaseCursor:
         def __exit__(self, exc_type, exc_value, traceback) -> None:
             if exc_type is None:
                 self._cursor._set_state(self._finish_state)
+                self._cursor._save_state(self._finish_state)
 
         async def __aexit__(self, exc_type, exc_value, traceback) -> Awaitable[None]:
             if exc_type is None:
                 self._cursor._set_state(self._finish_state)
+                await self._cursor._asave_state(self._finish_state)
+
+    def _get_state(self) -> Tuple[RequestObjectType, FrozenSet[str]]:
+        return self._request, frozenset(self._seen_ids)
 
-    def _get_state(self) -> Tuple[RequestObjectType, Optional[ResponseObjectType]]:
-        return self._request, self._prev_response
+    def _set_state(self, state: Tuple[RequestObjectType, FrozenSet[str]]) -> None:
+        self._request, self._seen_ids = state[0], set(state[1])
 
-    def _set_state(self, state: Tuple[RequestObjectType, Optional[ResponseObjectType]]) -> None:
-        self._request, self._prev_response = state
+    @staticmethod
+    def _dump_state(state: Tuple[RequestObjectType, FrozenSet[str]]) -> Dict[str, Any]:
+        request, seen_ids = state
+        return {'request': unstructure(request), 'seen_ids': sorted(seen_ids)}
 
-    def try_fetch_all(self) -> CursorFetchContext:
-        return self.CursorFetchContext(self)
+    def _load_state(self, state: Dict[str, Any]) -> None:
+        self._request = structure(state['request'], type(self._request))
+        self._seen_ids = set(state['seen_ids'])
+
+    def _save_state(self, state: Tuple[RequestObjectType, FrozenSet[str]]) -> None:
+        if self._storage is not None:
+            self._storage.save(self._storage_key, self._dump_state(state))
+
+    async def _asave_state(self, state: Tuple[RequestObjectType, FrozenSet[str]]) -> None:
+        # Storages do blocking file or database I/O, so they are not run on the event loop
+        if self._storage is not None:
+            await asyncio.get_event_loop().run_in_executor(None, self._save_state, state)
+
+    def try_fetch_all(self, batch_size: Optional[int] = None) -> CursorFetchContext:
+        """Fetches new events and moves the cursor only if they are handled without errors.
+
+        Args:
+            batch_size: The maximum number of events to fetch. The cursor is moved to the last fetched event, so the
+                next call returns the next batch. Bounds the memory used for handling many events.
+                Default value: `None`, all new events are fetched.
+
+        Example:
+            Handle events in batches of 1000, each batch is committed separately.
+
+            >>> while True:
+            >>>     with cursor.try_fetch_all(batch_size=1000) as events:
+            >>>         if not events:
+            >>>             break
+            >>>         handle(events)
+            ...
+        """
+        return self.CursorFetchContext(self, batch_size)
+
+    def _move_to(self, item: Any) -> None:
+        """Moves the position to just after the item."""
+        time = self._get_time(item)
+        if time != getattr(self._request, self._time_field_gte):
+            self._request = attr.evolve(self._request, **{self._time_field_gte: time})
+            self._seen_ids = set()
+        self._seen_ids.add(item.id)
+
+    def _move_start(self, time: datetime) -> None:
+        """Moves the position forward to the time unless the cursor is already past it."""
+        if getattr(self._request, self._time_field_gte) < time:
+            self._request = attr.evolve(self._request, **{self._time_field_gte: time})
+            self._seen_ids = set()
 
     def __attrs_post_init__(self):
+        if self._storage is not None:
+            if self._storage_key is None:
+                request_key = json.dumps(unstructure(self._request), sort_keys=True)
+                self._storage_key = f'{type(self).__name__}:{self._get_time_field()}:{request_key}'
+            state = self._storage.load(self._storage_key)
+            if state is not None:
+                logger.info('Resume %s from the saved state', self._storage_key)
+                self._load_state(state)
         if not getattr(self._request, self._time_field_gte):
             self._request = attr.evolve(self._request, **{self._time_field_gte: DATETIME_MIN})
 
@@ -148,54 +264,70 @@ class BaseCursor:
         fetcher = self._get_fetcher()
         while True:
             response = fetcher(self._request, sort=self._get_time_field())  # Diff between sync and async.
-            if response.items:
-                max_time = self._get_time(response.items[-1])
-                self._request = attr.evolve(self._request, **{self._time_field_gte: max_time})
-                seen_ids = frozenset(item.id for item in self._prev_response.items) if self._prev_response else ()
-                for item in response.items:
-                    if item.id not in seen_ids:
-                        yield self._construct_event(item)
+            if not response.items:
+                return
+
+            # The position is moved after every event, so it's exact even if the iteration is stopped.
+            max_time = self._get_time(response.items[-1])
+            for item in response.items:
+                if item.id not in self._seen_ids:
+                    self._move_to(item)
+                    yield self._construct_event(item)
 
-                self._prev_response = response
-                if not response.has_more:
-                    return
-
-                if self._get_time(response.items[0]) == max_time:
-                    fixed_time_request = attr.evolve(self._request, **{self._time_field_lte: max_time})
-                    seen_ids = frozenset(item.id for item in response.items)
-                    for item in _ByIdCursor(fetcher, fixed_time_request):  # Diff between sync and async.
-                        if item.id not in seen_ids:
-                            yield self._construct_event(item)
-                    self._request = attr.evolve(self._request, **{self._time_field_gt: max_time})
-            else:
+            if not response.has_more:
                 return
 
+            if self._get_time(response.items[0]) == max_time:
+                fixed_time_request = attr.evolve(self._request, **{self._time_field_lte: max_time})
+                for item in _ByIdCursor(fetcher, fixed_time_request, self._prefetch_pages):  # Diff between sync and async.
+                    if item.id not in self._seen_ids:
+                        self._move_to(item)
+                        yield self._construct_event(item)
+                # All events at max_time are fetched, their ids are not needed anymore.
+                self._request = attr.evolve(self._request, **{self._time_field_gt: max_time})
+                self._seen_ids = set()
+
     async def __aiter__(self) -> AsyncIterator[BaseEvent]:
         fetcher = self._get_fetcher()
         while True:
             response = await ensure_async(fetcher)(self._request, sort=self._get_time_field())  # Diff between sync and async.
-            if response.items:
-                max_time = self._get_time(response.items[-1])
-                self._request = attr.evolve(self._request, **{self._time_field_gte: max_time})
-                seen_ids = frozenset(item.id for item in self._prev_response.items) if self._prev_response else ()
-                for item in response.items:
-                    if item.id not in seen_ids:
-                        yield self._construct_event(item)
+            if not response.items:
+                return
+
+            # The position is moved after every event, so it's exact even if the iteration is stopped.
+            max_time = self._get_time(response.items[-1])
+            for item in response.items:
+                if item.id not in self._seen_ids:
+                    self._move_to(item)
+                    yield self._construct_event(item)
 
-                self._prev_response = response
-                if not response.has_more:
-                    return
-
-                if self._get_time(response.items[0]) == max_time:
-                    fixed_time_request = attr.evolve(self._request, **{self._time_field_lte: max_time})
-                    seen_ids = frozenset(item.id for item in response.items)
-                    async for item in _ByIdCursor(fetcher, fixed_time_request):  # Diff between sync and async.
-                        if item.id not in seen_ids:
-                            yield self._construct_event(item)
-                    self._request = attr.evolve(self._request, **{self._time_field_gt: max_time})
-            else:
+            if not response.has_more:
                 return
 
+            if self._get_time(response.items[0]) == max_time:
+                fixed_time_request = attr.evolve(self._request, **{self._time_field_lte: max_time})
+                async for item in _ByIdCursor(fetcher, fixed_time_request, self._prefetch_pages):  # Diff between sync and async.
+                    if item.id not in self._seen_ids:
+                        self._move_to(item)
+                        yield self._construct_event(item)
+                # All events at max_time are fetched, their ids are not needed anymore.
+                self._request = attr.evolve(self._request, **{self._time_field_gt: max_time})
+                self._seen_ids = set()
+
+    async def _aiter_batches(
+        self,
+        batch_size: int,
+    ) -> AsyncIterator[Tuple[List[BaseEvent], Tuple[RequestObjectType, FrozenSet[str]]]]:
+        """Iterate over batches of events with the cursor state after each batch. The cursor state is not restored."""
+        batch = []
+        async for event in self:
+            batch.append(event)
+            if len(batch) == batch_size:
+                yield batch, self._get_state()
+                batch = []
+        if batch:
+            yield batch, self._get_state()
+
 
 @expand('request')
 @fix_attrs_converters
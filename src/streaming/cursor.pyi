@@ -8,10 +8,12 @@ __all__ = [
     'UserSkillCursor',
 ]
 import datetime
+import toloka.async_client.client
 import toloka.client
 import toloka.client.assignment
 import toloka.client.search_requests
 import toloka.streaming.event
+import toloka.streaming.storage
 import typing
 
 
@@ -19,31 +21,67 @@ RequestObjectType = typing.TypeVar('RequestObjectType')
 
 ResponseObjectType = typing.TypeVar('ResponseObjectType')
 
-TolokaClientSyncOrAsyncType = typing.Union[toloka.client.TolokaClient, toloka.util.async_utils.AsyncMultithreadWrapper[toloka.client.TolokaClient]]
+TolokaClientSyncOrAsyncType = typing.Union[toloka.client.TolokaClient, toloka.util.async_utils.AsyncMultithreadWrapper[toloka.client.TolokaClient], toloka.async_client.client.AsyncTolokaClient]
 
 DATETIME_MIN = ...
 
 class BaseCursor:
+    """Base class for cursors over Toloka events.
+
+    The cursor keeps its position as the search request with the time bound of the last fetched event and the ids of
+    events seen at that time, so the position is exact after every event. If `storage` is set, the position is loaded on creation and saved every time
+    `try_fetch_all` commits, so a restarted process resumes from the last committed event. Unless `storage_key` is set,
+    the key is built from the cursor type, the event type and the request the cursor is created with.
+    """
+
     class CursorFetchContext:
         """Context manager to return from `BaseCursor.try_fetch_all method`.
         Commit cursor state only if no error occured.
+        If `batch_size` is set, fetch at most `batch_size` events, the rest are fetched by the next calls.
         """
 
-        def __init__(self, cursor: 'BaseCursor') -> None:
+        def __init__(
+            self,
+            cursor: 'BaseCursor',
+            batch_size: typing.Optional[int] = None
+        ) -> None:
             """Method generated by attrs for class BaseCursor.CursorFetchContext.
             """
             ...
 
         _cursor: 'BaseCursor'
+        _batch_size: typing.Optional[int]
         _start_state: typing.Optional[typing.Tuple]
         _finish_state: typing.Optional[typing.Tuple]
 
-    def try_fetch_all(self) -> CursorFetchContext: ...
+    def try_fetch_all(self, batch_size: typing.Optional[int] = None) -> CursorFetchContext:
+        """Fetches new events and moves the cursor only if they are handled without errors.
+
+        Args:
+            batch_size: The maximum number of events to fetch. The cursor is moved to the last fetched event, so the
+                next call returns the next batch. Bounds the memory used for handling many events.
+                Default value: `None`, all new events are fetched.
+
+        Example:
+            Handle events in batches of 1000, each batch is committed separately.
+
+            >>> while True:
+            >>>     with cursor.try_fetch_all(batch_size=1000) as events:
+            >>>         if not events:
+            >>>             break
+            >>>         handle(events)
+            ...
+        """
+        ...
 
     def __init__(
         self,
         toloka_client: TolokaClientSyncOrAsyncType,
-        request: RequestObjectType
+        request: RequestObjectType,
+        *,
+        prefetch_pages: int = 0,
+        storage: typing.Optional[toloka.streaming.storage.BaseStorage] = None,
+        storage_key: typing.Optional[str] = None
     ) -> None:
         """Method generated by attrs for class BaseCursor.
         """
@@ -51,7 +89,10 @@ class BaseCursor:
 
     toloka_client: TolokaClientSyncOrAsyncType
     _request: typing.Any
-    _prev_response: typing.Any
+    _seen_ids: typing.Set[str]
+    _prefetch_pages: int
+    _storage: typing.Optional[toloka.streaming.storage.BaseStorage]
+    _storage_key: typing.Optional[str]
 
 
 class AssignmentCursor(BaseCursor):
@@ -77,7 +118,11 @@ class AssignmentCursor(BaseCursor):
         self,
         toloka_client: TolokaClientSyncOrAsyncType,
         event_type: typing.Any,
-        request: toloka.client.search_requests.AssignmentSearchRequest = ...
+        request: toloka.client.search_requests.AssignmentSearchRequest = ...,
+        *,
+        prefetch_pages: int = 0,
+        storage: typing.Optional[toloka.streaming.storage.BaseStorage] = None,
+        storage_key: typing.Optional[str] = None
     ) -> None:
         """Method generated by attrs for class AssignmentCursor.
         """
@@ -120,7 +165,11 @@ class AssignmentCursor(BaseCursor):
         expired_lt: typing.Optional[datetime.datetime] = None,
         expired_lte: typing.Optional[datetime.datetime] = None,
         expired_gt: typing.Optional[datetime.datetime] = None,
-        expired_gte: typing.Optional[datetime.datetime] = None
+        expired_gte: typing.Optional[datetime.datetime] = None,
+        *,
+        prefetch_pages: int = 0,
+        storage: typing.Optional[toloka.streaming.storage.BaseStorage] = None,
+        storage_key: typing.Optional[str] = None
     ) -> None:
         """Method generated by attrs for class AssignmentCursor.
         """
@@ -128,7 +177,10 @@ class AssignmentCursor(BaseCursor):
 
     toloka_client: TolokaClientSyncOrAsyncType
     _request: toloka.client.search_requests.AssignmentSearchRequest
-    _prev_response: typing.Any
+    _seen_ids: typing.Set[str]
+    _prefetch_pages: int
+    _storage: typing.Optional[toloka.streaming.storage.BaseStorage]
+    _storage_key: typing.Optional[str]
     _event_type: toloka.streaming.event.AssignmentEvent.Type
 
 
@@ -153,7 +205,11 @@ class TaskCursor(BaseCursor):
     def __init__(
         self,
         toloka_client: TolokaClientSyncOrAsyncType,
-        request: toloka.client.search_requests.TaskSearchRequest = ...
+        request: toloka.client.search_requests.TaskSearchRequest = ...,
+        *,
+        prefetch_pages: int = 0,
+        storage: typing.Optional[toloka.streaming.storage.BaseStorage] = None,
+        storage_key: typing.Optional[str] = None
     ) -> None:
         """Method generated by attrs for class TaskCursor.
         """
@@ -176,7 +232,11 @@ class TaskCursor(BaseCursor):
         overlap_lt: typing.Optional[int] = None,
         overlap_lte: typing.Optional[int] = None,
         overlap_gt: typing.Optional[int] = None,
-        overlap_gte: typing.Optional[int] = None
+        overlap_gte: typing.Optional[int] = None,
+        *,
+        prefetch_pages: int = 0,
+        storage: typing.Optional[toloka.streaming.storage.BaseStorage] = None,
+        storage_key: typing.Optional[str] = None
     ) -> None:
         """Method generated by attrs for class TaskCursor.
         """
@@ -184,7 +244,10 @@ class TaskCursor(BaseCursor):
 
     toloka_client: TolokaClientSyncOrAsyncType
     _request: toloka.client.search_requests.TaskSearchRequest
-    _prev_response: typing.Any
+    _seen_ids: typing.Set[str]
+    _prefetch_pages: int
+    _storage: typing.Optional[toloka.streaming.storage.BaseStorage]
+    _storage_key: typing.Optional[str]
 
 
 class UserBonusCursor(BaseCursor):
@@ -208,7 +271,11 @@ class UserBonusCursor(BaseCursor):
     def __init__(
         self,
         toloka_client: TolokaClientSyncOrAsyncType,
-        request: toloka.client.search_requests.UserBonusSearchRequest = ...
+        request: toloka.client.search_requests.UserBonusSearchRequest = ...,
+        *,
+        prefetch_pages: int = 0,
+        storage: typing.Optional[toloka.streaming.storage.BaseStorage] = None,
+        storage_key: typing.Optional[str] = None
     ) -> None:
         """Method generated by attrs for class UserBonusCursor.
         """
@@ -227,7 +294,11 @@ class UserBonusCursor(BaseCursor):
         created_lt: typing.Optional[datetime.datetime] = None,
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
-        created_gte: typing.Optional[datetime.datetime] = None
+        created_gte: typing.Optional[datetime.datetime] = None,
+        *,
+        prefetch_pages: int = 0,
+        storage: typing.Optional[toloka.streaming.storage.BaseStorage] = None,
+        storage_key: typing.Optional[str] = None
     ) -> None:
         """Method generated by attrs for class UserBonusCursor.
         """
@@ -235,7 +306,10 @@ class UserBonusCursor(BaseCursor):
 
     toloka_client: TolokaClientSyncOrAsyncType
     _request: toloka.client.search_requests.UserBonusSearchRequest
-    _prev_response: typing.Any
+    _seen_ids: typing.Set[str]
+    _prefetch_pages: int
+    _storage: typing.Optional[toloka.streaming.storage.BaseStorage]
+    _storage_key: typing.Optional[str]
 
 
 class UserSkillCursor(BaseCursor):
@@ -261,7 +335,11 @@ class UserSkillCursor(BaseCursor):
         self,
         toloka_client: TolokaClientSyncOrAsyncType,
         event_type: typing.Any,
-        request: toloka.client.search_requests.UserSkillSearchRequest = ...
+        request: toloka.client.search_requests.UserSkillSearchRequest = ...,
+        *,
+        prefetch_pages: int = 0,
+        storage: typing.Optional[toloka.streaming.storage.BaseStorage] = None,
+        storage_key: typing.Optional[str] = None
     ) -> None:
         """Method generated by attrs for class UserSkillCursor.
         """
@@ -285,7 +363,11 @@ class UserSkillCursor(BaseCursor):
         modified_lt: typing.Optional[datetime.datetime] = None,
         modified_lte: typing.Optional[datetime.datetime] = None,
         modified_gt: typing.Optional[datetime.datetime] = None,
-        modified_gte: typing.Optional[datetime.datetime] = None
+        modified_gte: typing.Optional[datetime.datetime] = None,
+        *,
+        prefetch_pages: int = 0,
+        storage: typing.Optional[toloka.streaming.storage.BaseStorage] = None,
+        storage_key: typing.Optional[str] = None
     ) -> None:
         """Method generated by attrs for class UserSkillCursor.
         """
@@ -293,5 +375,8 @@ class UserSkillCursor(BaseCursor):
 
     toloka_client: TolokaClientSyncOrAsyncType
     _request: toloka.client.search_requests.UserSkillSearchRequest
-    _prev_response: typing.Any
+    _seen_ids: typing.Set[str]
+    _prefetch_pages: int
+    _storage: typing.Optional[toloka.streaming.storage.BaseStorage]
+    _storage_key: typing.Optional[str]
     _event_type: toloka.streaming.event.UserSkillEvent.Type
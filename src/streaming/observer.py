@@ -1,29 +1,41 @@
 __all__ = [
     'AssignmentsObserver',
     'BaseObserver',
+    'MultiPoolAssignmentsObserver',
     'PoolStatusObserver',
+    'WebhookAssignmentsObserver',
 ]
 
 import asyncio
 import attr
 import datetime
+import hashlib
+import hmac
+import json
 import logging
+import time
+from aiohttp import web
+from collections import OrderedDict
+from concurrent import futures
 
-from typing import Awaitable, Callable, Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
 
 from ..client.primitives.base import autocast_to_enum
 from ..client.assignment import Assignment
 from ..client.pool import Pool
+from ..client.webhook_subscription import WebhookSubscription
 from ..util.async_utils import AsyncInterfaceWrapper, ComplexException, ensure_async, get_task_traceback
 from .cursor import AssignmentCursor, TolokaClientSyncOrAsyncType
 from .event import AssignmentEvent
+from .storage import BaseStorage
 
 logger = logging.getLogger(__name__)
 
 
 @attr.s
 class BaseObserver:
-    async def __call__(self) -> None:
+    async def __call__(self) -> Optional[int]:
+        """Handle new events. Return the number of handled events, if it's known."""
         raise NotImplementedError
 
     async def should_resume(self) -> bool:
@@ -143,14 +155,15 @@ class PoolStatusObserver(BasePoolObserver):
             self.register_callback(callback, status)
         return callback
 
-    async def __call__(self) -> None:
+    async def __call__(self) -> int:
         if not self._callbacks:
-            return
+            return 0
 
         pool = await self.toloka_client.get_pool(self.pool_id)
         current_status = pool.status
+        status_changed = current_status != self._previous_status
 
-        if current_status != self._previous_status:
+        if status_changed:
             logger.info('Pool %s status change: %s -> %s', self.pool_id, self._previous_status, current_status)
             if self._callbacks.get(current_status):
                 loop = asyncio.get_event_loop()
@@ -164,6 +177,7 @@ class PoolStatusObserver(BasePoolObserver):
                     raise ComplexException([task.exception() for task in errored])
 
         self._previous_status = current_status
+        return int(status_changed)
 
 
 CallbackForAssignmentEventsSyncType = Callable[[List[AssignmentEvent]], None]
@@ -171,32 +185,166 @@ CallbackForAssignmentEventsAsyncType = Callable[[List[AssignmentEvent]], Awaitab
 CallbackForAssignmentEventsType = Union[CallbackForAssignmentEventsSyncType, CallbackForAssignmentEventsAsyncType]
 
 
+class _SeenAssignments:
+    """Ids of the recently handled assignments, the least recently handled are forgotten first.
+
+    Assignments are also seen while they are being handled, so events that come another way meanwhile are skipped.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._ids: 'OrderedDict[str, None]' = OrderedDict()
+        self._in_progress: Set[str] = set()
+
+    def __contains__(self, assignment_id: str) -> bool:
+        return assignment_id in self._ids or assignment_id in self._in_progress
+
+    def select_new(self, events: List[AssignmentEvent]) -> List[AssignmentEvent]:
+        """Returns events of the assignments that are not seen and marks them in progress."""
+        new_events = {}
+        for event in events:
+            if event.assignment.id not in self:
+                new_events.setdefault(event.assignment.id, event)
+        self._in_progress.update(new_events)
+        return list(new_events.values())
+
+    def discard(self, events: List[AssignmentEvent]) -> None:
+        """Forgets the assignments that failed to be handled."""
+        self._in_progress.difference_update(event.assignment.id for event in events)
+
+    def add(self, events: List[AssignmentEvent]) -> None:
+        self.discard(events)
+        for event in events:
+            self._ids[event.assignment.id] = None
+            self._ids.move_to_end(event.assignment.id)
+        while len(self._ids) > self.max_size:
+            self._ids.popitem(last=False)
+
+
 @attr.s
 class _CallbacksCursorConsumer:
     """Store cursor and related callbacks.
     Allow to run callbacks at fetched data and move the cursor in case of success.
+
+    If `queue_size` is set, fetching and callbacks run as separate stages: batches of events are fetched ahead into a
+    bounded queue while `concurrency` workers run callbacks, and the cursor is moved after all the previous batches are
+    handled too.
+
+    If `seen` is set, events of the recently handled assignments are skipped.
     """
     cursor: AssignmentCursor = attr.ib()
+    batch_size: Optional[int] = attr.ib(default=None)
+    queue_size: Optional[int] = attr.ib(default=None)
+    concurrency: int = attr.ib(default=1)
+    seen: Optional[_SeenAssignments] = attr.ib(default=None)
     callbacks: List[CallbackForAssignmentEventsAsyncType] = attr.ib(factory=list, init=False)
 
-    def add_callback(self, callback: CallbackForAssignmentEventsType) -> None:
-        self.callbacks.append(ensure_async(callback))
+    def add_callback(
+        self,
+        callback: CallbackForAssignmentEventsType,
+        executor: Optional[futures.Executor] = None,
+    ) -> None:
+        self.callbacks.append(ensure_async(callback, executor))
 
-    async def __call__(self, pool_id: str) -> None:
-        async with self.cursor.try_fetch_all() as fetched:
+    async def _run_callbacks(self, pool_id: str, fetched: List[AssignmentEvent]) -> int:
+        if self.seen is not None:
+            fetched = self.seen.select_new(fetched)
             if not fetched:
-                return
+                return 0
 
-            logger.info('Got pool %s events count of type %s: %d', pool_id, fetched[0].event_type, len(fetched))
-            loop = asyncio.get_event_loop()
-            callback_by_task = {loop.create_task(callback(fetched)): callback
-                                for callback in self.callbacks}
+        logger.info('Got pool %s events count of type %s: %d', pool_id, fetched[0].event_type, len(fetched))
+        loop = asyncio.get_event_loop()
+        callback_by_task = {loop.create_task(callback(fetched)): callback
+                            for callback in self.callbacks}
+        try:
             done, _ = await asyncio.wait(callback_by_task)
             errored = [task for task in done if task.exception() is not None]
             if errored:
                 for task in errored:
                     logger.error('Got error in callback: %s\n%s', callback_by_task[task], get_task_traceback(task))
                 raise ComplexException([task.exception() for task in errored])
+        except BaseException:
+            # Events of failed assignments are handled again, whatever way they come
+            if self.seen is not None:
+                self.seen.discard(fetched)
+            raise
+        if self.seen is not None:
+            self.seen.add(fetched)
+        return len(fetched)
+
+    async def _call_staged(self, pool_id: str) -> int:
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        handled_batches = {}
+        committed_state = self.cursor._get_state()
+        committed_count = 0
+        handled = 0
+        stopped = False
+        # Indices of workers waiting for a batch, asyncio.current_task is not available in Python 3.6
+        waiting_workers = set()
+
+        async def fetch() -> None:
+            number = 0
+            async for fetched, state in self.cursor._aiter_batches(self.batch_size):
+                await queue.put((number, fetched, state))
+                number += 1
+            for _ in range(self.concurrency):
+                await queue.put(None)
+
+        async def work(index: int) -> None:
+            nonlocal committed_state, committed_count, handled
+            while not stopped:
+                waiting_workers.add(index)
+                try:
+                    item = await queue.get()
+                finally:
+                    waiting_workers.discard(index)
+                if item is None:
+                    return
+                number, fetched, state = item
+                count = await self._run_callbacks(pool_id, fetched)
+                # Batches are acknowledged in any order but committed in the order they were fetched
+                handled_batches[number] = (state, count)
+                while committed_count in handled_batches:
+                    state, count = handled_batches.pop(committed_count)
+                    await self.cursor._asave_state(state)
+                    committed_state = state
+                    committed_count += 1
+                    handled += count
+
+        loop = asyncio.get_event_loop()
+        fetcher = loop.create_task(fetch())
+        workers = [loop.create_task(work(index)) for index in range(self.concurrency)]
+        try:
+            done, pending = await asyncio.wait([fetcher, *workers], return_when=asyncio.FIRST_EXCEPTION)
+            errored = [task for task in done if task.exception() is not None]
+            if errored:
+                # Workers finish their current batches, but take no new ones
+                stopped = True
+                fetcher.cancel()
+                for index in waiting_workers:
+                    workers[index].cancel()
+                if pending:
+                    done, _ = await asyncio.wait(pending)
+                    errored.extend(task for task in done if not task.cancelled() and task.exception() is not None)
+                raise ComplexException([task.exception() for task in errored])
+        finally:
+            # Batches fetched ahead but not handled are fetched again by the next call
+            self.cursor._set_state(committed_state)
+        return handled
+
+    async def __call__(self, pool_id: str) -> int:
+        if self.queue_size is not None:
+            return await self._call_staged(pool_id)
+
+        handled = 0
+        while True:
+            async with self.cursor.try_fetch_all(self.batch_size) as fetched:
+                if not fetched:
+                    return handled
+                handled += await self._run_callbacks(pool_id, fetched)
+
+            if self.batch_size is None or len(fetched) < self.batch_size:
+                return handled
 
 
 @attr.s
@@ -217,6 +365,19 @@ class AssignmentsObserver(BasePoolObserver):
     Attributes:
         toloka_client: TolokaClient instance or async wrapper around it.
         pool_id: Pool ID.
+        storage: Storage of cursor states. If set, a restarted observer continues from the last handled events instead
+            of passing all pool events to callbacks again. See `JSONLocalStorage` and `SQLiteStorage`.
+        batch_size: The maximum number of events passed to callbacks at once. Events are fetched and handled in
+            batches until all new events are handled, the cursor is moved after every batch. Limits the memory used by
+            the observer if many events occur between calls.
+            Default value: `None`, all new events are passed at once.
+        queue_size: The maximum number of batches fetched ahead while callbacks handle the previous ones. If set,
+            the next batches are fetched without waiting for callbacks, and the cursor is moved as soon as a batch and
+            all the batches before it are handled. Requires `batch_size`.
+            Default value: `None`, every batch is fetched after the previous one is handled.
+        concurrency: The number of batches of the same event type handled at once if `queue_size` is set. Callbacks
+            must tolerate being called for several batches at a time.
+            Default value: `1`.
 
     Examples:
         Send submitted assignments for verification.
@@ -228,9 +389,25 @@ class AssignmentsObserver(BasePoolObserver):
         >>> observer = AssignmentsObserver(toloka_client, pool_id='123')
         >>> observer.on_submitted(handle_submitted)
         ...
+
+        Run CPU-heavy checks in other processes, so they don't block other observers.
+
+        >>> process_pool = concurrent.futures.ProcessPoolExecutor()
+        >>> observer.on_submitted(check_image_quality, executor=process_pool)
+        ...
     """
 
     _callbacks: Dict[AssignmentEvent.Type, _CallbacksCursorConsumer] = attr.ib(factory=dict, init=False)
+    _storage: Optional[BaseStorage] = attr.ib(default=None, kw_only=True)
+    _batch_size: Optional[int] = attr.ib(default=None, kw_only=True)
+    _queue_size: Optional[int] = attr.ib(default=None, kw_only=True)
+    _concurrency: int = attr.ib(default=1, kw_only=True)
+
+    def __attrs_post_init__(self):
+        if self._queue_size is not None and (self._batch_size is None or self._queue_size < 1):
+            raise ValueError('queue_size must be positive and requires batch_size')
+        if self._concurrency < 1:
+            raise ValueError('concurrency must be positive')
 
     # Setup section.
 
@@ -239,6 +416,7 @@ class AssignmentsObserver(BasePoolObserver):
         self,
         callback: CallbackForAssignmentEventsType,
         event_type: AssignmentEvent.Type,
+        executor: Optional[futures.Executor] = None,
     ) -> CallbackForAssignmentEventsType:
         """Register given callable for given event type.
         Callback will be called multiple times if it has been registered for multiple event types.
@@ -246,44 +424,79 @@ class AssignmentsObserver(BasePoolObserver):
         Args:
             callback: Sync or async callable that pass List[AssignmentEvent] of desired event type.
             event_type: Selected event type.
+            executor: Executor to run a sync callback in, so it doesn't block the event loop and other observers.
+                Use `ProcessPoolExecutor` for CPU-heavy callbacks: they must be picklable, e.g. module-level
+                functions, and get pickled copies of events. By default, sync callbacks run in the event loop thread.
 
         Returns:
             The same callable passed as callback.
         """
         if event_type not in self._callbacks:
-            cursor = AssignmentCursor(pool_id=self.pool_id, event_type=event_type, toloka_client=self.toloka_client)
-            self._callbacks[event_type] = _CallbacksCursorConsumer(cursor)
-        self._callbacks[event_type].add_callback(callback)
+            self._callbacks[event_type] = self._create_consumer(event_type)
+        self._callbacks[event_type].add_callback(callback, executor)
         return callback
 
-    def on_any_event(self, callback: CallbackForAssignmentEventsType) -> CallbackForAssignmentEventsType:
+    def _create_consumer(self, event_type: AssignmentEvent.Type) -> _CallbacksCursorConsumer:
+        cursor = AssignmentCursor(pool_id=self.pool_id, event_type=event_type, toloka_client=self.toloka_client,
+                                  storage=self._storage)
+        return _CallbacksCursorConsumer(cursor, self._batch_size, self._queue_size, self._concurrency)
+
+    def on_any_event(
+        self,
+        callback: CallbackForAssignmentEventsType,
+        executor: Optional[futures.Executor] = None,
+    ) -> CallbackForAssignmentEventsType:
         for event_type in AssignmentEvent.Type.__members__.values():
-            self.register_callback(callback, event_type)
+            self.register_callback(callback, event_type, executor)
         return callback
 
-    def on_created(self, callback: CallbackForAssignmentEventsType) -> CallbackForAssignmentEventsType:
-        return self.register_callback(callback, AssignmentEvent.Type.CREATED)
+    def on_created(
+        self,
+        callback: CallbackForAssignmentEventsType,
+        executor: Optional[futures.Executor] = None,
+    ) -> CallbackForAssignmentEventsType:
+        return self.register_callback(callback, AssignmentEvent.Type.CREATED, executor)
 
-    def on_submitted(self, callback: CallbackForAssignmentEventsType) -> CallbackForAssignmentEventsType:
-        return self.register_callback(callback, AssignmentEvent.Type.SUBMITTED)
+    def on_submitted(
+        self,
+        callback: CallbackForAssignmentEventsType,
+        executor: Optional[futures.Executor] = None,
+    ) -> CallbackForAssignmentEventsType:
+        return self.register_callback(callback, AssignmentEvent.Type.SUBMITTED, executor)
 
-    def on_accepted(self, callback: CallbackForAssignmentEventsType) -> CallbackForAssignmentEventsType:
-        return self.register_callback(callback, AssignmentEvent.Type.ACCEPTED)
+    def on_accepted(
+        self,
+        callback: CallbackForAssignmentEventsType,
+        executor: Optional[futures.Executor] = None,
+    ) -> CallbackForAssignmentEventsType:
+        return self.register_callback(callback, AssignmentEvent.Type.ACCEPTED, executor)
 
-    def on_rejected(self, callback: CallbackForAssignmentEventsType) -> CallbackForAssignmentEventsType:
-        return self.register_callback(callback, AssignmentEvent.Type.REJECTED)
+    def on_rejected(
+        self,
+        callback: CallbackForAssignmentEventsType,
+        executor: Optional[futures.Executor] = None,
+    ) -> CallbackForAssignmentEventsType:
+        return self.register_callback(callback, AssignmentEvent.Type.REJECTED, executor)
 
-    def on_skipped(self, callback: CallbackForAssignmentEventsType) -> CallbackForAssignmentEventsType:
-        return self.register_callback(callback, AssignmentEvent.Type.SKIPPED)
+    def on_skipped(
+        self,
+        callback: CallbackForAssignmentEventsType,
+        executor: Optional[futures.Executor] = None,
+    ) -> CallbackForAssignmentEventsType:
+        return self.register_callback(callback, AssignmentEvent.Type.SKIPPED, executor)
 
-    def on_expired(self, callback: CallbackForAssignmentEventsType) -> CallbackForAssignmentEventsType:
-        return self.register_callback(callback, AssignmentEvent.Type.EXPIRED)
+    def on_expired(
+        self,
+        callback: CallbackForAssignmentEventsType,
+        executor: Optional[futures.Executor] = None,
+    ) -> CallbackForAssignmentEventsType:
+        return self.register_callback(callback, AssignmentEvent.Type.EXPIRED, executor)
 
     # Run section.
 
-    async def __call__(self) -> None:
+    async def __call__(self) -> int:
         if not self._callbacks:
-            return
+            return 0
 
         loop = asyncio.get_event_loop()
         event_type_by_task = {loop.create_task(cursor_and_callbacks(self.pool_id)): event_type
@@ -298,3 +511,521 @@ class AssignmentsObserver(BasePoolObserver):
                 logger.error('Got error while handling pool %s assignment events of type: %s',
                              self.pool_id, event_type_by_task[task])
             raise ComplexException([task.exception() for task in errored])
+        return sum(task.result() for task in done)
+
+
+_WEBHOOK_EVENT_TYPES = {
+    AssignmentEvent.Type.CREATED: WebhookSubscription.EventType.ASSIGNMENT_CREATED,
+    AssignmentEvent.Type.SUBMITTED: WebhookSubscription.EventType.ASSIGNMENT_SUBMITTED,
+    AssignmentEvent.Type.ACCEPTED: WebhookSubscription.EventType.ASSIGNMENT_APPROVED,
+    AssignmentEvent.Type.REJECTED: WebhookSubscription.EventType.ASSIGNMENT_REJECTED,
+    AssignmentEvent.Type.SKIPPED: WebhookSubscription.EventType.ASSIGNMENT_SKIPPED,
+    AssignmentEvent.Type.EXPIRED: WebhookSubscription.EventType.ASSIGNMENT_EXPIRED,
+}
+_ASSIGNMENT_EVENT_TYPES = {webhook_type.value: event_type for event_type, webhook_type in _WEBHOOK_EVENT_TYPES.items()}
+# Statuses assignments may have after the event, all statuses are possible after the creation
+_ASSIGNMENT_STATUSES_BY_EVENT_TYPE = {
+    AssignmentEvent.Type.SUBMITTED: frozenset((Assignment.SUBMITTED, Assignment.ACCEPTED, Assignment.REJECTED)),
+    AssignmentEvent.Type.ACCEPTED: frozenset((Assignment.ACCEPTED,)),
+    AssignmentEvent.Type.REJECTED: frozenset((Assignment.REJECTED,)),
+    AssignmentEvent.Type.SKIPPED: frozenset((Assignment.SKIPPED,)),
+    AssignmentEvent.Type.EXPIRED: frozenset((Assignment.EXPIRED,)),
+}
+_LOOPBACK_HOSTS = frozenset(('127.0.0.1', '::1', 'localhost'))
+
+
+@attr.s
+class WebhookAssignmentsObserver(AssignmentsObserver):
+    """Observer for the pool's assignment events that receives Toloka webhooks instead of polling.
+    For usage with Pipeline.
+
+    The observer runs a small HTTP server that accepts webhook deliveries, requests the assignments they refer to and
+    passes events to the same callbacks as `AssignmentsObserver`, as soon as they are delivered. Webhooks may be lost
+    or delayed, so events are also fetched by cursors once in `sweep_period`. The pool status is checked along with
+    these sweeps, and once the pool is found closed, events are fetched by every call, so the last call of the pipeline
+    fetches them too. Events of the recently handled assignments, and of the ones being handled, are skipped, whatever
+    way they come.
+
+    The server is started by the first call of the observer. Stop it with `stop` after the pipeline finishes.
+
+    By default, the server accepts local connections only, e.g. from a reverse proxy. To accept webhooks from Toloka
+    directly, set `host` to an external address, e.g. `'0.0.0.0'`, and `secret_key` to reject forged deliveries.
+    Delivered events are checked against the requested assignments: events of other pools and events the assignment
+    doesn't match, e.g. an acceptance of a rejected assignment, are skipped.
+
+    Attributes:
+        toloka_client: TolokaClient instance or async wrapper around it.
+        pool_id: Pool ID.
+        host: The host to listen on. Hosts other than loopback ones require `secret_key`.
+            Default value: `'127.0.0.1'`.
+        port: The port to listen on. If `0`, any free port is used, see `addresses`.
+            Default value: `8080`.
+        path: The path webhooks are delivered to.
+            Default value: `'/'`.
+        secret_key: The key of webhook subscriptions. If set, deliveries without a valid `Toloka-Signature` header,
+            the hex HMAC-SHA256 digest of the request body, are rejected.
+        sweep_period: How often events are fetched by cursors and the pool status is checked.
+            Default value: 10 minutes.
+        max_seen: The number of recently handled assignments of every event type remembered to skip their events.
+            Default value: `100000`.
+
+    Other attributes are the same as for `AssignmentsObserver`.
+
+    Examples:
+        Accept submitted assignments as soon as they are submitted.
+
+        >>> observer = WebhookAssignmentsObserver(toloka_client, pool_id='123', host='0.0.0.0', secret_key=secret_key)
+        >>> observer.on_submitted(accept_assignments)
+        >>> await observer.subscribe('https://my-host.example.com/')
+        >>> pipeline = Pipeline()
+        >>> pipeline.register(observer)
+        >>> await pipeline.run()
+        >>> await observer.stop()
+        ...
+    """
+
+    _host: str = attr.ib(default='127.0.0.1', kw_only=True)
+    _port: int = attr.ib(default=8080, kw_only=True)
+    _path: str = attr.ib(default='/', kw_only=True)
+    _secret_key: Optional[str] = attr.ib(default=None, kw_only=True)
+    _sweep_period: datetime.timedelta = attr.ib(default=datetime.timedelta(minutes=10), kw_only=True)
+    _max_seen: int = attr.ib(default=100000, kw_only=True)
+    _runner: Optional[web.AppRunner] = attr.ib(default=None, init=False)
+    _last_sweep_time: Optional[float] = attr.ib(default=None, init=False)
+    _pool_closed: bool = attr.ib(default=False, init=False)
+    _pushed_count: int = attr.ib(default=0, init=False)
+    _push_errors: List[BaseException] = attr.ib(factory=list, init=False)
+
+    def __attrs_post_init__(self):
+        super().__attrs_post_init__()
+        if self._secret_key is None and self._host not in _LOOPBACK_HOSTS:
+            raise ValueError('secret_key is required to listen on a non-loopback host')
+
+    def _create_consumer(self, event_type: AssignmentEvent.Type) -> _CallbacksCursorConsumer:
+        consumer = super()._create_consumer(event_type)
+        consumer.seen = _SeenAssignments(self._max_seen)
+        return consumer
+
+    @property
+    def addresses(self) -> List[Any]:
+        """Addresses the server listens on, e.g. `[('127.0.0.1', 8080)]`. Empty if the server is not started."""
+        return self._runner.addresses if self._runner is not None else []
+
+    async def subscribe(self, webhook_url: str) -> None:
+        """Subscribes the given URL to webhooks of all event types with registered callbacks.
+
+        Args:
+            webhook_url: The public URL of the server, including `path`.
+        """
+        await self.toloka_client.upsert_webhook_subscriptions([
+            WebhookSubscription(
+                webhook_url=webhook_url,
+                event_type=_WEBHOOK_EVENT_TYPES[event_type],
+                pool_id=self.pool_id,
+                secret_key=self._secret_key,
+            )
+            for event_type in self._callbacks
+        ])
+
+    async def start(self) -> None:
+        """Starts the server if it's not started yet."""
+        if self._runner is not None:
+            return
+        app = web.Application()
+        app.router.add_post(self._path, self._handle_delivery)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, self._host, self._port).start()
+        self._runner = runner
+        logger.info('Receiving pool %s webhooks at: %s', self.pool_id, runner.addresses)
+
+    async def stop(self) -> None:
+        """Stops the server."""
+        if self._runner is not None:
+            runner, self._runner = self._runner, None
+            await runner.cleanup()
+
+    def _is_signed(self, body: bytes, signature: Optional[str]) -> bool:
+        expected = hmac.new(self._secret_key.encode(), body, hashlib.sha256).hexdigest()
+        return signature is not None and hmac.compare_digest(expected, signature)
+
+    def _parse_delivery(self, body: bytes) -> Dict[AssignmentEvent.Type, List[str]]:
+        assignment_ids_by_type = {}
+        for item in json.loads(body)['events']:
+            event_type = _ASSIGNMENT_EVENT_TYPES.get(item['event_type'])
+            if item.get('pool_id') == self.pool_id and event_type in self._callbacks:
+                assignment_ids_by_type.setdefault(event_type, []).append(item['assignment_id'])
+        return assignment_ids_by_type
+
+    async def _handle_delivery(self, request: web.Request) -> web.Response:
+        body = await request.read()
+        if self._secret_key is not None and not self._is_signed(body, request.headers.get('Toloka-Signature')):
+            logger.warning('Got pool %s webhook delivery with invalid signature', self.pool_id)
+            return web.Response(status=401)
+        try:
+            assignment_ids_by_type = self._parse_delivery(body)
+        except (ValueError, KeyError, TypeError):
+            return web.Response(status=400)
+
+        try:
+            handled = await asyncio.gather(*[
+                self._handle_pushed(event_type, assignment_ids)
+                for event_type, assignment_ids in assignment_ids_by_type.items()
+            ])
+        except Exception as exc:
+            # Raised by the next call of the observer, while Toloka delivers the webhook again
+            self._push_errors.append(exc)
+            return web.Response(status=500)
+        self._pushed_count += sum(handled)
+        return web.Response()
+
+    async def _handle_pushed(self, event_type: AssignmentEvent.Type, assignment_ids: Iterable[str]) -> int:
+        consumer = self._callbacks[event_type]
+        # Deliveries contain ids only, so assignments of the new events are requested
+        assignments = await asyncio.gather(*[
+            self.toloka_client.get_assignment(assignment_id)
+            for assignment_id in dict.fromkeys(assignment_ids) if assignment_id not in consumer.seen
+        ])
+        events = [
+            AssignmentEvent(event_type=event_type, event_time=getattr(assignment, event_type.time_key),
+                            assignment=assignment)
+            for assignment in assignments
+            if self._is_event_of(event_type, assignment)
+        ]
+        return await consumer._run_callbacks(self.pool_id, events) if events else 0
+
+    def _is_event_of(self, event_type: AssignmentEvent.Type, assignment: Assignment) -> bool:
+        # Deliveries are not trusted to describe the assignment, so they are checked against its current state
+        statuses = _ASSIGNMENT_STATUSES_BY_EVENT_TYPE.get(event_type)
+        if (
+            assignment.pool_id != self.pool_id
+            or getattr(assignment, event_type.time_key) is None
+            or (statuses is not None and assignment.status not in statuses)
+        ):
+            logger.warning('Skip pool %s %s webhook event of assignment %s with status %s in pool %s',
+                           self.pool_id, event_type.value, assignment.id, assignment.status, assignment.pool_id)
+            return False
+        return True
+
+    # Run section.
+
+    async def _should_sweep(self, now: float) -> bool:
+        if self._last_sweep_time is not None and now - self._last_sweep_time < self._sweep_period.total_seconds():
+            # Once the pool is closed, any call may be the last one, and events may still be not delivered
+            return self._pool_closed
+        pool = await self.toloka_client.get_pool(self.pool_id)
+        self._pool_closed = not pool.is_open()
+        return True
+
+    async def __call__(self) -> int:
+        await self.start()
+        if self._push_errors:
+            errors, self._push_errors = self._push_errors, []
+            raise ComplexException(errors)
+
+        handled, self._pushed_count = self._pushed_count, 0
+        now = time.monotonic()
+        if await self._should_sweep(now):
+            logger.info('Sweeping pool %s assignment events', self.pool_id)
+            handled += await super().__call__()
+            self._last_sweep_time = now
+        return handled
+
+
+@attr.s
+class _PoolsCallbacksCursorConsumer:
+    """Store cursor over events of many pools and related callbacks by pool.
+    Allow to run callbacks at fetched data of their pools and move the cursor in case of success.
+    """
+    cursor: AssignmentCursor = attr.ib()
+    batch_size: Optional[int] = attr.ib(default=None)
+    callbacks: Dict[Optional[str], List[CallbackForAssignmentEventsAsyncType]] = attr.ib(factory=dict, init=False)
+
+    def add_callback(
+        self,
+        callback: CallbackForAssignmentEventsType,
+        pool_id: Optional[str] = None,
+        executor: Optional[futures.Executor] = None,
+    ) -> None:
+        self.callbacks.setdefault(pool_id, []).append(ensure_async(callback, executor))
+
+    async def __call__(
+        self,
+        select_events: Callable[[List[AssignmentEvent]], Awaitable[List[AssignmentEvent]]],
+    ) -> int:
+        handled = 0
+        while True:
+            async with self.cursor.try_fetch_all(self.batch_size) as fetched:
+                if not fetched:
+                    return handled
+
+                selected = await select_events(fetched)
+                logger.info('Got events count of type %s: %d, from observed pools: %d',
+                            fetched[0].event_type, len(fetched), len(selected))
+                events_by_pool = {}
+                for event in selected:
+                    events_by_pool.setdefault(event.assignment.pool_id, []).append(event)
+
+                loop = asyncio.get_event_loop()
+                callback_by_task = {loop.create_task(callback(events)): callback
+                                    for pool_id, events in events_by_pool.items()
+                                    for callback in self.callbacks.get(pool_id, [])}
+                if selected:
+                    callback_by_task.update((loop.create_task(callback(selected)), callback)
+                                            for callback in self.callbacks.get(None, []))
+                if callback_by_task:
+                    done, _ = await asyncio.wait(callback_by_task)
+                    errored = [task for task in done if task.exception() is not None]
+                    if errored:
+                        for task in errored:
+                            logger.error('Got error in callback: %s\n%s',
+                                         callback_by_task[task], get_task_traceback(task))
+                        raise ComplexException([task.exception() for task in errored])
+
+            handled += len(selected)
+            if self.batch_size is None or len(fetched) < self.batch_size:
+                return handled
+
+
+@attr.s
+class MultiPoolAssignmentsObserver(BaseObserver):
+    """Observer for assignment events of many pools: either all pools of the project or the given pools.
+    For usage with Pipeline.
+
+    Unlike a separate `AssignmentsObserver` for every pool, it requests events of each type with a single stream of
+    requests, ordered by event time, and passes the events to the callbacks of their pools. So the number of requests
+    doesn't depend on the number of pools.
+
+    Toloka can't search assignments by project, so unless a single pool is observed, events of all requester's
+    assignments are fetched and the events of other pools are skipped. The observer is the most effective if most of
+    requester's assignments belong to the observed pools.
+
+    Such requester-wide requests start from `start_time`, by default the creation time of the project or of the
+    earliest observed pool, as no assignment of the observed pools can be older. So the first call pages through all
+    requester's assignments since then, including ones of unrelated pools: set `start_time` to skip older events if
+    the observed pools are long-lived and other pools have many assignments. The next calls resume from the last event.
+
+    Allow to register callbacks using the following methods:
+        * on_created
+        * on_submitted
+        * on_accepted
+        * on_rejected
+        * on_skipped
+        * on_expired
+
+    Each method has an optional `pool_id` argument. Callbacks registered with it get events of that pool only, other
+    callbacks get events of all observed pools.
+
+    Attributes:
+        toloka_client: TolokaClient instance or async wrapper around it.
+        pool_ids: IDs of the observed pools.
+        project_id: ID of the project whose pools are observed, including pools created later. Set either `pool_ids` or
+            `project_id`.
+        storage: Storage of cursor states. See `AssignmentsObserver`. Observers of different projects or pools sets
+            may share a storage, their states are stored by different keys.
+        batch_size: The maximum number of events fetched at once, for all pools together. See `AssignmentsObserver`.
+        start_time: UTC time to observe events from. Events before it are skipped, unless the observer is resumed from
+            a storage state that is already past it. Default value: `None`, the creation time of the observed project
+            or of the earliest observed pool, requested on the first call.
+
+    Examples:
+        Send submitted assignments of every project pool for verification to the pool's own verification pool.
+
+        >>> observer = MultiPoolAssignmentsObserver(toloka_client, project_id='12')
+        >>> for pool_id, verification_pool_id in verification_pool_ids.items():
+        >>>     observer.on_submitted(functools.partial(send_for_verification, verification_pool_id), pool_id=pool_id)
+        ...
+    """
+
+    toloka_client: AsyncInterfaceWrapper[TolokaClientSyncOrAsyncType] = attr.ib(
+        converter=_wrap_client_to_async_converter,
+    )
+    pool_ids: Optional[List[str]] = attr.ib(default=None)
+    project_id: Optional[str] = attr.ib(default=None)
+    _storage: Optional[BaseStorage] = attr.ib(default=None, kw_only=True)
+    _batch_size: Optional[int] = attr.ib(default=None, kw_only=True)
+    _start_time: Optional[datetime.datetime] = attr.ib(default=None, kw_only=True)
+    _callbacks: Dict[AssignmentEvent.Type, _PoolsCallbacksCursorConsumer] = attr.ib(factory=dict, init=False)
+    _observed_pool_ids: FrozenSet[str] = attr.ib(factory=frozenset, init=False)
+    _project_id_by_pool_id: Dict[str, str] = attr.ib(factory=dict, init=False)
+
+    def __attrs_post_init__(self):
+        if (self.pool_ids is None) == (self.project_id is None):
+            raise ValueError('Either pool_ids or project_id must be set')
+        if self.pool_ids is not None:
+            self._observed_pool_ids = frozenset(self.pool_ids)
+
+    # Setup section.
+
+    @autocast_to_enum
+    def register_callback(
+        self,
+        callback: CallbackForAssignmentEventsType,
+        event_type: AssignmentEvent.Type,
+        pool_id: Optional[str] = None,
+        executor: Optional[futures.Executor] = None,
+    ) -> CallbackForAssignmentEventsType:
+        """Register given callable for given event type.
+        Callback will be called multiple times if it has been registered for multiple event types.
+
+        Args:
+            callback: Sync or async callable that pass List[AssignmentEvent] of desired event type.
+            event_type: Selected event type.
+            pool_id: Pass events of this pool only. By default, events of all observed pools are passed at once.
+            executor: Executor to run a sync callback in. See `AssignmentsObserver.register_callback`.
+
+        Returns:
+            The same callable passed as callback.
+        """
+        if self.pool_ids is not None and pool_id is not None and pool_id not in self._observed_pool_ids:
+            raise ValueError(f'Pool {pool_id} is not observed')
+        if event_type not in self._callbacks:
+            request = {'pool_id': self.pool_ids[0]} if self.pool_ids is not None and len(self.pool_ids) == 1 else {}
+            if self.project_id is not None:
+                observed = self.project_id
+            else:
+                observed = 'pools:' + hashlib.sha1(','.join(sorted(self._observed_pool_ids)).encode()).hexdigest()
+            storage_key = f'{type(self).__name__}:{observed}:{event_type.value}'
+            cursor = AssignmentCursor(event_type=event_type, toloka_client=self.toloka_client,
+                                      storage=self._storage, storage_key=storage_key, **request)
+            self._callbacks[event_type] = _PoolsCallbacksCursorConsumer(cursor, self._batch_size)
+        self._callbacks[event_type].add_callback(callback, pool_id, executor)
+        return callback
+
+    def on_any_event(
+        self,
+        callback: CallbackForAssignmentEventsType,
+        pool_id: Optional[str] = None,
+        executor: Optional[futures.Executor] = None,
+    ) -> CallbackForAssignmentEventsType:
+        for event_type in AssignmentEvent.Type.__members__.values():
+            self.register_callback(callback, event_type, pool_id, executor)
+        return callback
+
+    def on_created(
+        self,
+        callback: CallbackForAssignmentEventsType,
+        pool_id: Optional[str] = None,
+        executor: Optional[futures.Executor] = None,
+    ) -> CallbackForAssignmentEventsType:
+        return self.register_callback(callback, AssignmentEvent.Type.CREATED, pool_id, executor)
+
+    def on_submitted(
+        self,
+        callback: CallbackForAssignmentEventsType,
+        pool_id: Optional[str] = None,
+        executor: Optional[futures.Executor] = None,
+    ) -> CallbackForAssignmentEventsType:
+        return self.register_callback(callback, AssignmentEvent.Type.SUBMITTED, pool_id, executor)
+
+    def on_accepted(
+        self,
+        callback: CallbackForAssignmentEventsType,
+        pool_id: Optional[str] = None,
+        executor: Optional[futures.Executor] = None,
+    ) -> CallbackForAssignmentEventsType:
+        return self.register_callback(callback, AssignmentEvent.Type.ACCEPTED, pool_id, executor)
+
+    def on_rejected(
+        self,
+        callback: CallbackForAssignmentEventsType,
+        pool_id: Optional[str] = None,
+        executor: Optional[futures.Executor] = None,
+    ) -> CallbackForAssignmentEventsType:
+        return self.register_callback(callback, AssignmentEvent.Type.REJECTED, pool_id, executor)
+
+    def on_skipped(
+        self,
+        callback: CallbackForAssignmentEventsType,
+        pool_id: Optional[str] = None,
+        executor: Optional[futures.Executor] = None,
+    ) -> CallbackForAssignmentEventsType:
+        return self.register_callback(callback, AssignmentEvent.Type.SKIPPED, pool_id, executor)
+
+    def on_expired(
+        self,
+        callback: CallbackForAssignmentEventsType,
+        pool_id: Optional[str] = None,
+        executor: Optional[futures.Executor] = None,
+    ) -> CallbackForAssignmentEventsType:
+        return self.register_callback(callback, AssignmentEvent.Type.EXPIRED, pool_id, executor)
+
+    # Run section.
+
+    async def _select_events(self, events: List[AssignmentEvent]) -> List[AssignmentEvent]:
+        if self.project_id is not None:
+            # Pools never move between projects, so every pool is requested once.
+            unknown_pool_ids = {event.assignment.pool_id for event in events} - self._project_id_by_pool_id.keys()
+            if unknown_pool_ids:
+                pools = await asyncio.gather(*[self.toloka_client.get_pool(pool_id) for pool_id in unknown_pool_ids])
+                self._project_id_by_pool_id.update((pool.id, pool.project_id) for pool in pools)
+            return [event for event in events
+                    if self._project_id_by_pool_id[event.assignment.pool_id] == self.project_id]
+        return [event for event in events if event.assignment.pool_id in self._observed_pool_ids]
+
+    async def _get_start_time(self) -> Optional[datetime.datetime]:
+        # Requests of a single pool are bounded by the pool itself
+        if self._start_time is None and (self.project_id is not None or len(self._observed_pool_ids) > 1):
+            if self.project_id is not None:
+                project = await self.toloka_client.get_project(self.project_id)
+                self._start_time = project.created
+            else:
+                pools = await asyncio.gather(*[self.toloka_client.get_pool(pool_id) for pool_id in self.pool_ids])
+                self._start_time = min(pool.created for pool in pools)
+            logger.info('Observe assignment events since %s', self._start_time)
+        return self._start_time
+
+    async def _find_pool_ids(self, status: Pool.Status) -> List[str]:
+        pool_ids = []
+        request = {'project_id': self.project_id, 'status': status}
+        while True:
+            response = await self.toloka_client.find_pools(**request, sort='id')
+            pool_ids.extend(pool.id for pool in response.items)
+            if not response.has_more:
+                return pool_ids
+            request['id_gt'] = response.items[-1].id
+
+    async def should_resume(self) -> bool:
+        if self.project_id is not None:
+            logger.info('Check resume by project %s open pools', self.project_id)
+            response = await self.toloka_client.find_pools(project_id=self.project_id, status=Pool.Status.OPEN, limit=1)
+            if response.items:
+                return True
+            closed_pool_ids = await self._find_pool_ids(Pool.Status.CLOSED)
+        else:
+            logger.info('Check resume by pools status: %s', self.pool_ids)
+            pools = await asyncio.gather(*[self.toloka_client.get_pool(pool_id) for pool_id in self.pool_ids])
+            if any(pool.is_open() for pool in pools):
+                return True
+            closed_pool_ids = [pool.id for pool in pools if pool.is_closed()]
+
+        logger.info('Check resume by pools active assignments: %s', closed_pool_ids)
+        responses = await asyncio.gather(*[
+            self.toloka_client.find_assignments(pool_id=pool_id, status=[Assignment.ACTIVE], limit=1)
+            for pool_id in closed_pool_ids
+        ])
+        return any(response.items for response in responses)
+
+    async def __call__(self) -> int:
+        if not self._callbacks:
+            return 0
+
+        start_time = await self._get_start_time()
+        if start_time is not None:
+            for cursor_and_callbacks in self._callbacks.values():
+                cursor_and_callbacks.cursor._move_start(start_time)
+
+        loop = asyncio.get_event_loop()
+        event_type_by_task = {loop.create_task(cursor_and_callbacks(self._select_events)): event_type
+                              for event_type, cursor_and_callbacks in self._callbacks.items()}
+        logger.info('Gathering %s event of types: %s',
+                    f'project {self.project_id}' if self.project_id else f'pools {self.pool_ids}',
+                    list(event_type_by_task.values()))
+
+        done, _ = await asyncio.wait(event_type_by_task)
+        errored = [task for task in done if task.exception() is not None]
+        if errored:
+            for task in errored:
+                logger.error('Got error while handling assignment events of type: %s', event_type_by_task[task])
+            raise ComplexException([task.exception() for task in errored])
+        return sum(task.result() for task in done)
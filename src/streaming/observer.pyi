@@ -1,13 +1,18 @@
 __all__ = [
     'AssignmentsObserver',
     'BaseObserver',
+    'MultiPoolAssignmentsObserver',
     'PoolStatusObserver',
+    'WebhookAssignmentsObserver',
 ]
+import aiohttp.web_runner
+import concurrent.futures._base
 import datetime
 import toloka.client
 import toloka.client.pool
 import toloka.streaming.cursor
 import toloka.streaming.event
+import toloka.streaming.storage
 import typing
 
 
@@ -116,19 +121,52 @@ class PoolStatusObserver(BasePoolObserver):
     _previous_status: typing.Optional[toloka.client.pool.Pool.Status]
 
 
+class _SeenAssignments:
+    """Ids of the recently handled assignments, the least recently handled are forgotten first."""
+
+    def __init__(self, max_size: int): ...
+
+    def __contains__(self, assignment_id: str) -> bool: ...
+
+    def select_new(self, events: typing.List[toloka.streaming.event.AssignmentEvent]) -> typing.List[toloka.streaming.event.AssignmentEvent]: ...
+
+    def add(self, events: typing.List[toloka.streaming.event.AssignmentEvent]) -> None: ...
+
+
 class _CallbacksCursorConsumer:
     """Store cursor and related callbacks.
     Allow to run callbacks at fetched data and move the cursor in case of success.
+
+    If `queue_size` is set, fetching and callbacks run as separate stages: batches of events are fetched ahead into a
+    bounded queue while `concurrency` workers run callbacks, and the cursor is moved after all the previous batches are
+    handled too.
+
+    If `seen` is set, events of the recently handled assignments are skipped.
     """
 
-    def add_callback(self, callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]) -> None: ...
+    def add_callback(
+        self,
+        callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]],
+        executor: typing.Optional[concurrent.futures._base.Executor] = None
+    ) -> None: ...
 
-    def __init__(self, cursor: toloka.streaming.cursor.AssignmentCursor) -> None:
+    def __init__(
+        self,
+        cursor: toloka.streaming.cursor.AssignmentCursor,
+        batch_size: typing.Optional[int] = None,
+        queue_size: typing.Optional[int] = None,
+        concurrency: int = 1,
+        seen: typing.Optional[_SeenAssignments] = None
+    ) -> None:
         """Method generated by attrs for class _CallbacksCursorConsumer.
         """
         ...
 
     cursor: toloka.streaming.cursor.AssignmentCursor
+    batch_size: typing.Optional[int]
+    queue_size: typing.Optional[int]
+    concurrency: int
+    seen: typing.Optional[_SeenAssignments]
     callbacks: typing.List[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]
 
 
@@ -149,6 +187,19 @@ class AssignmentsObserver(BasePoolObserver):
     Attributes:
         toloka_client: TolokaClient instance or async wrapper around it.
         pool_id: Pool ID.
+        storage: Storage of cursor states. If set, a restarted observer continues from the last handled events instead
+            of passing all pool events to callbacks again. See `JSONLocalStorage` and `SQLiteStorage`.
+        batch_size: The maximum number of events passed to callbacks at once. Events are fetched and handled in
+            batches until all new events are handled, the cursor is moved after every batch. Limits the memory used by
+            the observer if many events occur between calls.
+            Default value: `None`, all new events are passed at once.
+        queue_size: The maximum number of batches fetched ahead while callbacks handle the previous ones. If set,
+            the next batches are fetched without waiting for callbacks, and the cursor is moved as soon as a batch and
+            all the batches before it are handled. Requires `batch_size`.
+            Default value: `None`, every batch is fetched after the previous one is handled.
+        concurrency: The number of batches of the same event type handled at once if `queue_size` is set. Callbacks
+            must tolerate being called for several batches at a time.
+            Default value: `1`.
 
     Examples:
         Send submitted assignments for verification.
@@ -160,12 +211,19 @@ class AssignmentsObserver(BasePoolObserver):
         >>> observer = AssignmentsObserver(toloka_client, pool_id='123')
         >>> observer.on_submitted(handle_submitted)
         ...
+
+        Run CPU-heavy checks in other processes, so they don't block other observers.
+
+        >>> process_pool = concurrent.futures.ProcessPoolExecutor()
+        >>> observer.on_submitted(check_image_quality, executor=process_pool)
+        ...
     """
 
     def register_callback(
         self,
         callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]],
-        event_type: typing.Union[toloka.streaming.event.AssignmentEvent.Type, str]
+        event_type: typing.Union[toloka.streaming.event.AssignmentEvent.Type, str],
+        executor: typing.Optional[concurrent.futures._base.Executor] = None
     ) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]:
         """Register given callable for given event type.
         Callback will be called multiple times if it has been registered for multiple event types.
@@ -173,30 +231,66 @@ class AssignmentsObserver(BasePoolObserver):
         Args:
             callback: Sync or async callable that pass List[AssignmentEvent] of desired event type.
             event_type: Selected event type.
+            executor: Executor to run a sync callback in, so it doesn't block the event loop and other observers.
+                Use `ProcessPoolExecutor` for CPU-heavy callbacks: they must be picklable, e.g. module-level
+                functions, and get pickled copies of events. By default, sync callbacks run in the event loop thread.
 
         Returns:
             The same callable passed as callback.
         """
         ...
 
-    def on_any_event(self, callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]: ...
+    def on_any_event(
+        self,
+        callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]],
+        executor: typing.Optional[concurrent.futures._base.Executor] = None
+    ) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]: ...
 
-    def on_created(self, callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]: ...
+    def on_created(
+        self,
+        callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]],
+        executor: typing.Optional[concurrent.futures._base.Executor] = None
+    ) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]: ...
 
-    def on_submitted(self, callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]: ...
+    def on_submitted(
+        self,
+        callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]],
+        executor: typing.Optional[concurrent.futures._base.Executor] = None
+    ) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]: ...
 
-    def on_accepted(self, callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]: ...
+    def on_accepted(
+        self,
+        callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]],
+        executor: typing.Optional[concurrent.futures._base.Executor] = None
+    ) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]: ...
 
-    def on_rejected(self, callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]: ...
+    def on_rejected(
+        self,
+        callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]],
+        executor: typing.Optional[concurrent.futures._base.Executor] = None
+    ) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]: ...
 
-    def on_skipped(self, callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]: ...
+    def on_skipped(
+        self,
+        callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]],
+        executor: typing.Optional[concurrent.futures._base.Executor] = None
+    ) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]: ...
 
-    def on_expired(self, callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]: ...
+    def on_expired(
+        self,
+        callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]],
+        executor: typing.Optional[concurrent.futures._base.Executor] = None
+    ) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]: ...
 
     def __init__(
         self,
         toloka_client: toloka.streaming.cursor.TolokaClientSyncOrAsyncType,
-        pool_id: str
+        pool_id: str,
+        *,
+        storage: typing.Optional[toloka.streaming.storage.BaseStorage] = None,
+        batch_size: typing.Optional[int] = None,
+        queue_size: typing.Optional[int] = None,
+        concurrency: int = 1
     ) -> None:
         """Method generated by attrs for class AssignmentsObserver.
         """
@@ -205,3 +299,289 @@ class AssignmentsObserver(BasePoolObserver):
     toloka_client: toloka.streaming.cursor.TolokaClientSyncOrAsyncType
     pool_id: str
     _callbacks: typing.Dict[toloka.streaming.event.AssignmentEvent.Type, _CallbacksCursorConsumer]
+    _storage: typing.Optional[toloka.streaming.storage.BaseStorage]
+    _batch_size: typing.Optional[int]
+    _queue_size: typing.Optional[int]
+    _concurrency: int
+
+
+class WebhookAssignmentsObserver(AssignmentsObserver):
+    """Observer for the pool's assignment events that receives Toloka webhooks instead of polling.
+    For usage with Pipeline.
+
+    The observer runs a small HTTP server that accepts webhook deliveries, requests the assignments they refer to and
+    passes events to the same callbacks as `AssignmentsObserver`, as soon as they are delivered. Webhooks may be lost
+    or delayed, so events are also fetched by cursors once in `sweep_period`. The pool status is checked along with
+    these sweeps, and once the pool is found closed, events are fetched by every call, so the last call of the pipeline
+    fetches them too. Events of the recently handled assignments, and of the ones being handled, are skipped, whatever
+    way they come.
+
+    The server is started by the first call of the observer. Stop it with `stop` after the pipeline finishes.
+
+    By default, the server accepts local connections only, e.g. from a reverse proxy. To accept webhooks from Toloka
+    directly, set `host` to an external address, e.g. `'0.0.0.0'`, and `secret_key` to reject forged deliveries.
+    Delivered events are checked against the requested assignments: events of other pools and events the assignment
+    doesn't match, e.g. an acceptance of a rejected assignment, are skipped.
+
+    Attributes:
+        toloka_client: TolokaClient instance or async wrapper around it.
+        pool_id: Pool ID.
+        host: The host to listen on. Hosts other than loopback ones require `secret_key`.
+            Default value: `'127.0.0.1'`.
+        port: The port to listen on. If `0`, any free port is used, see `addresses`.
+            Default value: `8080`.
+        path: The path webhooks are delivered to.
+            Default value: `'/'`.
+        secret_key: The key of webhook subscriptions. If set, deliveries without a valid `Toloka-Signature` header,
+            the hex HMAC-SHA256 digest of the request body, are rejected.
+        sweep_period: How often events are fetched by cursors and the pool status is checked.
+            Default value: 10 minutes.
+        max_seen: The number of recently handled assignments of every event type remembered to skip their events.
+            Default value: `100000`.
+
+    Other attributes are the same as for `AssignmentsObserver`.
+
+    Examples:
+        Accept submitted assignments as soon as they are submitted.
+
+        >>> observer = WebhookAssignmentsObserver(toloka_client, pool_id='123', host='0.0.0.0', secret_key=secret_key)
+        >>> observer.on_submitted(accept_assignments)
+        >>> await observer.subscribe('https://my-host.example.com/')
+        >>> pipeline = Pipeline()
+        >>> pipeline.register(observer)
+        >>> await pipeline.run()
+        >>> await observer.stop()
+        ...
+    """
+
+    @property
+    def addresses(self) -> typing.List[typing.Any]:
+        """Addresses the server listens on, e.g. `[('127.0.0.1', 8080)]`. Empty if the server is not started."""
+        ...
+
+    def subscribe(self, webhook_url: str) -> None:
+        """Subscribes the given URL to webhooks of all event types with registered callbacks.
+
+        Args:
+            webhook_url: The public URL of the server, including `path`.
+        """
+        ...
+
+    def start(self) -> None:
+        """Starts the server if it's not started yet."""
+        ...
+
+    def stop(self) -> None:
+        """Stops the server."""
+        ...
+
+    def __init__(
+        self,
+        toloka_client: toloka.streaming.cursor.TolokaClientSyncOrAsyncType,
+        pool_id: str,
+        *,
+        storage: typing.Optional[toloka.streaming.storage.BaseStorage] = None,
+        batch_size: typing.Optional[int] = None,
+        queue_size: typing.Optional[int] = None,
+        concurrency: int = 1,
+        host: str = '127.0.0.1',
+        port: int = 8080,
+        path: str = '/',
+        secret_key: typing.Optional[str] = None,
+        sweep_period: datetime.timedelta = ...,
+        max_seen: int = 100000
+    ) -> None:
+        """Method generated by attrs for class WebhookAssignmentsObserver.
+        """
+        ...
+
+    toloka_client: toloka.streaming.cursor.TolokaClientSyncOrAsyncType
+    pool_id: str
+    _callbacks: typing.Dict[toloka.streaming.event.AssignmentEvent.Type, _CallbacksCursorConsumer]
+    _storage: typing.Optional[toloka.streaming.storage.BaseStorage]
+    _batch_size: typing.Optional[int]
+    _queue_size: typing.Optional[int]
+    _concurrency: int
+    _host: str
+    _port: int
+    _path: str
+    _secret_key: typing.Optional[str]
+    _sweep_period: datetime.timedelta
+    _max_seen: int
+    _runner: typing.Optional[aiohttp.web_runner.AppRunner]
+    _last_sweep_time: typing.Optional[float]
+    _pool_closed: bool
+    _pushed_count: int
+    _push_errors: typing.List[BaseException]
+
+
+class _PoolsCallbacksCursorConsumer:
+    """Store cursor over events of many pools and related callbacks by pool.
+    Allow to run callbacks at fetched data of their pools and move the cursor in case of success.
+    """
+
+    def add_callback(
+        self,
+        callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]],
+        pool_id: typing.Optional[str] = None,
+        executor: typing.Optional[concurrent.futures._base.Executor] = None
+    ) -> None: ...
+
+    def __init__(
+        self,
+        cursor: toloka.streaming.cursor.AssignmentCursor,
+        batch_size: typing.Optional[int] = None
+    ) -> None:
+        """Method generated by attrs for class _PoolsCallbacksCursorConsumer.
+        """
+        ...
+
+    cursor: toloka.streaming.cursor.AssignmentCursor
+    batch_size: typing.Optional[int]
+    callbacks: typing.Dict[typing.Optional[str], typing.List[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]]
+
+
+class MultiPoolAssignmentsObserver(BaseObserver):
+    """Observer for assignment events of many pools: either all pools of the project or the given pools.
+    For usage with Pipeline.
+
+    Unlike a separate `AssignmentsObserver` for every pool, it requests events of each type with a single stream of
+    requests, ordered by event time, and passes the events to the callbacks of their pools. So the number of requests
+    doesn't depend on the number of pools.
+
+    Toloka can't search assignments by project, so unless a single pool is observed, events of all requester's
+    assignments are fetched and the events of other pools are skipped. The observer is the most effective if most of
+    requester's assignments belong to the observed pools.
+
+    Such requester-wide requests start from `start_time`, by default the creation time of the project or of the
+    earliest observed pool, as no assignment of the observed pools can be older. So the first call pages through all
+    requester's assignments since then, including ones of unrelated pools: set `start_time` to skip older events if
+    the observed pools are long-lived and other pools have many assignments. The next calls resume from the last event.
+
+    Allow to register callbacks using the following methods:
+        * on_created
+        * on_submitted
+        * on_accepted
+        * on_rejected
+        * on_skipped
+        * on_expired
+
+    Each method has an optional `pool_id` argument. Callbacks registered with it get events of that pool only, other
+    callbacks get events of all observed pools.
+
+    Attributes:
+        toloka_client: TolokaClient instance or async wrapper around it.
+        pool_ids: IDs of the observed pools.
+        project_id: ID of the project whose pools are observed, including pools created later. Set either `pool_ids` or
+            `project_id`.
+        storage: Storage of cursor states. See `AssignmentsObserver`. Observers of different projects or pools sets
+            may share a storage, their states are stored by different keys.
+        batch_size: The maximum number of events fetched at once, for all pools together. See `AssignmentsObserver`.
+        start_time: UTC time to observe events from. Events before it are skipped, unless the observer is resumed from
+            a storage state that is already past it. Default value: `None`, the creation time of the observed project
+            or of the earliest observed pool, requested on the first call.
+
+    Examples:
+        Send submitted assignments of every project pool for verification to the pool's own verification pool.
+
+        >>> observer = MultiPoolAssignmentsObserver(toloka_client, project_id='12')
+        >>> for pool_id, verification_pool_id in verification_pool_ids.items():
+        >>>     observer.on_submitted(functools.partial(send_for_verification, verification_pool_id), pool_id=pool_id)
+        ...
+    """
+
+    def register_callback(
+        self,
+        callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]],
+        event_type: typing.Union[toloka.streaming.event.AssignmentEvent.Type, str],
+        pool_id: typing.Optional[str] = None,
+        executor: typing.Optional[concurrent.futures._base.Executor] = None
+    ) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]:
+        """Register given callable for given event type.
+        Callback will be called multiple times if it has been registered for multiple event types.
+
+        Args:
+            callback: Sync or async callable that pass List[AssignmentEvent] of desired event type.
+            event_type: Selected event type.
+            pool_id: Pass events of this pool only. By default, events of all observed pools are passed at once.
+            executor: Executor to run a sync callback in. See `AssignmentsObserver.register_callback`.
+
+        Returns:
+            The same callable passed as callback.
+        """
+        ...
+
+    def on_any_event(
+        self,
+        callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]],
+        pool_id: typing.Optional[str] = None,
+        executor: typing.Optional[concurrent.futures._base.Executor] = None
+    ) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]: ...
+
+    def on_created(
+        self,
+        callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]],
+        pool_id: typing.Optional[str] = None,
+        executor: typing.Optional[concurrent.futures._base.Executor] = None
+    ) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]: ...
+
+    def on_submitted(
+        self,
+        callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]],
+        pool_id: typing.Optional[str] = None,
+        executor: typing.Optional[concurrent.futures._base.Executor] = None
+    ) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]: ...
+
+    def on_accepted(
+        self,
+        callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]],
+        pool_id: typing.Optional[str] = None,
+        executor: typing.Optional[concurrent.futures._base.Executor] = None
+    ) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]: ...
+
+    def on_rejected(
+        self,
+        callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]],
+        pool_id: typing.Optional[str] = None,
+        executor: typing.Optional[concurrent.futures._base.Executor] = None
+    ) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]: ...
+
+    def on_skipped(
+        self,
+        callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]],
+        pool_id: typing.Optional[str] = None,
+        executor: typing.Optional[concurrent.futures._base.Executor] = None
+    ) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]: ...
+
+    def on_expired(
+        self,
+        callback: typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]],
+        pool_id: typing.Optional[str] = None,
+        executor: typing.Optional[concurrent.futures._base.Executor] = None
+    ) -> typing.Union[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], None], typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]: ...
+
+    def should_resume(self) -> bool: ...
+
+    def __init__(
+        self,
+        toloka_client: toloka.streaming.cursor.TolokaClientSyncOrAsyncType,
+        pool_ids: typing.Optional[typing.List[str]] = None,
+        project_id: typing.Optional[str] = None,
+        *,
+        storage: typing.Optional[toloka.streaming.storage.BaseStorage] = None,
+        batch_size: typing.Optional[int] = None,
+        start_time: typing.Optional[datetime.datetime] = None
+    ) -> None:
+        """Method generated by attrs for class MultiPoolAssignmentsObserver.
+        """
+        ...
+
+    toloka_client: toloka.streaming.cursor.TolokaClientSyncOrAsyncType
+    pool_ids: typing.Optional[typing.List[str]]
+    project_id: typing.Optional[str]
+    _storage: typing.Optional[toloka.streaming.storage.BaseStorage]
+    _batch_size: typing.Optional[int]
+    _start_time: typing.Optional[datetime.datetime]
+    _callbacks: typing.Dict[toloka.streaming.event.AssignmentEvent.Type, _PoolsCallbacksCursorConsumer]
+    _observed_pool_ids: typing.FrozenSet[str]
+    _project_id_by_pool_id: typing.Dict[str, str]
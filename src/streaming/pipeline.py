@@ -1,29 +1,176 @@
 __all__ = [
     'Pipeline',
+    'PollingSchedule',
 ]
 
 import asyncio
 import attr
 import datetime
-import itertools
 import logging
+import random
 
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-from .observer import BaseObserver
-from ..util.async_utils import ComplexException
+from .cursor import TolokaClientSyncOrAsyncType
+from .observer import BaseObserver, BasePoolObserver, MultiPoolAssignmentsObserver
+from ..client.assignment import Assignment
+from ..client.pool import Pool
+from ..util.async_utils import AsyncInterfaceWrapper, ComplexException
 
 logger = logging.getLogger(__name__)
 
 
+@attr.s
+class PollingSchedule:
+    """Adaptive period of observer calls.
+
+    After a call that handled some events, the observer is called again after `min_period`. After every call without
+    events, the period is multiplied by `backoff` until it reaches `max_period`. So observers of active pools have low
+    latency, while idle ones make few requests.
+
+    Attributes:
+        min_period: The period while events are coming. By default, 5 seconds.
+        max_period: The longest period for idle observers. By default, 60 seconds.
+        backoff: How many times the period grows after a call without events. By default, 2.
+        jitter: Every period is randomly changed by up to this fraction of it, so that many observers don't make
+            requests at the same moment. By default, 0.1.
+
+    Examples:
+        Poll every second while assignments are being submitted and up to every 5 minutes otherwise.
+
+        >>> pipeline = Pipeline(schedule=PollingSchedule(
+        >>>     min_period=datetime.timedelta(seconds=1),
+        >>>     max_period=datetime.timedelta(minutes=5),
+        >>> ))
+        ...
+    """
+
+    min_period: datetime.timedelta = attr.ib(default=datetime.timedelta(seconds=5))
+    max_period: datetime.timedelta = attr.ib(default=datetime.timedelta(seconds=60))
+    backoff: float = attr.ib(default=2.0)
+    jitter: float = attr.ib(default=0.1)
+
+    def __attrs_post_init__(self):
+        if self.min_period > self.max_period or self.backoff < 1 or not 0 <= self.jitter < 1:
+            raise ValueError('Invalid polling schedule')
+
+    def get_next_period(self, period: Optional[float], handled: Optional[int]) -> float:
+        """Returns the period in seconds after the call that handled `handled` events."""
+        if handled or period is None:
+            return self.min_period.total_seconds()
+        return min(period * self.backoff, self.max_period.total_seconds())
+
+    def get_delay(self, period: float) -> float:
+        """Returns the period in seconds changed by a random jitter."""
+        return period * (1 + random.uniform(-self.jitter, self.jitter))
+
+
+def _get_observed_pool_ids(observer: BaseObserver) -> Optional[List[str]]:
+    # Pool observers with their own should_resume are checked by it
+    if isinstance(observer, BasePoolObserver) and type(observer).should_resume is BasePoolObserver.should_resume:
+        return [observer.pool_id]
+    if isinstance(observer, MultiPoolAssignmentsObserver) and observer.pool_ids is not None:
+        return observer.pool_ids
+    return None
+
+
+def _pool_id_key(pool_id: str) -> Tuple[int, str]:
+    # Numeric ids are compared as numbers
+    return len(pool_id), pool_id
+
+
+@attr.s
+class _PoolsResumeChecker:
+    """Check if pool observers may resume for all observed pools at once.
+
+    Pool statuses are found by a few `find_pools` requests over the ranges of pool ids, separately for every known
+    project. Active assignments are searched for closed pools only. Results are reused for `max_age` seconds.
+    """
+
+    toloka_client: AsyncInterfaceWrapper[TolokaClientSyncOrAsyncType] = attr.ib()
+    pool_ids: Set[str] = attr.ib(converter=set)
+    max_age: float = attr.ib()
+    _project_id_by_pool_id: Dict[str, str] = attr.ib(factory=dict, init=False)
+    _may_resume_by_pool_id: Dict[str, bool] = attr.ib(factory=dict, init=False)
+    _updated_at: Optional[float] = attr.ib(default=None, init=False)
+    _lock: Optional[asyncio.Lock] = attr.ib(default=None, init=False)
+
+    async def _find_pools(self, pool_ids: Iterable[str], project_id: Optional[str] = None) -> List[Pool]:
+        pool_ids = sorted(pool_ids, key=_pool_id_key)
+        request = {'id_gte': pool_ids[0], 'id_lte': pool_ids[-1]}
+        if project_id is not None:
+            request['project_id'] = project_id
+        pools = []
+        while True:
+            response = await self.toloka_client.find_pools(**request, sort='id', limit=300)
+            pools.extend(response.items)
+            if not response.has_more:
+                return pools
+            request['id_gt'] = response.items[-1].id
+
+    async def _update(self) -> None:
+        pool_ids_by_project_id = {}
+        for pool_id in self.pool_ids:
+            pool_ids_by_project_id.setdefault(self._project_id_by_pool_id.get(pool_id), []).append(pool_id)
+        found = await asyncio.gather(*[
+            self._find_pools(pool_ids, project_id) for project_id, pool_ids in pool_ids_by_project_id.items()
+        ])
+        pool_by_id = {pool.id: pool for pools in found for pool in pools if pool.id in self.pool_ids}
+        for pool_id in self.pool_ids - pool_by_id.keys():
+            pool_by_id[pool_id] = await self.toloka_client.get_pool(pool_id)
+        self._project_id_by_pool_id.update((pool.id, pool.project_id) for pool in pool_by_id.values())
+
+        probed_pool_ids = [pool.id for pool in pool_by_id.values() if not pool.is_open() and not pool.is_archived()]
+        logger.info('Check resume by pools active assignments: %s', probed_pool_ids)
+        responses = await asyncio.gather(*[
+            self.toloka_client.find_assignments(pool_id=pool_id, status=[Assignment.ACTIVE], limit=1)
+            for pool_id in probed_pool_ids
+        ])
+        self._may_resume_by_pool_id = {pool.id: pool.is_open() for pool in pool_by_id.values()}
+        self._may_resume_by_pool_id.update(
+            (pool_id, bool(response.items)) for pool_id, response in zip(probed_pool_ids, responses)
+        )
+        logger.info('Pools that may resume: %s',
+                    [pool_id for pool_id, may_resume in self._may_resume_by_pool_id.items() if may_resume])
+
+    async def should_resume(self, pool_ids: List[str]) -> bool:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            now = asyncio.get_event_loop().time()
+            if self._updated_at is None or now - self._updated_at > self.max_age:
+                await self._update()
+                self._updated_at = now
+        return any(self._may_resume_by_pool_id[pool_id] for pool_id in pool_ids)
+
+
+@attr.s
+class _ObserverState:
+    observer: BaseObserver = attr.ib()
+    schedule: Optional[PollingSchedule] = attr.ib()
+    period: Optional[float] = attr.ib(default=None)
+    next_call_time: float = attr.ib(default=0.0)
+    last_call_time: float = attr.ib(default=0.0)
+    may_resume: bool = attr.ib(default=True)
+    task: Optional[asyncio.Task] = attr.ib(default=None)
+
+
 @attr.s
 class Pipeline:
     """An entry point for toloka streaming pipelines.
     Allow you to register multiple observers and call them periodically
     while at least one of them may resume.
 
+    Every observer is called on its own schedule: when the previous call of the observer is finished, the next one is
+    scheduled according to the number of events it handled. See `PollingSchedule`.
+
     Attributes:
-        period: Period of observers calls. By default, 60 seconds.
+        period: Period of observers calls, if `schedule` is not set. By default, 60 seconds.
+        schedule: Adaptive schedule of observers calls. Can be overridden for an observer in `register`.
+        resume_check_period: If set, pool observers don't check if they may resume one by one. Instead, statuses of
+            all observed pools are found with a few `find_pools` requests at most once per this period, and only
+            closed pools are checked for active assignments. Observers must use clients of the same requester.
+            By default, every observer makes its own requests.
 
     Examples:
         Get assignments from segmentation pool and send them for verification to another pool.
@@ -59,13 +206,17 @@ class Pipeline:
     """
 
     period: datetime.timedelta = attr.ib(default=datetime.timedelta(seconds=60))
+    schedule: Optional[PollingSchedule] = attr.ib(default=None)
+    resume_check_period: Optional[datetime.timedelta] = attr.ib(default=None)
     _observers: Dict[int, BaseObserver] = attr.ib(factory=dict, init=False)
+    _schedules: Dict[int, PollingSchedule] = attr.ib(factory=dict, init=False)
 
-    def register(self, observer: BaseObserver) -> BaseObserver:
+    def register(self, observer: BaseObserver, schedule: Optional[PollingSchedule] = None) -> BaseObserver:
         """Register given observer.
 
         Args:
             observer: Observer object.
+            schedule: Schedule of the observer calls. By default, the pipeline `schedule` or `period` is used.
 
         Returns:
             The same observer object. It's usable to write one-liners.
@@ -84,32 +235,104 @@ class Pipeline:
             ...
         """
         self._observers[id(observer)] = observer
+        if schedule is not None:
+            self._schedules[id(observer)] = schedule
         return observer
 
+    def _get_schedule(self, key: int) -> PollingSchedule:
+        if key in self._schedules:
+            return self._schedules[key]
+        if self.schedule is not None:
+            return self.schedule
+        return PollingSchedule(min_period=self.period, max_period=self.period, jitter=0.0)
+
+    def _create_resume_checker(self) -> Optional[_PoolsResumeChecker]:
+        if self.resume_check_period is None:
+            return None
+        toloka_client = None
+        pool_ids = []
+        for observer in self._observers.values():
+            observed_pool_ids = _get_observed_pool_ids(observer)
+            if observed_pool_ids is not None:
+                toloka_client = toloka_client if toloka_client is not None else observer.toloka_client
+                pool_ids.extend(observed_pool_ids)
+        if not pool_ids:
+            return None
+        return _PoolsResumeChecker(toloka_client, pool_ids, self.resume_check_period.total_seconds())
+
+    @staticmethod
+    async def _call_observer(
+        observer: BaseObserver,
+        resume_checker: Optional[_PoolsResumeChecker],
+    ) -> Tuple[Optional[int], bool]:
+        handled = await observer()
+        pool_ids = _get_observed_pool_ids(observer) if resume_checker is not None else None
+        if pool_ids is not None:
+            may_resume = await resume_checker.should_resume(pool_ids)
+        elif getattr(observer, 'should_resume', None):
+            may_resume = await observer.should_resume()
+        else:
+            may_resume = False
+        return handled, may_resume
+
     async def run(self):
         if not self._observers:
             raise ValueError('No observers registered')
 
-        for iteration in itertools.count(1):
-            logger.debug('Iteration: %d', iteration)
-            logger.debug('Run observers count: %d', len(self._observers))
-            loop = asyncio.get_event_loop()
-            done, _ = await asyncio.wait([loop.create_task(observer()) for observer in self._observers.values()])
-            errored = [task for task in done if task.exception() is not None]
-            if errored:
-                for task in errored:
-                    logger.error('Got error in: %s', task)
+        loop = asyncio.get_event_loop()
+        states = [_ObserverState(observer, self._get_schedule(key)) for key, observer in self._observers.items()]
+        resume_checker = self._create_resume_checker()
+        # Start time of the last call after which no observer may resume.
+        last_stop_time = 0.0
+        errored = []
+        while True:
+            now = loop.time()
+            if not errored:
+                for state in states:
+                    if state.task is None and state.next_call_time <= now:
+                        logger.debug('Run observer: %s', state.observer)
+                        state.last_call_time = now
+                        state.task = loop.create_task(self._call_observer(state.observer, resume_checker))
+
+            running = [state.task for state in states if state.task is not None]
+            if errored and not running:
                 raise ComplexException([task.exception() for task in errored])
 
-            logger.debug('Check resume')
-            may_resume_each: List[bool] = await asyncio.gather(*[
-                observer.should_resume()
-                for observer in self._observers.values()
-                if getattr(observer, 'should_resume', None)
-            ])
-            if any(may_resume_each):
-                logger.debug('Sleep for %d seconds', self.period.total_seconds())
-                await asyncio.sleep(self.period.total_seconds())
-            else:
+            timeout = None
+            if not errored:
+                waiting = [state.next_call_time for state in states if state.task is None]
+                timeout = max(min(waiting) - now, 0) if waiting else None
+            if not running:
+                await asyncio.sleep(timeout)
+                continue
+            done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+            for state in states:
+                if state.task not in done:
+                    continue
+                task, state.task = state.task, None
+                if task.exception() is not None:
+                    logger.error('Got error in: %s', task)
+                    errored.append(task)
+                    continue
+                handled, may_resume = task.result()
+                if state.may_resume and not may_resume:
+                    state.may_resume = False
+                    if not any(other.may_resume for other in states):
+                        last_stop_time = state.last_call_time
+                state.may_resume = may_resume
+                state.period = state.schedule.get_next_period(state.period, handled)
+                state.next_call_time = loop.time() + state.schedule.get_delay(state.period)
+                logger.debug('Observer %s handled %s events, next call in %.1f seconds',
+                             state.observer, handled, state.next_call_time - loop.time())
+
+            if errored or any(state.may_resume for state in states):
+                continue
+            # No observer may resume. Observers called before that became known are called once more to handle the
+            # last events, e.g. the pool closing.
+            stale = [state for state in states if state.last_call_time < last_stop_time]
+            if not stale and all(state.task is None for state in states):
                 logger.debug('Finish')
                 return
+            for state in stale:
+                state.next_call_time = min(state.next_call_time, loop.time())
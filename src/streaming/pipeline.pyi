@@ -1,18 +1,80 @@
 __all__ = [
     'Pipeline',
+    'PollingSchedule',
 ]
 import datetime
 import toloka.streaming.observer
 import typing
 
 
+class PollingSchedule:
+    """Adaptive period of observer calls.
+
+    After a call that handled some events, the observer is called again after `min_period`. After every call without
+    events, the period is multiplied by `backoff` until it reaches `max_period`. So observers of active pools have low
+    latency, while idle ones make few requests.
+
+    Attributes:
+        min_period: The period while events are coming. By default, 5 seconds.
+        max_period: The longest period for idle observers. By default, 60 seconds.
+        backoff: How many times the period grows after a call without events. By default, 2.
+        jitter: Every period is randomly changed by up to this fraction of it, so that many observers don't make
+            requests at the same moment. By default, 0.1.
+
+    Examples:
+        Poll every second while assignments are being submitted and up to every 5 minutes otherwise.
+
+        >>> pipeline = Pipeline(schedule=PollingSchedule(
+        >>>     min_period=datetime.timedelta(seconds=1),
+        >>>     max_period=datetime.timedelta(minutes=5),
+        >>> ))
+        ...
+    """
+
+    def get_next_period(
+        self,
+        period: typing.Optional[float],
+        handled: typing.Optional[int]
+    ) -> float:
+        """Returns the period in seconds after the call that handled `handled` events."""
+        ...
+
+    def get_delay(self, period: float) -> float:
+        """Returns the period in seconds changed by a random jitter."""
+        ...
+
+    def __init__(
+        self,
+        min_period: datetime.timedelta = ...,
+        max_period: datetime.timedelta = ...,
+        backoff: float = 2.0,
+        jitter: float = 0.1
+    ) -> None:
+        """Method generated by attrs for class PollingSchedule.
+        """
+        ...
+
+    min_period: datetime.timedelta
+    max_period: datetime.timedelta
+    backoff: float
+    jitter: float
+
+
 class Pipeline:
     """An entry point for toloka streaming pipelines.
     Allow you to register multiple observers and call them periodically
     while at least one of them may resume.
 
+    Every observer is called on its own schedule: when the previous call of the observer is finished, the next one is
+    scheduled according to the number of events it handled. See `PollingSchedule`.
+
     Attributes:
-        period: Period of observers calls. By default, 60 seconds.
+        period: Period of observers calls, if `schedule` is not set. By default, 60 seconds.
+        schedule: Adaptive schedule of observers calls. Can be overridden for an observer in `register`.
+        resume_check_period: If set, pool observers don't check if they may resume one by one. Instead, statuses of
+            all observed pools are found with a few `find_pools` requests at most once per this period, and only
+            closed pools are checked for active assignments. Observers must use clients of the same requester.
+            By default, every observer makes its own requests.
 
     Examples:
         Get assignments from segmentation pool and send them for verification to another pool.
@@ -47,11 +109,16 @@ class Pipeline:
         ...
     """
 
-    def register(self, observer: toloka.streaming.observer.BaseObserver) -> toloka.streaming.observer.BaseObserver:
+    def register(
+        self,
+        observer: toloka.streaming.observer.BaseObserver,
+        schedule: typing.Optional[PollingSchedule] = None
+    ) -> toloka.streaming.observer.BaseObserver:
         """Register given observer.
 
         Args:
             observer: Observer object.
+            schedule: Schedule of the observer calls. By default, the pipeline `schedule` or `period` is used.
 
         Returns:
             The same observer object. It's usable to write one-liners.
@@ -73,10 +140,18 @@ class Pipeline:
 
     def run(self): ...
 
-    def __init__(self, period: datetime.timedelta = ...) -> None:
+    def __init__(
+        self,
+        period: datetime.timedelta = ...,
+        schedule: typing.Optional[PollingSchedule] = None,
+        resume_check_period: typing.Optional[datetime.timedelta] = None
+    ) -> None:
         """Method generated by attrs for class Pipeline.
         """
         ...
 
     period: datetime.timedelta
+    schedule: typing.Optional[PollingSchedule]
+    resume_check_period: typing.Optional[datetime.timedelta]
     _observers: typing.Dict[int, toloka.streaming.observer.BaseObserver]
+    _schedules: typing.Dict[int, PollingSchedule]
@@ -0,0 +1,114 @@
+__all__ = [
+    'BaseStorage',
+    'JSONLocalStorage',
+    'SQLiteStorage',
+]
+
+import attr
+import hashlib
+import json
+import os
+import sqlite3
+from typing import Any, Dict, Optional
+
+
+@attr.s
+class BaseStorage:
+    """Base class for storages of cursor states.
+
+    A cursor with a storage loads its state on creation and saves it every time `try_fetch_all` commits, so a restarted
+    process continues from the last committed position instead of fetching all events again.
+
+    States are small JSON-serializable dicts: the search request with the current time bound and the ids of objects
+    seen at that time.
+    """
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns the saved state or `None` if there is no state with this key."""
+        raise NotImplementedError
+
+    def save(self, key: str, state: Dict[str, Any]) -> None:
+        """Saves the state, replacing the previous one."""
+        raise NotImplementedError
+
+
+@attr.s
+class JSONLocalStorage(BaseStorage):
+    """Stores every cursor state in a separate JSON file in the local directory.
+
+    Files are replaced atomically, so a state is never partially written.
+
+    Attributes:
+        dirname: The directory for state files. It's created if it doesn't exist.
+
+    Example:
+        >>> storage = JSONLocalStorage('/var/lib/my-pipeline/cursors')
+        >>> cursor = AssignmentCursor(
+        >>>     pool_id='123', event_type='ACCEPTED', toloka_client=toloka_client, storage=storage,
+        >>> )
+        ...
+    """
+
+    dirname: str = attr.ib()
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.dirname, hashlib.sha1(key.encode()).hexdigest() + '.json')
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._get_path(key)) as file:
+                return json.load(file)['state']
+        except FileNotFoundError:
+            return None
+
+    def save(self, key: str, state: Dict[str, Any]) -> None:
+        os.makedirs(self.dirname, exist_ok=True)
+        path = self._get_path(key)
+        with open(path + '.tmp', 'w') as file:
+            json.dump({'key': key, 'state': state}, file)
+        os.replace(path + '.tmp', path)
+
+
+@attr.s
+class SQLiteStorage(BaseStorage):
+    """Stores cursor states in an SQLite database.
+
+    A single database file can be used by many cursors and processes.
+
+    Attributes:
+        path: The path to the database file. It's created if it doesn't exist.
+        table: The name of the table with states.
+
+    Example:
+        >>> storage = SQLiteStorage('/var/lib/my-pipeline/cursors.sqlite')
+        >>> observer = AssignmentsObserver(toloka_client, pool_id='123', storage=storage)
+        ...
+    """
+
+    path: str = attr.ib()
+    table: str = attr.ib(default='cursor_states')
+
+    def _connect(self) -> sqlite3.Connection:
+        # A new connection for every call, so the storage can be used from any thread and pickled
+        connection = sqlite3.connect(self.path)
+        connection.execute(f'CREATE TABLE IF NOT EXISTS {self.table} (key TEXT PRIMARY KEY, state TEXT NOT NULL)')
+        return connection
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        connection = self._connect()
+        try:
+            row = connection.execute(f'SELECT state FROM {self.table} WHERE key = ?', (key,)).fetchone()
+        finally:
+            connection.close()
+        return json.loads(row[0]) if row else None
+
+    def save(self, key: str, state: Dict[str, Any]) -> None:
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    f'INSERT OR REPLACE INTO {self.table} (key, state) VALUES (?, ?)',
+                    (key, json.dumps(state)),
+                )
+        finally:
+            connection.close()
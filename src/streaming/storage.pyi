@@ -0,0 +1,86 @@
+__all__ = [
+    'BaseStorage',
+    'JSONLocalStorage',
+    'SQLiteStorage',
+]
+import typing
+
+
+class BaseStorage:
+    """Base class for storages of cursor states.
+
+    A cursor with a storage loads its state on creation and saves it every time `try_fetch_all` commits, so a restarted
+    process continues from the last committed position instead of fetching all events again.
+
+    States are small JSON-serializable dicts: the search request with the current time bound and the ids of objects
+    seen at that time.
+    """
+
+    def load(self, key: str) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """Returns the saved state or `None` if there is no state with this key."""
+        ...
+
+    def save(
+        self,
+        key: str,
+        state: typing.Dict[str, typing.Any]
+    ) -> None:
+        """Saves the state, replacing the previous one."""
+        ...
+
+    def __init__(self) -> None:
+        """Method generated by attrs for class BaseStorage.
+        """
+        ...
+
+
+class JSONLocalStorage(BaseStorage):
+    """Stores every cursor state in a separate JSON file in the local directory.
+
+    Files are replaced atomically, so a state is never partially written.
+
+    Attributes:
+        dirname: The directory for state files. It's created if it doesn't exist.
+
+    Example:
+        >>> storage = JSONLocalStorage('/var/lib/my-pipeline/cursors')
+        >>> cursor = AssignmentCursor(
+        >>>     pool_id='123', event_type='ACCEPTED', toloka_client=toloka_client, storage=storage,
+        >>> )
+        ...
+    """
+
+    def __init__(self, dirname: str) -> None:
+        """Method generated by attrs for class JSONLocalStorage.
+        """
+        ...
+
+    dirname: str
+
+
+class SQLiteStorage(BaseStorage):
+    """Stores cursor states in an SQLite database.
+
+    A single database file can be used by many cursors and processes.
+
+    Attributes:
+        path: The path to the database file. It's created if it doesn't exist.
+        table: The name of the table with states.
+
+    Example:
+        >>> storage = SQLiteStorage('/var/lib/my-pipeline/cursors.sqlite')
+        >>> observer = AssignmentsObserver(toloka_client, pool_id='123', storage=storage)
+        ...
+    """
+
+    def __init__(
+        self,
+        path: str,
+        table: str = 'cursor_states'
+    ) -> None:
+        """Method generated by attrs for class SQLiteStorage.
+        """
+        ...
+
+    path: str
+    table: str
@@ -3,9 +3,9 @@ __all__: list = [
     'fix_attrs_converters',
 ]
 import functools
+import itertools
 import linecache
-import uuid
-from inspect import isclass, signature, Signature, Parameter, BoundArguments
+from inspect import iscoroutinefunction, isclass, signature, Signature, Parameter, BoundArguments
 from textwrap import dedent, indent
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
@@ -90,8 +90,12 @@ def _get_signature_invocation_string(sig: Signature) -> str:
     return '(' + ', '.join(tokens) + ')'
 
 
+# Unique suffixes for names of generated source files
+_compiled_functions_counter = itertools.count()
+
+
 def _compile_function(func_name, func_sig, func_body, globs=None):
-    file_name = f'{func_name}_{uuid.uuid4().hex}'
+    file_name = f'{func_name}_{next(_compiled_functions_counter)}'
     annotations = _get_annotations_from_signature(func_sig)
     sig = _remove_annotations_from_signature(func_sig)
 
@@ -230,6 +234,14 @@ def expand(arg_name: str, arg_type: Optional[Type] = None, check_type: bool = Tr
                 raise TypeError(f'Arguments does not fit standart or expanded version.\nStandart version on problem: {func_problem}\nExpand version on problem: {expand_func_problem}')
             return expanded_func(*args, **kwargs)
 
+        if iscoroutinefunction(func):
+            # Keep coroutine functions recognizable by asyncio.iscoroutinefunction
+            dispatch = wrapped
+
+            @functools.wraps(func)
+            async def wrapped(*args, **kwargs):
+                return await dispatch(*args, **kwargs)
+
         wrapped._func = func
         wrapped._expanded_func = expanded_func
         wrapped._func_sig = func_sig
@@ -1,5 +1,6 @@
 __all__: list = ['inherit_docstrings']
 from collections import OrderedDict
+from functools import lru_cache
 from inspect import Signature
 from io import StringIO
 from textwrap import indent
@@ -11,9 +12,15 @@ from ..util import get_signature
 
 
 def _get_docstring_params_dict(obj: Any) -> Dict[str, docstring_parser.DocstringParam]:
-    params = docstring_parser.google.parse(obj.__doc__).params
-    params_dict = OrderedDict((param.arg_name, param) for param in params)
-    return params_dict
+    return _parse_docstring_params(obj.__doc__)
+
+
+# Docstrings of base classes are parsed once for every subclass, so parsing results are cached. The returned dicts
+# must not be modified
+@lru_cache(maxsize=None)
+def _parse_docstring_params(docstring: Optional[str]) -> Dict[str, docstring_parser.DocstringParam]:
+    params = docstring_parser.google.parse(docstring).params
+    return OrderedDict((param.arg_name, param) for param in params)
 
 
 def _replace_params_in_docstring(docstring: docstring_parser.Docstring,
@@ -0,0 +1,63 @@
+__all__ = [
+    'iterable_to_stream',
+]
+
+import io
+from typing import Callable, Iterable, Iterator, Optional
+
+
+class _IterableRawStream(io.RawIOBase):
+    """Read-only raw stream over an iterable of byte chunks. Only the current chunk is kept in memory."""
+
+    def __init__(self, chunks: Iterable[bytes], on_close: Optional[Callable[[], None]] = None):
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._chunk: Optional[memoryview] = None
+        self._on_close = on_close
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._chunk:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._release()
+                return 0
+            self._chunk = memoryview(chunk)
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+    def _release(self) -> None:
+        # The stream stays readable after the end of chunks, readers may ask for more data
+        on_close, self._on_close = self._on_close, None
+        if on_close is not None:
+            on_close()
+
+    def close(self) -> None:
+        # Also called when the stream is garbage collected
+        self._release()
+        super().close()
+
+
+def iterable_to_stream(
+    chunks: Iterable[bytes],
+    buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+    on_close: Optional[Callable[[], None]] = None,
+) -> io.BufferedReader:
+    """Wraps an iterable of byte chunks into a binary file object.
+
+    Chunks are consumed as the stream is read, so it can be used to pass `requests.Response.iter_content` to readers
+    that expect a file, e.g. `pandas.read_csv`, without loading the whole response into memory.
+
+    Args:
+        chunks: Parts of the content.
+        buffer_size: Size of the read buffer.
+        on_close: Called once when all chunks are read or the stream is closed, e.g. to close the response.
+
+    Returns:
+        Buffered binary stream.
+    """
+
+    return io.BufferedReader(_IterableRawStream(chunks, on_close), buffer_size)
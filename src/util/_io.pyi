@@ -0,0 +1,26 @@
+__all__ = [
+    'iterable_to_stream',
+]
+import io
+import typing
+
+
+def iterable_to_stream(
+    chunks: typing.Iterable[bytes],
+    buffer_size: int = 8192,
+    on_close: typing.Optional[typing.Callable[[], None]] = None
+) -> io.BufferedReader:
+    """Wraps an iterable of byte chunks into a binary file object.
+
+    Chunks are consumed as the stream is read, so it can be used to pass `requests.Response.iter_content` to readers
+    that expect a file, e.g. `pandas.read_csv`, without loading the whole response into memory.
+
+    Args:
+        chunks: Parts of the content.
+        buffer_size: Size of the read buffer.
+        on_close: Called once when all chunks are read or the stream is closed, e.g. to close the response.
+
+    Returns:
+        Buffered binary stream.
+    """
+    ...
@@ -0,0 +1,230 @@
+__all__ = [
+    'ProducerThreadPool',
+    'aiterate_concurrently',
+    'chunked',
+    'iterate_concurrently',
+]
+
+import asyncio
+import heapq
+import itertools
+import queue
+import threading
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar('T')
+
+_ITEM, _ERROR, _END = range(3)
+_PUT_TIMEOUT = 0.1
+
+
+class ProducerThreadPool:
+    """Persistent daemon threads that run producers of `iterate_concurrently`.
+
+    Idle threads are reused, so thread-local resources, e.g. HTTP sessions of `TolokaClient`, are reused too. A new
+    thread is started only if all threads are busy: producers may start nested producers and wait for them, so a pool
+    of a fixed size could deadlock.
+    """
+
+    def __init__(self):
+        self._tasks = queue.Queue()
+        self._threads_count = 0
+        self._idle_count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """The number of started threads."""
+        return self._threads_count
+
+    def submit(self, func: Callable[[], None]) -> None:
+        with self._lock:
+            if self._idle_count == 0:
+                threading.Thread(target=self._work, daemon=True).start()
+                self._threads_count += 1
+                self._idle_count += 1
+            # Every submitted function has an idle thread reserved for it
+            self._idle_count -= 1
+        self._tasks.put(func)
+
+    def _work(self) -> None:
+        while True:
+            func = self._tasks.get()
+            try:
+                func()
+            finally:
+                with self._lock:
+                    self._idle_count += 1
+
+
+_default_pool = ProducerThreadPool()
+
+
+class _Producer:
+    """Iterates over an iterable in a background thread and puts items to the bounded output queue."""
+
+    def __init__(self, iterable_factory: Callable[[], Iterable[T]], output: queue.Queue, stopped: threading.Event):
+        self.iterable_factory = iterable_factory
+        self.output = output
+        self.stopped = stopped
+
+    def run(self) -> None:
+        try:
+            for item in self.iterable_factory():
+                if not self._put((_ITEM, item)):
+                    return
+        except BaseException as exc:
+            self._put((_ERROR, exc))
+        else:
+            self._put((_END, None))
+
+    def _put(self, message) -> bool:
+        # Wake up periodically to notice that the consumer has gone
+        while not self.stopped.is_set():
+            try:
+                self.output.put(message, timeout=_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+
+def _consume(output: queue.Queue, producers_count: int) -> Iterator[T]:
+    finished = 0
+    while finished < producers_count:
+        kind, value = output.get()
+        if kind == _ITEM:
+            yield value
+        elif kind == _ERROR:
+            raise value
+        else:
+            finished += 1
+
+
+def iterate_concurrently(
+    iterable_factories: List[Callable[[], Iterable[T]]],
+    key: Optional[Callable[[T], Any]] = None,
+    buffer_size: int = 1,
+    pool: Optional[ProducerThreadPool] = None,
+) -> Iterator[T]:
+    """Iterates over several iterables at once, each one in its own thread.
+
+    Every producer thread runs at most `buffer_size` items ahead of the consumer, so memory stays bounded even if
+    the consumer is slower than producers. Producers are started on the first `next` call and stopped as soon as
+    the returned iterator is exhausted or closed. An exception raised in any producer is re-raised to the consumer.
+
+    Args:
+        iterable_factories: Functions that create iterables. Each one is called in a separate thread.
+        key: If set, every iterable must be sorted by this key and items are merged preserving this order.
+            Otherwise items are yielded in order of arrival.
+        buffer_size: The maximum number of items buffered for each iterable.
+        pool: Threads to run producers in. By default, threads shared by the whole process are used.
+
+    Yields:
+        Items of all iterables.
+    """
+
+    stopped = threading.Event()
+    if key is None:
+        output = queue.Queue(maxsize=buffer_size * len(iterable_factories))
+        outputs = [output] * len(iterable_factories)
+    else:
+        outputs = [queue.Queue(maxsize=buffer_size) for _ in iterable_factories]
+
+    producers = [_Producer(factory, output, stopped) for factory, output in zip(iterable_factories, outputs)]
+    pool = pool if pool is not None else _default_pool
+    for producer in producers:
+        pool.submit(producer.run)
+    try:
+        if key is None:
+            yield from _consume(outputs[0] if outputs else None, len(producers))
+        else:
+            yield from heapq.merge(*(_consume(output, 1) for output in outputs), key=key)
+    finally:
+        stopped.set()
+
+
+async def _aproduce(aiterable_factory: Callable[[], AsyncIterable[T]], output: asyncio.Queue) -> None:
+    try:
+        async for item in aiterable_factory():
+            await output.put((_ITEM, item))
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:
+        await output.put((_ERROR, exc))
+    else:
+        await output.put((_END, None))
+
+
+async def _aconsume(output: asyncio.Queue, producers_count: int) -> AsyncIterator[T]:
+    finished = 0
+    while finished < producers_count:
+        kind, value = await output.get()
+        if kind == _ITEM:
+            yield value
+        elif kind == _ERROR:
+            raise value
+        else:
+            finished += 1
+
+
+async def _amerge(aiterators: List[AsyncIterator[T]], key: Callable[[T], Any]) -> AsyncIterator[T]:
+    heap = []
+    for index, aiterator in enumerate(aiterators):
+        try:
+            item = await aiterator.__anext__()
+        except StopAsyncIteration:
+            continue
+        heap.append((key(item), index, item))
+    heapq.heapify(heap)
+
+    while heap:
+        _, index, item = heap[0]
+        yield item
+        try:
+            item = await aiterators[index].__anext__()
+            heapq.heapreplace(heap, (key(item), index, item))
+        except StopAsyncIteration:
+            heapq.heappop(heap)
+
+
+async def aiterate_concurrently(
+    aiterable_factories: List[Callable[[], AsyncIterable[T]]],
+    key: Optional[Callable[[T], Any]] = None,
+    buffer_size: int = 1,
+) -> AsyncIterator[T]:
+    """Asynchronous version of `iterate_concurrently`: each iterable is consumed by a separate task
+    in the current event loop.
+    """
+
+    if key is None:
+        output = asyncio.Queue(maxsize=buffer_size * len(aiterable_factories))
+        outputs = [output] * len(aiterable_factories)
+    else:
+        outputs = [asyncio.Queue(maxsize=buffer_size) for _ in aiterable_factories]
+
+    loop = asyncio.get_event_loop()
+    tasks = [loop.create_task(_aproduce(factory, output)) for factory, output in zip(aiterable_factories, outputs)]
+    try:
+        if key is None:
+            items = _aconsume(outputs[0] if outputs else None, len(tasks))
+        else:
+            items = _amerge([_aconsume(output, 1) for output in outputs], key)
+        async for item in items:
+            yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def chunked(iterable: Iterable[T], chunk_size: int) -> Iterator[List[T]]:
+    """Splits an iterable into lists of `chunk_size` items. The last list may be shorter.
+
+    The iterable is consumed lazily, so it is never fully loaded into memory.
+    """
+
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
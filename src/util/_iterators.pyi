@@ -0,0 +1,74 @@
+__all__ = [
+    'ProducerThreadPool',
+    'aiterate_concurrently',
+    'chunked',
+    'iterate_concurrently',
+]
+import typing
+
+
+T = typing.TypeVar('T')
+
+
+class ProducerThreadPool:
+    """Persistent daemon threads that run producers of `iterate_concurrently`.
+
+    Idle threads are reused, so thread-local resources, e.g. HTTP sessions of `TolokaClient`, are reused too. A new
+    thread is started only if all threads are busy: producers may start nested producers and wait for them, so a pool
+    of a fixed size could deadlock.
+    """
+
+    def __init__(self): ...
+
+    def __len__(self) -> int:
+        """The number of started threads."""
+        ...
+
+    def submit(self, func: typing.Callable[[], None]) -> None: ...
+
+
+def iterate_concurrently(
+    iterable_factories: typing.List[typing.Callable[[], typing.Iterable[T]]],
+    key: typing.Optional[typing.Callable[[T], typing.Any]] = None,
+    buffer_size: int = 1,
+    pool: typing.Optional[ProducerThreadPool] = None
+) -> typing.Iterator[T]:
+    """Iterates over several iterables at once, each one in its own thread.
+
+    Every producer thread runs at most `buffer_size` items ahead of the consumer, so memory stays bounded even if
+    the consumer is slower than producers. Producers are started on the first `next` call and stopped as soon as
+    the returned iterator is exhausted or closed. An exception raised in any producer is re-raised to the consumer.
+
+    Args:
+        iterable_factories: Functions that create iterables. Each one is called in a separate thread.
+        key: If set, every iterable must be sorted by this key and items are merged preserving this order.
+            Otherwise items are yielded in order of arrival.
+        buffer_size: The maximum number of items buffered for each iterable.
+        pool: Threads to run producers in. By default, threads shared by the whole process are used.
+
+    Yields:
+        Items of all iterables.
+    """
+    ...
+
+
+def aiterate_concurrently(
+    aiterable_factories: typing.List[typing.Callable[[], typing.AsyncIterable[T]]],
+    key: typing.Optional[typing.Callable[[T], typing.Any]] = None,
+    buffer_size: int = 1
+) -> typing.AsyncIterator[T]:
+    """Asynchronous version of `iterate_concurrently`: each iterable is consumed by a separate task
+    in the current event loop.
+    """
+    ...
+
+
+def chunked(
+    iterable: typing.Iterable[T],
+    chunk_size: int
+) -> typing.Iterator[typing.List[T]]:
+    """Splits an iterable into lists of `chunk_size` items. The last list may be shorter.
+
+    The iterable is consumed lazily, so it is never fully loaded into memory.
+    """
+    ...
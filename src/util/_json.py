@@ -0,0 +1,154 @@
+__all__ = [
+    'aiter_json_array',
+    'fast_json_loads',
+    'iter_json_array',
+]
+
+import codecs
+from decimal import Decimal
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, Optional, Union
+
+import simplejson as json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+_WHITESPACE = ' \t\n\r'
+_DELIMITERS = _WHITESPACE + ',]'
+
+
+class _JsonArrayParser:
+    """Incrementally parses a JSON array fed in chunks of text and returns its elements as soon as they are complete.
+
+    Only the currently incomplete element is kept in the buffer.
+    """
+
+    def __init__(self):
+        self.decoder = json.JSONDecoder(parse_float=Decimal)
+        self.buffer = ''
+        self.started = False
+        self.finished = False
+        self.expect_value = True
+        self.empty = True
+
+    def _skip_whitespace(self, pos: int) -> int:
+        while pos < len(self.buffer) and self.buffer[pos] in _WHITESPACE:
+            pos += 1
+        return pos
+
+    def _error(self, message: str, pos: int) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.buffer, pos)
+
+    def feed(self, text: str, final: bool = False) -> Iterator[Any]:
+        self.buffer += text
+        pos = 0
+        try:
+            while not self.finished:
+                pos = self._skip_whitespace(pos)
+                if pos == len(self.buffer):
+                    break
+                char = self.buffer[pos]
+                if not self.started:
+                    if char != '[':
+                        raise self._error('Expecting JSON array', pos)
+                    self.started = True
+                    pos += 1
+                elif char == ']' and (self.empty or not self.expect_value):
+                    self.finished = True
+                    pos += 1
+                elif not self.expect_value:
+                    if char != ',':
+                        raise self._error("Expecting ',' delimiter", pos)
+                    self.expect_value = True
+                    pos += 1
+                else:
+                    try:
+                        value, end = self.decoder.raw_decode(self.buffer, pos)
+                    except json.JSONDecodeError:
+                        if final:
+                            raise
+                        break
+                    # A number or a literal may continue in the next chunk unless it is followed by a delimiter
+                    is_scalar = char not in '{["'
+                    if is_scalar and not final and (end == len(self.buffer) or self.buffer[end] not in _DELIMITERS):
+                        break
+                    self.expect_value = False
+                    self.empty = False
+                    pos = end
+                    yield value
+        finally:
+            self.buffer = self.buffer[pos:]
+
+        if final:
+            if not self.finished:
+                raise self._error('Unexpected end of JSON array', len(self.buffer))
+            if self._skip_whitespace(0) != len(self.buffer):
+                raise self._error('Extra data', 0)
+
+
+def iter_json_array(chunks: Iterable[Union[bytes, str]]) -> Iterator[Any]:
+    """Parses a JSON array from an iterable of chunks and yields its elements one by one.
+
+    Floats are parsed as `Decimal`. Unlike `json.loads`, the whole document is never loaded into memory, so it
+    can be used to read large responses with `requests.Response.iter_content`.
+
+    Args:
+        chunks: Parts of the JSON document, either `str` or UTF-8 encoded `bytes`.
+
+    Yields:
+        Elements of the array.
+
+    Raises:
+        simplejson.JSONDecodeError: If the document is not a valid JSON array.
+    """
+
+    parser = _JsonArrayParser()
+    utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            chunk = utf8_decoder.decode(chunk)
+        yield from parser.feed(chunk)
+    yield from parser.feed(utf8_decoder.decode(b'', final=True), final=True)
+
+
+async def aiter_json_array(chunks: AsyncIterable[Union[bytes, str]]) -> AsyncIterator[Any]:
+    """Same as `iter_json_array`, but the chunks are read from an asynchronous iterable.
+
+    Args:
+        chunks: Parts of the JSON document, either `str` or UTF-8 encoded `bytes`.
+
+    Yields:
+        Elements of the array.
+
+    Raises:
+        simplejson.JSONDecodeError: If the document is not a valid JSON array.
+    """
+
+    parser = _JsonArrayParser()
+    utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+    async for chunk in chunks:
+        if isinstance(chunk, bytes):
+            chunk = utf8_decoder.decode(chunk)
+        for value in parser.feed(chunk):
+            yield value
+    for value in parser.feed(utf8_decoder.decode(b'', final=True), final=True):
+        yield value
+
+
+def _get_fast_json_loads() -> Optional[Callable[[Union[bytes, str]], Any]]:
+    if orjson is not None:
+        return orjson.loads
+    if simdjson is not None:
+        return simdjson.loads
+    return None
+
+
+# The fastest installed JSON decoder (orjson or simdjson) or None. Unlike the default one, it decodes floats as `float`
+fast_json_loads = _get_fast_json_loads()
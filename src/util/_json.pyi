@@ -0,0 +1,42 @@
+__all__ = [
+    'aiter_json_array',
+    'fast_json_loads',
+    'iter_json_array',
+]
+import typing
+
+
+def iter_json_array(chunks: typing.Iterable[typing.Union[bytes, str]]) -> typing.Iterator[typing.Any]:
+    """Parses a JSON array from an iterable of chunks and yields its elements one by one.
+
+    Floats are parsed as `Decimal`. Unlike `json.loads`, the whole document is never loaded into memory, so it
+    can be used to read large responses with `requests.Response.iter_content`.
+
+    Args:
+        chunks: Parts of the JSON document, either `str` or UTF-8 encoded `bytes`.
+
+    Yields:
+        Elements of the array.
+
+    Raises:
+        simplejson.JSONDecodeError: If the document is not a valid JSON array.
+    """
+    ...
+
+
+async def aiter_json_array(chunks: typing.AsyncIterable[typing.Union[bytes, str]]) -> typing.AsyncIterator[typing.Any]:
+    """Same as `iter_json_array`, but the chunks are read from an asynchronous iterable.
+
+    Args:
+        chunks: Parts of the JSON document, either `str` or UTF-8 encoded `bytes`.
+
+    Yields:
+        Elements of the array.
+
+    Raises:
+        simplejson.JSONDecodeError: If the document is not a valid JSON array.
+    """
+    ...
+
+
+fast_json_loads: typing.Optional[typing.Callable[[typing.Union[bytes, str]], typing.Any]]
@@ -46,14 +46,16 @@ class ComplexException(Exception):
         raise self
 
 
-def ensure_async(func: Callable) -> Callable[..., Awaitable]:
+def ensure_async(func: Callable, executor: Optional[futures.Executor] = None) -> Callable[..., Awaitable]:
     """Ensure given callable is async.
 
-    Note, that it doesn't provide concurrency by itself!
+    Note, that it doesn't provide concurrency by itself, unless the executor is given!
     It just allow to treat sync and async callables in the same way.
 
     Args:
         func: Any callable: synchronous or asynchronous.
+        executor: Executor to run a synchronous callable in, e.g. `ProcessPoolExecutor` for CPU-heavy work. Arguments
+            and results must be picklable for a process pool. By default, the callable runs in the caller's thread.
     Returns:
         Wrapper that return awaitable object at call.
     """
@@ -62,10 +64,16 @@ def ensure_async(func: Callable) -> Callable[..., Awaitable]:
     async def _async_wrapper(*args, **kwargs):
         return func(*args, **kwargs)
 
+    @functools.wraps(func)
+    async def _executor_wrapper(*args, **kwargs):
+        return await asyncio.get_event_loop().run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
     if asyncio.iscoroutinefunction(func) or asyncio.iscoroutinefunction(getattr(func, '__call__', None)):
+        if executor is not None:
+            raise ValueError('Only synchronous callables can be run in the executor')
         return func
 
-    return _async_wrapper
+    return _async_wrapper if executor is None else _executor_wrapper
 
 
 T = TypeVar('T')
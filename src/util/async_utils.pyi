@@ -7,6 +7,7 @@ __all__ = [
 ]
 import asyncio
 import asyncio.events
+import concurrent.futures._base
 import typing
 
 
@@ -26,14 +27,19 @@ class ComplexException(Exception):
     exceptions: typing.List[Exception]
 
 
-def ensure_async(func: typing.Callable) -> typing.Callable[..., typing.Awaitable]:
+def ensure_async(
+    func: typing.Callable,
+    executor: typing.Optional[concurrent.futures._base.Executor] = None
+) -> typing.Callable[..., typing.Awaitable]:
     """Ensure given callable is async.
 
-    Note, that it doesn't provide concurrency by itself!
+    Note, that it doesn't provide concurrency by itself, unless the executor is given!
     It just allow to treat sync and async callables in the same way.
 
     Args:
         func: Any callable: synchronous or asynchronous.
+        executor: Executor to run a synchronous callable in, e.g. `ProcessPoolExecutor` for CPU-heavy work. Arguments
+            and results must be picklable for a process pool. By default, the callable runs in the caller's thread.
     Returns:
         Wrapper that return awaitable object at call.
     """
@@ -0,0 +1,151 @@
+import datetime
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import simplejson
+
+from toloka.client import Project, unstructure
+from toloka.client.project.field_spec import (
+    ArrayStringSpec,
+    BooleanSpec,
+    FloatSpec,
+    IntegerSpec,
+    JsonSpec,
+    StringSpec,
+    UrlSpec,
+)
+from toloka.client.project.task_spec import TaskSpec
+from toloka.client.search_requests import AssignmentSearchRequest, TaskSearchRequest
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+from toloka.export import (  # noqa: E402
+    get_assignments_schema,
+    get_tasks_schema,
+    iter_assignment_batches,
+    iter_task_batches,
+    write_assignments_parquet,
+    write_tasks_parquet,
+)
+
+
+@pytest.fixture
+def project():
+    return Project(
+        id='10',
+        task_spec=TaskSpec(
+            input_spec={'image': UrlSpec(), 'size': IntegerSpec(), 'meta': JsonSpec()},
+            output_spec={'label': StringSpec(), 'score': FloatSpec(), 'tags': ArrayStringSpec(), 'ok': BooleanSpec()},
+        ),
+    )
+
+
+def make_assignment(index):
+    return {
+        'id': f'assignment-{index}',
+        'task_suite_id': f'task-suite-{index}',
+        'pool_id': '21',
+        'user_id': f'user-{index}',
+        'status': 'ACCEPTED',
+        'reward': '0.05',
+        'mixed': False,
+        'automerged': False,
+        'created': '2016-04-18T12:43:04',
+        'submitted': '2016-04-18T12:44:04.123',
+        'accepted': '2016-04-18T13:00:00',
+        'tasks': [
+            {
+                'id': f'task-{index}-{i}',
+                'pool_id': '21',
+                'input_values': {'image': f'http://images.com/{index}/{i}.png', 'size': i, 'meta': {'a': [i]}},
+                'overlap': 3,
+                'created': '2016-04-18T12:00:00',
+            }
+            for i in range(2)
+        ],
+        'solutions': [
+            {'output_values': {'label': 'cat', 'score': 0.5, 'tags': ['x', None], 'ok': True}},
+            {'output_values': {'label': None}},
+        ],
+    }
+
+
+@pytest.fixture
+def assignments_pages(requests_mock, toloka_url):
+    pages = {
+        None: {'items': [make_assignment(0), make_assignment(1)], 'has_more': True},
+        'assignment-1': {'items': [make_assignment(2)], 'has_more': False},
+    }
+
+    def find_assignments(request, context):
+        params = parse_qs(urlparse(request.url).query)
+        assert params['pool_id'] == ['21']
+        assert params['sort'] == ['id']
+        return simplejson.dumps(pages[params.get('id_gt', [None])[0]])
+
+    requests_mock.get(f'{toloka_url}/assignments', text=find_assignments)
+
+
+def test_assignments_schema(project):
+    schema = get_assignments_schema(project)
+    assert schema.field('ASSIGNMENT:reward').type == pa.float64()
+    assert schema.field('ASSIGNMENT:submitted').type == pa.timestamp('ms')
+    assert schema.field('INPUT:size').type == pa.int64()
+    assert schema.field('INPUT:meta').type == pa.string()
+    assert schema.field('OUTPUT:tags').type == pa.list_(pa.string())
+    assert schema.field('OUTPUT:ok').type == pa.bool_()
+
+
+def test_iter_assignment_batches(toloka_client, project, assignments_pages):
+    request = AssignmentSearchRequest(pool_id='21')
+    batches = list(iter_assignment_batches(toloka_client, request, project, batch_size=4))
+    assert [batch.num_rows for batch in batches] == [4, 2]
+    assert all(batch.schema == get_assignments_schema(project) for batch in batches)
+
+    table = pa.Table.from_batches(batches).to_pydict()
+    assert table['ASSIGNMENT:assignment_id'] == [f'assignment-{i // 2}' for i in range(6)]
+    assert table['ASSIGNMENT:task_id'][:2] == ['task-0-0', 'task-0-1']
+    assert table['ASSIGNMENT:reward'][0] == 0.05
+    assert table['ASSIGNMENT:submitted'][0] == datetime.datetime(2016, 4, 18, 12, 44, 4, 123000)
+    assert table['ASSIGNMENT:rejected'][0] is None
+    assert table['INPUT:size'][:2] == [0, 1]
+    assert table['INPUT:meta'][1] == '{"a": [1]}'
+    assert table['OUTPUT:label'][:2] == ['cat', None]
+    assert table['OUTPUT:tags'][:2] == [['x', None], None]
+
+
+def test_iter_assignment_batches_gets_project_of_pool(requests_mock, toloka_client, toloka_url, project,
+                                                      assignments_pages):
+    requests_mock.get(f'{toloka_url}/pools/21', text=simplejson.dumps({'id': '21', 'project_id': '10'}))
+    requests_mock.get(f'{toloka_url}/projects/10', text=simplejson.dumps(unstructure(project)))
+    batches = list(iter_assignment_batches(toloka_client, AssignmentSearchRequest(pool_id='21')))
+    assert [batch.num_rows for batch in batches] == [6]
+
+    with pytest.raises(ValueError):
+        iter_assignment_batches(toloka_client, AssignmentSearchRequest(status='ACCEPTED'))
+
+
+def test_write_assignments_parquet(tmp_path, toloka_client, project, assignments_pages):
+    path = tmp_path / 'assignments.parquet'
+    request = AssignmentSearchRequest(pool_id='21')
+    assert write_assignments_parquet(toloka_client, path, request, project, batch_size=4) == 6
+
+    parquet_file = pq.ParquetFile(path)
+    assert parquet_file.num_row_groups == 2
+    assert parquet_file.schema_arrow == get_assignments_schema(project)
+    assert parquet_file.read().column('OUTPUT:score').to_pylist()[:2] == [0.5, None]
+
+
+def test_write_tasks_parquet(tmp_path, requests_mock, toloka_client, toloka_url, project):
+    tasks = [task for index in range(3) for task in make_assignment(index)['tasks']]
+    requests_mock.get(f'{toloka_url}/tasks', text=simplejson.dumps({'items': tasks, 'has_more': False}))
+    request = TaskSearchRequest(pool_id='21')
+
+    table = pa.Table.from_batches(iter_task_batches(toloka_client, request, project)).to_pydict()
+    assert table['TASK:task_id'] == [task['id'] for task in tasks]
+    assert table['TASK:overlap'] == [3] * 6
+
+    path = tmp_path / 'tasks.parquet'
+    assert write_tasks_parquet(toloka_client, path, request, project) == 6
+    assert pq.read_schema(path) == get_tasks_schema(project)
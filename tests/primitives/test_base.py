@@ -1,3 +1,4 @@
+import copy
 import pytest
 import pickle
 import inspect
@@ -240,3 +241,80 @@ def test_extendable_enum_union_autocast(test_extendable_enum, non_attr_class):
     assert func(['a', 'b', 'field_2']) == [test_extendable_enum.A, test_extendable_enum.B, test_extendable_enum.field_2]
     non_attr_class_instance = non_attr_class(1)
     assert func(non_attr_class_instance) == non_attr_class_instance
+
+
+def test_structure_unstructure_round_trip():
+
+    class Inner(BaseTolokaObject):
+        value: int
+
+    class Outer(BaseTolokaObject):
+        name: str
+        inner: Inner
+        optional_inner: Optional[Inner]
+        inners: List[Inner]
+
+    data = {
+        'name': 'outer',
+        'inner': {'value': 1},
+        'inners': [{'value': 2}, {'value': 3, 'extra': 'x'}],
+        'unknown_field': 'unknown_value',
+    }
+    obj = Outer.structure(data)
+    assert obj.name == 'outer'
+    assert obj.inner == Inner(value=1)
+    assert [inner.value for inner in obj.inners] == [2, 3]
+    assert obj.inners[1].extra == 'x'
+    assert obj.unknown_field == 'unknown_value'
+    assert obj.optional_inner is None
+    assert Outer.unstructure(obj) == data
+    assert 'value' in data['inner'], 'Structure must not modify the input'
+    assert Outer.unstructure(Outer()) is None
+
+
+def test_structure_variant_by_raw_value(test_enum):  # noqa: F811
+
+    class Base(BaseTolokaObject, spec_enum=test_enum, spec_field='type'):
+        pass
+
+    first, second = list(test_enum)[:2]
+
+    class First(Base, spec_value=first):
+        value: int
+
+    class Second(Base, spec_value=second):
+        value: str
+
+    assert Base.structure({'type': first.value, 'value': 1}) == First(value=1)
+    assert Base.structure({'type': second.value, 'value': 'a'}) == Second(value='a')
+    assert Base.unstructure(Second(value='a')) == {'type': second.value, 'value': 'a'}
+
+
+def test_slotted_toloka_object():
+
+    class Slotted(BaseTolokaObject, slots=True):
+        value: int
+        values: List[int] = attribute(factory=list)
+
+    obj = Slotted.structure({'value': 1})
+    assert not hasattr(obj, '__dict__')
+    assert obj.values == []
+    with pytest.raises(AttributeError):
+        obj.unknown_field = 'unknown_value'
+
+    obj = Slotted.structure({'value': 1, 'unknown_field': 'unknown_value'})
+    assert obj.unknown_field == 'unknown_value'
+    copied = copy.deepcopy(obj)
+    assert copied == obj
+    assert copied.unknown_field == 'unknown_value'
+
+
+def test_unexpected_allocated_lazily():
+    obj = BaseTolokaObject.structure({})
+    with pytest.raises(AttributeError):
+        obj.unknown_field
+    with pytest.raises(AttributeError):
+        object.__getattribute__(obj, '_unexpected')
+
+    obj._unexpected['unknown_field'] = 'unknown_value'
+    assert obj.unknown_field == 'unknown_value'
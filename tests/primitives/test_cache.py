@@ -0,0 +1,71 @@
+import pickle
+import time
+
+import pytest
+from toloka.client import TolokaClient
+from toloka.client.primitives.cache import ObjectCache
+
+
+@pytest.mark.parametrize(
+    ['path', 'expected_key'],
+    [
+        ('/v1/pools/1', '/v1/pools/1'),
+        ('/v1/pools/1/open', '/v1/pools/1'),
+        ('/v1/requester', '/v1/requester'),
+    ]
+)
+def test_cache_key(path, expected_key):
+    assert expected_key == ObjectCache.get_key(path)
+
+
+def test_cache_ttl():
+    cache = ObjectCache(ttl=0.05)
+    cache.put('/v1/pools/1', {'id': '1'})
+    assert {'id': '1'} == cache.get('/v1/pools/1')
+    time.sleep(0.06)
+    assert cache.get('/v1/pools/1') is None
+    assert (1, 1) == (cache.hits, cache.misses)
+
+
+def test_cache_lru_eviction():
+    cache = ObjectCache(max_size=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert 1 == cache.get('a')
+    cache.put('c', 3)
+    assert 2 == len(cache)
+    assert cache.get('b') is None
+    assert (1, 3) == (cache.get('a'), cache.get('c'))
+
+
+def test_cache_pickle():
+    cache = ObjectCache(ttl=10)
+    cache.put('a', 1)
+    restored = pickle.loads(pickle.dumps(cache))
+    assert 1 == restored.get('a')
+    restored.invalidate('a')
+    assert restored.get('a') is None
+
+
+def test_client_reads_through_cache(requests_mock, toloka_url):
+    pool_map = {'id': '1', 'project_id': '10', 'private_name': 'pool', 'status': 'CLOSED'}
+    requests_mock.get(f'{toloka_url}/pools/1', json=pool_map)
+    requests_mock.patch(f'{toloka_url}/pools/1', json=dict(pool_map, priority=10))
+    requests_mock.post(f'{toloka_url}/pools/1/open', status_code=204)
+    cache = ObjectCache()
+    toloka_client = TolokaClient('fake-token', 'SANDBOX', cache=cache)
+
+    pool = toloka_client.get_pool('1')
+    pool.private_name = 'changed locally'
+    assert 'pool' == toloka_client.get_pool('1').private_name
+    assert 1 == requests_mock.call_count
+    assert (1, 1) == (cache.hits, cache.misses)
+
+    toloka_client.patch_pool('1', priority=10)
+    toloka_client.get_pool('1')
+    assert 3 == requests_mock.call_count
+
+    toloka_client.open_pool('1')
+    toloka_client.get_pool('1')
+    assert 5 == requests_mock.call_count
+    assert (2, 3) == (cache.hits, cache.misses)
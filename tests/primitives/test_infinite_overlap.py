@@ -1,8 +1,11 @@
+import pickle
+
 import pytest
 
-from toloka.client._converter import unstructure
+from toloka.client._converter import structure, unstructure
 from toloka.client.primitives.base import BaseTolokaObject
 from toloka.client.primitives.infinite_overlap import InfiniteOverlapParametersMixin
+from toloka.client.task import Task
 
 
 class Parameters(InfiniteOverlapParametersMixin, BaseTolokaObject):
@@ -115,3 +118,16 @@ def test_assign_infinite_overlap():
     params = Parameters(payload=123, overlap=1, infinite_overlap=False)
     params.infinite_overlap = True
     assert {'payload': 123, 'overlap': None, 'infinite_overlap': True} == unstructure(params)
+
+
+def test_slotted_class_stores_overlap_in_slots():
+    task = structure({'pool_id': '1', 'input_values': {}, 'overlap': 3}, Task)
+    assert not hasattr(task, '__dict__')
+    assert (task.overlap, task.infinite_overlap) == (3, False)
+
+    task.infinite_overlap = True
+    assert (task.overlap, task.infinite_overlap) == (None, True)
+
+    deserialized = pickle.loads(pickle.dumps(task))
+    assert deserialized == task
+    assert {'pool_id': '1', 'input_values': {}, 'overlap': None, 'infinite_overlap': True} == unstructure(deserialized)
@@ -0,0 +1,110 @@
+import pickle
+from decimal import Decimal
+from enum import Enum
+
+import pytest
+from toloka.client import Task, structure, unstructure
+from toloka.client.assignment import Assignment
+from toloka.client.exceptions import SpecClassIdentificationError
+from toloka.client.primitives.base import BaseTolokaObject
+from toloka.client.pool.mixer_config import MixerConfig
+from toloka.client.primitives.lazy import LazyObject
+from toloka.client.project import Project
+from toloka.client.project.field_spec import FieldSpec, StringSpec
+
+
+@pytest.fixture
+def assignment_map():
+    return {
+        'id': 'assignment-i1d',
+        'status': 'ACCEPTED',
+        'reward': Decimal('0.05'),
+        'created': '2015-12-15T14:52:00',
+        'tasks': [{'pool_id': '21', 'input_values': {'image': 'http://images.com/1.png'}}],
+        'solutions': [{'output_values': {'color': 'white'}}],
+        'unknown_field': 'value',
+    }
+
+
+def test_fields_structured_on_access(assignment_map):
+    lazy = LazyObject(Assignment, assignment_map)
+    assert {} == lazy._values
+
+    tasks = lazy.tasks
+    assert [structure(assignment_map['tasks'][0], Task)] == tasks
+    assert tasks is lazy.tasks
+    assert ['tasks'] == list(lazy._values)
+
+    assert Assignment.ACCEPTED == lazy.status
+    assert lazy.pool_id is None
+    assert 'value' == lazy.unknown_field
+    with pytest.raises(AttributeError):
+        lazy.missing_field
+    with pytest.raises(AttributeError):
+        lazy.status = Assignment.REJECTED
+
+
+def test_required_fields_structured():
+    lazy = LazyObject(Project, {'public_name': 'Project', 'assignments_issuing_type': 'AUTOMATED'})
+    assert Project.AssignmentsIssuingType.AUTOMATED is lazy.assignments_issuing_type
+    assert 'Project' == lazy.public_name
+    with pytest.raises(AttributeError):
+        lazy._unexpected
+
+    lazy = LazyObject(MixerConfig, {'real_tasks_count': 3, 'golden_tasks_count': 1})
+    assert 3 == lazy.real_tasks_count
+    assert lazy.training_tasks_count is None
+
+
+def test_unstructure_and_structure(assignment_map):
+    lazy = LazyObject(Assignment, assignment_map)
+    assert assignment_map is unstructure(lazy)
+
+    lazy.tasks[0].input_values['image'] = 'http://images.com/2.png'
+    data = unstructure(lazy)
+    assert 'http://images.com/2.png' == data['tasks'][0]['input_values']['image']
+    assert 'http://images.com/1.png' == assignment_map['tasks'][0]['input_values']['image']
+    assert structure(data, Assignment) == lazy.structure()
+
+
+def test_variant_type():
+    lazy = LazyObject(FieldSpec, {'type': 'string', 'required': True, 'max_length': 10})
+    assert StringSpec is lazy.type_
+    assert 10 == lazy.max_length
+    assert StringSpec(required=True, max_length=10) == lazy.structure()
+
+
+@pytest.mark.parametrize('data', [{'type': 'unknown'}, {'required': True}])
+def test_unknown_variant_type(data):
+    with pytest.raises(SpecClassIdentificationError):
+        LazyObject(FieldSpec, data)
+
+
+def test_nested_variant_type():
+    class Kind(Enum):
+        OUTER = 'outer'
+
+    class InnerKind(Enum):
+        INNER = 'inner'
+
+    class Base(BaseTolokaObject, spec_enum=Kind, spec_field='kind'):
+        pass
+
+    class Middle(Base, spec_value=Kind.OUTER, spec_enum=InnerKind, spec_field='inner_kind'):
+        pass
+
+    class Leaf(Middle, spec_value=InnerKind.INNER):
+        value: int
+
+    lazy = LazyObject(Base, {'kind': 'outer', 'inner_kind': 'inner', 'value': 1})
+    assert Leaf is lazy.type_
+    assert 1 == lazy.value
+    assert Leaf(value=1) == lazy.structure()
+
+    with pytest.raises(SpecClassIdentificationError):
+        LazyObject(Base, {'kind': 'outer', 'value': 1})
+
+
+def test_pickle(assignment_map):
+    lazy = LazyObject(Assignment, assignment_map)
+    assert lazy == pickle.loads(pickle.dumps(lazy))
@@ -0,0 +1,80 @@
+import pickle
+import threading
+import time
+
+import pytest
+from toloka.client import TolokaClient
+from toloka.client.primitives.rate_limiter import RateLimiter, TokenBucket
+
+
+def test_token_bucket_smooths_bursts():
+    bucket = TokenBucket(100, capacity=2)
+    delays = [bucket.reserve() for _ in range(5)]
+    assert [0.0, 0.0] == delays[:2]
+    assert delays[2:] == pytest.approx([0.01, 0.02, 0.03], abs=0.005)
+    assert bucket.tokens == pytest.approx(-3, abs=0.5)
+
+
+def test_token_bucket_refill():
+    bucket = TokenBucket(1000, capacity=5)
+    for _ in range(5):
+        bucket.reserve()
+    time.sleep(0.02)
+    assert 5 == bucket.tokens
+
+
+def test_token_bucket_is_thread_safe():
+    bucket = TokenBucket(1, interval=3600, capacity=100)
+    threads = [threading.Thread(target=lambda: [bucket.reserve() for _ in range(100)]) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert bucket.tokens == pytest.approx(-900, abs=0.1)
+
+
+def test_token_bucket_pickle():
+    bucket = TokenBucket(10, capacity=3)
+    bucket.reserve()
+    restored = pickle.loads(pickle.dumps(bucket))
+    assert 10 == restored.rate
+    assert restored.tokens == pytest.approx(2, abs=0.5)
+
+
+@pytest.mark.parametrize(
+    ['method', 'path', 'expected_families'],
+    [
+        ('post', '/v1/tasks', ['POST tasks', 'tasks', '*']),
+        ('get', '/v1/assignments/1', ['GET assignments', 'assignments', '*']),
+        ('GET', '/v1/requester', ['GET requester', 'requester', '*']),
+    ]
+)
+def test_rate_limiter_families(method, path, expected_families):
+    assert expected_families == RateLimiter.get_families(method, path)
+
+
+def test_rate_limiter_matches_all_families():
+    rate_limiter = RateLimiter({
+        'POST tasks': TokenBucket(1, capacity=2),
+        'tasks': [TokenBucket(1, capacity=3), TokenBucket(1, capacity=10)],
+        '*': TokenBucket(1, capacity=4),
+        'GET assignments': TokenBucket(1, capacity=5),
+    })
+    assert 0 == rate_limiter.reserve('POST', '/v1/tasks')
+    assert 0 == rate_limiter.reserve('GET', '/v1/tasks/1')
+    assert 0 == rate_limiter.reserve('POST', '/v1/tasks')
+    assert rate_limiter.reserve('POST', '/v1/tasks') == pytest.approx(1, abs=0.01)
+    tokens = {family: [round(level) for level in levels] for family, levels in rate_limiter.tokens.items()}
+    assert {'POST tasks': [-1], 'tasks': [-1, 6], '*': [0], 'GET assignments': [5]} == tokens
+
+
+def test_client_requests_are_limited(requests_mock, toloka_url):
+    requests_mock.get(f'{toloka_url}/requester', json={'id': '1', 'balance': 10})
+    rate_limiter = RateLimiter({'GET requester': TokenBucket(50, capacity=1)})
+    toloka_client = TolokaClient('fake-token', 'SANDBOX', rate_limiter=rate_limiter)
+
+    start = time.monotonic()
+    for _ in range(6):
+        toloka_client.get_requester()
+    assert time.monotonic() - start >= 0.09
+    assert 6 == requests_mock.call_count
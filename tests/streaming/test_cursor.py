@@ -1,6 +1,7 @@
 import asyncio
 import inspect
 import itertools
+import threading
 import pytest
 
 from toloka.client import unstructure
@@ -12,6 +13,7 @@ from toloka.streaming.cursor import (
     UserBonusCursor,
     UserSkillCursor,
 )
+from toloka.streaming.storage import BaseStorage
 from ..testutils.backend_mock import BackendSearchMock
 
 
@@ -168,6 +170,108 @@ def test_cursor_iter_different_chunk_size(toloka_client, mocked_backend_for_user
     ], key=str) == sorted(unstructure(list(cursor)), key=str)
 
 
+def fetch_batches_sync(cursor, batch_size, fail_at):
+    batches = []
+    while True:
+        try:
+            with cursor.try_fetch_all(batch_size=batch_size) as fetched:
+                if len(batches) == fail_at:
+                    fail_at = None
+                    raise RuntimeError
+        except RuntimeError:
+            continue
+        if not fetched:
+            return batches
+        batches.append(unstructure(fetched))
+
+
+def fetch_batches_async(cursor, batch_size, fail_at):
+    async def _fetch():
+        nonlocal fail_at
+        batches = []
+        while True:
+            try:
+                async with cursor.try_fetch_all(batch_size=batch_size) as fetched:
+                    if len(batches) == fail_at:
+                        fail_at = None
+                        raise RuntimeError
+            except RuntimeError:
+                continue
+            if not fetched:
+                return batches
+            batches.append(unstructure(fetched))
+
+    return asyncio.get_event_loop().run_until_complete(_fetch())
+
+
+@pytest.mark.parametrize(
+    ['fetcher', 'batch_size'],
+    itertools.product((fetch_batches_sync, fetch_batches_async), range(1, 6))
+)
+def test_cursor_try_fetch_all_batches(
+    toloka_client, mocked_backend_for_user_bonus, user_bonus_existing, fetcher, batch_size
+):
+    mocked_backend_for_user_bonus.storage.extend(user_bonus_existing)
+    cursor = UserBonusCursor(toloka_client=toloka_client)
+
+    # The failed batch is fetched again.
+    batches = fetcher(cursor, batch_size, fail_at=1)
+    assert all(len(batch) <= batch_size for batch in batches)
+    assert [
+        {'user_bonus': item, 'event_time': item['created']}
+        for item in user_bonus_existing
+    ] == [event for batch in batches for event in batch]
+    assert [] == list(cursor)
+    # Only ids at the time bound are kept.
+    assert cursor._seen_ids <= {'N', 'O', 'P', 'F', 'G', 'H'}
+
+
+class ThreadRecordingStorage(BaseStorage):
+    def __init__(self):
+        self.states = {}
+        self.save_threads = []
+
+    def load(self, key):
+        return self.states.get(key)
+
+    def save(self, key, state):
+        self.save_threads.append(threading.get_ident())
+        self.states[key] = state
+
+
+@pytest.mark.parametrize('fetcher', [fetch_batches_sync, fetch_batches_async])
+def test_cursor_try_fetch_all_storage(toloka_client, mocked_backend_for_user_bonus, user_bonus_existing, fetcher):
+    mocked_backend_for_user_bonus.storage.extend(user_bonus_existing)
+    storage = ThreadRecordingStorage()
+    batches = fetcher(UserBonusCursor(toloka_client=toloka_client, storage=storage), 4, fail_at=None)
+    assert len(user_bonus_existing) == sum(len(batch) for batch in batches)
+    # The async cursor doesn't block the event loop with storage I/O
+    main_thread = threading.get_ident()
+    assert storage.save_threads
+    if fetcher is fetch_batches_sync:
+        assert all(thread == main_thread for thread in storage.save_threads)
+    else:
+        assert all(thread != main_thread for thread in storage.save_threads)
+
+    # The saved state is restored by a new cursor
+    assert [] == fetcher(UserBonusCursor(toloka_client=toloka_client, storage=storage), 4, fail_at=None)
+
+
+@pytest.mark.parametrize(
+    ['fetcher', 'prefetch_pages'],
+    itertools.product((fetch_sync, fetch_async), (1, 3))
+)
+def test_cursor_iter_prefetch(toloka_client, mocked_backend_for_user_bonus, user_bonus_existing, fetcher, prefetch_pages):
+    mocked_backend_for_user_bonus.storage.extend(user_bonus_existing)
+    mocked_backend_for_user_bonus.limit = 1
+    cursor = UserBonusCursor(toloka_client=toloka_client, prefetch_pages=prefetch_pages)
+    assert sorted([
+        {'user_bonus': item, 'event_time': item['created']}
+        for item in user_bonus_existing
+    ], key=str) == sorted(fetcher(cursor), key=str)
+    assert [] == fetcher(cursor)
+
+
 def test_assignment_cursor(requests_mock, toloka_url, toloka_client):
     backend_data = [
         {'pool_id': '100', 'id': 'A', 'submitted': '2020-01-01T01:01:01'},
@@ -228,14 +332,25 @@ def test_user_skill_cursor(requests_mock, toloka_url, toloka_client, chunk_size,
 
 
 @pytest.mark.parametrize(
-    ['object_class', 'async_to_sync_differencies'],
+    ['iter_method', 'aiter_method', 'async_to_sync_differencies'],
     [
         (
-            _ByIdCursor,
+            _ByIdCursor._iter_pages,
+            _ByIdCursor._aiter_pages,
             {'await ensure_async(self.fetcher)': 'self.fetcher'}
         ),
         (
-            BaseCursor,
+            _ByIdCursor.__iter__,
+            _ByIdCursor.__aiter__,
+            {
+                'aiterate_concurrently([self._aiter_pages]': 'iterate_concurrently([self._iter_pages]',
+                'self._aiter_pages()': 'self._iter_pages()',
+                'async for response': 'for response',
+            }
+        ),
+        (
+            BaseCursor.__iter__,
+            BaseCursor.__aiter__,
             {
                 'await ensure_async(fetcher)': 'fetcher',
                 'async for item in _ByIdCursor': 'for item in _ByIdCursor',
@@ -243,12 +358,12 @@ def test_user_skill_cursor(requests_mock, toloka_url, toloka_client, chunk_size,
         ),
     ]
 )
-def test_exact_iter_and_aiter_code(object_class, async_to_sync_differencies):
+def test_exact_iter_and_aiter_code(iter_method, aiter_method, async_to_sync_differencies):
     def get_func_body(func):
         return '\n'.join(inspect.getsource(func).rstrip().split('\n')[1:])
 
-    iter_code = get_func_body(object_class.__iter__)
-    aiter_code = get_func_body(object_class.__aiter__)
+    iter_code = get_func_body(iter_method)
+    aiter_code = get_func_body(aiter_method)
     for async_version, sync_version in async_to_sync_differencies.items():
         aiter_code = aiter_code.replace(async_version, sync_version)
 
@@ -1,10 +1,29 @@
+import aiohttp
 import asyncio
 import datetime
+import functools
+import hashlib
+import hmac
+import json
+import os
+import pickle
 import pytest
+import threading
+from concurrent import futures
 
-from toloka.client import unstructure
-from toloka.util.async_utils import ComplexException, AsyncMultithreadWrapper
-from toloka.streaming import AssignmentsObserver, PoolStatusObserver, Pipeline
+from toloka.client import Assignment, structure, unstructure
+from toloka.util.async_utils import AsyncInterfaceWrapper, ComplexException, AsyncMultithreadWrapper
+from toloka.streaming import (
+    AssignmentsObserver,
+    MultiPoolAssignmentsObserver,
+    PoolStatusObserver,
+    Pipeline,
+    WebhookAssignmentsObserver,
+)
+from toloka.streaming.event import AssignmentEvent
+from toloka.streaming.observer import BaseObserver
+from toloka.streaming.pipeline import PollingSchedule, _PoolsResumeChecker
+from toloka.streaming.storage import JSONLocalStorage
 
 from ..testutils.backend_mock import BackendSearchMock
 
@@ -68,6 +87,361 @@ def test_pipeline_errored_callback(requests_mock, toloka_url, toloka_client, exi
     assert events_expected == unstructure(handler.received)
 
 
+@pytest.mark.parametrize('batch_size', [1, 2, 3, 100])
+def test_assignments_observer_batch_size(requests_mock, toloka_url, toloka_client, existing_backend_assignments,
+                                         batch_size):
+    storage = [item for item in existing_backend_assignments if item['status'] != 'ACTIVE']
+    backend = BackendSearchMock(storage, limit=3)
+    requests_mock.get(f'{toloka_url}/assignments', json=backend)
+
+    batches = []
+    observer = AssignmentsObserver(toloka_client, pool_id='100', batch_size=batch_size)
+    observer.on_submitted(lambda events: batches.append(unstructure([event.assignment for event in events])))
+    asyncio.get_event_loop().run_until_complete(observer())
+
+    assert all(0 < len(batch) <= batch_size for batch in batches)
+    assert storage == [item for batch in batches for item in batch]
+
+
+@pytest.mark.parametrize('concurrency', [1, 3])
+def test_assignments_observer_staged(requests_mock, toloka_url, toloka_client, existing_backend_assignments,
+                                     concurrency):
+    storage = [item for item in existing_backend_assignments if item['status'] != 'ACTIVE']
+    backend = BackendSearchMock(storage, limit=3)
+    requests_mock.get(f'{toloka_url}/assignments', json=backend)
+
+    batches = []
+    running = 0
+    max_running = 0
+
+    async def handler(events):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        # Later batches are handled faster, so they are acknowledged out of order
+        await asyncio.sleep(0.01 * (len(storage) - len(batches)))
+        batches.append(unstructure([event.assignment for event in events]))
+        running -= 1
+
+    observer = AssignmentsObserver(toloka_client, pool_id='100', batch_size=2, queue_size=2, concurrency=concurrency)
+    observer.on_submitted(handler)
+    assert len(storage) == asyncio.get_event_loop().run_until_complete(observer())
+    assert concurrency == max_running
+    assert all(0 < len(batch) <= 2 for batch in batches)
+    assert sorted(storage, key=lambda item: item['id']) == sorted(
+        (item for batch in batches for item in batch), key=lambda item: item['id'],
+    )
+
+    batches.clear()
+    assert 0 == asyncio.get_event_loop().run_until_complete(observer())
+    assert [] == batches
+
+
+def test_assignments_observer_staged_errored_callback(requests_mock, toloka_url, toloka_client,
+                                                      existing_backend_assignments):
+    storage = [item for item in existing_backend_assignments if item['status'] != 'ACTIVE']
+    backend = BackendSearchMock(storage, limit=3)
+    requests_mock.get(f'{toloka_url}/assignments', json=backend)
+
+    received = []
+    fail_on = {'N'}
+
+    async def handler(events):
+        ids = [event.assignment.id for event in events]
+        if fail_on.intersection(ids):
+            fail_on.clear()
+            raise ValueError('Raised from callback')
+        received.extend(ids)
+
+    observer = AssignmentsObserver(toloka_client, pool_id='100', batch_size=2, queue_size=1)
+    observer.on_submitted(handler)
+    with pytest.raises(ComplexException, match='Raised from callback'):
+        asyncio.get_event_loop().run_until_complete(observer())
+    assert ['K', 'L'] == received
+
+    # The failed batch and the batches fetched ahead of it are passed again
+    assert len(storage) - 2 == asyncio.get_event_loop().run_until_complete(observer())
+    assert [item['id'] for item in storage] == received
+
+
+def test_assignments_observer_staged_requires_batch_size(toloka_client):
+    with pytest.raises(ValueError):
+        AssignmentsObserver(toloka_client, pool_id='100', queue_size=2)
+
+
+def _write_handled_ids(path, events):
+    # Module-level, so it can be pickled for a process pool
+    with open(path, 'a') as file:
+        for event in events:
+            file.write(f'{os.getpid()} {threading.get_ident()} {event.assignment.id}\n')
+
+
+@pytest.mark.parametrize('executor_type', [futures.ThreadPoolExecutor, futures.ProcessPoolExecutor])
+def test_assignments_observer_callback_executor(requests_mock, toloka_url, toloka_client, existing_backend_assignments,
+                                                tmp_path, executor_type):
+    storage = [item for item in existing_backend_assignments if item['status'] != 'ACTIVE']
+    backend = BackendSearchMock(storage, limit=3)
+    requests_mock.get(f'{toloka_url}/assignments', json=backend)
+
+    path = tmp_path / 'handled.txt'
+    observer = AssignmentsObserver(toloka_client, pool_id='100', batch_size=3)
+    with executor_type(max_workers=1) as executor:
+        observer.on_submitted(functools.partial(_write_handled_ids, str(path)), executor=executor)
+        assert len(storage) == asyncio.get_event_loop().run_until_complete(observer())
+
+    handled = [line.split() for line in path.read_text().splitlines()]
+    assert [item['id'] for item in storage] == [assignment_id for _, _, assignment_id in handled]
+    if executor_type is futures.ProcessPoolExecutor:
+        assert all(int(pid) != os.getpid() for pid, _, _ in handled)
+    else:
+        assert all(int(thread_id) != threading.get_ident() for _, thread_id, _ in handled)
+
+
+def test_assignments_observer_async_callback_executor(toloka_client):
+    async def callback(events):
+        pass
+
+    observer = AssignmentsObserver(toloka_client, pool_id='100')
+    with pytest.raises(ValueError):
+        observer.on_submitted(callback, executor=futures.ThreadPoolExecutor(max_workers=1))
+
+
+def test_assignment_events_pickle(existing_backend_assignments):
+    events = [
+        AssignmentEvent(event_type='SUBMITTED', event_time=item['submitted'], assignment=structure(item, Assignment))
+        for item in existing_backend_assignments if item['status'] == 'SUBMITTED'
+    ]
+    assert events == pickle.loads(pickle.dumps(events))
+
+
+def test_webhook_assignments_observer(requests_mock, toloka_url, toloka_client, existing_backend_assignments,
+                                      new_backend_assignments):
+    storage = [item for item in existing_backend_assignments if item['status'] != 'ACTIVE']
+    existing_ids = [item['id'] for item in storage]
+    backend = BackendSearchMock(storage, limit=3)
+    requests_mock.get(f'{toloka_url}/assignments', json=backend)
+    for item in new_backend_assignments:
+        requests_mock.get(f'{toloka_url}/assignments/{item["id"]}', json=item)
+    # Deliveries that don't match the actual assignments
+    requests_mock.get(f'{toloka_url}/assignments/Y', json={'pool_id': '200', 'id': 'Y', 'status': 'SUBMITTED',
+                                                            'submitted': '2020-01-01T01:01:05'})
+    requests_mock.get(f'{toloka_url}/assignments/Z', json={'pool_id': '100', 'id': 'Z', 'status': 'ACTIVE'})
+    pool = {'id': '100', 'status': 'OPEN'}
+    requests_mock.get(f'{toloka_url}/pools/100', json=lambda request, context: pool)
+
+    with pytest.raises(ValueError):
+        WebhookAssignmentsObserver(toloka_client, pool_id='100', host='0.0.0.0')
+
+    received = []
+    observer = WebhookAssignmentsObserver(toloka_client, pool_id='100', host='127.0.0.1', port=0, secret_key='secret',
+                                          sweep_period=datetime.timedelta(hours=1))
+    observer.on_submitted(lambda events: received.extend(event.assignment.id for event in events))
+
+    async def deliver(events, secret_key='secret'):
+        # A fake sender of Toloka webhooks
+        body = json.dumps({'events': events}).encode()
+        signature = hmac.new(secret_key.encode(), body, hashlib.sha256).hexdigest()
+        host, port = observer.addresses[0][:2]
+        async with aiohttp.ClientSession() as session:
+            async with session.post(f'http://{host}:{port}/', data=body,
+                                    headers={'Toloka-Signature': signature}) as response:
+                return response.status
+
+    def submitted(assignment_id, pool_id='100'):
+        return {'event_type': 'ASSIGNMENT_SUBMITTED', 'pool_id': pool_id, 'assignment_id': assignment_id,
+                'event_time': '2020-01-01T01:01:05'}
+
+    async def scenario():
+        try:
+            # The first call fetches the existing events
+            assert len(storage) == await observer()
+            assert existing_ids == received
+            search_count = len(backend.responses)
+
+            assert 401 == await deliver([submitted('C')], secret_key='wrong')
+            assert 200 == await deliver([submitted('C'), submitted('C'), submitted('K'), submitted('X', pool_id='200')])
+            assert 200 == await deliver([submitted('Y'), submitted('Z')])
+            assert 200 == await deliver([submitted('C')])
+            assert existing_ids + ['C'] == received
+            assert 1 == await observer()
+            assert search_count == len(backend.responses)
+            # The pool status is checked along with sweeps only
+            pool_requests = [request for request in requests_mock.request_history if request.path.endswith('/pools/100')]
+            assert 1 == len(pool_requests)
+
+            # The closed pool is found by the next sweep, then every call fetches undelivered events, but skips
+            # delivered ones
+            pool['status'] = 'CLOSED'
+            backend.storage.extend(new_backend_assignments)
+            assert not await observer.should_resume()
+            search_count = len(backend.responses)
+            assert 0 == await observer()
+            assert search_count == len(backend.responses)
+            observer._last_sweep_time -= 3600
+            assert 1 == await observer()
+            assert existing_ids + ['C', 'D'] == received
+            search_count = len(backend.responses)
+            assert 0 == await observer()
+            assert search_count < len(backend.responses)
+        finally:
+            await observer.stop()
+
+    asyncio.get_event_loop().run_until_complete(scenario())
+    assert [] == observer.addresses
+
+
+def test_webhook_assignments_observer_push_during_sweep(requests_mock, toloka_url, toloka_client,
+                                                        new_backend_assignments):
+    backend = BackendSearchMock([], limit=3)
+    requests_mock.get(f'{toloka_url}/assignments', json=backend)
+    for item in new_backend_assignments:
+        requests_mock.get(f'{toloka_url}/assignments/{item["id"]}', json=item)
+    requests_mock.get(f'{toloka_url}/pools/100', json={'id': '100', 'status': 'CLOSED'})
+
+    received = []
+    observer = WebhookAssignmentsObserver(toloka_client, pool_id='100', port=0)
+
+    async def scenario():
+        pushed_started = asyncio.Event()
+        sweep_finished = asyncio.Event()
+
+        async def handle(events):
+            received.extend(event.assignment.id for event in events)
+            if not pushed_started.is_set():
+                pushed_started.set()
+                await sweep_finished.wait()
+
+        observer.on_submitted(handle)
+        try:
+            assert 0 == await observer()
+            host, port = observer.addresses[0][:2]
+            event = {'event_type': 'ASSIGNMENT_SUBMITTED', 'pool_id': '100', 'assignment_id': 'C',
+                     'event_time': '2020-01-01T01:01:05'}
+            async with aiohttp.ClientSession() as session:
+                delivery = asyncio.ensure_future(session.post(f'http://{host}:{port}/', json={'events': [event]}))
+                await pushed_started.wait()
+                # The assignment being handled after the push is skipped by the sweep
+                backend.storage.extend(new_backend_assignments)
+                assert 1 == await observer()
+                sweep_finished.set()
+                async with await delivery as response:
+                    assert 200 == response.status
+            assert 1 == await observer()
+        finally:
+            await observer.stop()
+
+    asyncio.get_event_loop().run_until_complete(scenario())
+    assert ['C', 'D'] == received
+
+
+@pytest.fixture
+def multi_pool_backend_assignments():
+    return [
+        {'pool_id': '100', 'id': 'K', 'submitted': '2020-01-01T01:01:01', 'status': 'SUBMITTED'},
+        {'pool_id': '200', 'id': 'L', 'submitted': '2020-01-01T01:01:01', 'status': 'SUBMITTED'},
+        {'pool_id': '300', 'id': 'M', 'submitted': '2020-01-01T01:01:02', 'status': 'SUBMITTED'},
+        {'pool_id': '100', 'id': 'N', 'submitted': '2020-01-01T01:01:03', 'status': 'SUBMITTED'},
+        {'pool_id': '200', 'id': 'O', 'submitted': '2020-01-01T01:01:03', 'status': 'SUBMITTED'},
+        {'pool_id': '100', 'id': 'P', 'submitted': '2020-01-01T01:01:04', 'status': 'SUBMITTED'},
+    ]
+
+
+@pytest.mark.parametrize('observed', [{'pool_ids': ['100', '200']}, {'project_id': '10'}])
+def test_multi_pool_assignments_observer(requests_mock, toloka_url, toloka_client, multi_pool_backend_assignments,
+                                         observed):
+    backend = BackendSearchMock(multi_pool_backend_assignments, limit=2)
+    requests_mock.get(f'{toloka_url}/assignments', json=backend)
+    for pool_id, project_id, created in (('100', '10', '2020-01-01T01:01:01'), ('200', '10', '2020-01-01T00:00:00'),
+                                         ('300', '20', '2019-01-01T00:00:00')):
+        requests_mock.get(f'{toloka_url}/pools/{pool_id}',
+                          json={'id': pool_id, 'project_id': project_id, 'created': created})
+    requests_mock.get(f'{toloka_url}/projects/10', json={'id': '10', 'created': '2020-01-01T00:00:00'})
+
+    received = {'100': [], '200': [], None: []}
+    observer = MultiPoolAssignmentsObserver(toloka_client, **observed)
+    for pool_id, events in received.items():
+        observer.on_submitted(lambda new, events=events: events.extend(event.assignment.id for event in new), pool_id)
+    asyncio.get_event_loop().run_until_complete(observer())
+
+    assert {'100': ['K', 'N', 'P'], '200': ['L', 'O'], None: ['K', 'L', 'N', 'O', 'P']} == received
+    assignment_requests = [request for request in requests_mock.request_history if request.path.endswith('/assignments')]
+    assert len(backend.responses) == len(assignment_requests)
+    assert all('pool_id' not in request.qs for request in assignment_requests)
+    # Requests start from the creation of the project or the earliest pool, not from the whole requester's history
+    assert ['2020-01-01t00:00:00'] == assignment_requests[0].qs['submitted_gte']
+    pool_requests = [request for request in requests_mock.request_history if '/pools/' in request.path]
+    assert (3 if 'project_id' in observed else 2) == len(pool_requests)
+
+    backend.storage.append({'pool_id': '200', 'id': 'A', 'submitted': '2020-01-01T01:01:05', 'status': 'SUBMITTED'})
+    asyncio.get_event_loop().run_until_complete(observer())
+    assert ['L', 'O', 'A'] == received['200']
+    # The start time is requested once
+    assert pool_requests == [request for request in requests_mock.request_history if '/pools/' in request.path]
+
+
+def test_multi_pool_assignments_observers_share_storage(requests_mock, toloka_url, toloka_client, tmp_path,
+                                                        multi_pool_backend_assignments):
+    backend = BackendSearchMock(multi_pool_backend_assignments, limit=2)
+    requests_mock.get(f'{toloka_url}/assignments', json=backend)
+    storage = JSONLocalStorage(str(tmp_path))
+
+    def observe(pool_ids):
+        received = []
+        observer = MultiPoolAssignmentsObserver(toloka_client, pool_ids=pool_ids, storage=storage)
+        observer.on_submitted(lambda events: received.extend(event.assignment.id for event in events))
+        asyncio.get_event_loop().run_until_complete(observer())
+        return received
+
+    assert ['K', 'N', 'P'] == observe(['100'])
+    # The state of another pools set doesn't affect the observer
+    assert ['L', 'O'] == observe(['200'])
+    assert [] == observe(['100'])
+    assert [] == observe(['200'])
+
+
+def test_multi_pool_assignments_observer_start_time(requests_mock, toloka_url, toloka_client,
+                                                    multi_pool_backend_assignments):
+    backend = BackendSearchMock(multi_pool_backend_assignments, limit=2)
+    requests_mock.get(f'{toloka_url}/assignments', json=backend)
+
+    received = []
+    observer = MultiPoolAssignmentsObserver(toloka_client, pool_ids=['100', '200'],
+                                            start_time=datetime.datetime(2020, 1, 1, 1, 1, 3))
+    observer.on_submitted(lambda events: received.extend(event.assignment.id for event in events))
+    asyncio.get_event_loop().run_until_complete(observer())
+
+    assert ['N', 'O', 'P'] == received
+    assert not [request for request in requests_mock.request_history if '/pools/' in request.path]
+
+
+def test_multi_pool_assignments_observer_should_resume(requests_mock, toloka_url, toloka_client):
+    open_pools = {'items': [], 'has_more': False}
+    requests_mock.get(
+        f'{toloka_url}/pools',
+        [
+            {'json': open_pools},
+            {'json': {'items': [{'id': '100', 'status': 'CLOSED'}], 'has_more': True}},
+            {'json': {'items': [{'id': '200', 'status': 'CLOSED'}], 'has_more': False}},
+        ],
+    )
+    requests_mock.get(f'{toloka_url}/assignments?pool_id=100', json={'items': [], 'has_more': False})
+    requests_mock.get(f'{toloka_url}/assignments?pool_id=200', json={'items': [{'id': 'A'}], 'has_more': False})
+
+    observer = MultiPoolAssignmentsObserver(toloka_client, project_id='10')
+    assert asyncio.get_event_loop().run_until_complete(observer.should_resume())
+    pools_requests = [request.qs for request in requests_mock.request_history if request.path.endswith('/pools')]
+    assert [
+        {'project_id': ['10'], 'status': ['open'], 'limit': ['1']},
+        {'project_id': ['10'], 'status': ['closed'], 'sort': ['id']},
+        {'project_id': ['10'], 'status': ['closed'], 'sort': ['id'], 'id_gt': ['100']},
+    ] == pools_requests
+
+    with pytest.raises(ValueError):
+        MultiPoolAssignmentsObserver(toloka_client)
+    with pytest.raises(ValueError):
+        MultiPoolAssignmentsObserver(toloka_client, pool_ids=['100']).on_submitted(lambda events: None, '200')
+
+
 @pytest.mark.parametrize('use_async', [False, True])
 def test_pipeline(requests_mock, toloka_url, toloka_client, existing_backend_assignments, new_backend_assignments, use_async):
     pool_mock = {'id': '100', 'status': 'OPEN'}
@@ -128,3 +502,110 @@ def test_pipeline(requests_mock, toloka_url, toloka_client, existing_backend_ass
         'pool open with active tasks count: 1',
         'pool closed with reason: EXPIRED',
     ] == save_pool_info_here
+
+
+def test_polling_schedule():
+    schedule = PollingSchedule(
+        min_period=datetime.timedelta(seconds=1),
+        max_period=datetime.timedelta(seconds=10),
+        backoff=3,
+        jitter=0.1,
+    )
+    periods = [None]
+    for handled in (0, 0, 0, 0, 5, 0):
+        periods.append(schedule.get_next_period(periods[-1], handled))
+    assert [1, 3, 9, 10, 1, 3] == periods[1:]
+    assert all(0.9 <= schedule.get_delay(1) <= 1.1 for _ in range(100))
+
+    with pytest.raises(ValueError):
+        PollingSchedule(min_period=datetime.timedelta(seconds=2), max_period=datetime.timedelta(seconds=1))
+
+
+def test_pipeline_adaptive_schedule():
+
+    class ObserverStub(BaseObserver):
+        def __init__(self, handled):
+            self.handled = list(handled)
+            self.call_times = []
+
+        async def __call__(self):
+            self.call_times.append(asyncio.get_event_loop().time())
+            return self.handled.pop(0) if self.handled else 0
+
+        async def should_resume(self):
+            return bool(self.handled)
+
+    active = ObserverStub([1] * 12)
+    idle = ObserverStub([])
+    pipeline = Pipeline(schedule=PollingSchedule(
+        min_period=datetime.timedelta(milliseconds=20),
+        max_period=datetime.timedelta(milliseconds=160),
+        jitter=0,
+    ))
+    pipeline.register(active)
+    pipeline.register(idle)
+    asyncio.get_event_loop().run_until_complete(pipeline.run())
+
+    assert 12 == len(active.call_times)
+    # The idle observer backs off: 20, 40, 80, 160 ms, and is called once more after the active one stops.
+    idle_periods = [end - start for start, end in zip(idle.call_times, idle.call_times[1:])]
+    assert pytest.approx([0.02, 0.04, 0.08], abs=0.01) == idle_periods[:3]
+    assert idle.call_times[-1] >= active.call_times[-1]
+    assert len(idle.call_times) < len(active.call_times)
+
+
+@pytest.fixture
+def observed_pools_mock(requests_mock, toloka_url):
+    pools = [
+        {'id': '100', 'project_id': '10', 'status': 'CLOSED'},
+        {'id': '150', 'project_id': '20', 'status': 'OPEN'},
+        {'id': '200', 'project_id': '10', 'status': 'CLOSED'},
+        {'id': '300', 'project_id': '10', 'status': 'ARCHIVED'},
+    ]
+    requests_mock.get(f'{toloka_url}/pools', json={'items': pools, 'has_more': False})
+    requests_mock.get(f'{toloka_url}/pools/400', json={'id': '400', 'project_id': '10', 'status': 'CLOSED'})
+    return pools
+
+
+def test_pools_resume_checker(requests_mock, toloka_url, toloka_client, observed_pools_mock):
+    backend = BackendSearchMock([{'pool_id': '200', 'id': 'A', 'created': '2020-01-01T01:01:01', 'status': 'ACTIVE'}])
+    requests_mock.get(f'{toloka_url}/assignments', json=backend)
+
+    checker = _PoolsResumeChecker(AsyncInterfaceWrapper(toloka_client), ['100', '200', '300', '400'], max_age=60)
+
+    async def _check_all():
+        return [await checker.should_resume([pool_id]) for pool_id in ('100', '200', '300', '400')]
+
+    loop = asyncio.get_event_loop()
+    assert [False, True, False, False] == loop.run_until_complete(_check_all())
+    assert [False, True, False, False] == loop.run_until_complete(_check_all())
+    pools_requests = [request for request in requests_mock.request_history if request.path.endswith('/pools')]
+    assert [{'id_gte': ['100'], 'id_lte': ['400'], 'sort': ['id'], 'limit': ['300']}] == [
+        request.qs for request in pools_requests
+    ]
+    assert 1 == sum(request.path.endswith('/pools/400') for request in requests_mock.request_history)
+    # Archived pools can't have active assignments
+    assert [['100'], ['200'], ['400']] == sorted(
+        request.qs['pool_id'] for request in requests_mock.request_history if request.path.endswith('/assignments')
+    )
+
+    # Projects are known after the first check
+    checker._updated_at = None
+    loop.run_until_complete(_check_all())
+    pools_requests = [request for request in requests_mock.request_history if request.path.endswith('/pools')]
+    assert {'id_gte': ['100'], 'id_lte': ['400'], 'sort': ['id'], 'limit': ['300'], 'project_id': ['10']} == (
+        pools_requests[-1].qs
+    )
+
+
+def test_pipeline_resume_check_period(requests_mock, toloka_url, toloka_client, observed_pools_mock):
+    requests_mock.get(f'{toloka_url}/assignments', json={'items': [], 'has_more': False})
+
+    pipeline = Pipeline(datetime.timedelta(milliseconds=10), resume_check_period=datetime.timedelta(minutes=1))
+    for pool_id in ('100', '200', '300', '400'):
+        pipeline.register(AssignmentsObserver(toloka_client, pool_id=pool_id)).on_submitted(lambda events: None)
+    asyncio.get_event_loop().run_until_complete(pipeline.run())
+
+    pool_paths = [request.path for request in requests_mock.request_history if '/pools' in request.path]
+    assert ['/api/v1/pools', '/api/v1/pools/400'] == pool_paths
+
@@ -0,0 +1,54 @@
+import pytest
+
+from toloka.client import unstructure
+from toloka.streaming.cursor import UserBonusCursor
+from toloka.streaming.storage import JSONLocalStorage, SQLiteStorage
+from ..testutils.backend_mock import BackendSearchMock
+
+
+@pytest.fixture(params=['json', 'sqlite'])
+def storage(request, tmp_path):
+    if request.param == 'json':
+        return JSONLocalStorage(str(tmp_path / 'cursors'))
+    return SQLiteStorage(str(tmp_path / 'cursors.sqlite'))
+
+
+def test_storage_save_and_load(storage):
+    assert storage.load('key') is None
+    storage.save('key', {'request': {'created_gte': '2020-01-01T01:01:01'}, 'seen_ids': ['A']})
+    storage.save('other key', {'request': {}, 'seen_ids': []})
+    storage.save('key', {'request': {'created_gte': '2020-01-01T01:01:02'}, 'seen_ids': ['B', 'C']})
+    assert {'request': {'created_gte': '2020-01-01T01:01:02'}, 'seen_ids': ['B', 'C']} == storage.load('key')
+    assert {'request': {}, 'seen_ids': []} == storage.load('other key')
+
+
+def test_cursor_resumes_from_storage(requests_mock, toloka_url, toloka_client, storage):
+    backend = BackendSearchMock([
+        {'user_id': '001', 'id': 'K', 'created': '2020-01-01T01:01:01'},
+        {'user_id': '001', 'id': 'L', 'created': '2020-01-01T01:01:02'},
+        {'user_id': '001', 'id': 'M', 'created': '2020-01-01T01:01:02'},
+    ], limit=2)
+    requests_mock.get(f'{toloka_url}/user-bonuses', json=backend)
+
+    cursor = UserBonusCursor(toloka_client=toloka_client, storage=storage)
+    with cursor.try_fetch_all() as fetched:
+        assert ['K', 'L', 'M'] == [event.user_bonus.id for event in fetched]
+
+    # Not committed state is not saved.
+    backend.storage.append({'user_id': '002', 'id': 'N', 'created': '2020-01-01T01:01:02'})
+    with pytest.raises(RuntimeError):
+        with UserBonusCursor(toloka_client=toloka_client, storage=storage).try_fetch_all():
+            raise RuntimeError
+
+    # A new cursor with the same request continues from the last committed event.
+    backend.responses.clear()
+    restarted_cursor = UserBonusCursor(toloka_client=toloka_client, storage=storage)
+    assert unstructure(cursor._request) == unstructure(restarted_cursor._request)
+    with restarted_cursor.try_fetch_all() as fetched:
+        assert ['N'] == [event.user_bonus.id for event in fetched]
+    # The first request starts from the time of the last committed event, not from the beginning.
+    assert ['L', 'M'] == [item['id'] for item in backend.responses[0]['items']]
+
+    # Cursors with other requests have their own states.
+    other_cursor = UserBonusCursor(toloka_client=toloka_client, storage=storage, user_id='002')
+    assert ['N'] == [event.user_bonus.id for event in other_cursor]
@@ -1,4 +1,6 @@
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timedelta
 from operator import itemgetter
 from urllib.parse import urlparse, parse_qs
 from decimal import Decimal
@@ -6,6 +8,9 @@ from decimal import Decimal
 import pytest
 import simplejson
 import toloka.client as client
+from toloka.client.primitives.lazy import LazyObject
+
+from .testutils.backend_mock import BackendSearchMock
 
 
 @pytest.fixture
@@ -34,6 +39,17 @@ def test_get_assignment(requests_mock, toloka_client, toloka_url, assignment_map
     assert assignment_map == client.unstructure(result)
 
 
+@pytest.mark.parametrize('reward', [Decimal('0.05'), Decimal('0.1'), Decimal('12.34')])
+def test_get_assignment_fast_json(requests_mock, toloka_url, assignment_map, reward):
+    pytest.importorskip('orjson')
+    assignment_map['reward'] = reward
+    requests_mock.get(f'{toloka_url}/assignments/assignment-i1d', text=simplejson.dumps(assignment_map))
+    toloka_client = client.TolokaClient('fake-token', 'SANDBOX', fast_json=True)
+    result = toloka_client.get_assignment('assignment-i1d')
+    assert reward == result.reward
+    assert assignment_map == client.unstructure(result)
+
+
 def test_find_assignments(requests_mock, toloka_client, toloka_url, assignment_map):
     raw_result = {
         'items': [assignment_map],
@@ -120,6 +136,94 @@ def test_get_assignments(requests_mock, toloka_client, toloka_url, assignment_ma
     assert assignments == client.unstructure(list(result))
 
 
+def test_get_assignments_prefetch(requests_mock, toloka_url, assignment_map):
+    toloka_client = client.TolokaClient('fake-token', 'SANDBOX', prefetch_pages=2)
+    backend = BackendSearchMock([dict(assignment_map, id=f'assignment-i{i:02}d') for i in range(10)], limit=3)
+    threads = set()
+
+    def get_assignments(request, context):
+        threads.add(threading.get_ident())
+        return simplejson.dumps(backend(request, context))
+
+    requests_mock.get(f'{toloka_url}/assignments', text=get_assignments)
+
+    assert backend.storage == client.unstructure(list(toloka_client.get_assignments(pool_id='21')))
+    assert 4 == len(backend.responses)
+    assert {threading.get_ident()} != threads
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_get_assignments_parallel(requests_mock, toloka_client, toloka_url, assignment_map, ordered):
+    created = datetime(2015, 12, 15, 14, 52)
+    backend = BackendSearchMock(
+        [
+            dict(assignment_map, id=f'assignment-i{(i * 7) % 50:02}d', created=(created + timedelta(minutes=i)).isoformat())
+            for i in range(50)
+        ],
+        limit=3,
+    )
+    threads = set()
+
+    def get_assignments(request, context):
+        threads.add(threading.get_ident())
+        return simplejson.dumps(backend(request, context))
+
+    requests_mock.get(f'{toloka_url}/assignments', text=get_assignments)
+
+    result = list(toloka_client.get_assignments(pool_id='21', parallelism=4, ordered=ordered))
+    expected = sorted(backend.storage, key=itemgetter('id'))
+    if ordered:
+        assert expected == client.unstructure(result)
+    else:
+        assert expected == sorted(client.unstructure(result), key=itemgetter('id'))
+    assert len(threads) > 1
+
+    partitions = {
+        (request.qs.get('created_gte', [None])[0], request.qs.get('created_lt', [None])[0])
+        for request in requests_mock.request_history
+        if 'limit' not in request.qs
+    }
+    assert 4 == len(partitions)
+
+    # Producers of the next call run in the same threads, so their sessions are reused
+    pool = toloka_client._producer_pool
+    threads_count = len(pool)
+    deadline = time.monotonic() + 5
+    while pool._idle_count < threads_count and time.monotonic() < deadline:
+        time.sleep(0.01)
+    list(toloka_client.get_assignments(pool_id='21', parallelism=4, ordered=ordered))
+    assert threads_count == len(pool)
+
+
+def test_find_assignments_lazy(requests_mock, toloka_client, toloka_url, assignment_map):
+    raw_result = {'items': [assignment_map], 'has_more': False}
+    requests_mock.get(f'{toloka_url}/assignments', text=simplejson.dumps(raw_result))
+
+    result = toloka_client.find_assignments(pool_id='21', lazy=True)
+    assignment = result.items[0]
+    assert isinstance(assignment, LazyObject)
+    assert client.assignment.Assignment.ACCEPTED == assignment.status
+    assert {'color': 'white', 'comment': 'So белый'} == assignment.solutions[0].output_values
+    assert raw_result == client.unstructure(result)
+    assert client.structure(assignment_map, client.assignment.Assignment) == assignment.structure()
+
+
+def test_get_assignments_lazy_parallel(requests_mock, toloka_client, toloka_url, assignment_map):
+    created = datetime(2015, 12, 15, 14, 52)
+    backend = BackendSearchMock(
+        [
+            dict(assignment_map, id=f'assignment-i{i:02}d', created=(created + timedelta(minutes=i)).isoformat())
+            for i in range(20)
+        ],
+        limit=3,
+    )
+    requests_mock.get(f'{toloka_url}/assignments', text=lambda request, context: simplejson.dumps(backend(request, context)))
+
+    result = list(toloka_client.get_assignments(pool_id='21', parallelism=2, lazy=True))
+    assert all(isinstance(assignment, LazyObject) for assignment in result)
+    assert [item['id'] for item in backend.storage] == [assignment.id for assignment in result]
+
+
 def test_assignment_from_json(assignment_map):
     assignment = client.structure(assignment_map, client.assignment.Assignment)
     assignment_json = simplejson.dumps(assignment_map, use_decimal=True, ensure_ascii=True)
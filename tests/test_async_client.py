@@ -0,0 +1,563 @@
+import asyncio
+import datetime
+import ast
+import inspect
+import pickle
+import textwrap
+import threading
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+import simplejson
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import toloka.client as client
+from toloka.async_client import AsyncTolokaClient
+from toloka.streaming.cursor import AssignmentCursor
+
+from .testutils.backend_mock import BackendSearchMock
+
+
+@pytest.fixture
+def event_loop():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    loop.close()
+
+
+class FakeBackend:
+    """Route requests to handlers registered during the test by method and exact path."""
+
+    def __init__(self):
+        self.handlers = {}
+
+    def add(self, method, path, handler):
+        self.handlers[(method, path)] = handler
+
+    async def handle(self, request):
+        handler = self.handlers.get((request.method, request.path))
+        if handler is None:
+            return json_response({'code': 'DOES_NOT_EXIST', 'message': 'Not found'}, status=404)
+        return await handler(request)
+
+
+@pytest.fixture
+def backend():
+    return FakeBackend()
+
+
+@pytest.fixture
+def async_toloka_client(event_loop, backend):
+    app = web.Application()
+    app.router.add_route('*', '/{tail:.*}', backend.handle)
+    server = TestServer(app)
+    event_loop.run_until_complete(server.start_server())
+    async_toloka_client = AsyncTolokaClient('fake-token', url=str(server.make_url('')), retries=2)
+    yield async_toloka_client
+    event_loop.run_until_complete(async_toloka_client.close())
+    event_loop.run_until_complete(server.close())
+
+
+def json_response(data, status=200):
+    return web.Response(text=simplejson.dumps(data), status=status, content_type='application/json')
+
+
+def search_handler(backend):
+    async def handler(request):
+        return json_response(backend(SimpleNamespace(url=str(request.url)), None))
+    return handler
+
+
+@pytest.fixture
+def requester_map():
+    return {
+        'id': '566ec2b0ff0deeaae5f9d500',
+        'balance': Decimal('120.3'),
+        'public_name': {'EN': 'John Smith'},
+    }
+
+
+def test_methods_are_coroutines():
+    assert asyncio.iscoroutinefunction(AsyncTolokaClient.get_requester)
+    assert asyncio.iscoroutinefunction(AsyncTolokaClient.find_assignments)
+    assert asyncio.iscoroutinefunction(AsyncTolokaClient.add_message_thread_to_folders)
+    assert asyncio.iscoroutinefunction(AsyncTolokaClient.wait_operation)
+    assert not asyncio.iscoroutinefunction(AsyncTolokaClient.get_assignments)
+    assert inspect.isasyncgenfunction(AsyncTolokaClient._find_all)
+
+
+class AsyncCallsTransformer(ast.NodeTransformer):
+    """Turns a sync method of TolokaClient into the expected async one: coroutine calls are awaited, loops over async
+    iterators become `async for` and `time.sleep` becomes `await asyncio.sleep`."""
+
+    def __init__(self, coroutine_names, iterator_names):
+        self.coroutine_names = coroutine_names
+        self.iterator_names = iterator_names
+
+    @staticmethod
+    def _is_call_of(node, owner, names):
+        return (
+            isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name) and node.func.value.id == owner and node.func.attr in names
+        )
+
+    def visit_FunctionDef(self, node):
+        # Nested functions stay synchronous
+        return node
+
+    def visit_Lambda(self, node):
+        return node
+
+    def visit_Call(self, node):
+        node = self.generic_visit(node)
+        if self._is_call_of(node, 'time', {'sleep'}):
+            node.func = ast.Attribute(value=ast.Name(id='asyncio', ctx=ast.Load()), attr='sleep', ctx=ast.Load())
+            return ast.Await(value=node)
+        if self._is_call_of(node, 'self', self.coroutine_names):
+            return ast.Await(value=node)
+        return node
+
+    def visit_For(self, node):
+        node = self.generic_visit(node)
+        if self._is_call_of(node.iter, 'self', self.iterator_names):
+            return ast.AsyncFor(**{field: getattr(node, field) for field in node._fields if hasattr(node, field)})
+        return node
+
+    def visit_comprehension(self, node):
+        node = self.generic_visit(node)
+        if self._is_call_of(node.iter, 'self', self.iterator_names):
+            node.is_async = 1
+        return node
+
+
+def parse_method(func):
+    return ast.parse(textwrap.dedent(inspect.getsource(inspect.unwrap(func)))).body[0]
+
+
+# Responses of these methods are streamed from aiohttp instead of requests, so they are written by hand
+STREAMED_METHODS = {'download_attachment', 'download_assignments_tsv', 'get_assignments_df'}
+
+
+def test_public_methods_match_sync_code():
+    sync_methods = {
+        name: func for name, func in vars(client.TolokaClient).items()
+        if not name.startswith('_') and name not in STREAMED_METHODS and inspect.isfunction(func)
+    }
+    async_methods = {name: inspect.unwrap(func) for name, func in vars(AsyncTolokaClient).items()
+                     if inspect.isfunction(func)}
+    iterator_names = {name for name, func in async_methods.items() if inspect.isasyncgenfunction(func)}
+    iterator_names.update(name for name, func in async_methods.items()
+                          if not asyncio.iscoroutinefunction(func) and name in sync_methods)
+    coroutine_names = {name for name, func in async_methods.items() if asyncio.iscoroutinefunction(func)}
+
+    for name, func in sync_methods.items():
+        transformer = AsyncCallsTransformer(coroutine_names, iterator_names)
+        expected = parse_method(func)
+        expected.body = [transformer.visit(statement) for statement in expected.body]
+        if name in coroutine_names:
+            expected = ast.AsyncFunctionDef(**{field: getattr(expected, field) for field in expected._fields})
+        assert ast.dump(expected) == ast.dump(parse_method(async_methods[name])), name
+
+
+def test_all_public_methods_mirrored():
+    sync_methods = {name for name in vars(client.TolokaClient) if not name.startswith('_')}
+    assert sync_methods <= set(dir(AsyncTolokaClient))
+
+
+def test_get_requester(event_loop, backend, async_toloka_client, requester_map):
+    async def handler(request):
+        assert request.headers['Authorization'] == 'OAuth fake-token'
+        return json_response(requester_map)
+
+    backend.add('GET', '/api/v1/requester', handler)
+    requester = event_loop.run_until_complete(async_toloka_client.get_requester())
+    assert requester_map == client.unstructure(requester)
+    assert requester.balance == Decimal('120.3')
+
+
+def test_api_error(event_loop, backend, async_toloka_client):
+    async def handler(request):
+        return json_response({'code': 'DOES_NOT_EXIST', 'message': 'Pool does not exist'}, status=404)
+
+    backend.add('GET', '/api/v1/pools/1', handler)
+    with pytest.raises(client.exceptions.DoesNotExistApiError):
+        event_loop.run_until_complete(async_toloka_client.get_pool('1'))
+
+
+def test_retries_on_server_error(event_loop, backend, async_toloka_client, requester_map):
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        if len(calls) < 2:
+            return json_response({'code': 'INTERNAL_ERROR', 'message': 'Oops'}, status=500)
+        return json_response(requester_map)
+
+    backend.add('GET', '/api/v1/requester', handler)
+    async_toloka_client.retryer_factory = lambda: client.primitives.retry.TolokaRetry(
+        total=2, status_forcelist=[500], method_whitelist=['GET'], backoff_factor=0,
+    )
+    requester = event_loop.run_until_complete(async_toloka_client.get_requester())
+    assert requester_map == client.unstructure(requester)
+    assert 2 == len(calls)
+
+
+def test_get_assignments_expanded(event_loop, backend, async_toloka_client):
+    search_backend = BackendSearchMock(
+        [{'id': str(i), 'pool_id': '100', 'status': 'SUBMITTED'} for i in range(7)] +
+        [{'id': '7', 'pool_id': '200', 'status': 'SUBMITTED'}],
+        limit=3,
+    )
+    backend.add('GET', '/api/v1/assignments', search_handler(search_backend))
+
+    async def fetch():
+        return [assignment async for assignment in async_toloka_client.get_assignments(pool_id='100')]
+
+    assignments = event_loop.run_until_complete(fetch())
+    assert [str(i) for i in range(7)] == [assignment.id for assignment in assignments]
+    assert 3 == len(search_backend.responses)
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_get_assignments_parallel(event_loop, backend, async_toloka_client, ordered):
+    search_backend = BackendSearchMock(
+        [
+            {'id': f'{(i * 7) % 20:02}', 'pool_id': '100', 'created': f'2020-01-01T01:{i:02}:00'}
+            for i in range(20)
+        ],
+        limit=3,
+    )
+    backend.add('GET', '/api/v1/assignments', search_handler(search_backend))
+
+    async def fetch():
+        assignments = async_toloka_client.get_assignments(pool_id='100', parallelism=3, ordered=ordered)
+        return [assignment.id async for assignment in assignments]
+
+    ids = event_loop.run_until_complete(fetch())
+    expected = [f'{i:02}' for i in range(20)]
+    assert expected == (ids if ordered else sorted(ids))
+
+
+def test_concurrent_requests(event_loop, backend, async_toloka_client):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return json_response({'id': request.path.rsplit('/', 1)[-1], 'status': 'OPEN'})
+
+    for i in range(30):
+        backend.add('GET', f'/api/v1/pools/{i}', handler)
+    async_toloka_client.max_connections = 10
+
+    async def fetch():
+        return await asyncio.gather(*[async_toloka_client.get_pool(str(i)) for i in range(30)])
+
+    pools = event_loop.run_until_complete(fetch())
+    assert [str(i) for i in range(30)] == [pool.id for pool in pools]
+    assert max_in_flight == 10
+
+
+def test_create_tasks_sync_through_async(event_loop, backend, async_toloka_client):
+    operation_map = {
+        'id': 'op-1', 'type': 'TASK.BATCH_CREATE', 'status': 'SUCCESS',
+        'submitted': '2016-10-10T20:33:01', 'started': '2016-10-10T20:33:01',
+    }
+    created = {}
+
+    async def create_tasks(request):
+        assert request.query['async_mode'] == 'true'
+        for i, task in enumerate(await request.json()):
+            created[task['__client_uuid']] = dict(task, id=f'task-{i}')
+        return json_response(dict(operation_map, status='RUNNING'))
+
+    async def get_operation(request):
+        return json_response(operation_map)
+
+    async def get_operation_log(request):
+        return json_response([
+            {'type': 'TASK_CREATE', 'success': True, 'input': task, 'output': {'task_id': task['id']}}
+            for task in created.values()
+        ])
+
+    async def get_tasks(request):
+        items = [{k: v for k, v in task.items() if k != '__client_uuid'} for task in created.values()]
+        return json_response({'items': items, 'has_more': False})
+
+    backend.add('POST', '/api/v1/tasks', create_tasks)
+    backend.add('GET', '/api/v1/operations/op-1', get_operation)
+    backend.add('GET', '/api/v1/operations/op-1/log', get_operation_log)
+    backend.add('GET', '/api/v1/tasks', get_tasks)
+
+    tasks = [client.Task(pool_id='21', input_values={'image': f'{i}.png'}) for i in range(3)]
+    result = event_loop.run_until_complete(async_toloka_client.create_tasks(tasks, allow_defaults=True))
+    assert {'0', '1', '2'} == set(result.items)
+    assert {'0.png', '1.png', '2.png'} == {task.input_values['image'] for task in result.items.values()}
+
+
+def test_wait_operations(event_loop, backend, async_toloka_client, monkeypatch):
+    monkeypatch.setattr(client, '_OPERATION_POLL_MIN_DELAY', datetime.timedelta(milliseconds=10))
+    monkeypatch.setattr(client, '_OPERATION_POLL_MAX_DELAY', datetime.timedelta(milliseconds=50))
+    operation_map = {
+        'type': 'POOL.OPEN', 'status': 'RUNNING', 'submitted': '2016-10-10T20:33:01', 'started': '2016-10-10T20:33:01',
+    }
+    polls = []
+
+    async def get_operation(request):
+        polls.append(request.path)
+        operation_id = request.path.rsplit('/', 1)[-1]
+        status = 'SUCCESS' if polls.count(request.path) > int(operation_id) else 'RUNNING'
+        return json_response(dict(operation_map, id=operation_id, status=status))
+
+    ops = []
+    for operation_id in ['2', '0', '1']:
+        backend.add('GET', f'/api/v1/operations/{operation_id}', get_operation)
+        ops.append(client.structure(dict(operation_map, id=operation_id), client.operations.Operation))
+
+    async def wait():
+        return [op.id async for op in async_toloka_client.wait_operations(ops)]
+
+    assert ['0', '1', '2'] == event_loop.run_until_complete(wait())
+    assert 6 == len(polls)
+
+
+def test_assignment_cursor(event_loop, backend, async_toloka_client):
+    search_backend = BackendSearchMock([
+        {'pool_id': '100', 'id': 'A', 'submitted': '2020-01-01T01:01:01'},
+        {'pool_id': '100', 'id': 'B', 'submitted': '2020-01-01T01:01:02'},
+    ])
+    backend.add('GET', '/api/v1/assignments', search_handler(search_backend))
+    cursor = AssignmentCursor(pool_id='100', event_type='SUBMITTED', toloka_client=async_toloka_client)
+
+    async def fetch():
+        return [event async for event in cursor]
+
+    assert ['A', 'B'] == [event.assignment.id for event in event_loop.run_until_complete(fetch())]
+
+
+def test_download_attachments(event_loop, backend, async_toloka_client, tmp_path):
+    search_backend = BackendSearchMock(
+        [{'id': str(i), 'attachment_type': 'ASSIGNMENT_ATTACHMENT', 'name': f'{i}.txt'} for i in range(5)],
+        limit=2,
+    )
+    backend.add('GET', '/api/v1/attachments', search_handler(search_backend))
+
+    async def download(request):
+        return web.Response(body=request.match_info['tail'].encode())
+
+    for i in range(5):
+        backend.add('GET', f'/api/v1/attachments/{i}/download', download)
+
+    paths = event_loop.run_until_complete(
+        async_toloka_client.download_attachments(client.search_requests.AttachmentSearchRequest(), tmp_path)
+    )
+    assert {str(i): str(tmp_path / f'{i}_{i}.txt') for i in range(5)} == paths
+    assert b'api/v1/attachments/3/download' == (tmp_path / '3_3.txt').read_bytes()
+
+
+def test_download_attachments_streamed(event_loop, backend, async_toloka_client, tmp_path, monkeypatch):
+    content = bytes(range(256)) * 4096
+    attachment = client.attachment.AssignmentAttachment(id='1', name='big.bin')
+
+    async def download(request):
+        response = web.StreamResponse()
+        await response.prepare(request)
+        for offset in range(0, len(content), 100000):
+            await response.write(content[offset:offset + 100000])
+        return response
+
+    backend.add('GET', '/api/v1/attachments/1/download', download)
+
+    written = []
+    loop_thread = threading.get_ident()
+    original_open = open
+
+    def tracking_open(*args, **kwargs):
+        out_file = original_open(*args, **kwargs)
+        original_write = out_file.write
+        out_file.write = lambda data: written.append((len(data), threading.get_ident())) or original_write(data)
+        return out_file
+
+    monkeypatch.setattr('builtins.open', tracking_open)
+    paths = event_loop.run_until_complete(async_toloka_client.download_attachments([attachment], tmp_path))
+    monkeypatch.undo()
+
+    assert content == (tmp_path / '1_big.bin').read_bytes()
+    assert {'1': str(tmp_path / '1_big.bin')} == paths
+    assert len(written) > 1
+    assert all(size <= 64 * 1024 and thread != loop_thread for size, thread in written)
+
+    with pytest.raises(client.exceptions.DoesNotExistApiError):
+        event_loop.run_until_complete(async_toloka_client.download_attachments(['3'], tmp_path))
+
+
+def streamed_response(content):
+    async def handler(request):
+        response = web.StreamResponse(headers={'Content-Type': 'text/plain; charset=utf-8'})
+        await response.prepare(request)
+        for offset in range(0, len(content), 100000):
+            await response.write(content[offset:offset + 100000])
+        return response
+    return handler
+
+
+def test_raw_request_rejects_stream(event_loop, async_toloka_client):
+    with pytest.raises(TypeError):
+        event_loop.run_until_complete(async_toloka_client._raw_request('get', '/v1/requester', stream=True))
+
+
+def test_iter_operation_log_streamed(event_loop, backend, async_toloka_client):
+    log = [
+        {'type': 'TASK_CREATE', 'success': True, 'input': {'pool_id': '21', 'name': 'x' * 1000},
+         'output': {'task_id': str(i)}}
+        for i in range(300)
+    ]
+    backend.add('GET', '/api/v1/operations/op-1/log', streamed_response(simplejson.dumps(log).encode()))
+
+    async def read_log():
+        return [item.output['task_id'] async for item in async_toloka_client.iter_operation_log('op-1')]
+
+    assert [str(i) for i in range(300)] == event_loop.run_until_complete(read_log())
+
+
+def test_download_assignments_tsv_streamed(event_loop, backend, async_toloka_client, tmp_path):
+    content = ('INPUT:image\tOUTPUT:result\n' + ''.join(f'{i}.png\t{i % 2}\n' for i in range(50000))).encode()
+    backend.add('GET', '/api/new/requester/pools/1/assignments.tsv', streamed_response(content))
+
+    event_loop.run_until_complete(async_toloka_client.download_assignments_tsv('1', tmp_path / 'result.tsv'))
+    assert content == (tmp_path / 'result.tsv').read_bytes()
+
+    df = event_loop.run_until_complete(async_toloka_client.get_assignments_df('1'))
+    assert 50000 == len(df)
+    assert '49999.png' == df['INPUT:image'].iloc[-1]
+
+    reader = event_loop.run_until_complete(async_toloka_client.get_assignments_df('1', chunksize=20000))
+    with reader:
+        assert [20000, 20000, 10000] == [len(chunk) for chunk in reader]
+
+
+def test_pickle():
+    async_toloka_client = AsyncTolokaClient('fake-token', 'SANDBOX', max_connections=5)
+    restored = pickle.loads(pickle.dumps(async_toloka_client))
+    assert restored.url == async_toloka_client.url
+    assert restored.max_connections == 5
+
+
+@pytest.mark.parametrize(
+    ['method_name', 'async_to_sync_differencies'],
+    [
+        (
+            '_request',
+            {
+                'await self.': 'self.',
+            },
+        ),
+        (
+            '_find_all_pages',
+            {
+                'await find_function': 'find_function',
+            },
+        ),
+        (
+            '_find_all',
+            {
+                'aiterate_concurrently': 'iterate_concurrently',
+                'buffer_size=self.prefetch_pages)': 'buffer_size=self.prefetch_pages, pool=self._producer_pool)',
+                'async for result in pages:\n            for item in getattr(result, items_field):\n                yield item':
+                    'for result in pages:\n            yield from getattr(result, items_field)',
+            },
+        ),
+        (
+            '_split_request_by_created',
+            {
+                '(await find_function(': 'find_function(',
+                'limit=1)).items': 'limit=1).items',
+            },
+        ),
+        (
+            '_find_all_in_partitions',
+            {
+                'await self.': 'self.',
+                'aiterate_concurrently': 'iterate_concurrently',
+                'buffer_size=buffer_size,\n': 'buffer_size=buffer_size,\n            pool=self._producer_pool,\n',
+                'async for item in items:\n            yield item': 'yield from items',
+                '                                      buffer_size': '                                buffer_size',
+            },
+        ),
+        (
+            '_create_user_bonuses_chunk',
+            {
+                'await self.': 'self.',
+            },
+        ),
+        (
+            '_wait_operations',
+            {
+                'for op in polls.completed:\n            yield op': 'yield from polls.completed',
+                'await asyncio.sleep': 'time.sleep',
+                'await self.': 'self.',
+            },
+        ),
+        (
+            '_invalidate_cache',
+            {},
+        ),
+        (
+            '_cached_request',
+            {
+                'await self.': 'self.',
+            },
+        ),
+        (
+            '_download_attachment_to_dir',
+            {
+                'await self.': 'self.',
+                'stream_body=True': 'stream=True',
+                'await _save_attachment': '_save_attachment',
+            },
+        ),
+        (
+            '_iter_operation_log',
+            {
+                'await self.': 'self.',
+                'stream_body=True': 'stream=True',
+                'async for log_item in aiter_json_array(response.raw.content.iter_chunked(64 * 1024))':
+                    'for log_item in iter_json_array(response.iter_content(chunk_size=64 * 1024))',
+            },
+        ),
+        (
+            '_find_created',
+            {
+                'for obj in window.take(await find_function': 'yield from window.take(find_function',
+                ')):\n                yield obj': '))',
+            },
+        ),
+        (
+            '_sync_via_async',
+            {
+                'async for obj in self._find_created(find_function, pool_id, created_ids.keys()):\n'
+                '                created_objects.append(obj)':
+                    'created_objects.extend(self._find_created(find_function, pool_id, created_ids.keys()))',
+                'await self.': 'self.',
+                'async for ': 'for ',
+            },
+        ),
+    ]
+)
+def test_exact_sync_and_async_code(method_name, async_to_sync_differencies):
+    def get_func_body(func):
+        return '\n'.join(inspect.getsource(func).rstrip().split('\n')[1:])
+
+    sync_code = get_func_body(getattr(client.TolokaClient, method_name))
+    async_code = get_func_body(getattr(AsyncTolokaClient, method_name))
+    for async_version, sync_version in async_to_sync_differencies.items():
+        async_code = async_code.replace(async_version, sync_version)
+
+    assert sync_code.split('\n') == async_code.split('\n')
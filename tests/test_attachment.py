@@ -171,3 +171,46 @@ sandy hole with nothing in it to sit down on or to eat: it was a hobbit-hole, an
 
     with open(tmp_file_path, 'r') as in_f:
         assert content == in_f.read()
+
+
+def test_download_attachments(requests_mock, toloka_client, toloka_url, tmp_path, assignment_attachment_map):
+    attachments = [
+        dict(assignment_attachment_map, id=f'attachment-{i}', name=f'photo-{i}.png') for i in range(5)
+    ]
+    contents = {attachment['id']: attachment['id'].encode() * 1000 for attachment in attachments}
+    requests_mock.get(
+        f'{toloka_url}/attachments',
+        json={'items': attachments, 'has_more': False},
+    )
+    for attachment_id, content in contents.items():
+        requests_mock.get(
+            f'{toloka_url}/attachments/{attachment_id}/download',
+            content=content,
+            headers={'Content-Length': str(len(content))},
+        )
+    # A complete file from the previous run and an incomplete one
+    (tmp_path / 'attachment-0_photo-0.png').write_bytes(contents['attachment-0'])
+    (tmp_path / 'attachment-1_photo-1.png').write_bytes(b'attachment-1')
+
+    request = client.search_requests.AttachmentSearchRequest(pool_id='pool-1')
+    paths = toloka_client.download_attachments(request, tmp_path, parallelism=2)
+    assert {
+        attachment['id']: str(tmp_path / f'{attachment["id"]}_{attachment["name"]}') for attachment in attachments
+    } == paths
+    for attachment_id, file_path in paths.items():
+        with open(file_path, 'rb') as in_f:
+            assert contents[attachment_id] == in_f.read()
+    # No temporary files are left
+    assert sorted(path.basename(file_path) for file_path in paths.values()) == sorted(
+        file.name for file in tmp_path.iterdir()
+    )
+
+
+def test_download_attachments_by_ids(requests_mock, toloka_client, toloka_url, tmp_path, assignment_attachment_map):
+    requests_mock.get(f'{toloka_url}/attachments/attachment-1', json=dict(assignment_attachment_map, id='attachment-1'))
+    requests_mock.get(f'{toloka_url}/attachments/attachment-1/download', content=b'content')
+
+    paths = toloka_client.download_attachments(['attachment-1'], tmp_path / 'out')
+    assert {'attachment-1': str(tmp_path / 'out' / 'attachment-1_ExampleAttachment.txt')} == paths
+    with open(paths['attachment-1'], 'rb') as in_f:
+        assert b'content' == in_f.read()
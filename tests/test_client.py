@@ -3,6 +3,8 @@ from decimal import Decimal
 import pickle
 import pytest
 import simplejson
+import subprocess
+import sys
 
 from toloka.client import TolokaClient
 import toloka.client as client
@@ -50,3 +52,8 @@ def test_different_urls(requests_mock, random_url):
     toloka_client = TolokaClient('fake-token', url=f'{random_url}/')
     requester = toloka_client.get_requester()
     assert result == client.unstructure(requester)
+
+
+def test_client_import_does_not_load_pandas():
+    code = 'import sys, toloka.client; assert "pandas" not in sys.modules'
+    subprocess.run([sys.executable, '-c', code], check=True)
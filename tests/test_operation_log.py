@@ -1,3 +1,4 @@
+import io
 from decimal import Decimal
 import simplejson
 
@@ -182,3 +183,21 @@ def test_get_operagiton_log(request, requests_mock, toloka_client, toloka_url, o
     requests_mock.get(f'{toloka_url}/operations/{operation_id}/log', text=simplejson.dumps(log_list), status_code=201)
     result = toloka_client.get_operation_log(operation_id)
     assert log_list == client.unstructure(result)
+
+
+@pytest.mark.parametrize(
+    'object',
+    [
+        'task',
+        'bonus',
+        'tasks_suite',
+    ],
+)
+def test_iter_operation_log(request, requests_mock, toloka_client, toloka_url, object):
+    log_list = request.getfixturevalue(f'{object}_operation_log_list')
+    operation_id = 'ee60ef13-37a3-666a-9220-266daa4b71a7'
+    body = io.BytesIO(simplejson.dumps(log_list, ensure_ascii=False).encode())
+    requests_mock.get(f'{toloka_url}/operations/{operation_id}/log', body=body, status_code=201)
+    result = toloka_client.iter_operation_log(operation_id)
+    assert not isinstance(result, list)
+    assert log_list == [client.unstructure(log_item) for log_item in result]
@@ -0,0 +1,82 @@
+import datetime
+
+import pytest
+import toloka.client as client
+
+
+@pytest.fixture
+def fast_polling(monkeypatch):
+    monkeypatch.setattr(client, '_OPERATION_POLL_INITIAL_DELAY', datetime.timedelta(milliseconds=10))
+    monkeypatch.setattr(client, '_OPERATION_POLL_MIN_DELAY', datetime.timedelta(milliseconds=10))
+    monkeypatch.setattr(client, '_OPERATION_POLL_MAX_DELAY', datetime.timedelta(milliseconds=50))
+
+
+def operation_map(operation_id, status, progress=None):
+    return {
+        'id': operation_id,
+        'type': 'POOL.OPEN',
+        'status': status,
+        'submitted': '2016-03-07T15:47:00',
+        'started': '2016-03-07T15:47:21',
+        'parameters': {'pool_id': operation_id},
+        **({} if progress is None else {'progress': progress}),
+    }
+
+
+@pytest.mark.parametrize(
+    ['previous_progress', 'current_progress', 'delay', 'expected_delay'],
+    [
+        (None, None, 2, 4),
+        (10, 10, 2, 4),
+        (10, 10, 8, 10),
+        (10, 20, 2, 10),
+        (10, 90, 2, 1),
+        (60, 80, 4, 4),
+    ]
+)
+def test_get_operation_poll_delay(previous_progress, current_progress, delay, expected_delay):
+    previous = client.structure(operation_map('1', 'RUNNING', previous_progress), client.operations.Operation)
+    current = client.structure(operation_map('1', 'RUNNING', current_progress), client.operations.Operation)
+    assert datetime.timedelta(seconds=expected_delay) == client._get_operation_poll_delay(
+        previous, current, datetime.timedelta(seconds=delay),
+    )
+
+
+def test_wait_operations(requests_mock, toloka_client, toloka_url, fast_polling):
+    polls_left = {'1': 3, '2': 1, '3': 0}
+
+    def get_operation(request, context):
+        operation_id = request.path.rsplit('/', 1)[-1]
+        polls_left[operation_id] -= 1
+        if polls_left[operation_id] > 0:
+            return operation_map(operation_id, 'RUNNING', progress=50)
+        return operation_map(operation_id, 'SUCCESS', progress=100)
+
+    requests_mock.get(f'{toloka_url}/operations/1', json=get_operation)
+    requests_mock.get(f'{toloka_url}/operations/2', json=get_operation)
+
+    ops = [
+        client.structure(operation_map('1', 'RUNNING', progress=0), client.operations.Operation),
+        client.structure(operation_map('2', 'PENDING'), client.operations.Operation),
+        client.structure(operation_map('3', 'SUCCESS', progress=100), client.operations.Operation),
+    ]
+    completed = list(toloka_client.wait_operations(ops))
+    assert ['3', '2', '1'] == [op.id for op in completed]
+    assert all(op.status == client.operations.Operation.Status.SUCCESS for op in completed)
+    assert 4 == requests_mock.call_count
+
+
+def test_wait_operations_timeout(requests_mock, toloka_client, toloka_url, fast_polling):
+    requests_mock.get(f'{toloka_url}/operations/1', json=operation_map('1', 'RUNNING'))
+    requests_mock.get(f'{toloka_url}/operations/2', json=operation_map('2', 'SUCCESS'))
+
+    ops = [
+        client.structure(operation_map('1', 'RUNNING'), client.operations.Operation),
+        client.structure(operation_map('2', 'RUNNING'), client.operations.Operation),
+    ]
+    completed = toloka_client.wait_operations(ops, timeout=datetime.timedelta(milliseconds=100))
+    assert '2' == next(completed).id
+    with pytest.raises(TimeoutError):
+        next(completed)
+    # The delay grows exponentially, so there are just several polls
+    assert requests_mock.call_count < 10
@@ -8,6 +8,7 @@ import simplejson as json
 import logging
 import pandas as pd
 import pytest
+import requests
 import toloka.client as client
 from toloka.client.exceptions import InternalApiError, ValidationApiError, IncorrectActionsApiError
 from .template_builder.test_template_builder import view_spec_map as tb_view_spec_map  # noqa: F401
@@ -560,6 +561,64 @@ def test_get_assignments_df(requests_mock, toloka_client, toloka_api_url):
     assert requests_mock.last_request.qs == expected_params
 
 
+
+@pytest.fixture
+def assignments_tsv(requests_mock, toloka_api_url):
+    content = b'INPUT:image\tOUTPUT:result\tASSIGNMENT:worker_id\na.png\tcat\tw1\nb.png\tdog\tw2\nc.png\tcat\tw1\n'
+    requests_mock.get(f'{toloka_api_url}/new/requester/pools/123/assignments.tsv', content=content)
+    return content
+
+
+def test_get_assignments_df_by_chunks(toloka_client, assignments_tsv):
+    chunks = list(toloka_client.get_assignments_df(
+        pool_id=123, chunksize=2, usecols=['INPUT:image', 'OUTPUT:result'], dtype={'OUTPUT:result': 'category'},
+    ))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert all(list(chunk.columns) == ['INPUT:image', 'OUTPUT:result'] for chunk in chunks)
+    assert all(chunk['OUTPUT:result'].dtype == 'category' for chunk in chunks)
+    assert pd.concat(chunks)['INPUT:image'].tolist() == ['a.png', 'b.png', 'c.png']
+
+
+def test_get_assignments_df_by_chunks_closes_response(toloka_client, assignments_tsv, monkeypatch):
+    closed = []
+    monkeypatch.setattr(requests.Response, 'close', lambda response: closed.append(response))
+
+    reader = toloka_client.get_assignments_df(pool_id=123, chunksize=1)
+    assert len(next(reader)) == 1
+    reader.close()
+    assert len(closed) == 1
+
+    assert len(list(toloka_client.get_assignments_df(pool_id=123, chunksize=1))) == 3
+    assert len(closed) == 2
+
+    toloka_client.get_assignments_df(pool_id=123)
+    assert len(closed) == 3
+
+
+def test_get_assignments_df_response_encoding(requests_mock, toloka_client, toloka_api_url):
+    content = 'INPUT:text\tOUTPUT:result\nкошка\tкот\n'.encode('cp1251')
+    requests_mock.get(f'{toloka_api_url}/new/requester/pools/123/assignments.tsv', content=content,
+                      headers={'Content-Type': 'text/tab-separated-values; charset=windows-1251'})
+
+    assert toloka_client.get_assignments_df(pool_id=123)['INPUT:text'].tolist() == ['кошка']
+    assert next(toloka_client.get_assignments_df(pool_id=123, chunksize=1))['OUTPUT:result'].tolist() == ['кот']
+
+
+def test_download_assignments_tsv(toloka_client, assignments_tsv, tmp_path, monkeypatch):
+    closed = []
+    monkeypatch.setattr(requests.Response, 'close', lambda response: closed.append(response))
+
+    path = tmp_path / 'assignments.tsv'
+    toloka_client.download_assignments_tsv(pool_id=123, out=str(path))
+    assert path.read_bytes() == assignments_tsv
+    assert len(closed) == 1
+
+    out = io.BytesIO()
+    toloka_client.download_assignments_tsv(123, out, client.assignment.GetAssignmentsTsvParameters())
+    assert out.getvalue() == assignments_tsv
+    assert len(closed) == 2
+
 @pytest.fixture
 def simple_localization_config_map():
     return {
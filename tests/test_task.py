@@ -7,6 +7,8 @@ import pytest
 import simplejson as json
 import toloka.client as client
 
+from .testutils.backend_mock import BackendSearchMock
+
 
 @pytest.fixture
 def task_map():
@@ -317,6 +319,38 @@ def test_create_tasks_sync_through_async(
     assert task_create_result_map == client.unstructure(result)
 
 
+def test_create_tasks_sync_through_async_fetches_only_created(
+        requests_mock, toloka_client, toloka_url, operation_running_map, operation_success_map,
+):
+    # Tasks created by someone else are interleaved with the created ones
+    search_backend = BackendSearchMock(
+        [{'id': f'{i:02}', 'pool_id': '21'} for i in range(40) if not 10 <= i < 30 or i % 2]
+    )
+    log = []
+
+    def create_tasks(request, context):
+        for i, task in enumerate(request.json()):
+            task_id = f'{10 + i * 2:02}'
+            search_backend.storage.append(dict(task, id=task_id))
+            log.append({'input': task, 'output': {'task_id': task_id}, 'success': True, 'type': 'TASK_CREATE'})
+        return operation_running_map
+
+    requests_mock.post(f'{toloka_url}/tasks', json=create_tasks, status_code=201)
+    requests_mock.get(f'{toloka_url}/operations/{operation_running_map["id"]}', json=operation_success_map)
+    requests_mock.get(f'{toloka_url}/operations/{operation_running_map["id"]}/log', json=lambda *args: log)
+    requests_mock.get(f'{toloka_url}/tasks', json=search_backend)
+
+    tasks = [client.Task(pool_id='21', input_values={'image': f'{i}.png'}) for i in range(10)]
+    result = toloka_client.create_tasks(tasks, allow_defaults=True)
+
+    assert {str(i): f'{10 + i * 2:02}' for i in range(10)} == {index: task.id for index, task in result.items.items()}
+    assert {str(i): f'{i}.png' for i in range(10)} == {
+        index: task.input_values['image'] for index, task in result.items.items()
+    }
+    # Every request starts from the first task which is not fetched yet
+    assert [10, 5, 2, 1] == [len(response['items']) for response in search_backend.responses]
+
+
 def test_create_tasks_sync(requests_mock, toloka_client, toloka_url, tasks_map, task_create_result_map):
     requests_mock.post(f'{toloka_url}/tasks', json=task_create_result_map, status_code=201)
 
@@ -332,6 +366,56 @@ def test_create_tasks_sync(requests_mock, toloka_client, toloka_url, tasks_map,
     assert task_create_result_map == client.unstructure(result)
 
 
+@pytest.fixture
+def create_tasks_in_chunks_mock(requests_mock, toloka_url):
+    def tasks(request, context):
+        items, validation_errors = {}, {}
+        for index, task in enumerate(request.json()):
+            if task['input_values']['image'] is None:
+                validation_errors[str(index)] = {'input_values.image': {'code': 'VALUE_REQUIRED', 'message': 'May not be null'}}
+            else:
+                items[str(index)] = dict(task, id=task['input_values']['image'])
+        if not items or validation_errors and request.qs.get('skip_invalid_items') != ['true']:
+            context.status_code = 400
+            return {'code': 'VALIDATION_ERROR', 'message': 'Validation failed', 'payload': validation_errors}
+        context.status_code = 201
+        return {'items': items, 'validation_errors': validation_errors}
+
+    requests_mock.post(f'{toloka_url}/tasks', json=tasks)
+    return requests_mock
+
+
+def test_create_tasks_in_chunks(create_tasks_in_chunks_mock, toloka_client):
+    images = ['0.png', None, '2.png', '3.png', None, None, None, '7.png']
+    tasks = (client.Task(pool_id='21', input_values={'image': image}) for image in images)
+
+    result = toloka_client.create_tasks(
+        tasks, skip_invalid_items=True, async_mode=False, chunk_size=3, parallelism=2,
+    )
+    assert 3 == create_tasks_in_chunks_mock.call_count
+    assert {'0': '0.png', '2': '2.png', '3': '3.png', '7': '7.png'} == {
+        index: task.id for index, task in result.items.items()
+    }
+    assert {'1', '4', '5', '6'} == set(result.validation_errors)
+
+
+def test_create_tasks_in_chunks_without_skipping_invalid(create_tasks_in_chunks_mock, toloka_client):
+    images = ['0.png', '1.png', '2.png', None, '4.png', '5.png', '6.png']
+    tasks = [client.Task(pool_id='21', input_values={'image': image}) for image in images]
+
+    with pytest.raises(client.exceptions.ValidationApiError) as exc_info:
+        toloka_client.create_tasks(tasks, async_mode=False, chunk_size=2)
+    # Chunks after the failed one are not sent
+    assert 2 == create_tasks_in_chunks_mock.call_count
+    assert {'3'} == set(exc_info.value.payload)
+
+
+def test_create_tasks_in_chunks_with_operation_id(toloka_client):
+    tasks = [client.Task(pool_id='21', input_values={'image': f'{i}.png'}) for i in range(3)]
+    with pytest.raises(ValueError):
+        toloka_client.create_tasks(tasks, operation_id='281073ea-ab34-416e-a028-47421ff1b166', chunk_size=2)
+
+
 def test_create_tasks_async(requests_mock, toloka_client, toloka_url):
     tasks_map = [
         {'pool_id': '21', 'input_values': {'image': 'http://images.com/1.png'}},
@@ -117,6 +117,26 @@ def test_create_user_bonuses(requests_mock, toloka_client, toloka_url, user_bonu
     assert raw_result == client.unstructure(result)
 
 
+def test_create_user_bonuses_in_chunks(requests_mock, toloka_client, toloka_url, user_bonus_map):
+    def user_bonuses(request, context):
+        items = {
+            str(index): dict(user_bonus, id=f'bonus-{user_bonus["user_id"]}')
+            for index, user_bonus in enumerate(request.json())
+        }
+        return simplejson.dumps({'items': items})
+
+    requests_mock.post(f'{toloka_url}/user-bonuses', text=user_bonuses, status_code=201)
+
+    result = toloka_client.create_user_bonuses(
+        (client.structure(dict(user_bonus_map, user_id=f'user-{i}'), client.user_bonus.UserBonus) for i in range(5)),
+        chunk_size=2,
+        parallelism=3,
+    )
+    assert 3 == requests_mock.call_count
+    assert {str(i): f'bonus-user-{i}' for i in range(5)} == {index: bonus.id for index, bonus in result.items.items()}
+    assert result.validation_errors is None
+
+
 def test_create_user_bonuses_without_message(
     requests_mock, toloka_client, toloka_url,
     user_bonus_map_without_message, user_bonus_map_without_message_with_readonly
@@ -0,0 +1,59 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+import simplejson
+from toloka.util._json import aiter_json_array, iter_json_array
+
+
+@pytest.fixture
+def json_array():
+    return [
+        {'id': '1', 'title': 'Молодец!', 'amount': Decimal('0.01'), 'tags': ['a', 'b']},
+        {'id': '2', 'nested': {'x': [1, 2, {'y': None}]}},
+        12345,
+        'string with ] and , inside',
+        Decimal('1.25'),
+        [],
+    ]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 7, 1000])
+def test_iter_json_array_chunks(json_array, chunk_size):
+    document = simplejson.dumps(json_array, ensure_ascii=False, indent=2).encode()
+    chunks = (document[i:i + chunk_size] for i in range(0, len(document), chunk_size))
+    assert json_array == list(iter_json_array(chunks))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1000])
+def test_aiter_json_array_chunks(json_array, chunk_size):
+    document = simplejson.dumps(json_array, ensure_ascii=False, indent=2).encode()
+
+    async def chunks():
+        for i in range(0, len(document), chunk_size):
+            yield document[i:i + chunk_size]
+
+    async def parse():
+        return [item async for item in aiter_json_array(chunks())]
+
+    assert json_array == asyncio.run(parse())
+
+
+def test_iter_json_array_is_lazy():
+    chunks = iter(['[{"id": "1"},', ' {"id": "2"}', ', {"id"'])
+    items = iter_json_array(chunks)
+    assert {'id': '1'} == next(items)
+    assert {'id': '2'} == next(items)
+    with pytest.raises(simplejson.JSONDecodeError):
+        next(items)
+
+
+@pytest.mark.parametrize('document', ['[]', ' [ ] ', '[\n]'])
+def test_iter_json_array_empty(document):
+    assert [] == list(iter_json_array([document]))
+
+
+@pytest.mark.parametrize('document', ['', '{}', '[1', '[1,]', '[1 2]', '[1] 2'])
+def test_iter_json_array_invalid(document):
+    with pytest.raises(simplejson.JSONDecodeError):
+        list(iter_json_array([document]))